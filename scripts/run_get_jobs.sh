@@ -15,4 +15,4 @@ export PYTHONPATH="$(pwd)/src"
 
 # Run the main pipeline script
 echo "Running Job Search Pipeline..."
-python3 src/main_get_jobs.py
\ No newline at end of file
+python3 src/main_get_jobs.py "$@"
\ No newline at end of file
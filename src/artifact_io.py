@@ -0,0 +1,190 @@
+"""
+Artifact I/O
+════════════
+Crash-safe, cross-process-safe writes for pipeline artifacts (master and
+unified CSVs, the master input index, insights JSON, trackers).
+
+  • atomic writes   write to a temp file in the same directory, flush +
+                    fsync, then rename over the target (and fsync the
+                    directory) – readers see the old file or the new
+                    one, never a truncated mix
+  • artifact locks  advisory ``fcntl.flock`` on ``<artifact>.lock``, so
+                    overlapping runs (cron plus a manual run, parallel
+                    title pipelines) serialise their read-modify-write of
+                    the same artifact.  Re-entrant within a thread; other
+                    threads and processes wait.
+  • contention      per-artifact acquisitions, how many had to wait and
+                    the total wait, via ``lock_stats()``; waits longer
+                    than ``CONTENTION_LOG_S`` are logged
+
+Without ``fcntl`` (Windows) locks are no-ops; writes stay atomic.
+
+Usage:
+    with artifact_lock(master_file):          # read → merge → write
+        df = pd.read_csv(master_file)
+        ...
+        write_csv(df, master_file, index=False)
+
+    write_json(index_path, index)             # single atomic write
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional, Union
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+LOCK_SUFFIX = ".lock"
+DEFAULT_LOCK_TIMEOUT_S = 600
+CONTENTION_LOG_S = 1.0
+_POLL_S = 0.05
+
+_held = threading.local()          # this thread's locks: path → (fd, depth)
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+class ArtifactLockTimeout(TimeoutError):
+    """Raised when an artifact lock is not acquired within the timeout."""
+
+
+def _key(path: PathLike) -> str:
+    return os.path.abspath(os.fspath(path))
+
+
+def _record(key: str, waited: float, contended: bool) -> None:
+    with _stats_lock:
+        entry = _stats.setdefault(key, {"acquired": 0, "contended": 0, "wait_s": 0.0, "max_wait_s": 0.0})
+        entry["acquired"] += 1
+        entry["contended"] += int(contended)
+        entry["wait_s"] += waited
+        entry["max_wait_s"] = max(entry["max_wait_s"], waited)
+
+
+def lock_stats(reset: bool = False) -> Dict[str, Dict[str, float]]:
+    """Lock contention per artifact path: acquisitions, contended ones, total / max wait."""
+    with _stats_lock:
+        snapshot = {k: dict(v) for k, v in _stats.items()}
+        if reset:
+            _stats.clear()
+    return snapshot
+
+
+@contextmanager
+def artifact_lock(path: PathLike, timeout: Optional[float] = DEFAULT_LOCK_TIMEOUT_S) -> Iterator[None]:
+    """Hold the exclusive advisory lock of the artifact at *path*."""
+    key = _key(path)
+    held = getattr(_held, "locks", None)
+    if held is None:
+        held = _held.locks = {}
+    if key in held:
+        fd, depth = held[key]
+        held[key] = (fd, depth + 1)
+        try:
+            yield
+        finally:
+            fd, depth = held[key]
+            held[key] = (fd, depth - 1)
+        return
+
+    if fcntl is None:
+        yield
+        return
+
+    os.makedirs(os.path.dirname(key), exist_ok=True)
+    fd = os.open(key + LOCK_SUFFIX, os.O_RDWR | os.O_CREAT, 0o644)
+    start = time.monotonic()
+    contended = False
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                contended = True
+                if timeout is not None and time.monotonic() - start > timeout:
+                    raise ArtifactLockTimeout(f"Timed out after {timeout}s waiting for lock on {key}")
+                time.sleep(_POLL_S)
+    except BaseException:
+        os.close(fd)
+        raise
+
+    waited = time.monotonic() - start
+    _record(key, waited, contended)
+    if waited >= CONTENTION_LOG_S:
+        logging.info(f"Waited {waited:.1f}s for lock on {os.path.basename(key)}")
+    held[key] = (fd, 1)
+    try:
+        yield
+    finally:
+        del held[key]
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: PathLike, mode: str = "w", encoding: Optional[str] = "utf-8",
+                 lock: bool = True, **open_kwargs: Any) -> Iterator[Any]:
+    """Open a temp file for writing; on success it atomically replaces *path*."""
+    target = _key(path)
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+    if "b" in mode:
+        encoding = None
+    with (artifact_lock(target) if lock else nullcontext()):
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(target)}.", suffix=".tmp", dir=directory)
+        try:
+            # mkstemp creates 0600 files; keep the artifact's own permissions
+            os.chmod(tmp_path, os.stat(target).st_mode & 0o777 if os.path.exists(target) else 0o644)
+            with os.fdopen(fd, mode, encoding=encoding, **open_kwargs) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _fsync_dir(directory)
+
+
+def write_text(path: PathLike, text: str, encoding: str = "utf-8") -> None:
+    with atomic_write(path, "w", encoding=encoding) as f:
+        f.write(text)
+
+
+def write_json(path: PathLike, data: Any, indent: Optional[int] = 2) -> None:
+    with atomic_write(path, "w") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+
+
+def write_csv(df: pd.DataFrame, path: PathLike, **to_csv_kwargs: Any) -> None:
+    with atomic_write(path, "w", newline="") as f:
+        df.to_csv(f, **to_csv_kwargs)
@@ -7,16 +7,23 @@ from datetime import datetime
 from pathlib import Path
 
 from paths import APPLICATION_LOGS_DIR, APPLICATIONS_CSV
+from job_db import get_job_db
 
 class ApplicationTracker:
-    """Track job applications."""
+    """Track job applications.
+
+    The job database's ``applications`` table is the system of record
+    (indexed lookups for "already applied?"); the CSV log is still
+    appended for reading by hand.
+    """
     
-    def __init__(self, log_file=None):
+    def __init__(self, log_file=None, db=None):
         """
         Initialize the application tracker.
         
         Args:
             log_file: Path to the CSV file for tracking applications
+            db: JobDB to record applications in (default: the shared job database)
         """
         if log_file is None:
             log_dir = str(APPLICATION_LOGS_DIR)
@@ -25,6 +32,7 @@ class ApplicationTracker:
         
         self.log_file = log_file
         self.logger = logging.getLogger(__name__)
+        self.db = db or get_job_db()
         
         # Create log file with headers if it doesn't exist
         if not os.path.exists(self.log_file):
@@ -62,21 +70,8 @@ class ApplicationTracker:
         Returns:
             bool: True if already applied
         """
-        if not os.path.exists(self.log_file):
-            return False
-        
         try:
-            with open(self.log_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    status = (row.get('status') or '').strip().lower()
-                    submitted = (row.get('submitted') or '').strip().lower()
-                    if status not in ['success'] and submitted != 'yes':
-                        continue
-                    if row.get('job_url') == job_url:
-                        return True
-                    if job_id and row.get('job_id') == job_id:
-                        return True
+            return self.db.is_already_applied(job_url, job_id)
         except Exception as e:
             self.logger.error(f"Error checking application history: {e}")
         
@@ -110,6 +105,11 @@ class ApplicationTracker:
             'error': result.get('error', '')
         }
         
+        try:
+            self.db.log_application(row)
+        except Exception as e:
+            self.logger.error(f"Error recording application in job database: {e}")
+        
         try:
             # Check if headers exist
             file_exists = os.path.exists(self.log_file) and os.path.getsize(self.log_file) > 0
@@ -131,30 +131,8 @@ class ApplicationTracker:
         Returns:
             dict: Statistics including total, successful, failed, submitted
         """
-        if not os.path.exists(self.log_file):
-            return {
-                'total': 0,
-                'successful': 0,
-                'failed': 0,
-                'submitted': 0
-            }
-        
         try:
-            with open(self.log_file, 'r') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            
-            total = len(rows)
-            successful = sum(1 for row in rows if row.get('status') == 'success')
-            failed = sum(1 for row in rows if row.get('status') == 'failed')
-            submitted = sum(1 for row in rows if row.get('submitted') == 'yes')
-            
-            return {
-                'total': total,
-                'successful': successful,
-                'failed': failed,
-                'submitted': submitted
-            }
+            return self.db.application_stats()
         except Exception as e:
             self.logger.error(f"Error getting application stats: {e}")
             return {
@@ -21,6 +21,7 @@ from auto_application.job_board_detector import detect_job_board, get_job_board_
 from auto_application.application_tracker import ApplicationTracker
 from auto_application.form_fillers import GreenhouseFormFiller, WorkdayFormFiller, GenericFormFiller
 from job_extraction.driver_utils import create_driver, cleanup_driver, cleanup_xvfb
+from job_extraction.merge_job_details import rebuild_unified_master
 
 # Configure logging
 logging.basicConfig(
@@ -289,10 +290,11 @@ def main():
     
     args = parser.parse_args()
 
-    # Resolve CSV path: explicit arg → unified master → error
+    # Resolve CSV path: explicit arg → unified master (exported from the job
+    # store / brought up to date on demand) → error
     csv_file = args.csv_file
     if not csv_file:
-        csv_file = str(UNIFIED_MASTER_CSV)
+        csv_file = rebuild_unified_master() or str(UNIFIED_MASTER_CSV)
         if not os.path.exists(csv_file):
             logging.error(
                 "No --csv_file provided and unified master CSV not found at %s. "
@@ -18,8 +18,14 @@ Output per job:
 The file follows the same schema as the base resume components JSON
 so it can be loaded by ResumeComponentsLoader for form-filling.
 
-Also appends an ``optimized_resume_path`` column to the master
-aggregated CSV so the auto-apply pipeline knows which resume to use.
+When the master input index exists, each output's ``_optimised_for``
+block lists the index inputs the JD asks for, split by the shared resume
+coverage (see ``alignment_scorer.resume_coverage``) into resume,
+supplementary-only and gap.
+
+Also records an ``optimized_resume_path`` per job (job store ``resumes``
+side table, joined into the unified master) so the auto-apply pipeline
+knows which resume to use.
 """
 
 import argparse
@@ -31,12 +37,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import re
 from collections import Counter
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 import pandas as pd
 
-from paths import master_aggregated_csv, OPTIMIZED_RESUMES_DIR, USER_CONFIG_JSON, UNIFIED_MASTER_CSV
+from paths import master_aggregated_csv, MASTER_INPUT_INDEX, OPTIMIZED_RESUMES_DIR, USER_CONFIG_JSON, UNIFIED_MASTER_CSV
+from artifact_io import artifact_lock, write_csv, write_json
+from job_extraction.alignment_scorer import resume_coverage, text_matcher_for
+from job_extraction.job_store import JobStore
+from job_extraction.near_duplicates import NearDuplicateIndex
 
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +57,9 @@ DEFAULT_MODEL = "gpt-4o-mini"
 
 OPTIMIZED_DIR = OPTIMIZED_RESUMES_DIR
 
+# Columns projected from the job store
+RESUME_JOB_COLUMNS = ["job_url", "job_title", "company", "company_title", "description", "application_url"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Helpers
@@ -64,9 +76,7 @@ def _load_json(path: str) -> dict:
 
 
 def _save_json(path: str, data: dict) -> None:
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2, ensure_ascii=False)
+    write_json(path, data)
 
 
 def _extract_jd_keywords(description: str) -> List[str]:
@@ -234,29 +244,34 @@ def run_resume_optimisation(
     """
     Batch-optimise resumes for every job with a description in a master CSV.
 
-    Resolution order for the source CSV:
+    Resolution order for the source:
       1. Explicit *csv_path* argument (e.g. the unified master).
-      2. Per-title master aggregated CSV derived from *job_title*.
-      3. Unified master CSV as a last-resort fallback.
+      2. The job store (only the columns used here).
+      3. Per-title master aggregated CSV derived from *job_title*.
+      4. Unified master CSV as a last-resort fallback.
 
     Returns the number of new optimised resumes generated this run.
     """
     jt_clean = job_title.lower().replace(" ", "_")
 
-    # ── locate master CSV ─────────────────────────────────────────────────
+    # ── locate jobs: explicit CSV → job store → master CSV ────────────────
+    store = JobStore()
+    master_csv_path = None
     if csv_path and os.path.exists(csv_path):
         master_csv_path = csv_path
-    else:
+    elif not store.has(jt_clean):
         master_csv_path = str(master_aggregated_csv(jt_clean))
         if not os.path.exists(master_csv_path):
             # Fallback to unified master
             master_csv_path = str(UNIFIED_MASTER_CSV)
 
-    if not os.path.exists(master_csv_path):
+    if master_csv_path is None:
+        df = store.read(jt_clean, columns=RESUME_JOB_COLUMNS, side=False)
+    elif not os.path.exists(master_csv_path):
         logging.warning("No master CSV found (tried per-title and unified): %s", master_csv_path)
         return 0
-
-    df = pd.read_csv(master_csv_path)
+    else:
+        df = pd.read_csv(master_csv_path)
     if df.empty:
         logging.warning("Master aggregated CSV is empty.")
         return 0
@@ -279,6 +294,18 @@ def run_resume_optimisation(
     base_resume = _load_json(resume_components_path)
     logging.info("Loaded base resume from %s", resume_components_path)
 
+    # ── resume coverage of the master input index (shared with scoring) ───
+    coverage = text_matcher = index_inputs = None
+    if MASTER_INPUT_INDEX.exists():
+        try:
+            index = json.loads(MASTER_INPUT_INDEX.read_text(encoding="utf-8"))
+            index_inputs = index.get("inputs", [])
+            text_matcher = text_matcher_for(index)
+            coverage = resume_coverage(index, text_matcher=text_matcher)
+        except Exception as exc:
+            logging.warning("Resume coverage unavailable (%s); optimising without it.", exc)
+            coverage = None
+
     # ── determine LLM availability ────────────────────────────────────────
     use_llm = bool(os.environ.get("OPENAI_API_KEY"))
     if use_llm:
@@ -319,11 +346,27 @@ def run_resume_optimisation(
         logging.info("Resume Optimiser: all eligible jobs already optimised – nothing to do.")
         return 0
 
+    # ── near-duplicates: one resume per repost cluster ────────────────────
+    count = 0
+    url_to_path: Dict[str, str] = dict(tracker_data.get("url_to_path", {}))
+    dup_index = NearDuplicateIndex()
+    copies = eligible
+    if url_to_path:
+        # Reposts of an already-optimised job reuse its resume
+        done_clusters = dict(zip(dup_index.cluster_ids(url_to_path), url_to_path.values()))
+        clusters = dup_index.cluster_ids(eligible["job_url"]).set_axis(eligible.index)
+        reused = clusters.map(done_clusters).dropna()
+        for job_url, path in zip(eligible.loc[reused.index, "job_url"].astype(str), reused):
+            optimised_urls.add(job_url)
+            url_to_path[job_url] = path
+        if len(reused):
+            logging.info("Resume Optimiser: %d reposted jobs reuse an existing resume.", len(reused))
+        copies = eligible.drop(index=reused.index)
+    eligible = dup_index.representatives(copies)
+
     logging.info("Resume Optimiser: %d new jobs to optimise.", len(eligible))
 
     # ── optimise ──────────────────────────────────────────────────────────
-    count = 0
-    url_to_path: Dict[str, str] = dict(tracker_data.get("url_to_path", {}))
 
     for _, row in eligible.iterrows():
         company = str(row.get("company", row.get("company_title", "unknown"))).strip()
@@ -351,6 +394,10 @@ def run_resume_optimisation(
                 "optimised_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "method": "llm" if use_llm and "jd_alignment_notes" in opt and opt["jd_alignment_notes"].get("method") != "keyword_match_fallback" else "keyword_match",
             }
+            if coverage is not None:
+                # Index inputs this JD asks for: already on the resume, only in
+                # supplementary terms (worth surfacing), or missing
+                opt["_optimised_for"]["index_coverage"] = coverage.for_jd(description, text_matcher, index_inputs)
 
             fname = f"{_sanitize(company)}_{_sanitize(title)}_{datetime.now().strftime('%Y%m%d')}.json"
             out_path = OPTIMIZED_DIR / fname
@@ -364,24 +411,54 @@ def run_resume_optimisation(
         except Exception as exc:
             logging.error("  Failed to optimise for %s @ %s: %s", title, company, exc)
 
+    # Copies in the same cluster share the representative's resume
+    if len(copies) > len(eligible):
+        done = [url for url in eligible["job_url"].astype(str) if url in url_to_path]
+        rep_paths = dict(zip(dup_index.cluster_ids(done), (url_to_path[url] for url in done)))
+        for job_url, cluster in zip(copies["job_url"].astype(str), dup_index.cluster_ids(copies["job_url"])):
+            if job_url not in url_to_path and cluster in rep_paths:
+                optimised_urls.add(job_url)
+                url_to_path[job_url] = rep_paths[cluster]
+
     # ── persist tracker ───────────────────────────────────────────────────
-    _save_json(str(tracker_path), {
-        "urls": sorted(optimised_urls),
-        "url_to_path": url_to_path,
-        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    })
+    with artifact_lock(tracker_path):
+        # A concurrent run may have saved its own resumes since we loaded
+        if tracker_path.exists():
+            try:
+                latest = _load_json(str(tracker_path))
+                optimised_urls.update(latest.get("urls", []))
+                url_to_path = {**latest.get("url_to_path", {}), **url_to_path}
+            except Exception as exc:
+                logging.warning("Could not re-read tracker %s: %s", tracker_path, exc)
+        _save_json(str(tracker_path), {
+            "urls": sorted(optimised_urls),
+            "url_to_path": url_to_path,
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
+    # ── record optimized_resume_path (side table, or the explicit CSV) ────
+    if master_csv_path is None:
+        try:
+            store.write_side("resumes", jt_clean, pd.DataFrame({
+                "job_url": list(url_to_path.keys()),
+                "optimized_resume_path": list(url_to_path.values()),
+            }))
+        except Exception as exc:
+            logging.warning("Could not update job store: %s", exc)
+        logging.info("Resume Optimiser: %d new resumes generated.", count)
+        return count
 
-    # ── update master CSV with optimized_resume_path column ───────────────
     try:
-        master_df = pd.read_csv(master_csv_path)
-        if "optimized_resume_path" not in master_df.columns:
-            master_df["optimized_resume_path"] = ""
+        with artifact_lock(master_csv_path):
+            master_df = pd.read_csv(master_csv_path)
+            if "optimized_resume_path" not in master_df.columns:
+                master_df["optimized_resume_path"] = ""
 
-        for url, path in url_to_path.items():
-            mask = master_df["job_url"].astype(str) == url
-            master_df.loc[mask, "optimized_resume_path"] = path
+            for url, path in url_to_path.items():
+                mask = master_df["job_url"].astype(str) == url
+                master_df.loc[mask, "optimized_resume_path"] = path
 
-        master_df.to_csv(master_csv_path, index=False)
+            write_csv(master_df, master_csv_path, index=False)
         logging.info("Updated master CSV with optimized_resume_path column.")
     except Exception as exc:
         logging.warning("Could not update master CSV: %s", exc)
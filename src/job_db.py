@@ -0,0 +1,692 @@
+"""
+Job Database
+════════════
+SQLite system of record for job state that used to be spread over CSV
+logs and JSON trackers (``applications.csv``, ``jobs_ran.csv``, the
+metrics CSVs and the processed-URL JSON files).
+
+Tables:
+  • jobs          one row per (search_title, job_url) – card fields,
+                  LinkedIn job ID, company+title dedup key, extraction date
+  • details       one row per job_url – description, days_since_posted,
+                  application_url (shared by every title that found it)
+  • scores        alignment score / grade / top gaps per (search_title, job_url)
+  • applications  every auto-apply attempt
+  • runs          search runs and pipeline runs (with their parameters);
+                  append-only – one INSERT per run
+  • run_rollups   per-day run totals that old runs are compacted into
+  • processed     per-stage "already handled" job URLs (NLP stages)
+
+Indexed on job ID, the company+title key, extraction date and job URL, so
+"already applied?", "already processed?" and "already known?" are index
+lookups instead of whole-file scans.
+
+The database runs in WAL mode (concurrent readers alongside one writer)
+and hands out connections from a small per-file pool, so worker threads
+can share it.  Legacy CSV logs are imported once when the database is
+created.
+
+Usage:
+    db = get_job_db()
+    db.upsert_jobs("marketing_analytics", master_df)
+    if not db.is_already_applied(job_url):
+        ...
+    db.log_application({...})
+
+CLI:
+    python src/job_db.py                      # table row counts
+    python src/job_db.py --export runs --out runs.csv
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+import pandas as pd
+
+from job_extraction.utils import extract_linkedin_job_id
+from paths import APPLICATIONS_CSV, JOB_DB, JOBS_RAN_CSV, METRICS_DIR
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+DEFAULT_POOL_SIZE = 4
+BUSY_TIMEOUT_S = 30
+# SQLite's default host-parameter limit is 999; stay well below it
+_CHUNK = 500
+# Runs older than this are folded into run_rollups, every COMPACT_EVERY runs
+RUN_RETENTION_DAYS = 90
+COMPACT_EVERY = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    search_title      TEXT NOT NULL,
+    job_url           TEXT NOT NULL,
+    job_id            TEXT,
+    job_title         TEXT,
+    company           TEXT,
+    location          TEXT,
+    salary_range      TEXT,
+    job_type          TEXT,
+    company_title_key TEXT,
+    date_extracted    TEXT,
+    updated_at        TEXT NOT NULL,
+    PRIMARY KEY (search_title, job_url)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_job_id        ON jobs (job_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_job_url       ON jobs (job_url);
+CREATE INDEX IF NOT EXISTS idx_jobs_company_title ON jobs (search_title, company_title_key);
+CREATE INDEX IF NOT EXISTS idx_jobs_date          ON jobs (search_title, date_extracted);
+
+CREATE TABLE IF NOT EXISTS details (
+    job_url           TEXT PRIMARY KEY,
+    job_id            TEXT,
+    description       TEXT,
+    days_since_posted REAL,
+    application_url   TEXT,
+    updated_at        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_details_job_id ON details (job_id);
+
+CREATE TABLE IF NOT EXISTS scores (
+    search_title    TEXT NOT NULL,
+    job_url         TEXT NOT NULL,
+    alignment_score REAL,
+    alignment_grade TEXT,
+    top_gaps        TEXT,
+    scored_at       TEXT NOT NULL,
+    PRIMARY KEY (search_title, job_url)
+);
+
+CREATE TABLE IF NOT EXISTS applications (
+    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp      TEXT NOT NULL,
+    job_id         TEXT,
+    job_title      TEXT,
+    company        TEXT,
+    job_url        TEXT,
+    job_board_type TEXT,
+    status         TEXT,
+    submitted      TEXT,
+    message        TEXT,
+    error          TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applications_job_url   ON applications (job_url);
+CREATE INDEX IF NOT EXISTS idx_applications_job_id    ON applications (job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_timestamp ON applications (timestamp);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id       TEXT PRIMARY KEY,
+    kind         TEXT NOT NULL,
+    date_of_run  TEXT NOT NULL,
+    job_title    TEXT,
+    status       TEXT,
+    total_jobs   INTEGER,
+    salary_range TEXT,
+    job_type     TEXT,
+    search_type  TEXT,
+    geography    TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_title_date ON runs (job_title, date_of_run);
+CREATE INDEX IF NOT EXISTS idx_runs_date       ON runs (date_of_run);
+
+CREATE TABLE IF NOT EXISTS run_rollups (
+    kind         TEXT NOT NULL,
+    job_title    TEXT NOT NULL,
+    day          TEXT NOT NULL,
+    runs         INTEGER NOT NULL,
+    total_jobs   INTEGER NOT NULL,
+    first_run    TEXT NOT NULL,
+    last_run     TEXT NOT NULL,
+    PRIMARY KEY (kind, job_title, day)
+);
+
+CREATE TABLE IF NOT EXISTS processed (
+    stage        TEXT NOT NULL,
+    scope        TEXT NOT NULL DEFAULT '',
+    job_url      TEXT NOT NULL,
+    processed_at TEXT NOT NULL,
+    PRIMARY KEY (stage, scope, job_url)
+);
+"""
+
+APPLICATION_COLUMNS = [
+    "timestamp", "job_id", "job_title", "company", "job_url",
+    "job_board_type", "status", "submitted", "message", "error",
+]
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _clean(value: Any) -> Any:
+    """SQLite-ready scalar: NaN / blank / ``"nan"`` → None, numpy → Python."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, str):
+        value = value.strip()
+        if not value or value.lower() == "nan":
+            return None
+    return value
+
+
+def _column(df: pd.DataFrame, *names: str) -> pd.Series:
+    """First of *names* present in *df* (all-None when none is)."""
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def _chunks(values: Sequence[Any], size: int = _CHUNK) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Connection pool
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class ConnectionPool:
+    """Bounded pool of WAL-mode connections to one SQLite file."""
+
+    def __init__(self, path: str, size: int = DEFAULT_POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_S, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_S * 1000}")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection (waits when all *size* are in use)."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            conn = self._connect() if create else self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Job database
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class JobDB:
+    """Typed access to the job database (see module docstring for tables)."""
+
+    def __init__(self, path: Optional[str] = None, pool_size: int = DEFAULT_POOL_SIZE):
+        self.path = str(path or JOB_DB)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        created = not os.path.exists(self.path)
+        self.pool = ConnectionPool(self.path, pool_size)
+        with self.transaction() as conn:
+            conn.executescript(SCHEMA)
+        if created:
+            self._import_legacy()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Pooled connection inside one transaction (commit, or rollback on error)."""
+        with self.pool.connection() as conn:
+            with conn:
+                yield conn
+
+    def frame(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        with self.pool.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=list(params))
+
+    def table_counts(self) -> Dict[str, int]:
+        tables = ["jobs", "details", "scores", "applications", "runs", "run_rollups", "processed"]
+        with self.pool.connection() as conn:
+            return {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in tables}
+
+    # ── jobs / details / scores ───────────────────────────────────────────
+
+    def upsert_jobs(self, search_title: str, df: pd.DataFrame) -> int:
+        """Insert or refresh *df*'s jobs under *search_title*; returns rows new to the title.
+
+        Card fields already stored are only replaced by non-empty values.
+        """
+        if df is None or df.empty or "job_url" not in df.columns:
+            return 0
+        urls = df["job_url"].astype(str)
+        company = _column(df, "company_title", "company", "company_name").map(_clean)
+        title = _column(df, "job_title", "job_title_collected").map(_clean)
+        now = _now()
+        rows = [
+            (search_title, url, extract_linkedin_job_id(url), jt, co, _clean(loc), _clean(sal), _clean(jtype),
+             f"{co}|{jt}" if co and jt else None, _clean(date), now)
+            for url, jt, co, loc, sal, jtype, date in zip(
+                urls, title, company, _column(df, "location"), _column(df, "salary_range"),
+                _column(df, "job_type"), _column(df, "date_extracted", "date_of_collection"),
+            )
+        ]
+        with self.transaction() as conn:
+            before = conn.execute("SELECT COUNT(*) FROM jobs WHERE search_title = ?", (search_title,)).fetchone()[0]
+            conn.executemany(
+                """
+                INSERT INTO jobs (search_title, job_url, job_id, job_title, company, location,
+                                  salary_range, job_type, company_title_key, date_extracted, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (search_title, job_url) DO UPDATE SET
+                    job_id            = COALESCE(excluded.job_id, jobs.job_id),
+                    job_title         = COALESCE(excluded.job_title, jobs.job_title),
+                    company           = COALESCE(excluded.company, jobs.company),
+                    location          = COALESCE(excluded.location, jobs.location),
+                    salary_range      = COALESCE(excluded.salary_range, jobs.salary_range),
+                    job_type          = COALESCE(excluded.job_type, jobs.job_type),
+                    company_title_key = COALESCE(excluded.company_title_key, jobs.company_title_key),
+                    date_extracted    = COALESCE(jobs.date_extracted, excluded.date_extracted),
+                    updated_at        = excluded.updated_at
+                """,
+                rows,
+            )
+            after = conn.execute("SELECT COUNT(*) FROM jobs WHERE search_title = ?", (search_title,)).fetchone()[0]
+        return after - before
+
+    def upsert_details(self, df: pd.DataFrame) -> int:
+        """Fill-missing upsert of description / days_since_posted / application_url.
+
+        A value already stored is never overwritten (same rule as
+        ``job_upsert``).  Rows without any detail value are skipped.
+        """
+        if df is None or df.empty or "job_url" not in df.columns:
+            return 0
+        now = _now()
+        rows = []
+        for url, desc, days, apply_url in zip(
+            df["job_url"].astype(str), _column(df, "description"),
+            _column(df, "days_since_posted"), _column(df, "application_url"),
+        ):
+            desc, days, apply_url = _clean(desc), _clean(days), _clean(apply_url)
+            if desc is None and days is None and apply_url is None:
+                continue
+            try:
+                days = float(days) if days is not None else None
+            except (TypeError, ValueError):
+                days = None
+            rows.append((url, extract_linkedin_job_id(url), desc, days, apply_url, now))
+        if not rows:
+            return 0
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO details (job_url, job_id, description, days_since_posted, application_url, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (job_url) DO UPDATE SET
+                    description       = COALESCE(details.description, excluded.description),
+                    days_since_posted = COALESCE(details.days_since_posted, excluded.days_since_posted),
+                    application_url   = COALESCE(details.application_url, excluded.application_url),
+                    updated_at        = excluded.updated_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def details_for(self, urls: Iterable[str]) -> pd.DataFrame:
+        """Stored details for *urls* (indexed lookup, any title)."""
+        urls = list(dict.fromkeys(str(u) for u in urls))
+        frames = [
+            self.frame(
+                "SELECT job_url, description, days_since_posted, application_url FROM details "
+                f"WHERE job_url IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for chunk in _chunks(urls)
+        ]
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=["job_url", "description", "days_since_posted", "application_url"])
+        return pd.concat(frames, ignore_index=True)
+
+    def job_count(self, search_title: str) -> int:
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs WHERE search_title = ?", (search_title,)).fetchone()[0]
+
+    def known_urls(self, search_title: str, urls: Iterable[str]) -> Set[str]:
+        """The subset of *urls* already stored under *search_title*."""
+        urls = list(dict.fromkeys(str(u) for u in urls))
+        known: Set[str] = set()
+        with self.pool.connection() as conn:
+            for chunk in _chunks(urls):
+                known.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT job_url FROM jobs WHERE search_title = ? "
+                        f"AND job_url IN ({','.join('?' * len(chunk))})",
+                        [search_title, *chunk],
+                    )
+                )
+        return known
+
+    def upsert_scores(self, search_title: str, df: pd.DataFrame) -> int:
+        if df is None or df.empty:
+            return 0
+        now = _now()
+        rows = [
+            (search_title, str(url), _clean(score), _clean(grade), _clean(gaps), now)
+            for url, score, grade, gaps in zip(
+                df["job_url"], _column(df, "alignment_score"),
+                _column(df, "alignment_grade"), _column(df, "top_gaps"),
+            )
+        ]
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO scores (search_title, job_url, alignment_score, alignment_grade, top_gaps, scored_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (search_title, job_url) DO UPDATE SET
+                    alignment_score = excluded.alignment_score,
+                    alignment_grade = excluded.alignment_grade,
+                    top_gaps        = excluded.top_gaps,
+                    scored_at       = excluded.scored_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    # ── applications ──────────────────────────────────────────────────────
+
+    def log_application(self, row: Dict[str, Any]) -> None:
+        values = [_clean(row.get(col)) for col in APPLICATION_COLUMNS]
+        values[0] = values[0] or _now()
+        with self.transaction() as conn:
+            conn.execute(
+                f"INSERT INTO applications ({', '.join(APPLICATION_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(APPLICATION_COLUMNS))})",
+                values,
+            )
+
+    def is_already_applied(self, job_url: str, job_id: Optional[str] = None) -> bool:
+        """True when a successful or submitted application exists for the URL / job ID."""
+        with self.pool.connection() as conn:
+            for column, value in (("job_url", job_url), ("job_id", job_id)):
+                value = _clean(value)
+                if value is None:
+                    continue
+                hit = conn.execute(
+                    f"SELECT 1 FROM applications WHERE {column} = ? "
+                    "AND (LOWER(status) = 'success' OR LOWER(submitted) = 'yes') LIMIT 1",
+                    (str(value),),
+                ).fetchone()
+                if hit:
+                    return True
+        return False
+
+    def application_stats(self) -> Dict[str, int]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(status = 'success'), 0),
+                       COALESCE(SUM(status = 'failed'), 0),
+                       COALESCE(SUM(submitted = 'yes'), 0)
+                FROM applications
+                """
+            ).fetchone()
+        return {"total": row[0], "successful": row[1], "failed": row[2], "submitted": row[3]}
+
+    # ── runs ──────────────────────────────────────────────────────────────
+
+    def record_run(
+        self,
+        kind: str,
+        job_title: Optional[str],
+        status: Optional[str] = None,
+        run_id: Optional[str] = None,
+        date_of_run: Optional[str] = None,
+        **params: Any,
+    ) -> str:
+        """Record a run (``kind`` is e.g. ``"search"`` or ``"pipeline"``); returns its ID."""
+        run_id = run_id or str(uuid.uuid4())
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT OR REPLACE INTO runs (run_id, kind, date_of_run, job_title, status, total_jobs,
+                                             salary_range, job_type, search_type, geography)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    run_id, kind, date_of_run or _now(), job_title, status,
+                    _clean(params.get("total_jobs")), _clean(params.get("salary_range")),
+                    _clean(params.get("job_type")), _clean(params.get("search_type")),
+                    _clean(params.get("geography")),
+                ),
+            )
+        if cursor.lastrowid and cursor.lastrowid % COMPACT_EVERY == 0:
+            self.compact_runs()
+        return run_id
+
+    def compact_runs(self, older_than_days: int = RUN_RETENTION_DAYS) -> int:
+        """Fold runs older than *older_than_days* into per-day ``run_rollups``; returns runs folded."""
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime("%Y-%m-%d %H:%M:%S")
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO run_rollups (kind, job_title, day, runs, total_jobs, first_run, last_run)
+                SELECT kind, COALESCE(job_title, ''), substr(date_of_run, 1, 10), COUNT(*),
+                       SUM(COALESCE(total_jobs, 0)), MIN(date_of_run), MAX(date_of_run)
+                FROM runs WHERE date_of_run < ?
+                GROUP BY kind, COALESCE(job_title, ''), substr(date_of_run, 1, 10)
+                ON CONFLICT (kind, job_title, day) DO UPDATE SET
+                    runs       = runs + excluded.runs,
+                    total_jobs = total_jobs + excluded.total_jobs,
+                    first_run  = MIN(first_run, excluded.first_run),
+                    last_run   = MAX(last_run, excluded.last_run)
+                """,
+                (cutoff,),
+            )
+            folded = conn.execute("DELETE FROM runs WHERE date_of_run < ?", (cutoff,)).rowcount
+        if folded:
+            logging.info(f"Compacted {folded} runs older than {older_than_days} days into run_rollups")
+        return folded
+
+    def run_rollup(self, kind: str = "search", job_title: Optional[str] = None) -> pd.DataFrame:
+        """Per-title run totals (runs, jobs, average, first / last run) over live and compacted runs."""
+        title_clause = "AND job_title = ?" if job_title else ""
+        params: List[Any] = [kind, job_title, kind, job_title] if job_title else [kind, kind]
+        df = self.frame(
+            f"""
+            SELECT job_title, SUM(runs) AS runs, SUM(total_jobs) AS total_jobs,
+                   MIN(first_run) AS first_run, MAX(last_run) AS last_run
+            FROM (
+                SELECT COALESCE(job_title, '') AS job_title, COUNT(*) AS runs,
+                       SUM(COALESCE(total_jobs, 0)) AS total_jobs,
+                       MIN(date_of_run) AS first_run, MAX(date_of_run) AS last_run
+                FROM runs WHERE kind = ? {title_clause}
+                GROUP BY COALESCE(job_title, '')
+                UNION ALL
+                SELECT job_title, runs, total_jobs, first_run, last_run
+                FROM run_rollups WHERE kind = ? {title_clause}
+            )
+            GROUP BY job_title ORDER BY job_title
+            """,
+            params,
+        )
+        df["avg_jobs"] = (df["total_jobs"] / df["runs"]).round(1)
+        return df
+
+    def runs(self, job_title: Optional[str] = None, kind: Optional[str] = None) -> pd.DataFrame:
+        clauses, params = [], []
+        if job_title:
+            clauses.append("job_title = ?")
+            params.append(job_title)
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.frame(f"SELECT * FROM runs {where} ORDER BY date_of_run", params)
+
+    # ── processed-URL trackers ────────────────────────────────────────────
+
+    def unprocessed(
+        self,
+        stage: str,
+        urls: Iterable[str],
+        scope: str = "",
+        legacy_json: Optional[str] = None,
+    ) -> List[str]:
+        """The subset of *urls* not yet marked processed for (*stage*, *scope*).
+
+        *legacy_json* (a ``{"urls": [...]}`` tracker) is imported the first
+        time the stage/scope is used.
+        """
+        if legacy_json:
+            self._import_processed_json(stage, scope, legacy_json)
+        urls = list(dict.fromkeys(str(u) for u in urls))
+        done: Set[str] = set()
+        with self.pool.connection() as conn:
+            for chunk in _chunks(urls):
+                done.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT job_url FROM processed WHERE stage = ? AND scope = ? "
+                        f"AND job_url IN ({','.join('?' * len(chunk))})",
+                        [stage, scope, *chunk],
+                    )
+                )
+        return [u for u in urls if u not in done]
+
+    def mark_processed(self, stage: str, urls: Iterable[str], scope: str = "") -> int:
+        now = _now()
+        rows = [(stage, scope, str(u), now) for u in dict.fromkeys(urls)]
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO processed (stage, scope, job_url, processed_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def processed_count(self, stage: str, scope: str = "") -> int:
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM processed WHERE stage = ? AND scope = ?", (stage, scope)
+            ).fetchone()[0]
+
+    # ── legacy import ─────────────────────────────────────────────────────
+
+    def _import_processed_json(self, stage: str, scope: str, path: str) -> None:
+        if not os.path.exists(path) or self.processed_count(stage, scope):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                urls = json.load(f).get("urls", [])
+        except Exception as e:
+            logging.warning(f"Could not import processed-URL tracker {path}: {e}")
+            return
+        if urls:
+            self.mark_processed(stage, urls, scope)
+            logging.info(f"Imported {len(urls)} processed URLs for '{stage}' from {path}")
+
+    def _import_legacy(self) -> None:
+        """One-off import of the CSV logs this database replaces."""
+        try:
+            if APPLICATIONS_CSV.exists():
+                apps = pd.read_csv(APPLICATIONS_CSV, dtype=str)
+                with self.transaction() as conn:
+                    conn.executemany(
+                        f"INSERT INTO applications ({', '.join(APPLICATION_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(APPLICATION_COLUMNS))})",
+                        [[_clean(r.get(c)) for c in APPLICATION_COLUMNS] for r in apps.to_dict("records")],
+                    )
+                logging.info(f"Imported {len(apps)} applications from {APPLICATIONS_CSV}")
+            if JOBS_RAN_CSV.exists():
+                ran = pd.read_csv(JOBS_RAN_CSV, dtype=str)
+                for r in ran.to_dict("records"):
+                    self.record_run("pipeline", _clean(r.get("job_keyword")), _clean(r.get("search_status")),
+                                    date_of_run=_clean(r.get("timestamp")))
+                logging.info(f"Imported {len(ran)} runs from {JOBS_RAN_CSV}")
+            for path in glob.glob(str(METRICS_DIR / "*_job_run_metrics.csv")):
+                for r in pd.read_csv(path, dtype=str).to_dict("records"):
+                    self.record_run(
+                        "search", _clean(r.get("job_title")), "completed",
+                        run_id=_clean(r.get("run_id")), date_of_run=_clean(r.get("date_of_run")),
+                        total_jobs=_clean(r.get("total_jobs_collected")), salary_range=r.get("salary_range"),
+                        job_type=r.get("job_type_setting"), search_type=r.get("search_type"),
+                        geography=r.get("geography"),
+                    )
+        except Exception as e:
+            logging.warning(f"Legacy import into {self.path} incomplete: {e}")
+
+
+_DBS: Dict[str, JobDB] = {}
+_DBS_LOCK = threading.Lock()
+
+
+def get_job_db(path: Optional[str] = None) -> JobDB:
+    """Shared ``JobDB`` (and connection pool) per database file in this process."""
+    key = os.path.abspath(str(path or JOB_DB))
+    with _DBS_LOCK:
+        if key not in _DBS:
+            _DBS[key] = JobDB(key)
+        return _DBS[key]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or export the job database.")
+    parser.add_argument("--db", default=None, help=f"Database file (default: {JOB_DB}).")
+    parser.add_argument("--export", choices=["jobs", "details", "scores", "applications", "runs", "run_rollups",
+                                             "processed"],
+                        default=None, help="Export one table to CSV.")
+    parser.add_argument("--out", default=None, help="CSV path for --export (default: <table>.csv).")
+    args = parser.parse_args()
+
+    db = get_job_db(args.db)
+    if args.export:
+        out = args.out or f"{args.export}.csv"
+        df = db.frame(f"SELECT * FROM {args.export}")
+        df.to_csv(out, index=False)
+        print(f"Exported {len(df)} rows from {args.export} to {out}")
+        return
+    for table, count in db.table_counts().items():
+        print(f"{table:<14}{count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Aho-Corasick
+════════════
+Pure-Python multi-pattern substring matcher.  All patterns are compiled
+into one automaton (a trie plus failure links), so a single pass over a
+text reports every pattern it contains – the cost is linear in the text
+length plus the number of hits, however many patterns there are.
+
+Each pattern carries a value (e.g. the position of an index input); a
+search returns the set of values whose pattern occurs in the text.
+Matching is plain substring containment, the same as ``pattern in text``;
+normalise case before building and searching.
+
+Usage:
+    automaton = AhoCorasick([("sql", 0), ("python", 1), ("a/b testing", 2)])
+    automaton.find("python and sql")          # {0, 1}
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+class AhoCorasick:
+    """Compiled automaton over (pattern, value) pairs."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[Tuple[Hashable, ...]] = [()]
+        self.patterns = 0
+        for pattern, value in patterns:
+            if pattern:
+                self._add(pattern, value)
+        self._fail = [0] * len(self._goto)
+        self._link()
+
+    def __len__(self) -> int:
+        return self.patterns
+
+    @property
+    def states(self) -> int:
+        return len(self._goto)
+
+    def _add(self, pattern: str, value: Hashable) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._out.append(())
+            node = nxt
+        if value not in self._out[node]:
+            self._out[node] += (value,)
+            self.patterns += 1
+
+    def _link(self) -> None:
+        """Breadth-first failure links; each state inherits its fallback's outputs."""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fallback = goto[f].get(ch, 0)
+                fail[child] = fallback
+                if out[fallback]:
+                    out[child] += out[fallback]
+
+    def find(self, text: str) -> Set[Hashable]:
+        """Values of every pattern occurring in *text*."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[Hashable] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
@@ -8,14 +8,20 @@ Produces:
   • Per-job alignment score (0–1) + letter grade
   • Matched inputs (from resume and supplementary terms)
   • Gap analysis (missing high-weight inputs)
-  • Per-title CSV + JSON reports
-  • Columns appended to the master aggregated CSV
+  • Per-title CSV reports + an append-only JSONL of per-job details
+  • Score columns in the job store's ``scores`` side table (or appended
+    to an explicitly passed CSV)
+
+Jobs are scored in one batch (``job_extraction.batch_scorer``): a sparse
+jobs × inputs matrix and vectorised weights, identical to scoring each
+job with ``score_single_job``.
 
 Usage:
     from job_extraction.alignment_scorer import score_all_jobs
     score_all_jobs(index, job_title)
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -34,6 +40,7 @@ from paths import (
     ALIGNMENT_SCORES_DIR,
     BASE_RESUME_DIR,
     MASTER_INPUT_INDEX,
+    RESUME_COVERAGE_JSON,
     SUPPLEMENTARY_TERMS,
     UNIFIED_MASTER_CSV,
     USER_CONFIG_JSON,
@@ -41,7 +48,13 @@ from paths import (
     master_aggregated_csv,
 )
 from job_extraction.jd_term_extractor import IndexMatcher, infer_seniority
+from job_extraction.aho_corasick import AhoCorasick
 from job_extraction.input_deduplicator import InputDeduplicator
+from job_extraction.job_store import JobStore
+from job_extraction.near_duplicates import NearDuplicateIndex
+from job_extraction.score_cache import ScoreCache
+from artifact_io import artifact_lock, write_csv, write_json
+from job_db import get_job_db
 
 logging.basicConfig(
     level=logging.INFO,
@@ -183,32 +196,232 @@ def _load_supplementary_terms() -> List[Dict[str, Any]]:
 
 
 class TextMatcher:
-    """Check whether an input (or its aliases) appears in a body of text."""
+    """Check whether index inputs (or their lemmas / aliases) appear in a body of text.
+
+    ``compile(inputs)`` builds one Aho-Corasick automaton over every term,
+    lemma and alias, so ``present(text)`` finds all inputs in a single pass
+    over the text instead of one substring scan per input and alias.
+    """
 
-    def __init__(self):
+    _MEMO_SIZE = 4
+
+    def __init__(self, inputs: Optional[List[Dict[str, Any]]] = None):
         self.deduper = InputDeduplicator()
+        self._inputs: Optional[List[Dict[str, Any]]] = None
+        self._automaton: Optional[AhoCorasick] = None
+        self._memo: Dict[int, Tuple[str, Set[int]]] = {}
+        if inputs is not None:
+            self.compile(inputs)
+
+    def patterns(self, inp: Dict[str, Any]) -> List[str]:
+        """Lowercased term, its lemma and aliases – the strings that count as a match."""
+        term = inp.get("input", "").lower().strip()
+        out = [term, self.deduper.lemmatise(term)]
+        out.extend(alias.lower().strip() for alias in inp.get("aliases", []))
+        return [p for p in dict.fromkeys(out) if p]
+
+    def compile(self, inputs: List[Dict[str, Any]]) -> None:
+        """Build the automaton for *inputs* (no-op if already built for this list)."""
+        if inputs is self._inputs:
+            return
+        self._automaton = AhoCorasick(
+            (pattern, pos) for pos, inp in enumerate(inputs) for pattern in self.patterns(inp)
+        )
+        self._inputs = inputs
+        self._memo.clear()
+        logging.info(
+            "Compiled text matcher: %d patterns for %d inputs (%d states).",
+            len(self._automaton), len(inputs), self._automaton.states,
+        )
+
+    def present(self, text: str, inputs: Optional[List[Dict[str, Any]]] = None) -> Set[int]:
+        """Positions (in the compiled inputs) of every input found in *text*."""
+        if inputs is not None:
+            self.compile(inputs)
+        if self._automaton is None:
+            raise ValueError("TextMatcher.present() needs compiled inputs")
+        # The resume is searched once per job; remember the last few texts by identity
+        cached = self._memo.get(id(text))
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        hits = self._automaton.find(text.lower())
+        if len(self._memo) >= self._MEMO_SIZE:
+            self._memo.clear()
+        self._memo[id(text)] = (text, hits)
+        return hits
 
     def matches(self, inp: Dict[str, Any], text: str) -> bool:
         """Return True if the input or any alias is found in the text."""
         text_lower = text.lower()
+        return any(pattern in text_lower for pattern in self.patterns(inp))
 
-        # Check main input
-        term = inp.get("input", "").lower().strip()
-        if term and term in text_lower:
-            return True
 
-        # Check lemmatised form
-        lemma = self.deduper.lemmatise(term)
-        if lemma and lemma in text_lower:
-            return True
+_matcher_cache: Dict[Tuple[Any, ...], TextMatcher] = {}
+
+
+def text_matcher_for(index: Dict[str, Any]) -> TextMatcher:
+    """The compiled TextMatcher for this version of the index (built once per version)."""
+    meta = index.get("metadata", {})
+    inputs = index.get("inputs", [])
+    key = (meta.get("version"), meta.get("updated_at"), len(inputs))
+    matcher = _matcher_cache.get(key)
+    if matcher is None:
+        _matcher_cache.clear()
+        matcher = _matcher_cache[key] = TextMatcher()
+    # Same version re-loaded from disk is a new list: re-point without rebuilding
+    if matcher._inputs is not inputs:
+        if matcher._inputs is not None and matcher._inputs == inputs:
+            matcher._inputs = inputs
+        else:
+            matcher.compile(inputs)
+    return matcher
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Resume coverage
+# ═══════════════════════════════════════════════════════════════════════════
 
-        # Check aliases
-        for alias in inp.get("aliases", []):
-            al = alias.lower().strip()
-            if al and al in text_lower:
-                return True
+# Credit for an input the JD asks for, by how the user covers it
+RESUME_MATCH_SCORE = 1.0
+SUPPLEMENTARY_STRONG_SCORE = 0.7   # expert / advanced proficiency
+SUPPLEMENTARY_SCORE = 0.5
 
-        return False
+
+def _sha1(payload: Any) -> str:
+    raw = payload if isinstance(payload, str) else json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ResumeCoverage:
+    """How the resume covers each index input: resume, supplementary (with proficiency) or gap.
+
+    The resume, supplementary terms and index are fixed for a run, so the
+    coverage is computed once and persisted in ``resume_coverage.json``,
+    keyed by the index hash and the resume (+ supplementary terms) hash.
+    Entries follow the order of ``index["inputs"]``.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]], index_sha1: str, resume_sha1: str):
+        self.entries = entries
+        self.index_sha1 = index_sha1
+        self.resume_sha1 = resume_sha1
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def keys(inputs: List[Dict[str, Any]], resume_text: str,
+             supplementary: List[Dict[str, Any]]) -> Tuple[str, str]:
+        """(index hash, resume hash) – only what decides coverage goes in."""
+        index_sha1 = _sha1([[inp.get("input", ""), inp.get("aliases", [])] for inp in inputs])
+        resume_sha1 = _sha1({"resume": resume_text, "supplementary": supplementary})
+        return index_sha1, resume_sha1
+
+    @classmethod
+    def build(cls, inputs: List[Dict[str, Any]], resume_text: str,
+              supplementary: List[Dict[str, Any]], text_matcher: TextMatcher) -> "ResumeCoverage":
+        supp_lookup: Dict[str, Dict[str, Any]] = {}
+        for st in supplementary:
+            key = st.get("term", "").lower().strip()
+            if key:
+                supp_lookup[key] = st
+
+        in_resume = text_matcher.present(resume_text, inputs) if resume_text else set()
+        entries = []
+        for pos, inp in enumerate(inputs):
+            entry = {"id": inp.get("id"), "input": inp.get("input")}
+            if pos in in_resume:
+                entry.update(match="resume", score=RESUME_MATCH_SCORE)
+            else:
+                supp_match = supp_lookup.get(inp.get("input", "").lower())
+                if supp_match is None:
+                    supp_match = next(
+                        (supp_lookup[a.lower()] for a in inp.get("aliases", []) if a.lower() in supp_lookup), None
+                    )
+                if supp_match:
+                    proficiency = supp_match.get("proficiency", "intermediate").lower()
+                    strong = proficiency in ("expert", "advanced")
+                    entry.update(match="supplementary", proficiency=proficiency,
+                                 score=SUPPLEMENTARY_STRONG_SCORE if strong else SUPPLEMENTARY_SCORE)
+                else:
+                    entry.update(match="gap", score=0.0)
+            entries.append(entry)
+        return cls(entries, *cls.keys(inputs, resume_text, supplementary))
+
+    def summary(self) -> Dict[str, int]:
+        counts = {"resume": 0, "supplementary": 0, "gap": 0}
+        for entry in self.entries:
+            counts[entry["match"]] += 1
+        return counts
+
+    def save(self, path: Optional[str] = None) -> None:
+        write_json(path or RESUME_COVERAGE_JSON, {
+            "index_sha1": self.index_sha1,
+            "resume_sha1": self.resume_sha1,
+            "computed_at": datetime.now().isoformat(),
+            "summary": self.summary(),
+            "coverage": self.entries,
+        })
+
+    @classmethod
+    def load(cls, index_sha1: str, resume_sha1: str, path: Optional[str] = None) -> Optional["ResumeCoverage"]:
+        """The persisted coverage if it was computed for these hashes, else None."""
+        path = Path(path or RESUME_COVERAGE_JSON)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            logging.warning("Could not read resume coverage %s: %s", path, exc)
+            return None
+        if data.get("index_sha1") != index_sha1 or data.get("resume_sha1") != resume_sha1:
+            return None
+        return cls(data.get("coverage", []), index_sha1, resume_sha1)
+
+    def for_jd(self, jd_text: str, text_matcher: TextMatcher,
+               inputs: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Index inputs a JD asks for, grouped by match type."""
+        out: Dict[str, List[str]] = {"resume": [], "supplementary": [], "gap": []}
+        for pos in sorted(text_matcher.present(jd_text, inputs)):
+            entry = self.entries[pos]
+            out[entry["match"]].append(entry["input"])
+        return out
+
+
+def resume_coverage(
+    index: Optional[Dict[str, Any]] = None,
+    resume_text: Optional[str] = None,
+    supplementary: Optional[List[Dict[str, Any]]] = None,
+    text_matcher: Optional[TextMatcher] = None,
+) -> ResumeCoverage:
+    """
+    Coverage of *index* by the resume + supplementary terms, reused from
+    ``resume_coverage.json`` when the hashes match, else computed and saved.
+
+    Anything not passed is loaded (index from the master input index,
+    resume and supplementary terms from config).
+    """
+    if index is None:
+        index = json.loads(MASTER_INPUT_INDEX.read_text(encoding="utf-8"))
+    inputs = index.get("inputs", [])
+    if resume_text is None:
+        resume_text = _load_resume_text()
+    if supplementary is None:
+        supplementary = _load_supplementary_terms()
+
+    keys = ResumeCoverage.keys(inputs, resume_text, supplementary)
+    coverage = ResumeCoverage.load(*keys)
+    if coverage is not None and len(coverage) == len(inputs):
+        logging.info("Reusing resume coverage (%s).", coverage.summary())
+        return coverage
+
+    coverage = ResumeCoverage.build(inputs, resume_text, supplementary, text_matcher or text_matcher_for(index))
+    try:
+        coverage.save()
+    except Exception as exc:
+        logging.warning("Could not save resume coverage: %s", exc)
+    logging.info("Computed resume coverage (%s).", coverage.summary())
+    return coverage
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -224,30 +437,26 @@ def score_single_job(
     supplementary: List[Dict[str, Any]],
     matcher: IndexMatcher,
     text_matcher: TextMatcher,
+    coverage: Optional[ResumeCoverage] = None,
 ) -> Dict[str, Any]:
     """
     Score a single job description against the resume + supplementary terms.
 
+    With a precomputed *coverage* (see ``resume_coverage``) this is a
+    lookup per JD input and a weighted sum; without one it is built here.
+
     Returns a detailed score dict.
     """
     if not jd_text or jd_text in ("-", "nan"):
         return {"alignment_score": None, "alignment_grade": None, "error": "empty_jd"}
 
-    jd_lower = jd_text.lower()
     job_seniority = infer_seniority(job_title)
+    if coverage is None:
+        coverage = ResumeCoverage.build(inputs, resume_text, supplementary, text_matcher)
 
-    # Build supplementary term lookup
-    supp_lookup: Dict[str, Dict[str, Any]] = {}
-    for st in supplementary:
-        key = st.get("term", "").lower().strip()
-        if key:
-            supp_lookup[key] = st
-
-    # Find which index inputs appear in this JD
-    jd_inputs: List[Dict[str, Any]] = []
-    for inp in inputs:
-        if text_matcher.matches(inp, jd_text):
-            jd_inputs.append(inp)
+    # Find which index inputs appear in this JD (one pass over the text)
+    jd_positions = sorted(text_matcher.present(jd_text, inputs))
+    jd_inputs = [inputs[pos] for pos in jd_positions]
 
     if not jd_inputs:
         return {
@@ -262,7 +471,7 @@ def score_single_job(
             "seniority_fit": job_seniority,
         }
 
-    # Score each JD input against resume
+    # Look up how the resume covers each JD input
     matched_inputs = []
     supplementary_matches = []
     gaps = []
@@ -270,7 +479,7 @@ def score_single_job(
     total_weighted = 0.0
     matched_weighted = 0.0
 
-    for inp in jd_inputs:
+    for pos, inp in zip(jd_positions, jd_inputs):
         weight = inp.get("weight", 0.5)
         inp_seniority = set(inp.get("seniority", []))
 
@@ -281,52 +490,31 @@ def score_single_job(
         effective_weight = weight * seniority_factor
         total_weighted += effective_weight
 
-        # Check resume match
-        if text_matcher.matches(inp, resume_text):
-            match_score = 1.0
+        entry = coverage.entries[pos]
+        if entry["match"] == "resume":
             matched_inputs.append({
                 "input": inp.get("input"),
                 "type": inp.get("type"),
                 "weight": weight,
                 "match": "resume",
             })
+        elif entry["match"] == "supplementary":
+            supplementary_matches.append({
+                "input": inp.get("input"),
+                "type": inp.get("type"),
+                "weight": weight,
+                "match": "supplementary",
+                "proficiency": entry["proficiency"],
+            })
         else:
-            # Check supplementary terms
-            supp_match = None
-            term_lower = inp.get("input", "").lower()
-            if term_lower in supp_lookup:
-                supp_match = supp_lookup[term_lower]
-            else:
-                # Check aliases against supplementary
-                for alias in inp.get("aliases", []):
-                    al = alias.lower()
-                    if al in supp_lookup:
-                        supp_match = supp_lookup[al]
-                        break
-
-            if supp_match:
-                proficiency = supp_match.get("proficiency", "intermediate").lower()
-                if proficiency in ("expert", "advanced"):
-                    match_score = 0.7
-                else:
-                    match_score = 0.5
-                supplementary_matches.append({
-                    "input": inp.get("input"),
-                    "type": inp.get("type"),
-                    "weight": weight,
-                    "match": "supplementary",
-                    "proficiency": proficiency,
-                })
-            else:
-                match_score = 0.0
-                gaps.append({
-                    "input": inp.get("input"),
-                    "type": inp.get("type"),
-                    "weight": weight,
-                    "seniority": inp.get("seniority", []),
-                })
+            gaps.append({
+                "input": inp.get("input"),
+                "type": inp.get("type"),
+                "weight": weight,
+                "seniority": inp.get("seniority", []),
+            })
 
-        matched_weighted += effective_weight * match_score
+        matched_weighted += effective_weight * entry["score"]
 
     # Compute score
     alignment_score = round(matched_weighted / total_weighted, 4) if total_weighted > 0 else 0.0
@@ -351,6 +539,9 @@ def score_single_job(
 # Batch scoring
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Columns projected from the job store for scoring
+SCORING_COLUMNS = ["job_url", "job_title", "description", "company_title", "company"]
+
 
 def score_all_jobs(
     index: Dict[str, Any],
@@ -367,7 +558,8 @@ def score_all_jobs(
     job_title : str
         The search title.
     csv_path : str, optional
-        Explicit CSV path.
+        Explicit CSV path.  Without one, jobs are read from the job store
+        (falling back to the per-title / unified master CSV).
 
     Returns
     -------
@@ -375,23 +567,33 @@ def score_all_jobs(
     """
     jt_clean = job_title.lower().replace(" ", "_")
 
-    # Locate CSV
+    # Locate source: explicit CSV → job store → per-title / unified CSV
+    store = JobStore()
+    source_csv = None
     if csv_path and os.path.exists(csv_path):
         source_csv = csv_path
-    else:
+    elif not store.has(jt_clean):
         source_csv = str(master_aggregated_csv(jt_clean))
         if not os.path.exists(source_csv):
             source_csv = str(UNIFIED_MASTER_CSV)
 
-    if not os.path.exists(source_csv):
+    if source_csv is None:
+        df = store.read(jt_clean, columns=SCORING_COLUMNS, side=False)
+    elif not os.path.exists(source_csv):
         logging.warning("No aggregated CSV found for scoring.")
         return 0
-
-    df = pd.read_csv(source_csv)
+    else:
+        df = pd.read_csv(source_csv)
     if df.empty:
         logging.warning("Aggregated CSV is empty.")
         return 0
 
+    # Score one job per near-duplicate cluster; reposted copies inherit its score
+    dup_index = NearDuplicateIndex()
+    all_jobs = df
+    if "job_url" in df.columns:
+        df = dup_index.representatives(df)
+
     inputs = index.get("inputs", [])
     if not inputs:
         logging.warning("Master input index is empty — nothing to score against.")
@@ -411,115 +613,93 @@ def score_all_jobs(
     )
 
     # Prepare matchers
-    idx_matcher = IndexMatcher(inputs)
-    text_matcher = TextMatcher()
-
-    # Score each job
-    results: List[Dict[str, Any]] = []
-    scores: List[Optional[float]] = []
-    grades: List[Optional[str]] = []
-    top_gaps_col: List[str] = []
-
-    for _, row in df.iterrows():
-        jd = str(row.get("description", ""))
-        jt = str(row.get("job_title", ""))
-        company = str(row.get("company_title", row.get("company", "")))
-        job_url = str(row.get("job_url", ""))
-
-        result = score_single_job(
-            jd_text=jd,
-            job_title=jt,
-            inputs=inputs,
-            resume_text=resume_text,
-            supplementary=supplementary,
-            matcher=idx_matcher,
-            text_matcher=text_matcher,
-        )
+    text_matcher = text_matcher_for(index)
+    coverage = resume_coverage(index, resume_text, supplementary, text_matcher)
 
-        result["job_url"] = job_url
-        result["job_title"] = jt
-        result["company"] = company
-        results.append(result)
+    # Score every job at once: jobs × inputs incidence matrix → vectorised
+    # scores.  Only new or edited descriptions are matched (score cache).
+    from job_extraction.batch_scorer import BatchScorer  # lazy: batch_scorer builds on this module
 
-        scores.append(result.get("alignment_score"))
-        grades.append(result.get("alignment_grade"))
+    def text_col(*names: str) -> pd.Series:
+        for name in names:
+            if name in df.columns:
+                return df[name].astype(str)
+        return pd.Series("", index=df.index)
 
-        # Top gaps as pipe-separated string for CSV column
-        gap_terms = [g.get("input", "") for g in result.get("gaps", [])[:5]]
-        top_gaps_col.append(" | ".join(gap_terms))
-
-    # ── Save outputs ──────────────────────────────────────────────────────
+    job_urls = text_col("job_url").tolist()
+    job_titles = text_col("job_title").tolist()
+    companies = text_col("company_title", "company").tolist()
+    scorer = BatchScorer(inputs, coverage, text_matcher)
 
     scores_dir = alignment_scores_for(jt_clean)
     scores_dir.mkdir(parents=True, exist_ok=True)
-
-    # 1. Detailed JSON
-    detail_path = scores_dir / f"{jt_clean}_alignment_detail.json"
-    detail_json = {
-        "metadata": {
-            "job_title": job_title,
-            "scored_at": datetime.now().isoformat(),
-            "total_jobs": len(results),
-            "index_inputs": len(inputs),
-            "resume_loaded": bool(resume_text),
-            "supplementary_terms": len(supplementary),
-        },
-        "scores": results,
-    }
-    detail_path.write_text(
-        json.dumps(detail_json, indent=2, ensure_ascii=False), encoding="utf-8"
+    cache = ScoreCache(jt_clean, scores_dir)
+    with artifact_lock(cache.path):
+        matrix, empty = cache.incidence(job_urls, text_col("description").tolist(), scorer, coverage.index_sha1)
+        batch = scorer.score_incidence(matrix, job_titles, empty)
+
+        # 1. Detail JSONL: one appended line per job whose score inputs changed
+        changed = cache.changed(job_titles, coverage.index_sha1, _sha1(inputs), coverage.resume_sha1)
+        appended = cache.append_details(
+            {"job_url": job_urls[i], "score_key": key, "job_title": job_titles[i],
+             "company": companies[i], **batch.result(i)}
+            for i, key in changed
+        )
+        cache.save()
+    logging.info(
+        "Score cache: %d descriptions reused, %d matched; %d detail lines appended → %s",
+        cache.reused, cache.matched, appended, cache.detail_path,
     )
 
+    scores: List[Optional[float]] = batch.scores
+    grades: List[Optional[str]] = batch.grades
+    top_gaps_col: List[str] = batch.top_gaps(5)
+
+    # ── Save outputs ──────────────────────────────────────────────────────
+
     # 2. Score CSV
-    score_df = pd.DataFrame([
-        {
-            "job_url": r.get("job_url"),
-            "job_title": r.get("job_title"),
-            "company": r.get("company"),
-            "alignment_score": r.get("alignment_score"),
-            "alignment_grade": r.get("alignment_grade"),
-            "inputs_found": r.get("inputs_found"),
-            "inputs_matched": r.get("inputs_matched"),
-            "inputs_gap": r.get("inputs_gap"),
-            "top_gaps": " | ".join(
-                g.get("input", "") for g in r.get("gaps", [])[:5]
-            ),
-        }
-        for r in results
-    ])
+    score_df = pd.concat([
+        pd.DataFrame({"job_url": job_urls, "job_title": job_titles, "company": companies}),
+        batch.frame(),
+    ], axis=1)
     score_csv_path = scores_dir / f"{jt_clean}_alignment_scores.csv"
-    score_df.to_csv(score_csv_path, index=False)
+    write_csv(score_df, score_csv_path, index=False)
 
     # 3. Gap analysis CSV (term × frequency across all scored jobs)
-    all_gaps: Dict[str, Dict[str, Any]] = {}
-    for r in results:
-        for g in r.get("gaps", []):
-            term = g.get("input", "")
-            if term not in all_gaps:
-                all_gaps[term] = {
-                    "input": term,
-                    "type": g.get("type", ""),
-                    "weight": g.get("weight", 0),
-                    "gap_count": 0,
-                }
-            all_gaps[term]["gap_count"] += 1
-
-    gap_df = pd.DataFrame(list(all_gaps.values()))
-    if not gap_df.empty:
-        gap_df = gap_df.sort_values("gap_count", ascending=False)
+    gap_df = batch.gap_analysis()
     gap_csv_path = scores_dir / f"{jt_clean}_gap_analysis.csv"
-    gap_df.to_csv(gap_csv_path, index=False)
-
-    # 4. Append columns to master aggregated CSV
+    write_csv(gap_df, gap_csv_path, index=False)
+
+    # 4. Score columns → job database + job store side table (or the explicit CSV)
+    score_cols = pd.DataFrame({
+        "job_url": df["job_url"].astype(str) if "job_url" in df.columns else "",
+        "alignment_score": scores,
+        "alignment_grade": grades,
+        "top_gaps": top_gaps_col,
+    })
+    if df is not all_jobs:
+        reps = score_cols.drop(columns="job_url").set_axis(dup_index.cluster_ids(score_cols["job_url"]).to_numpy())
+        score_cols = reps.reindex(dup_index.cluster_ids(all_jobs["job_url"]).to_numpy()).reset_index(drop=True)
+        score_cols.insert(0, "job_url", all_jobs["job_url"].astype(str).to_numpy())
+    try:
+        get_job_db().upsert_scores(jt_clean, score_cols[score_cols["job_url"] != ""])
+    except Exception as exc:
+        logging.warning("Could not save scores to the job database: %s", exc)
     try:
-        master_df = pd.read_csv(source_csv)
-        master_df["alignment_score"] = scores
-        master_df["alignment_grade"] = grades
-        master_df["top_gaps"] = top_gaps_col
-        master_df.to_csv(source_csv, index=False)
-        logging.info("Appended alignment columns to %s", source_csv)
+        if source_csv is None:
+            store.write_side("scores", jt_clean, score_cols)
+        else:
+            with artifact_lock(source_csv):
+                master_df = pd.read_csv(source_csv)
+                if len(master_df) != len(score_cols):
+                    raise ValueError(f"{source_csv} changed while scoring ({len(master_df)} rows, scored {len(score_cols)})")
+                master_df["alignment_score"] = score_cols["alignment_score"].to_numpy()
+                master_df["alignment_grade"] = score_cols["alignment_grade"].to_numpy()
+                master_df["top_gaps"] = score_cols["top_gaps"].to_numpy()
+                write_csv(master_df, source_csv, index=False)
+            logging.info("Appended alignment columns to %s", source_csv)
     except Exception as exc:
-        logging.warning("Could not update master CSV: %s", exc)
+        logging.warning("Could not save alignment columns: %s", exc)
 
     # Summary stats
     valid_scores = [s for s in scores if s is not None]
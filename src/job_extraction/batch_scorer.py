@@ -0,0 +1,391 @@
+"""
+Batch Scorer
+════════════
+Vectorised ``score_single_job`` for whole job tables (up to the unified
+master across all titles).
+
+  1. incidence   one automaton pass per description (``TextMatcher``) →
+                 a jobs × inputs CSR matrix of the index inputs each JD
+                 contains
+  2. weights     input weights, resume-coverage credit and a seniority
+                 bitmask per input as NumPy vectors
+  3. scores      jobs are grouped by their seniority mask; per group the
+                 seniority factor is one vector op and the weighted totals
+                 are two sparse mat-vecs
+  4. gaps        gap inputs re-indexed by weight rank and row-sorted, so
+                 each job's top-N gaps are the first N entries of its row
+
+Results are identical to ``score_single_job`` (same summation order,
+Python rounding), which ``check_parity`` verifies.
+
+Usage:
+    scorer = BatchScorer(inputs, coverage, text_matcher)
+    batch = scorer.score(descriptions, job_titles)
+    batch.scores, batch.grades, batch.top_gaps(5), batch.result(i)
+
+    python src/job_extraction/batch_scorer.py --parity 300
+    python src/job_extraction/batch_scorer.py --benchmark 100000 5000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_extraction.alignment_scorer import (
+    GRADE_THRESHOLDS,
+    ResumeCoverage,
+    TextMatcher,
+    score_single_job,
+)
+from job_extraction.jd_term_extractor import infer_seniority
+
+# Match codes in the coverage vector
+GAP, RESUME, SUPPLEMENTARY = 0, 1, 2
+_MATCH_CODES = {"gap": GAP, "resume": RESUME, "supplementary": SUPPLEMENTARY}
+
+SENIORITY_MISMATCH_FACTOR = 0.8
+DETAIL_GAPS = 20        # gaps kept per job in the detail report
+EMPTY_JD = ("-", "nan")
+
+
+class BatchScores:
+    """Scores for a batch of jobs, with per-job details materialised on demand."""
+
+    def __init__(self, scorer: "BatchScorer", incidence: sparse.csr_matrix, empty: np.ndarray,
+                 seniority: List[List[str]], ratios: np.ndarray, gap_indptr: np.ndarray,
+                 gap_positions: np.ndarray, gap_counts: np.ndarray):
+        self._scorer = scorer
+        self.incidence = incidence
+        self.empty = empty
+        self.seniority = seniority
+        self._gap_indptr = gap_indptr
+        self._gap_positions = gap_positions
+        self.found = np.diff(incidence.indptr)
+        self.gap_counts = gap_counts
+        self.scores: List[Optional[float]] = [
+            None if is_empty else round(float(r), 4) for r, is_empty in zip(ratios, empty)
+        ]
+        self.grades: List[Optional[str]] = _grades(self.scores)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def gaps(self, i: int, n: int = DETAIL_GAPS) -> np.ndarray:
+        """Positions of job *i*'s top-*n* gaps, by weight (ties by index order)."""
+        start = self._gap_indptr[i]
+        return self._gap_positions[start:min(start + n, self._gap_indptr[i + 1])]
+
+    def top_gaps(self, n: int = 5) -> List[str]:
+        """Pipe-separated names of each job's top-*n* gaps (the ``top_gaps`` column)."""
+        names = self._scorer.names
+        return [" | ".join(names[p] for p in self.gaps(i, n)) for i in range(len(self))]
+
+    def frame(self) -> pd.DataFrame:
+        """Per-job summary columns of the score CSV."""
+        found = pd.array(self.found, dtype="Int64")
+        gap_counts = pd.array(self.gap_counts, dtype="Int64")
+        found[self.empty] = pd.NA
+        gap_counts[self.empty] = pd.NA
+        return pd.DataFrame({
+            "alignment_score": pd.array(self.scores, dtype="Float64"),
+            "alignment_grade": self.grades,
+            "inputs_found": found,
+            "inputs_matched": found - gap_counts,
+            "inputs_gap": gap_counts,
+            "top_gaps": self.top_gaps(5),
+        })
+
+    def gap_analysis(self) -> pd.DataFrame:
+        """Gap frequency over each job's reported (top-20) gaps, keyed by input name."""
+        scorer = self._scorer
+        flat = np.concatenate([self.gaps(i) for i in range(len(self))]) if len(self) else np.array([], int)
+        positions, first = np.unique(flat, return_index=True)
+        counts = np.bincount(flat, minlength=len(scorer.names)) if len(flat) else np.array([])
+        all_gaps: Dict[str, Dict[str, Any]] = {}
+        for pos in positions[np.argsort(first, kind="stable")]:
+            inp = scorer.inputs[pos]
+            term = inp.get("input", "")
+            entry = all_gaps.setdefault(term, {
+                "input": term, "type": inp.get("type", ""), "weight": inp.get("weight", 0.5), "gap_count": 0,
+            })
+            entry["gap_count"] += int(counts[pos])
+        gap_df = pd.DataFrame(list(all_gaps.values()))
+        if not gap_df.empty:
+            gap_df = gap_df.sort_values("gap_count", ascending=False)
+        return gap_df
+
+    def result(self, i: int) -> Dict[str, Any]:
+        """Job *i* in the ``score_single_job`` format."""
+        if self.empty[i]:
+            return {"alignment_score": None, "alignment_grade": None, "error": "empty_jd"}
+        inputs, codes = self._scorer.inputs, self._scorer.codes
+        entries = self._scorer.coverage.entries
+        row = self.incidence.indices[self.incidence.indptr[i]:self.incidence.indptr[i + 1]]
+        matched = [
+            {"input": inputs[p].get("input"), "type": inputs[p].get("type"),
+             "weight": inputs[p].get("weight", 0.5), "match": "resume"}
+            for p in row if codes[p] == RESUME
+        ]
+        supplementary = [
+            {"input": inputs[p].get("input"), "type": inputs[p].get("type"),
+             "weight": inputs[p].get("weight", 0.5), "match": "supplementary",
+             "proficiency": entries[p]["proficiency"]}
+            for p in row if codes[p] == SUPPLEMENTARY
+        ]
+        gaps = [
+            {"input": inputs[p].get("input"), "type": inputs[p].get("type"),
+             "weight": inputs[p].get("weight", 0.5), "seniority": inputs[p].get("seniority", [])}
+            for p in self.gaps(i)
+        ]
+        return {
+            "alignment_score": self.scores[i],
+            "alignment_grade": self.grades[i],
+            "inputs_found": int(self.found[i]),
+            "inputs_matched": len(matched) + len(supplementary),
+            "inputs_gap": int(self.gap_counts[i]),
+            "matched_inputs": matched,
+            "supplementary_matches": supplementary,
+            "gaps": gaps,
+            "seniority_fit": self.seniority[i],
+        }
+
+
+def _grades(scores: Sequence[Optional[float]]) -> List[Optional[str]]:
+    """Vectorised ``score_to_grade`` (None stays None)."""
+    values = np.array([np.nan if s is None else s for s in scores], dtype=float)
+    grades = np.full(len(values), "D", dtype=object)
+    assigned = np.zeros(len(values), dtype=bool)
+    for threshold, grade in GRADE_THRESHOLDS:
+        hit = ~assigned & (values >= threshold)
+        grades[hit] = grade
+        assigned |= hit
+    grades[np.isnan(values)] = None
+    return grades.tolist()
+
+
+class BatchScorer:
+    """Index inputs + resume coverage compiled into vectors for batch scoring."""
+
+    def __init__(self, inputs: List[Dict[str, Any]], coverage: ResumeCoverage,
+                 text_matcher: Optional[TextMatcher] = None):
+        if len(coverage) != len(inputs):
+            raise ValueError(f"Coverage has {len(coverage)} entries for {len(inputs)} inputs")
+        self.inputs = inputs
+        self.coverage = coverage
+        self.text_matcher = text_matcher
+        self.names = [inp.get("input", "") for inp in inputs]
+        self.weights = np.array([inp.get("weight", 0.5) for inp in inputs], dtype=float)
+        self.credit = np.array([entry["score"] for entry in coverage.entries], dtype=float)
+        self.codes = np.array([_MATCH_CODES[entry["match"]] for entry in coverage.entries], dtype=np.int8)
+
+        # Seniority bands → bits; an input without bands fits every job
+        self._bits: Dict[str, int] = {}
+        self.seniority_masks = np.array(
+            [self._mask(inp.get("seniority", [])) for inp in inputs], dtype=np.uint64
+        )
+
+        # Gap order: weight descending, ties by index position (a stable sort)
+        self._order = np.argsort(-self.weights, kind="stable")
+        self._rank = np.empty(len(inputs), dtype=np.int64)
+        self._rank[self._order] = np.arange(len(inputs))
+
+    def _mask(self, bands: Sequence[str]) -> int:
+        mask = 0
+        for band in bands:
+            if band not in self._bits:
+                if len(self._bits) == 64:
+                    raise ValueError("More than 64 distinct seniority bands")
+                self._bits[band] = len(self._bits)
+            mask |= 1 << self._bits[band]
+        return mask
+
+    # ── incidence ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def empty_mask(descriptions: Sequence[str]) -> np.ndarray:
+        """Descriptions ``score_single_job`` reports as empty_jd."""
+        return np.fromiter((not text or text in EMPTY_JD for text in descriptions),
+                           dtype=bool, count=len(descriptions))
+
+    def incidence(self, descriptions: Sequence[str]) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Jobs × inputs 0/1 matrix of the inputs each description contains, and the empty-JD mask."""
+        if self.text_matcher is None:
+            raise ValueError("BatchScorer.incidence() needs a text matcher")
+        indptr = [0]
+        indices: List[int] = []
+        empty = self.empty_mask(descriptions)
+        for text, is_empty in zip(descriptions, empty):
+            if not is_empty:
+                indices.extend(sorted(self.text_matcher.present(text, self.inputs)))
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices)), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(descriptions), len(self.inputs)),
+        )
+        return matrix, empty
+
+    # ── scoring ───────────────────────────────────────────────────────────
+
+    def score(self, descriptions: Sequence[str], job_titles: Sequence[str]) -> BatchScores:
+        """Score every job (descriptions and titles as strings, e.g. ``astype(str)``)."""
+        matrix, empty = self.incidence(descriptions)
+        return self.score_incidence(matrix, job_titles, empty)
+
+    def score_incidence(self, matrix: sparse.csr_matrix, job_titles: Sequence[str],
+                        empty: Optional[np.ndarray] = None) -> BatchScores:
+        """Score a prebuilt incidence matrix (rows with sorted column indices)."""
+        n_jobs = matrix.shape[0]
+        if empty is None:
+            empty = np.zeros(n_jobs, dtype=bool)
+
+        # Seniority per distinct title, then jobs grouped by seniority mask
+        bands_for: Dict[str, List[str]] = {}
+        seniority = []
+        for title in job_titles:
+            if title not in bands_for:
+                bands_for[title] = infer_seniority(title)
+            seniority.append(bands_for[title])
+        job_masks = np.array([self._mask(bands) for bands in seniority], dtype=np.uint64)
+
+        total = np.zeros(n_jobs)
+        matched = np.zeros(n_jobs)
+        for mask in np.unique(job_masks):
+            rows = np.flatnonzero(job_masks == mask)
+            fits = ((self.seniority_masks & mask) != 0) | (self.seniority_masks == 0)
+            effective = self.weights * np.where(fits, 1.0, SENIORITY_MISMATCH_FACTOR)
+            block = matrix if len(rows) == n_jobs else matrix[rows]
+            total[rows] = block @ effective
+            matched[rows] = block @ (effective * self.credit)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(total > 0, matched / total, 0.0)
+
+        # Top gaps: keep gap columns, renumber them by weight rank and sort each row
+        is_gap = (self.codes == GAP)[matrix.indices]
+        row_of = np.repeat(np.arange(n_jobs), np.diff(matrix.indptr))
+        gap_counts = np.bincount(row_of[is_gap], minlength=n_jobs)
+        gaps = sparse.csr_matrix(
+            (np.ones(int(is_gap.sum())), self._rank[matrix.indices[is_gap]],
+             np.concatenate([[0], np.cumsum(gap_counts)])),
+            shape=matrix.shape,
+        )
+        gaps.sort_indices()
+        gap_positions = self._order[gaps.indices]
+
+        # Keep at most DETAIL_GAPS per row
+        take = np.minimum(gap_counts, DETAIL_GAPS)
+        starts = np.repeat(gaps.indptr[:-1], take)
+        offsets = np.arange(take.sum()) - np.repeat(np.cumsum(take) - take, take)
+        gap_positions = gap_positions[starts + offsets]
+        gap_indptr = np.concatenate([[0], np.cumsum(take)])
+
+        return BatchScores(self, matrix, empty, seniority, ratios, gap_indptr, gap_positions, gap_counts)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Parity check + benchmark
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _synthetic(n_inputs: int, seed: int = 0):
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghik") for _ in range(rng.randint(3, 8))) for _ in range(max(50, n_inputs // 5))]
+    bands = ["entry", "mid", "senior", "director", "vp"]
+    inputs = [
+        {
+            "id": f"in_{i}",
+            "input": " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 2))),
+            "type": rng.choice(["skill", "tool", "domain"]),
+            "weight": rng.choice([0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1, 1.0]),
+            "seniority": rng.sample(bands, rng.randint(0, 2)),
+            "aliases": [rng.choice(vocab) for _ in range(rng.randint(0, 2))],
+        }
+        for i in range(n_inputs)
+    ]
+    titles = ["Senior Data Analyst", "Junior Analyst", "Analytics Manager", "Director of Analytics",
+              "VP Marketing Science", "Data Scientist", "nan"]
+    resume = " ".join(rng.choice(vocab) for _ in range(800))
+    supplementary = [{"term": rng.choice(vocab), "proficiency": rng.choice(["expert", "intermediate"])}
+                     for _ in range(40)]
+
+    def jd():
+        return " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 400)))
+
+    return inputs, titles, resume, supplementary, jd, rng
+
+
+def check_parity(n_jobs: int = 300, n_inputs: int = 1500, seed: int = 0) -> int:
+    """Compare the batch engine with score_single_job on synthetic jobs; returns mismatches."""
+    inputs, titles, resume, supplementary, jd, rng = _synthetic(n_inputs, seed)
+    matcher = TextMatcher(inputs)
+    coverage = ResumeCoverage.build(inputs, resume, supplementary, matcher)
+    descriptions = [jd() for _ in range(n_jobs)] + ["", "-", "nan"]
+    job_titles = [rng.choice(titles) for _ in descriptions]
+
+    batch = BatchScorer(inputs, coverage, matcher).score(descriptions, job_titles)
+    mismatches = 0
+    for i, (text, title) in enumerate(zip(descriptions, job_titles)):
+        expected = score_single_job(text, title, inputs, resume, supplementary, None, matcher, coverage=coverage)
+        if batch.result(i) != expected:
+            mismatches += 1
+            if mismatches <= 3:
+                logging.error("Mismatch for job %d: %s != %s", i, batch.result(i), expected)
+    logging.info("Parity: %d of %d jobs identical.", len(descriptions) - mismatches, len(descriptions))
+    return mismatches
+
+
+def benchmark(n_jobs: int = 100_000, n_inputs: int = 5_000, per_job: int = 60, seed: int = 0) -> Dict[str, float]:
+    """Time scoring (not matching) on a random incidence matrix of *n_jobs* × *n_inputs*."""
+    inputs, titles, _, _, _, rng = _synthetic(n_inputs, seed)
+    np_rng = np.random.default_rng(seed)
+    codes = np_rng.choice(["resume", "supplementary", "gap"], n_inputs, p=[0.3, 0.05, 0.65])
+    coverage = ResumeCoverage(
+        [{"id": inp["id"], "input": inp["input"], "match": code, "proficiency": "expert",
+          "score": {"resume": 1.0, "supplementary": 0.7, "gap": 0.0}[code]}
+         for inp, code in zip(inputs, codes)],
+        "bench", "bench",
+    )
+    counts = np_rng.integers(0, 2 * per_job, n_jobs)
+    rows = np.repeat(np.arange(n_jobs), counts)
+    cols = np_rng.integers(0, n_inputs, counts.sum())
+    matrix = sparse.csr_matrix((np.ones(len(cols)), (rows, cols)), shape=(n_jobs, n_inputs))
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    job_titles = [rng.choice(titles) for _ in range(n_jobs)]
+
+    start = time.perf_counter()
+    scorer = BatchScorer(inputs, coverage)
+    batch = scorer.score_incidence(matrix, job_titles)
+    scored = time.perf_counter() - start
+    frame = batch.frame()
+    framed = time.perf_counter() - start
+    return {"jobs": n_jobs, "inputs": n_inputs, "nnz": int(matrix.nnz),
+            "score_s": round(scored, 2), "with_csv_columns_s": round(framed, 2),
+            "mean_score": round(float(frame["alignment_score"].mean()), 4)}
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s",
+                        datefmt="%Y-%m-%d %H:%M:%S")
+    parser = argparse.ArgumentParser(description="Batch alignment scoring engine")
+    parser.add_argument("--parity", type=int, metavar="JOBS", help="Check parity with score_single_job")
+    parser.add_argument("--benchmark", type=int, nargs=2, metavar=("JOBS", "INPUTS"),
+                        help="Time scoring a random JOBS × INPUTS incidence matrix")
+    args = parser.parse_args()
+    if args.parity:
+        sys.exit(1 if check_parity(args.parity) else 0)
+    if args.benchmark:
+        print(benchmark(*args.benchmark))
+
+
+if __name__ == "__main__":
+    main()
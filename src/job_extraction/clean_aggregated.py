@@ -7,6 +7,8 @@ import argparse
 from datetime import datetime
 
 from paths import master_aggregated_csv, UNIFIED_MASTER_CSV
+from artifact_io import artifact_lock, write_csv
+from job_extraction.job_store import JobStore
 
 # Configure logging
 logging.basicConfig(
@@ -75,12 +77,26 @@ def clean_aggregated_file(job_title, keep_strategy='latest', csv_path=None):
     """Clean an existing aggregated file by removing duplicates.
     
     If *csv_path* is provided it is used directly; otherwise the
-    per-title master is resolved from *job_title* (with a fallback
-    to the unified master CSV).
+    per-title master is resolved from *job_title*: the job store when it
+    holds the title, else the master CSV (with a fallback to the unified
+    master CSV).
     """
     try:
         job_title_clean = job_title.lower().replace(' ', '_')
 
+        store = JobStore()
+        if not (csv_path and os.path.exists(csv_path)) and store.has(job_title_clean):
+            # Same lock as the merge, which reads and writes the stored master
+            with artifact_lock(master_aggregated_csv(job_title_clean)):
+                df = store.read(job_title_clean, side=False)
+                original_count = len(df)
+                df_cleaned = deduplicate_by_company_and_title(df, keep_strategy=keep_strategy)
+                final_count = len(df_cleaned)
+                store.append(job_title_clean, df_cleaned, complete=True)
+            logging.info(f"Cleaned stored jobs: {original_count} -> {final_count} jobs "
+                         f"(removed {original_count - final_count} duplicates)")
+            return store.location(job_title_clean)
+
         if csv_path and os.path.exists(csv_path):
             master_file = csv_path
         else:
@@ -92,16 +108,17 @@ def clean_aggregated_file(job_title, keep_strategy='latest', csv_path=None):
             logging.error(f"Master file not found: {master_file}")
             return None
         
-        # Load the existing file
-        df = pd.read_csv(master_file)
-        original_count = len(df)
-        
-        # Apply deduplication
-        df_cleaned = deduplicate_by_company_and_title(df, keep_strategy=keep_strategy)
-        final_count = len(df_cleaned)
-        
-        # Save the cleaned file
-        df_cleaned.to_csv(master_file, index=False)
+        with artifact_lock(master_file):
+            # Load the existing file
+            df = pd.read_csv(master_file)
+            original_count = len(df)
+            
+            # Apply deduplication
+            df_cleaned = deduplicate_by_company_and_title(df, keep_strategy=keep_strategy)
+            final_count = len(df_cleaned)
+            
+            # Save the cleaned file
+            write_csv(df_cleaned, master_file, index=False)
         
         logging.info(f"Cleaned aggregated file: {original_count} -> {final_count} jobs (removed {original_count - final_count} duplicates)")
         
@@ -115,7 +132,7 @@ def main():
     parser = argparse.ArgumentParser(description='Clean aggregated job files by removing duplicates')
     parser.add_argument('--job_title', required=True, help='Job title to clean')
     parser.add_argument('--csv_file', default=None,
-                        help='Path to input CSV (default: per-title master, falls back to unified master).')
+                        help='Path to input CSV (default: the job store or per-title master, falls back to unified master).')
     parser.add_argument('--keep_strategy', default='latest', choices=['latest', 'earliest', 'random'], 
                        help='Strategy for keeping duplicates')
     args = parser.parse_args()
@@ -0,0 +1,360 @@
+"""
+Detail Cache
+════════════
+Persistent job-detail cache keyed by LinkedIn job ID, so repeat searches
+do not re-scrape postings we already have.
+
+TTL policy (per entry):
+  • description / title / company / location / salary / date_posted
+      – immutable once scraped, never re-fetched
+  • days_since_posted
+      – never stored; recomputed from ``date_posted`` on every read
+  • application_url
+      – re-fetched (page load + Apply click only) once older than
+        ``ttl_days`` (default 7)
+
+Lookups return one of:
+  HIT    – serve entirely from cache, no page load
+  STALE  – cached, but application_url must be refreshed
+  MISS   – not cached (or cached without a usable description)
+
+Storage is an append-only JSONL log – one ``{"id": <job ID>, ...}`` line
+per scrape or application_url refresh, later lines updating earlier ones
+– so a save appends only this run's changes instead of rewriting every
+cached description.  Appends take the cache's artifact lock; the log is
+compacted (one line per job) once it holds ``COMPACT_RATIO`` lines per
+job.  A legacy ``_detail_cache.json`` is migrated on first load.
+
+The cache is seeded from existing ``data/job_details/<title>/`` outputs
+(and, the first time a title is seeded, its master aggregated CSV).  A
+per-title ingest manifest records the files already seeded, so each run
+reads only new job_details CSVs.  Safe to share between worker-pool
+threads.
+
+Storage: ``data/job_details/_detail_cache.jsonl``
+"""
+
+import glob
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from artifact_io import artifact_lock, atomic_write
+from job_extraction.ingest_manifest import IngestManifest
+from job_extraction.job_store import JobStore
+from job_extraction.utils import extract_linkedin_job_id
+from paths import DETAIL_CACHE_JSONL, detail_cache_manifest_for, job_details_for, master_aggregated_csv
+from record_io import dumps
+
+HIT, STALE, MISS = "hit", "stale", "miss"
+DEFAULT_TTL_DAYS = 7
+AUTOSAVE_EVERY = 25   # writes between automatic saves (crash safety)
+COMPACT_MIN_LINES = 1000
+COMPACT_RATIO = 2.0   # compact once the log holds this many lines per job
+SEED_SECTION = "detail_cache"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Immutable fields kept per job ID
+CACHED_FIELDS = [
+    "job_title", "company", "description", "date_posted",
+    "location", "remote", "salary", "job_url", "application_url",
+]
+_MISSING = (None, "", "-")
+
+
+def _clean(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return None if pd.isna(value) else value.strftime(TIMESTAMP_FORMAT)
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def has_description(values: pd.Series) -> pd.Series:
+    """Mask of real descriptions – not NaN, blank, ``"nan"`` or the ``"-"`` placeholder."""
+    text = values.astype(str).str.strip()
+    return values.notna() & ~text.isin([v for v in _MISSING if v is not None] + ["nan"])
+
+
+def _usable(entry: Dict[str, Any]) -> bool:
+    return entry.get("description") not in _MISSING and entry.get("job_title") not in _MISSING
+
+
+class DetailCache:
+    """Job-ID → detail record store with an application_url TTL."""
+
+    def __init__(self, path: str = str(DETAIL_CACHE_JSONL), ttl_days: float = DEFAULT_TTL_DAYS):
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[Dict[str, Any]] = []   # log lines not yet appended
+        self._lines = 0                            # lines in the on-disk log
+        self._writes_since_save = 0
+        self.stats = {HIT: 0, STALE: 0, MISS: 0}
+        self.load()
+
+    # ── Persistence ───────────────────────────────────────────────────────
+
+    def _read(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Replay the log: (entries by job ID, number of lines)."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        lines = 0
+        with open(self.path, "rb") as f:
+            for raw in f:
+                if not raw.strip():
+                    continue
+                lines += 1
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    # Torn append (crash mid-write) or a damaged line: lose that update only
+                    logging.warning("Skipping unreadable line %d of detail cache %s", lines, self.path)
+                    continue
+                job_id = record.pop("id", None)
+                if job_id:
+                    entries.setdefault(job_id, {}).update(record)
+        return entries, lines
+
+    def load(self) -> None:
+        legacy_path = os.path.splitext(self.path)[0] + ".json"
+        if not os.path.exists(self.path) and os.path.exists(legacy_path):
+            self._migrate(legacy_path)
+        if not os.path.exists(self.path):
+            return
+        self._entries, self._lines = self._read()
+        logging.info("Detail cache loaded: %d jobs from %s", len(self._entries), self.path)
+
+    def _migrate(self, legacy_path: str) -> None:
+        """Convert the old single-document JSON cache into the log."""
+        with artifact_lock(self.path):
+            if os.path.exists(self.path):
+                return
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("jobs", {})
+            except Exception as e:
+                logging.warning("Could not migrate legacy detail cache %s: %s", legacy_path, e)
+                return
+            self._write_log(entries)
+            os.remove(legacy_path)
+        logging.info("Migrated %d jobs from %s to %s", len(entries), legacy_path, self.path)
+
+    def _write_log(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        with atomic_write(self.path, "wb") as f:
+            for job_id, entry in entries.items():
+                f.write(dumps({"id": job_id, **entry}) + b"\n")
+
+    def save(self) -> None:
+        """Append this run's new and refreshed entries to the log (under the cache's lock)."""
+        with self._lock:
+            if not self._pending:
+                return
+            appended = len(self._pending)
+            data = b"".join(dumps(record) + b"\n" for record in self._pending)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with artifact_lock(self.path):
+                with open(self.path, "a+b") as f:
+                    f.seek(0, os.SEEK_END)
+                    if f.tell():
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            data = b"\n" + data   # the previous append was cut short
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._pending = []
+                self._writes_since_save = 0
+                self._lines += appended
+                if self._lines >= COMPACT_MIN_LINES and self._lines > COMPACT_RATIO * len(self._entries):
+                    self._compact()
+        logging.info("Detail cache saved: %d new/refreshed entries (%d jobs)", appended, len(self._entries))
+
+    def _compact(self) -> None:
+        """Rewrite the log as one line per job (called with both locks held)."""
+        entries, lines = self._read()   # includes other runs' appends
+        self._write_log(entries)
+        self._entries, self._lines = entries, len(entries)
+        logging.info("Detail cache compacted: %d lines → %d", lines, len(entries))
+
+    # ── Lookup / update ───────────────────────────────────────────────────
+
+    def lookup(self, url: str, count: bool = True) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Classify *url* as HIT / STALE / MISS and return the cached entry."""
+        job_id = extract_linkedin_job_id(url)
+        with self._lock:
+            entry = self._entries.get(job_id) if job_id else None
+            if entry is None or not _usable(entry):
+                status, entry = MISS, None
+            else:
+                refreshed = entry.get("refreshed_at")
+                fresh = False
+                if refreshed:
+                    try:
+                        fresh = datetime.now() - datetime.strptime(refreshed, TIMESTAMP_FORMAT) < self.ttl
+                    except ValueError:
+                        fresh = False
+                status = HIT if fresh else STALE
+                entry = dict(entry)
+            if count:
+                self.stats[status] += 1
+        return status, entry
+
+    def store(self, url: str, record: Dict[str, Any]) -> None:
+        """Cache a full scrape (ignored for failure placeholders)."""
+        job_id = extract_linkedin_job_id(url)
+        if not job_id or record.get("job_title") in _MISSING:
+            return
+        now = datetime.now().strftime(TIMESTAMP_FORMAT)
+        entry = {field: _clean(record.get(field)) for field in CACHED_FIELDS}
+        entry["job_url"] = url
+        with self._lock:
+            previous = self._entries.get(job_id, {})
+            entry["scraped_at"] = previous.get("scraped_at") or now
+            entry["refreshed_at"] = now
+            self._entries[job_id] = entry
+            self._queue(job_id, entry)
+        self._maybe_autosave()
+
+    def refresh(self, url: str, application_url: Optional[str]) -> None:
+        """Record a re-fetched application_url and reset the entry's TTL clock."""
+        job_id = extract_linkedin_job_id(url)
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return
+            update = {"refreshed_at": datetime.now().strftime(TIMESTAMP_FORMAT)}
+            if application_url not in _MISSING:
+                update["application_url"] = application_url
+            entry.update(update)
+            self._queue(job_id, update)
+        self._maybe_autosave()
+
+    def _queue(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Log line for the next save (called with the lock held)."""
+        self._pending.append({"id": job_id, **fields})
+        self._writes_since_save += 1
+
+    def _maybe_autosave(self) -> None:
+        if self._writes_since_save >= AUTOSAVE_EVERY:
+            self.save()
+
+    # ── Seeding from existing outputs ─────────────────────────────────────
+
+    def _seed_entry(self, job_id: str, entry: Dict[str, Any]) -> bool:
+        if job_id in self._entries or not _usable(entry):
+            return False
+        self._entries[job_id] = entry
+        self._pending.append({"id": job_id, **entry})
+        return True
+
+    def seed_from_outputs(self, job_title_clean: str) -> int:
+        """Add jobs from job_details CSVs not seeded before (and, once, the master aggregate).
+
+        Only files that are new or changed since the title's last seeding
+        are read (see ``detail_cache_manifest_for``); the master aggregate
+        (job store, else master CSV) is read only on a title's first seeding.  Seeded entries carry no
+        ``refreshed_at``, so their application_url is refreshed (STALE) the
+        first time they are looked up.
+        """
+        manifest = IngestManifest(job_title_clean, path=str(detail_cache_manifest_for(job_title_clean)))
+        if not self._entries:
+            manifest.reset(SEED_SECTION)   # new or deleted cache: seed everything again
+        first_seed = not manifest.count(SEED_SECTION)
+        detail_files = manifest.changed(SEED_SECTION, glob.glob(str(job_details_for(job_title_clean) / "*.csv")))
+        seeded: List[str] = []
+        added = 0
+        with self._lock:
+            for path in detail_files:
+                try:
+                    df = pd.read_csv(path)
+                except Exception as e:
+                    logging.warning("Skipping %s while seeding detail cache: %s", path, e)
+                    continue
+                seeded.append(path)
+                if "job_url" not in df.columns:
+                    continue
+                scraped_at = datetime.fromtimestamp(os.path.getmtime(path)).strftime(TIMESTAMP_FORMAT)
+                for row in df.to_dict("records"):
+                    job_id = extract_linkedin_job_id(row.get("job_url"))
+                    if not job_id:
+                        continue
+                    entry = {field: _clean(row.get(field)) for field in CACHED_FIELDS}
+                    entry.update({"scraped_at": scraped_at, "refreshed_at": None})
+                    added += self._seed_entry(job_id, entry)
+
+            store = JobStore()
+            master_path = master_aggregated_csv(job_title_clean)
+            df = pd.DataFrame()
+            if first_seed:
+                try:
+                    if store.has(job_title_clean):
+                        df = store.read(job_title_clean, side=False)
+                        # A part file stands in for the store in the seed manifest
+                        seeded.append(str(store.parts(job_title_clean)[0]))
+                    elif master_path.exists():
+                        df = pd.read_csv(master_path)
+                        seeded.append(str(master_path))
+                except Exception as e:
+                    logging.warning("Skipping the '%s' master aggregate while seeding detail cache: %s",
+                                    job_title_clean, e)
+                for row in df.to_dict("records"):
+                    job_id = extract_linkedin_job_id(row.get("job_url"))
+                    if not job_id:
+                        continue
+                    # Master rows carry search-card names and days_since_posted instead of a date
+                    date_posted = None
+                    extracted = pd.to_datetime(row.get("date_extracted"), errors="coerce")
+                    days = pd.to_numeric(row.get("days_since_posted"), errors="coerce")
+                    if not pd.isna(extracted) and not pd.isna(days):
+                        date_posted = (extracted.normalize() - pd.Timedelta(days=int(days))).strftime(TIMESTAMP_FORMAT)
+                    entry = {
+                        "job_title": _clean(row.get("job_title")),
+                        "company": _clean(row.get("company_title", row.get("company"))),
+                        "description": _clean(row.get("description")),
+                        "date_posted": date_posted,
+                        "location": _clean(row.get("location")),
+                        "remote": _clean(row.get("remote_status", row.get("remote"))),
+                        "salary": _clean(row.get("salary_range", row.get("salary"))),
+                        "job_url": row.get("job_url"),
+                        "application_url": _clean(row.get("application_url")),
+                        "scraped_at": _clean(row.get("date_extracted")),
+                        "refreshed_at": None,
+                    }
+                    added += self._seed_entry(job_id, entry)
+
+        if added:
+            logging.info("Seeded detail cache with %d jobs from %d new %s output(s)",
+                         added, len(seeded), job_title_clean)
+        if seeded:
+            # Seeded entries are appended before the files are recorded as seeded
+            self.save()
+            for path in seeded:
+                manifest.mark(SEED_SECTION, path)
+            manifest.save()
+        return added
+
+    # ── Reporting ─────────────────────────────────────────────────────────
+
+    def log_stats(self) -> None:
+        total = sum(self.stats.values())
+        if not total:
+            return
+        logging.info(
+            "Detail cache: %d lookups – %d hits, %d stale (application_url refresh), %d misses (%.0f%% served without full scrape)",
+            total, self.stats[HIT], self.stats[STALE], self.stats[MISS],
+            100.0 * (self.stats[HIT] + self.stats[STALE]) / total,
+        )
@@ -0,0 +1,255 @@
+"""
+Detail Worker Pool
+══════════════════
+Runs job-detail collection across N Chrome drivers in parallel.
+
+  • Each worker owns one driver (own profile dir + cookies) created
+    through ``driver_utils.create_driver``
+  • Workers pull ``(position, url)`` items from one shared queue
+  • A global ``RateLimiter`` caps total page loads per minute no matter
+    how many workers run (the serial path in ``scrape_job_details`` paces
+    itself with the same limiter, plus jitter)
+  • Results go through one ``OrderedResultWriter`` so the sink sees them
+    in the original URL order
+
+Usage:
+    from job_extraction.detail_worker_pool import run_worker_pool
+    results = run_worker_pool(links, n_workers=3, driver_factory=...,
+                              process_fn=get_job_details, max_per_minute=6)
+"""
+
+import logging
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Shared default for the global page-load cap (loads per minute, all workers)
+DEFAULT_MAX_LOADS_PER_MINUTE = 6.0
+# Extra random seconds added to each load interval on the serial path, so
+# back-to-back loads do not land on an exact period
+DEFAULT_LOAD_JITTER_S = 5.0
+
+# undetected_chromedriver patches the chromedriver binary on start-up, so
+# concurrent create_driver() calls must not overlap.
+_DRIVER_CREATE_LOCK = threading.Lock()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Global request-rate cap
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class RateLimiter:
+    """Spread page loads evenly so all workers together stay under a cap.
+
+    With *jitter_s*, each interval is lengthened by a random
+    ``0..jitter_s`` seconds – loads never come faster than the cap.
+    """
+
+    def __init__(self, max_per_minute: Optional[float], jitter_s: float = 0.0):
+        self.interval = 60.0 / max_per_minute if max_per_minute and max_per_minute > 0 else 0.0
+        self.jitter_s = jitter_s
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> float:
+        """Block until the next load slot is free; return seconds waited."""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval + random.uniform(0, self.jitter_s)
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Ordered result writer
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class OrderedResultWriter:
+    """Re-sequence out-of-order worker results into input order.
+
+    ``sink(position, result)`` is called exactly once per non-``None``
+    result, strictly in ascending position order.
+    """
+
+    def __init__(self, sink: Callable[[int, Any], None]):
+        self._sink = sink
+        self._pending: Dict[int, Any] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def submit(self, position: int, result: Any) -> None:
+        """Record a result (``None`` marks a failed position)."""
+        with self._lock:
+            self._pending[position] = result
+            self._drain()
+
+    def close(self) -> None:
+        """Flush whatever is still buffered, skipping positions never submitted."""
+        with self._lock:
+            for position in sorted(self._pending):
+                result = self._pending.pop(position)
+                if result is not None:
+                    self._sink(position, result)
+                self._next = position + 1
+
+    def _drain(self) -> None:
+        while self._next in self._pending:
+            result = self._pending.pop(self._next)
+            if result is not None:
+                self._sink(self._next, result)
+            self._next += 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Pool runner
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _worker_loop(
+    worker_id: int,
+    work_queue: "queue.Queue",
+    writer: OrderedResultWriter,
+    limiter: RateLimiter,
+    driver_factory: Callable[[int], Any],
+    process_fn: Callable[[Any, str], Any],
+    cleanup_fn: Callable[[Any], None],
+    stop_event: threading.Event,
+    deadline: Optional[float] = None,
+) -> None:
+    driver = None
+    try:
+        with _DRIVER_CREATE_LOCK:
+            driver = driver_factory(worker_id)
+        logging.info(f"Worker {worker_id}: driver ready")
+    except Exception as e:
+        logging.error(f"Worker {worker_id}: could not start driver: {e}")
+        return
+
+    try:
+        while not stop_event.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                stop_event.set()
+                break
+            try:
+                position, url = work_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            limiter.acquire()
+            try:
+                result = process_fn(driver, url)
+            except Exception as e:
+                logging.error(f"Worker {worker_id}: error processing URL {url}: {e}")
+                result = None
+            writer.submit(position, result)
+            work_queue.task_done()
+    finally:
+        try:
+            cleanup_fn(driver)
+        except Exception as e:
+            logging.warning(f"Worker {worker_id}: error during driver cleanup: {e}")
+
+
+def run_worker_pool(
+    urls: List[str],
+    n_workers: int,
+    driver_factory: Callable[[int], Any],
+    process_fn: Callable[[Any, str], Any],
+    cleanup_fn: Callable[[Any], None],
+    max_per_minute: Optional[float] = DEFAULT_MAX_LOADS_PER_MINUTE,
+    sink: Optional[Callable[[int, Any], None]] = None,
+    deadline: Optional[float] = None,
+) -> List[Any]:
+    """
+    Process *urls* with *n_workers* drivers and return results in input order.
+
+    Parameters
+    ----------
+    urls : list of str
+        URLs to visit.
+    n_workers : int
+        Number of parallel drivers (capped at ``len(urls)``).
+    driver_factory : callable
+        ``driver_factory(worker_id)`` → ready-to-use driver (cookies loaded).
+    process_fn : callable
+        ``process_fn(driver, url)`` → result (``None`` / exception = failure).
+    cleanup_fn : callable
+        ``cleanup_fn(driver)`` — called once per worker when it exits.
+    max_per_minute : float, optional
+        Global page-load cap across every worker. ``None``/0 disables it.
+    sink : callable, optional
+        Extra ``sink(position, result)`` hook, called in input order.
+    deadline : float, optional
+        ``time.monotonic()`` value after which workers take no new URLs
+        (the URL in progress is finished).
+
+    Returns
+    -------
+    list  Successful results, in the same order as *urls*.
+    """
+    if not urls:
+        return []
+
+    n_workers = max(1, min(n_workers, len(urls)))
+    work_queue: "queue.Queue" = queue.Queue()
+    for position, url in enumerate(urls):
+        work_queue.put((position, url))
+
+    results: List[Any] = []
+
+    def _collect(position: int, result: Any) -> None:
+        results.append(result)
+        if sink:
+            sink(position, result)
+
+    writer = OrderedResultWriter(_collect)
+    limiter = RateLimiter(max_per_minute)
+    stop_event = threading.Event()
+
+    logging.info(
+        f"Starting worker pool: {n_workers} workers, {len(urls)} URLs, "
+        f"cap {max_per_minute or 'unlimited'} loads/min"
+    )
+
+    threads = [
+        threading.Thread(
+            target=_worker_loop,
+            args=(i, work_queue, writer, limiter, driver_factory, process_fn, cleanup_fn, stop_event, deadline),
+            name=f"detail-worker-{i}",
+            daemon=True,
+        )
+        for i in range(n_workers)
+    ]
+    for t in threads:
+        t.start()
+
+    try:
+        for t in threads:
+            while t.is_alive():
+                t.join(timeout=1.0)
+    except KeyboardInterrupt:
+        logging.warning("Interrupted – letting workers finish their current URL...")
+        stop_event.set()
+        for t in threads:
+            t.join()
+        raise
+    finally:
+        writer.close()
+
+    remaining = work_queue.qsize()
+    if remaining and deadline is not None and time.monotonic() >= deadline:
+        logging.info(f"Time budget reached – {remaining} lower-priority URLs left for the next run")
+    elif remaining:
+        logging.warning(f"Worker pool finished with {remaining} URLs unprocessed (no live workers)")
+
+    logging.info(f"Worker pool complete: {len(results)}/{len(urls)} URLs returned results")
+    return results
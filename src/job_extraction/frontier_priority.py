@@ -0,0 +1,254 @@
+"""
+Frontier Priority
+═════════════════
+Orders the job-detail frontier by a cheap pre-score computed from
+search-card data only, so a run cut short by ``--time_budget`` has fully
+detailed the most relevant jobs first.
+
+Pre-score (0–1) per card:
+  • title       0.5 – token overlap with the master job title, best
+                      weighted Master Input Index term in the title, and a
+                      seniority penalty (``infer_seniority``) on mismatch
+  • salary      0.2 – upper bound of the card's salary text vs the target
+                      salary (neutral 0.5 when the card shows none)
+  • freshness   0.3 – LinkedIn job IDs increase over time, so a card's
+                      job-ID rank within the batch stands in for its age
+
+Cards a time-budgeted run never started are saved per title
+(``_journal/pending_<title>.jsonl``) and added to the next run's cards,
+so the lower-priority remainder is scraped then instead of dropped.
+
+Usage:
+    scorer = CardPreScorer(target_salary=160000)
+    cards_df = with_pending_cards(title_clean, cards_df)
+    frontier = PriorityFrontier.from_cards(links, cards_df, scorer)
+    while frontier:
+        url, score = frontier.pop()
+    save_pending_cards(title_clean, cards_df, unstarted_urls)
+"""
+
+import heapq
+import json
+import logging
+import os
+import re
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from artifact_io import atomic_write
+from job_extraction.input_index_generator import load_index
+from job_extraction.jd_term_extractor import infer_seniority
+from job_extraction.salary_parser import parse_salary
+from job_extraction.result_journal import pending_path_for
+from job_extraction.utils import extract_linkedin_job_id
+from paths import MASTER_JOB_TITLE_JSON
+from record_io import dumps, iter_records
+
+TITLE_WEIGHT = 0.5
+SALARY_WEIGHT = 0.2
+FRESHNESS_WEIGHT = 0.3
+
+DEFAULT_TARGET_SALARY = 150000
+SENIORITY_MISMATCH_FACTOR = 0.6
+NEUTRAL_SCORE = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {"of", "and", "the", "a", "an", "for", "in", "to", "sr", "jr", "i", "ii", "iii"}
+
+
+def _tokens(text: str) -> Set[str]:
+    return {t for t in _TOKEN_RE.findall(str(text).lower()) if t not in _STOPWORDS}
+
+
+def _load_master_title() -> Optional[str]:
+    """Master job title from config, without prompting."""
+    if MASTER_JOB_TITLE_JSON.exists():
+        try:
+            data = json.loads(MASTER_JOB_TITLE_JSON.read_text(encoding="utf-8"))
+            return (data.get("master_job_title") or "").strip() or None
+        except Exception as exc:
+            logging.warning("Could not load %s: %s", MASTER_JOB_TITLE_JSON, exc)
+    return None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Card pre-scorer
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class CardPreScorer:
+    """Relevance estimate from card fields (title, salary text, job ID)."""
+
+    def __init__(
+        self,
+        master_title: Optional[str] = None,
+        index: Optional[Dict[str, Any]] = None,
+        target_salary: Optional[float] = None,
+    ):
+        index = index if index is not None else (load_index() or {})
+        self.master_title = (
+            master_title
+            or index.get("metadata", {}).get("master_job_title")
+            or _load_master_title()
+            or ""
+        )
+        self.title_tokens = _tokens(self.master_title)
+        self.target_bands = set(infer_seniority(self.master_title)) if self.master_title else set()
+        self.target_salary = float(target_salary or DEFAULT_TARGET_SALARY)
+
+        # Index terms short enough to plausibly appear in a job title
+        self.index_terms: List[Tuple[str, float]] = []
+        for inp in index.get("inputs", []):
+            weight = float(inp.get("weight", NEUTRAL_SCORE))
+            for term in [inp.get("input", "")] + list(inp.get("aliases", []) or []):
+                term = str(term).lower().strip()
+                if 3 <= len(term) <= 40:
+                    self.index_terms.append((term, weight))
+        self.index_terms.sort(key=lambda tw: -tw[1])
+
+    def title_score(self, title: Any) -> float:
+        if title is None or (isinstance(title, float) and pd.isna(title)):
+            return 0.0
+        title_lower = str(title).lower()
+        tokens = _tokens(title_lower)
+        overlap = len(tokens & self.title_tokens) / len(self.title_tokens) if self.title_tokens else NEUTRAL_SCORE
+        # Terms are sorted by weight, so the first hit is the best one
+        index_hit = next(
+            (weight for term, weight in self.index_terms
+             if term in title_lower and re.search(rf"\b{re.escape(term)}\b", title_lower)),
+            0.0,
+        )
+        score = 0.6 * overlap + 0.4 * min(1.0, index_hit)
+        if self.target_bands and not (set(infer_seniority(title_lower)) & self.target_bands):
+            score *= SENIORITY_MISMATCH_FACTOR
+        return score
+
+    @staticmethod
+    def freshness_scores(urls: Iterable[str]) -> pd.Series:
+        """Job-ID percentile within the batch (newest → 1.0, no ID → neutral)."""
+        ids = pd.to_numeric(pd.Series([extract_linkedin_job_id(u) for u in urls], dtype=object), errors="coerce")
+        if ids.notna().sum() <= 1:
+            return pd.Series(NEUTRAL_SCORE, index=ids.index)
+        return ids.rank(pct=True).fillna(NEUTRAL_SCORE)
+
+    def score_frame(self, cards: pd.DataFrame) -> pd.Series:
+        """Pre-score every row of a card DataFrame (needs ``job_url``)."""
+        titles = cards["job_title"] if "job_title" in cards.columns else pd.Series(None, index=cards.index)
+        salaries = cards["salary_range"] if "salary_range" in cards.columns else pd.Series(None, index=cards.index)
+        title = titles.map(self.title_score)
+        upper = parse_salary(salaries)["salary_max_annual"].set_axis(cards.index)
+        salary = (upper / self.target_salary).clip(upper=1.0).fillna(NEUTRAL_SCORE)
+        freshness = self.freshness_scores(cards["job_url"].astype(str)).set_axis(cards.index)
+        return TITLE_WEIGHT * title + SALARY_WEIGHT * salary + FRESHNESS_WEIGHT * freshness
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Priority frontier
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class PriorityFrontier:
+    """Max-priority queue of URLs; ties keep insertion order."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, url: str, score: float) -> None:
+        heapq.heappush(self._heap, (-float(score), self._seq, url))
+        self._seq += 1
+
+    def pop(self) -> Tuple[str, float]:
+        neg_score, _, url = heapq.heappop(self._heap)
+        return url, -neg_score
+
+    def drain(self) -> List[str]:
+        """Every remaining URL, highest priority first (empties the frontier)."""
+        return [self.pop()[0] for _ in range(len(self))]
+
+    @classmethod
+    def from_cards(
+        cls,
+        links: List[str],
+        cards: Optional[pd.DataFrame] = None,
+        scorer: Optional[CardPreScorer] = None,
+    ) -> "PriorityFrontier":
+        """Frontier over *links*, scored from their rows in *cards* (if given)."""
+        frontier = cls()
+        if not links:
+            return frontier
+        frame = pd.DataFrame({"job_url": [str(u) for u in links]})
+        if cards is not None and not cards.empty and "job_url" in cards.columns:
+            card_cols = [c for c in ("job_url", "job_title", "salary_range") if c in cards.columns]
+            lookup = cards[card_cols].assign(job_url=cards["job_url"].astype(str)).drop_duplicates("job_url")
+            frame = frame.merge(lookup, on="job_url", how="left")
+        scores = (scorer or CardPreScorer()).score_frame(frame)
+        for url, score in zip(frame["job_url"], scores):
+            frontier.push(url, score)
+        logging.info(
+            f"Priority frontier: {len(frontier)} URLs, pre-score "
+            f"max {scores.max():.2f} / median {scores.median():.2f} / min {scores.min():.2f}"
+        )
+        return frontier
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Pending cards (carried to the next run)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def load_pending_cards(job_title_clean: str) -> pd.DataFrame:
+    """Cards the title's last time-budgeted run left unstarted (empty if none)."""
+    path = pending_path_for(job_title_clean)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logging.warning("Skipping corrupt line in %s", path)
+    return pd.DataFrame(records)
+
+
+def save_pending_cards(job_title_clean: str, cards: Optional[pd.DataFrame], urls: Iterable[str]) -> int:
+    """Replace the title's pending cards with the rows of *urls* (removes the file when none)."""
+    path = pending_path_for(job_title_clean)
+    urls = list(dict.fromkeys(str(u) for u in urls))
+    if not urls:
+        if os.path.exists(path):
+            os.remove(path)
+        return 0
+    if cards is not None and not cards.empty and "job_url" in cards.columns:
+        rows = cards.assign(job_url=cards["job_url"].astype(str)).drop_duplicates("job_url").set_index("job_url")
+        rows = rows.reindex(urls).reset_index()
+    else:
+        rows = pd.DataFrame({"job_url": urls})
+    with atomic_write(path, "wb") as f:
+        for record in iter_records(rows):
+            f.write(dumps(record) + b"\n")
+    logging.info(f"Saved {len(urls)} unstarted URLs for the next run: {path}")
+    return len(urls)
+
+
+def with_pending_cards(job_title_clean: str, cards: pd.DataFrame) -> pd.DataFrame:
+    """*cards* plus the pending cards it does not already hold (this run's rows win)."""
+    pending = load_pending_cards(job_title_clean)
+    if pending.empty or "job_url" not in pending.columns:
+        return cards
+    if cards is not None and not cards.empty and "job_url" in cards.columns:
+        pending = pending[~pending["job_url"].astype(str).isin(set(cards["job_url"].astype(str)))]
+    if pending.empty:
+        return cards
+    logging.info(f"Carrying over {len(pending)} URLs left unstarted by the previous run")
+    if cards is None or cards.empty:
+        return pending.reset_index(drop=True)
+    return pd.concat([cards, pending], ignore_index=True)
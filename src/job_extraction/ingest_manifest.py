@@ -0,0 +1,118 @@
+"""
+Ingest Manifest
+═══════════════
+Records which input files a title's aggregation has already ingested, so
+each run reads only new or changed files instead of re-parsing the whole
+(ever-growing) ``job_details`` history.
+
+Per file: path, size, mtime, SHA-1 of the content and rows ingested.
+A file counts as changed when its size or mtime differ AND its content
+hash differs (a touched-but-identical file is not re-read).
+
+One JSON file per title, with a section per input family:
+
+    data/aggregated/<title>/_ingest_manifest.json
+    {"job_details": {"<path>": {...}}, "salary": {...}}
+
+Usage:
+    manifest = IngestManifest(job_title_clean)
+    for path in manifest.changed("job_details", detail_files):
+        ...read path...
+        manifest.mark("job_details", path, rows=len(df))
+    manifest.save()           # only after the outputs are written
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from artifact_io import write_json
+from paths import ingest_manifest_for
+
+_HASH_CHUNK = 1 << 20
+
+
+def file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    """Per-title record of ingested files (path → size / mtime / hash)."""
+
+    def __init__(self, job_title_clean: str, path: Optional[str] = None):
+        self.path = path or str(ingest_manifest_for(job_title_clean))
+        self._sections: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._hashes: Dict[str, str] = {}   # hashes computed this run
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._sections = json.load(f).get("sections", {})
+        except Exception as e:
+            logging.warning("Could not read ingest manifest %s (full re-read): %s", self.path, e)
+            self._sections = {}
+
+    def save(self) -> None:
+        payload = {
+            "updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "sections": self._sections,
+        }
+        write_json(self.path, payload)
+
+    def reset(self, section: Optional[str] = None) -> None:
+        """Forget ingested files (all sections, or one) – forces a full re-read."""
+        if section is None:
+            self._sections = {}
+        else:
+            self._sections.pop(section, None)
+
+    def _hash(self, path: str) -> str:
+        if path not in self._hashes:
+            self._hashes[path] = file_sha1(path)
+        return self._hashes[path]
+
+    def changed(self, section: str, paths: Iterable[str]) -> List[str]:
+        """The subset of *paths* that is new or whose content changed."""
+        entries = self._sections.get(section, {})
+        out = []
+        for path in sorted(paths):
+            entry = entries.get(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime:
+                continue
+            if entry and entry.get("sha1") == self._hash(path):
+                # Touched but identical: refresh the stat so it is not hashed again
+                entry.update({"size": stat.st_size, "mtime": stat.st_mtime})
+                continue
+            out.append(path)
+        return out
+
+    def mark(self, section: str, path: str, rows: Optional[int] = None) -> None:
+        """Record *path* as ingested in its current state."""
+        stat = os.stat(path)
+        self._sections.setdefault(section, {})[path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "sha1": self._hash(path),
+            "rows": rows,
+            "ingested_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def count(self, section: str) -> int:
+        return len(self._sections.get(section, {}))
@@ -8,7 +8,8 @@ Strategies (applied in order):
   2. Lemmatise: NLTK WordNet lemmatiser (scraping → scrape)
   3. Alias match: if A in B.aliases or B in A.aliases → merge
   4. Abbreviation expansion: SQL, ML, NLP, CRM, etc.
-  5. Fuzzy match: difflib.SequenceMatcher ratio > 0.88
+  5. Fuzzy match: difflib.SequenceMatcher ratio > 0.88, on candidate
+     pairs from a lossless bigram prefix filter (no size cap)
 
 Merge policy:
   • Keep the record with more metadata / higher weight
@@ -21,9 +22,10 @@ import logging
 import re
 from collections import defaultdict
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import nltk
+import numpy as np
 
 for _pkg, _res in [
     ("wordnet", "corpora/wordnet"),
@@ -91,6 +93,130 @@ for abbr, expansions in ABBREVIATIONS.items():
         _EXPANSION_TO_ABBR[exp.lower()] = abbr.lower()
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Fuzzy candidate blocking
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class BigramBlocker:
+    """
+    Lossless candidate generation for fuzzy matching on ``SequenceMatcher`` ratio.
+
+    A ratio >= t means the matched characters M satisfy 2M >= t(la+lb), so
+    the indel distance d = la + lb - 2·LCS <= floor((1-t)(la+lb)).  Each
+    indel destroys at most q q-grams, so the keys share at least
+    τ = max(la, lb) - q + 1 - q·d bigrams (as multisets).
+
+      • prefix filter   bigrams sorted rarest first; keys can only share τ
+                        bigrams if the first |A| - τ_min + 1 of each
+                        intersect, so only those are indexed and probed
+      • count filter    the exact shared-bigram count against τ for the
+                        pair, plus the length filter, vectorised per key
+
+    Keys too short for a positive bound are compared with every key of a
+    compatible length.
+    """
+
+    Q = 2
+
+    def __init__(self, keys: Sequence[str], threshold: float, max_length_gap: float):
+        self.keys = list(keys)
+        self.threshold = threshold
+        self.max_length_gap = max_length_gap
+        self.lengths = np.array([len(key) for key in self.keys], dtype=np.int64)
+
+        vocab: Dict[Tuple[str, int], int] = {}
+        rows = [[vocab.setdefault(tok, len(vocab)) for tok in self._grams(key)] for key in self.keys]
+        # CSR layout: key pos holds bigram ids indices[indptr[pos]:indptr[pos + 1]]
+        indptr = np.cumsum([0] + [len(row) for row in rows])
+        indices = np.fromiter((col for row in rows for col in row), dtype=np.int64, count=int(indptr[-1]))
+        self._indptr, self._indices = indptr, indices
+        freq = np.bincount(indices, minlength=len(vocab))
+        self._mark = np.zeros(len(vocab), dtype=bool)
+
+        by_length: Dict[int, List[int]] = defaultdict(list)
+        short: List[int] = []
+        postings: Dict[int, List[int]] = defaultdict(list)
+        self.prefixes: List[List[int]] = []
+        min_overlap: Dict[int, int] = {}
+        for pos, (key, row) in enumerate(zip(self.keys, rows)):
+            by_length[len(key)].append(pos)
+            if len(key) not in min_overlap:
+                min_overlap[len(key)] = self._min_overlap(len(key))
+            overlap = min_overlap[len(key)]
+            if overlap <= 0 or not row:
+                short.append(pos)
+                self.prefixes.append([])
+                continue
+            prefix = sorted(row, key=lambda col: (freq[col], col))[:len(row) - overlap + 1]
+            self.prefixes.append(prefix)
+            for col in prefix:
+                postings[col].append(pos)
+
+        self._short = np.array(short, dtype=np.int64)
+        self._postings = {col: np.array(group, dtype=np.int64) for col, group in postings.items()}
+        self._by_length = {la: np.array(group, dtype=np.int64) for la, group in by_length.items()}
+
+    @classmethod
+    def _grams(cls, key: str) -> List[Tuple[str, int]]:
+        """Bigrams with occurrence numbers, so set overlap counts the multiset."""
+        seen: Dict[str, int] = defaultdict(int)
+        out = []
+        for i in range(len(key) - cls.Q + 1):
+            gram = key[i:i + cls.Q]
+            out.append((gram, seen[gram]))
+            seen[gram] += 1
+        return out
+
+    def compatible(self, la, lb):
+        """The length filter applied before computing a ratio (scalars or arrays)."""
+        return np.abs(la - lb) <= np.maximum(la, lb) * self.max_length_gap
+
+    def _bound(self, la, lb):
+        max_indels = np.floor((1 - self.threshold) * (la + lb) + 1e-9)
+        return np.maximum(la, lb) - self.Q + 1 - self.Q * max_indels
+
+    def _min_overlap(self, la: int) -> int:
+        """Smallest shared-bigram bound over every length-compatible partner."""
+        lb = np.arange(int(la / (1 - self.max_length_gap)) + 2)
+        bounds = self._bound(la, lb[self.compatible(la, lb)])
+        return int(bounds.min()) if len(bounds) else 0
+
+    def candidates(self, pos: int, after: int) -> List[int]:
+        """
+        Positions after *after*, ascending, that may reach the threshold
+        against key *pos* – a superset of its fuzzy matches.
+        """
+        la = int(self.lengths[pos])
+        if self.prefixes[pos]:
+            groups = [self._postings[col] for col in self.prefixes[pos]] + [self._short]
+        else:
+            groups = [group for lb, group in self._by_length.items() if self.compatible(la, lb)]
+        if not groups:
+            return []
+        found = np.concatenate(groups)
+        found = np.unique(found[found > after])
+        lb = self.lengths[found]
+        bound = self._bound(la, lb)
+        keep = self.compatible(la, lb)
+        check = keep & (bound > 0)
+        if check.any():
+            keep[check] = self._shared(pos, found[check]) >= bound[check]
+        return found[keep].tolist()
+
+    def _shared(self, pos: int, rows: np.ndarray) -> np.ndarray:
+        """Bigrams each of *rows* shares with key *pos* (every row has at least one)."""
+        indptr, indices = self._indptr, self._indices
+        own = indices[indptr[pos]:indptr[pos + 1]]
+        self._mark[own] = True
+        starts, counts = indptr[rows], indptr[rows + 1] - indptr[rows]
+        offsets = np.cumsum(counts) - counts
+        gather = np.arange(int(counts.sum())) - np.repeat(offsets - starts, counts)
+        shared = np.add.reduceat(self._mark[indices[gather]].astype(np.int64), offsets)
+        self._mark[own] = False
+        return shared
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Core deduplicator
 # ═══════════════════════════════════════════════════════════════════════════
@@ -261,8 +387,10 @@ class InputDeduplicator:
     def _fuzzy_merge(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge items with fuzzy-similar names (SequenceMatcher > threshold).
         
-        Only attempts fuzzy matching on items with short names (≤5 words)
-        to keep runtime tractable on large indexes.
+        Only attempts fuzzy matching on items with short names (≤5 words).
+        Canonical keys are computed once, and each item is compared only
+        with the candidates ``BigramBlocker`` cannot rule out, so the
+        merges are the same as comparing every pair, at any index size.
         """
         if len(items) <= 1:
             return items
@@ -270,7 +398,7 @@ class InputDeduplicator:
         # Split into candidates for fuzzy matching vs pass-through
         # Only fuzzy-match short terms; long/unique phrases pass through
         MAX_WORDS_FOR_FUZZY = 5
-        MAX_ITEMS_FOR_FUZZY = 2000  # safety cap
+        MAX_LENGTH_GAP = 0.3    # very different lengths can't be fuzzy matches
 
         candidates = []
         passthrough = []
@@ -281,35 +409,50 @@ class InputDeduplicator:
             else:
                 passthrough.append(item)
 
-        # If too many candidates, skip fuzzy (canonical + alias merge is enough)
-        if len(candidates) > MAX_ITEMS_FOR_FUZZY:
-            logging.info(
-                "Fuzzy merge: skipping — %d candidates exceeds cap of %d.",
-                len(candidates), MAX_ITEMS_FOR_FUZZY,
-            )
-            return items
+        key_of: Dict[str, str] = {}
+        for item in candidates:
+            text = item.get("input", "")
+            if text not in key_of:
+                key_of[text] = self.canonical_key(text)
+        keys = [key_of[item.get("input", "")] for item in candidates]
+        blocker = BigramBlocker(keys, self.FUZZY_THRESHOLD, MAX_LENGTH_GAP)
+        source = {key: pos for pos, key in reversed(list(enumerate(keys)))}
 
         merged_indices: Set[int] = set()
         result: List[Dict[str, Any]] = []
+        compared = 0
 
         for i in range(len(candidates)):
             if i in merged_indices:
                 continue
             current = candidates[i]
-            for j in range(i + 1, len(candidates)):
+            name_a = keys[i]
+            pending = blocker.candidates(i, i)
+            pos = 0
+            while pos < len(pending):
+                j = pending[pos]
+                pos += 1
                 if j in merged_indices:
                     continue
-                name_a = self.canonical_key(current.get("input", ""))
-                name_b = self.canonical_key(candidates[j].get("input", ""))
-                # Quick length check — very different lengths can't be fuzzy matches
-                if abs(len(name_a) - len(name_b)) > max(len(name_a), len(name_b)) * 0.3:
-                    continue
-                ratio = SequenceMatcher(None, name_a, name_b).ratio()
-                if ratio >= self.FUZZY_THRESHOLD:
+                compared += 1
+                matcher = SequenceMatcher(None, name_a, keys[j])
+                if (matcher.real_quick_ratio() >= self.FUZZY_THRESHOLD
+                        and matcher.quick_ratio() >= self.FUZZY_THRESHOLD
+                        and matcher.ratio() >= self.FUZZY_THRESHOLD):
                     current = self._merge_two(current, candidates[j])
                     merged_indices.add(j)
+                    new_name = key_of[current.get("input", "")]
+                    if new_name != name_a:
+                        # The merged record took the other name: block on its key from here on
+                        name_a = new_name
+                        pending = blocker.candidates(source[new_name], j)
+                        pos = 0
             result.append(current)
 
+        logging.info(
+            "Fuzzy merge: %d candidates, %d pairs compared, %d merged.",
+            len(candidates), compared, len(merged_indices),
+        )
         return result + passthrough
 
     @staticmethod
@@ -33,6 +33,7 @@ from paths import (
     ALIGNMENT_DIR,
     PROJECT_ROOT,
 )
+from artifact_io import write_json
 from job_extraction.input_deduplicator import deduplicate_inputs
 
 logging.basicConfig(
@@ -574,9 +575,7 @@ def _save_index(
         "inputs": inputs,
     }
 
-    MASTER_INPUT_INDEX.write_text(
-        json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    write_json(MASTER_INPUT_INDEX, index)
     logging.info(
         "Saved master input index: %d inputs → %s",
         len(inputs), MASTER_INPUT_INDEX,
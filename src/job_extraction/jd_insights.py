@@ -31,6 +31,10 @@ from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 
 from paths import master_aggregated_csv, insights_for, UNIFIED_MASTER_CSV
+from job_extraction.job_store import JobStore
+from job_extraction.near_duplicates import NearDuplicateIndex
+from artifact_io import artifact_lock, write_csv, write_json
+from job_db import get_job_db
 
 # ---------------------------------------------------------------------------
 # NLP imports (NLTK – already in requirements.txt)
@@ -337,8 +341,13 @@ def _load_json(path: Path) -> Optional[dict]:
 
 
 def _save_json(path: Path, data: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(path, data)
+
+
+# Columns projected from the job store for analysis
+INSIGHT_COLUMNS = ["job_url", "job_title", "description", "company", "company_title", "location"]
+# Stage name for the job database's processed-URL tracker
+INSIGHTS_STAGE = "jd_insights"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -350,33 +359,49 @@ def run_jd_insights(job_title: str, base_path: str = None, csv_path: str = None)
     """
     Run aggregated JD insights for *job_title*.
 
-    Resolution order for the source CSV:
+    Resolution order for the source:
       1. Explicit *csv_path* argument.
-      2. Per-title master aggregated CSV derived from *job_title*.
-      3. Unified master CSV as a last-resort fallback.
+      2. The job store (only the columns the analysis uses).
+      3. Per-title master aggregated CSV derived from *job_title*.
+      4. Unified master CSV as a last-resort fallback.
 
     Reads the CSV, analyses only previously-unprocessed jobs, merges
     with cumulative results, and writes:
         data/insights/<title>/<title>_cumulative_insights.json
         data/insights/<title>/reports/*.csv
 
+    The cumulative JSON stays locked for the whole run, so overlapping runs
+    for the same title neither double-count jobs nor lose each other's merge.
+
     Returns the path to the cumulative JSON or ``None`` on failure.
     """
     jt_clean = job_title.lower().replace(" ", "_")
+    with artifact_lock(insights_for(jt_clean) / f"{jt_clean}_cumulative_insights.json"):
+        return _run_jd_insights(job_title, csv_path)
+
+
+def _run_jd_insights(job_title: str, csv_path: Optional[str]) -> Optional[str]:
+    """Body of run_jd_insights (called with the cumulative JSON locked)."""
+    jt_clean = job_title.lower().replace(" ", "_")
 
-    # ── locate master aggregated CSV ──────────────────────────────────────
-    if csv_path and os.path.exists(csv_path):
-        master_csv = csv_path
+    # ── locate jobs: explicit CSV → job store → master aggregated CSV ─────
+    store = JobStore()
+    if not (csv_path and os.path.exists(csv_path)) and store.has(jt_clean):
+        master_csv = f"job store ({jt_clean})"
+        df = store.read(jt_clean, columns=INSIGHT_COLUMNS, side=False)
     else:
-        master_csv = str(master_aggregated_csv(jt_clean))
-        if not os.path.exists(master_csv):
-            master_csv = str(UNIFIED_MASTER_CSV)
+        if csv_path and os.path.exists(csv_path):
+            master_csv = csv_path
+        else:
+            master_csv = str(master_aggregated_csv(jt_clean))
+            if not os.path.exists(master_csv):
+                master_csv = str(UNIFIED_MASTER_CSV)
 
-    if not os.path.exists(master_csv):
-        logging.warning("Master aggregated CSV not found: %s", master_csv)
-        return None
+        if not os.path.exists(master_csv):
+            logging.warning("Master aggregated CSV not found: %s", master_csv)
+            return None
 
-    df = pd.read_csv(master_csv)
+        df = pd.read_csv(master_csv)
     if df.empty:
         logging.warning("Master aggregated CSV is empty.")
         return None
@@ -386,22 +411,27 @@ def run_jd_insights(job_title: str, base_path: str = None, csv_path: str = None)
     # ── tracker: skip already-processed job URLs ──────────────────────────
     insights_dir = insights_for(jt_clean)
     insights_dir.mkdir(parents=True, exist_ok=True)
+    # Processed URLs live in the job database (legacy JSON tracker imported once)
+    db = get_job_db()
     tracker_path = insights_dir / f"{jt_clean}_processed_urls.json"
-    processed_urls: set = set()
-
-    tracker_data = _load_json(tracker_path)
-    if tracker_data:
-        processed_urls = set(tracker_data.get("urls", []))
-        logging.info("JD Insights: %d URLs already processed.", len(processed_urls))
 
     # filter to new rows only
     if "job_url" in df.columns:
-        new_mask = ~df["job_url"].astype(str).isin(processed_urls)
-        new_df = df[new_mask]
+        pending = set(db.unprocessed(INSIGHTS_STAGE, df["job_url"].astype(str), scope=jt_clean,
+                                     legacy_json=str(tracker_path)))
+        logging.info("JD Insights: %d URLs already processed.", df["job_url"].nunique() - len(pending))
+        new_df = df[df["job_url"].astype(str).isin(pending)]
     else:
         new_df = df
+    pending_df = new_df
+    # Reposts count once: one job per near-duplicate cluster, none already analysed
+    if "job_url" in df.columns:
+        done = df.loc[~df["job_url"].astype(str).isin(pending), "job_url"].astype(str)
+        new_df = NearDuplicateIndex().representatives(new_df, done=done)
 
     if new_df.empty:
+        if not pending_df.empty and "job_url" in pending_df.columns:
+            db.mark_processed(INSIGHTS_STAGE, pending_df["job_url"].astype(str), scope=jt_clean)
         logging.info("JD Insights: no new jobs to analyse – skipping.")
         # Still return the cumulative path so downstream can use it.
         cum_path = insights_dir / f"{jt_clean}_cumulative_insights.json"
@@ -499,7 +529,7 @@ def run_jd_insights(job_title: str, base_path: str = None, csv_path: str = None)
         if key in cumulative and cumulative[key]:
             top = Counter(cumulative[key]).most_common(limit)
             rdf = pd.DataFrame(top, columns=[col_label, "Count"])
-            rdf.to_csv(reports_dir / f"{jt_clean}_{key}.csv", index=False)
+            write_csv(rdf, reports_dir / f"{jt_clean}_{key}.csv", index=False)
 
     # category phrase reports
     for cat_key in [
@@ -511,15 +541,14 @@ def run_jd_insights(job_title: str, base_path: str = None, csv_path: str = None)
         if pkey in cumulative and cumulative[pkey]:
             top = Counter(cumulative[pkey]).most_common(100)
             rdf = pd.DataFrame(top, columns=["Phrase", "Count"])
-            rdf.to_csv(reports_dir / f"{jt_clean}_{cat_key}.csv", index=False)
+            write_csv(rdf, reports_dir / f"{jt_clean}_{cat_key}.csv", index=False)
 
     logging.info("Saved CSV reports to: %s", reports_dir)
 
     # ── update processed-URL tracker ──────────────────────────────────────
-    if "job_url" in new_df.columns:
-        processed_urls.update(new_df["job_url"].astype(str).tolist())
-    _save_json(tracker_path, {"urls": sorted(processed_urls)})
-    logging.info("Updated processed-URL tracker (%d total).", len(processed_urls))
+    if "job_url" in pending_df.columns:
+        db.mark_processed(INSIGHTS_STAGE, pending_df["job_url"].astype(str), scope=jt_clean)
+    logging.info("Updated processed-URL tracker (%d total).", db.processed_count(INSIGHTS_STAGE, scope=jt_clean))
 
     return str(cum_path)
 
@@ -39,6 +39,10 @@ from paths import (
 )
 from job_extraction.jd_insights import JDInsightExtractor, CATEGORY_KEYWORDS
 from job_extraction.input_deduplicator import InputDeduplicator, deduplicate_inputs
+from job_extraction.job_store import JobStore
+from job_extraction.near_duplicates import NearDuplicateIndex
+from artifact_io import artifact_lock, write_json
+from job_db import get_job_db
 
 logging.basicConfig(
     level=logging.INFO,
@@ -108,27 +112,13 @@ CATEGORY_TO_TYPE: Dict[str, str] = {
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _tracker_path() -> Path:
-    return ALIGNMENT_DIR / "jd_term_processed_urls.json"
-
+# Stage name in the job database's processed-URL tracker
+TERM_STAGE = "jd_term_extractor"
 
-def _load_processed_urls() -> Set[str]:
-    tp = _tracker_path()
-    if tp.exists():
-        try:
-            data = json.loads(tp.read_text(encoding="utf-8"))
-            return set(data.get("urls", []))
-        except Exception:
-            pass
-    return set()
 
-
-def _save_processed_urls(urls: Set[str]) -> None:
-    tp = _tracker_path()
-    tp.parent.mkdir(parents=True, exist_ok=True)
-    tp.write_text(
-        json.dumps({"urls": sorted(urls)}, indent=2), encoding="utf-8"
-    )
+def _tracker_path() -> Path:
+    """Legacy JSON tracker (imported into the job database on first use)."""
+    return ALIGNMENT_DIR / "jd_term_processed_urls.json"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -181,6 +171,9 @@ class IndexMatcher:
 # Core enrichment
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Columns read from the job store (the extractor needs no others)
+TERM_JOB_COLUMNS = ["job_url", "job_title", "description"]
+
 
 def enrich_index_from_jds(
     index: Dict[str, Any],
@@ -195,42 +188,74 @@ def enrich_index_from_jds(
     index : dict
         The current master input index (with 'metadata' and 'inputs').
     job_title : str
-        The search title (used to locate the aggregated CSV).
+        The search title (used to locate its jobs).
     csv_path : str, optional
-        Explicit path to a CSV file with a 'description' column.
+        Explicit path to a CSV file with a 'description' column.  Without
+        one, jobs are read from the job store (falling back to the
+        per-title / unified master CSV).
 
     Returns
     -------
     dict  The updated index.
+
+    The index file stays locked for the whole run and is re-read under the
+    lock, so parallel title pipelines add to each other's terms instead of
+    overwriting them.
     """
+    with artifact_lock(MASTER_INPUT_INDEX):
+        if MASTER_INPUT_INDEX.exists():
+            try:
+                index = json.loads(MASTER_INPUT_INDEX.read_text(encoding="utf-8"))
+            except Exception as exc:
+                logging.warning("Could not re-read %s, using the caller's index: %s", MASTER_INPUT_INDEX, exc)
+        return _enrich_index_from_jds(index, job_title, csv_path)
+
+
+def _enrich_index_from_jds(
+    index: Dict[str, Any],
+    job_title: str,
+    csv_path: Optional[str],
+) -> Dict[str, Any]:
+    """Body of enrich_index_from_jds (called with the index locked)."""
     jt_clean = job_title.lower().replace(" ", "_")
 
-    # Locate CSV
+    # Locate source: explicit CSV → job store → per-title / unified CSV
+    store = JobStore()
+    source_csv = None
     if csv_path and os.path.exists(csv_path):
         source_csv = csv_path
-    else:
+    elif not store.has(jt_clean):
         source_csv = str(master_aggregated_csv(jt_clean))
         if not os.path.exists(source_csv):
             source_csv = str(UNIFIED_MASTER_CSV)
 
-    if not os.path.exists(source_csv):
+    if source_csv is None:
+        df = store.read(jt_clean, columns=TERM_JOB_COLUMNS, side=False)
+    elif not os.path.exists(source_csv):
         logging.warning("No aggregated CSV found for JD enrichment.")
         return index
-
-    df = pd.read_csv(source_csv)
+    else:
+        df = pd.read_csv(source_csv)
     if df.empty or "description" not in df.columns:
         logging.warning("CSV empty or missing 'description' column.")
         return index
 
-    # Filter to unprocessed URLs
-    processed = _load_processed_urls()
+    # Filter to unprocessed URLs (indexed lookup in the job database)
+    db = get_job_db()
     if "job_url" in df.columns:
-        new_mask = ~df["job_url"].astype(str).isin(processed)
-        new_df = df[new_mask]
+        pending = set(db.unprocessed(TERM_STAGE, df["job_url"].astype(str), legacy_json=str(_tracker_path())))
+        new_df = df[df["job_url"].astype(str).isin(pending)]
     else:
         new_df = df
+    pending_df = new_df
+    # Reposts count once: one job per near-duplicate cluster, none already processed
+    if "job_url" in df.columns:
+        done = df.loc[~df["job_url"].astype(str).isin(pending), "job_url"].astype(str)
+        new_df = NearDuplicateIndex().representatives(new_df, done=done)
 
     if new_df.empty:
+        if not pending_df.empty and "job_url" in pending_df.columns:
+            db.mark_processed(TERM_STAGE, pending_df["job_url"].astype(str))
         logging.info("JD Term Extractor: no new jobs to process.")
         return index
 
@@ -338,9 +363,8 @@ def enrich_index_from_jds(
             )
 
     # Update processed URLs
-    if "job_url" in new_df.columns:
-        processed.update(new_df["job_url"].astype(str).tolist())
-    _save_processed_urls(processed)
+    if "job_url" in pending_df.columns:
+        db.mark_processed(TERM_STAGE, pending_df["job_url"].astype(str))
 
     # Save updated index
     index["inputs"] = inputs
@@ -355,10 +379,7 @@ def enrich_index_from_jds(
             source_counts[src] += 1
     index["metadata"]["sources"] = source_counts
 
-    MASTER_INPUT_INDEX.parent.mkdir(parents=True, exist_ok=True)
-    MASTER_INPUT_INDEX.write_text(
-        json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    write_json(MASTER_INPUT_INDEX, index)
     logging.info(
         "JD Term Extractor: index updated → %d total inputs (%d from JDs).",
         len(inputs), source_counts.get("jd", 0) + source_counts.get("both", 0),
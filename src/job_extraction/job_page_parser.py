@@ -0,0 +1,265 @@
+"""
+Job Page Parser
+═══════════════
+Extracts every job-detail field from ONE ``driver.page_source`` snapshot
+in a single lxml pass, instead of one WebDriver round trip (and one
+15-second timeout when absent) per field.
+
+Fields:
+  • job_title        h1
+  • company          top-card company link
+  • description      "About the job" module (whitespace-normalised)
+  • date_text        raw "Posted 3 days ago" text from the tertiary container
+  • location         first span of the primary description container
+  • salary           first preferences-and-skills pill
+  • remote_status    Remote / Hybrid / Onsite from the fit-level preferences
+
+Works offline on saved HTML (e.g. the ``data/debug/*.html`` snapshots
+written by ``capture_url_debug_snapshot``):
+
+    python src/job_extraction/job_page_parser.py --html data/debug/x.html
+    python src/job_extraction/job_page_parser.py --benchmark data/debug/*.html
+"""
+
+import argparse
+import glob
+import json
+import logging
+import re
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+import lxml.html
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Selectors (kept identical to the WebDriver path in job_url_details)
+# ═══════════════════════════════════════════════════════════════════════════
+
+TOP_CARD_SELECTOR = "h1"
+DESCRIPTION_SELECTOR = (
+    "div.job-details-about-the-job-module__description div.feed-shared-inline-show-more-text"
+)
+COMPANY_SELECTOR = "div.job-details-jobs-unified-top-card__company-name a"
+TERTIARY_SELECTOR = "div.job-details-jobs-unified-top-card__tertiary-description-container"
+TERTIARY_SPAN_SELECTOR = "span.tvm__text.tvm__text--low-emphasis"
+LOCATION_SELECTOR = (
+    "div.job-details-jobs-unified-top-card__primary-description-container span.tvm__text"
+)
+SALARY_SELECTOR = "div.job-details-preferences-and-skills__pill span.ui-label.text-body-small"
+PREFERENCES_SELECTOR = "div.job-details-fit-level-preferences"
+
+TIME_AGO_PATTERN = re.compile(r"(\d+)\s*(hour|day|week|month)s?\s*ago", re.IGNORECASE)
+
+# Elements whose boundaries Selenium renders as line breaks
+_BLOCK_TAGS = {
+    "p", "div", "li", "ul", "ol", "br", "section", "article",
+    "h1", "h2", "h3", "h4", "h5", "h6", "tr", "td", "th", "table",
+}
+# Elements never rendered as visible text
+_SKIP_TAGS = {"script", "style", "noscript", "template"}
+
+
+@dataclass
+class JobPageRecord:
+    """Typed result of a job-page extraction (missing fields use the legacy defaults)."""
+
+    job_title: Optional[str] = None
+    company: str = "-"
+    description: str = "-"
+    date_text: Optional[str] = None
+    location: str = "-"
+    salary: str = "-"
+    remote_status: str = "Onsite"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Text helpers
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _is_hidden(el) -> bool:
+    if el.tag in _SKIP_TAGS:
+        return True
+    classes = (el.get("class") or "").split()
+    return "visually-hidden" in classes
+
+
+def _collect_text(el, parts: List[str]) -> None:
+    if not isinstance(el.tag, str) or _is_hidden(el):
+        return
+    block = el.tag in _BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if el.text:
+        parts.append(el.text)
+    for child in el:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+
+
+def element_text(el) -> str:
+    """Approximate Selenium's ``.text``: visible text, block elements on new lines."""
+    parts: List[str] = []
+    _collect_text(el, parts)
+    lines = [" ".join(line.split()) for line in "".join(parts).split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+def _first(root, selector: str):
+    found = root.cssselect(selector)
+    return found[0] if found else None
+
+
+def find_date_text(span_texts: List[str], container_text: str) -> Optional[str]:
+    """Pick the posted-date text from tertiary-container spans, else from its full text."""
+    for span_text in span_texts:
+        span_text = span_text.strip()
+        if TIME_AGO_PATTERN.search(span_text):
+            return span_text
+        if "reposted" in span_text.lower() or "posted" in span_text.lower():
+            return span_text
+
+    time_match = TIME_AGO_PATTERN.search(container_text or "")
+    if time_match:
+        match_start = max(0, time_match.start() - 10)
+        match_end = min(len(container_text), time_match.end())
+        date_text = container_text[match_start:match_end].strip()
+        return re.sub(r"^[·\s]+", "", date_text)
+    return None
+
+
+def normalise_description(text: str) -> str:
+    """Same clean-up the scraper has always applied to descriptions."""
+    text = text.replace("-", " ").strip()
+    return re.sub(r"\s+", " ", text)
+
+
+def remote_status_from_buttons(button_texts: List[str]) -> str:
+    """Map the fit-level preference buttons to Remote / Hybrid / Onsite."""
+    for text in button_texts:
+        if "Remote" in text:
+            return "Remote"
+        if "Hybrid" in text:
+            return "Hybrid"
+        if "Onsite" in text:
+            return "Onsite"
+    return "Onsite"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Single-pass extraction
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def parse_job_page(html: str) -> JobPageRecord:
+    """Extract all job-detail fields from one HTML snapshot."""
+    record = JobPageRecord()
+    if not html:
+        return record
+
+    root = lxml.html.fromstring(html)
+
+    title_el = _first(root, TOP_CARD_SELECTOR)
+    if title_el is not None:
+        record.job_title = element_text(title_el).strip() or None
+
+    desc_el = _first(root, DESCRIPTION_SELECTOR)
+    if desc_el is not None:
+        record.description = normalise_description(element_text(desc_el))
+
+    company_el = _first(root, COMPANY_SELECTOR)
+    if company_el is not None:
+        record.company = element_text(company_el).strip()
+
+    tertiary_el = _first(root, TERTIARY_SELECTOR)
+    if tertiary_el is not None:
+        span_texts = [element_text(s) for s in tertiary_el.cssselect(TERTIARY_SPAN_SELECTOR)]
+        record.date_text = find_date_text(span_texts, element_text(tertiary_el))
+
+    location_el = _first(root, LOCATION_SELECTOR)
+    if location_el is not None:
+        record.location = element_text(location_el).strip()
+
+    salary_el = _first(root, SALARY_SELECTOR)
+    if salary_el is not None:
+        record.salary = element_text(salary_el).strip()
+
+    prefs_el = _first(root, PREFERENCES_SELECTOR)
+    if prefs_el is not None:
+        buttons = [element_text(b).strip() for b in prefs_el.iter("button")]
+        record.remote_status = remote_status_from_buttons(buttons)
+
+    return record
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CLI – offline parsing + benchmark
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def benchmark(paths: List[str], repeat: int = 5) -> None:
+    """Print per-job extraction latency for saved HTML snapshots."""
+    timings: List[float] = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            record = parse_job_page(html)
+            runs.append(time.perf_counter() - start)
+        best = min(runs)
+        timings.append(best)
+        print(f"{best * 1000:8.2f} ms  {path}  title={record.job_title!r}")
+
+    if timings:
+        print(
+            f"\n{len(timings)} pages: mean {statistics.mean(timings) * 1000:.2f} ms, "
+            f"max {max(timings) * 1000:.2f} ms per job (snapshot parse)"
+        )
+        print(
+            "Compare with the per-job 'Field extraction (webdriver)' timings logged by "
+            "job_url_details.py --extraction webdriver."
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse saved LinkedIn job pages offline.")
+    parser.add_argument("--html", nargs="*", default=[], help="HTML file(s) to parse and print.")
+    parser.add_argument("--benchmark", nargs="*", default=None,
+                        help="HTML file(s) to time (default: data/debug/*.html).")
+    parser.add_argument("--repeat", type=int, default=5, help="Benchmark repetitions per file.")
+    args = parser.parse_args()
+
+    for path in args.html:
+        with open(path, "r", encoding="utf-8") as f:
+            record = parse_job_page(f.read())
+        print(json.dumps({"file": path, **asdict(record)}, indent=2, ensure_ascii=False))
+
+    if args.benchmark is not None:
+        paths = args.benchmark
+        if not paths:
+            import os
+            import sys
+            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            from paths import DEBUG_DIR
+            paths = sorted(glob.glob(str(DEBUG_DIR / "*.html")))
+        if not paths:
+            logging.warning("No HTML snapshots found to benchmark.")
+            return
+        benchmark(paths, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
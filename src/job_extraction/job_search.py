@@ -15,10 +15,11 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 import pandas as pd
 import random
+import threading
 import time
 import os
 from datetime import datetime
-import json
+from pathlib import Path
 import logging
 from job_extraction.utils import load_cookie_data
 from job_extraction.config import search_parameters
@@ -26,7 +27,10 @@ from job_extraction.driver_utils import create_driver, cleanup_driver
 import urllib3
 import uuid
 from job_metrics_tracker import JobMetricsTracker
+from job_extraction.seen_jobs import SeenJobSet, DEFAULT_SEEN_THRESHOLD
+from job_extraction.page_waits import current_telemetry, network_quiet, telemetry_scope, wait_for, wait_until_ready
 from paths import DEBUG_DIR, SEARCH_RESULTS_DIR, search_results_for
+from record_io import frame_to_records, write_json_twin
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +43,29 @@ logging.basicConfig(
 urllib3.disable_warnings()
 logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
 
+# Known selectors for the search results list (tried in order)
+JOBS_CONTAINER_SELECTORS = [
+    "div.jobs-search-two-pane__results-container ul.jobs-search__results-list",
+    "ul.jobs-search__results-list",
+    "div[class*='scaffold-layout__list']",
+]
+
+# Wait caps (seconds); each is the old fixed sleep, now an upper bound
+PAGE_READY_TIMEOUT = 15
+SCROLL_CHUNK_WAIT = 1
+NEXT_PAGE_WAIT = 3
+NETWORK_QUIET_MS = 300
+
+# Serialises result/metrics file writes when several titles search concurrently
+_RESULTS_LOCK = threading.Lock()
+
+# Card extraction modes for scrape_job_data: "js" reads every card on the page
+# in one execute_script call; "element" is the per-card find_element path
+CARD_EXTRACTION_MODES = ("js", "element")
+DEFAULT_CARD_EXTRACTION = "js"
+JOB_CARD_SELECTOR = "li.scaffold-layout__list-item"
+DEFAULT_COMPANY_CLASS = 'dWJplLBRBAptgNcPwCBFsflKmzwrdqqy'
+
 def press_shift_tab(driver):
     """Simulates pressing Shift+Tab."""
     try:
@@ -77,7 +104,8 @@ def load_cookies(driver, cookies):
                 
         logging.info(f"Successfully loaded {cookies_loaded} cookies")
         driver.refresh()
-        time.sleep(5)
+        wait_until_ready(driver, None, timeout=PAGE_READY_TIMEOUT, quiet_ms=NETWORK_QUIET_MS,
+                         site="search.cookies_refresh")
         
     except Exception as e:
         logging.error(f"Error in load_cookies: {str(e)}")
@@ -135,13 +163,7 @@ def capture_debug_artifacts(driver, prefix="linkedin_search"):
 
 def locate_jobs_container(driver, timeout=15):
     """Locate the jobs list container using multiple fallback selectors."""
-    selectors = [
-        "div.jobs-search-two-pane__results-container ul.jobs-search__results-list",
-        "ul.jobs-search__results-list",
-        "div[class*='scaffold-layout__list']",
-    ]
-
-    for selector in selectors:
+    for selector in JOBS_CONTAINER_SELECTORS:
         try:
             logging.debug(f"Trying jobs container selector: {selector}")
             return WebDriverWait(driver, timeout).until(
@@ -154,14 +176,32 @@ def locate_jobs_container(driver, timeout=15):
     raise TimeoutException("Could not locate jobs results container with known selectors")
 
 
-def scrape_job_data(driver, url, max_pages=3):
-    """Scrapes job data from LinkedIn."""
+def scrape_job_data(driver, url, max_pages=3, card_extraction=DEFAULT_CARD_EXTRACTION, check_parity=False,
+                    seen=None, seen_threshold=DEFAULT_SEEN_THRESHOLD, stats=None):
+    """Scrapes job data from LinkedIn.
+
+    ``card_extraction="js"`` reads all cards on a page with one
+    execute_script call; ``"element"`` uses extract_job_details per card.
+    ``check_parity`` runs both on every page and logs any difference.
+
+    With a ``SeenJobSet``, pagination stops after a page whose share of
+    already-seen jobs reaches ``seen_threshold``.  ``stats`` (a dict, if
+    given) is filled with pages scraped / saved and seen / new card counts.
+    """
     jobs = []
     page = 1
+    if stats is None:
+        stats = {}
+    stats.update({"pages_scraped": 0, "pages_saved": 0, "cards_seen": 0, "cards_new": 0, "stopped_early": False})
     try:
         logging.info("Starting job scraping...")
         driver.get(url)
-        time.sleep(5)  # Wait for initial load
+        try:
+            # Wait for any results container instead of a fixed delay
+            wait_until_ready(driver, ", ".join(JOBS_CONTAINER_SELECTORS), timeout=PAGE_READY_TIMEOUT,
+                             quiet_ms=NETWORK_QUIET_MS, site="search.results_ready")
+        except TimeoutException:
+            logging.warning("Results list not ready after initial load")
         
         while page <= max_pages:
             logging.info(f"Scraping page {page}")
@@ -177,25 +217,46 @@ def scrape_job_data(driver, url, max_pages=3):
             # Scroll through the jobs list
             for i in range(5):  # Scroll in chunks
                 driver.execute_script("arguments[0].scrollBy(0, 300);", jobs_container)
-                time.sleep(1)
+                # Lazy-loaded cards arrive over the network; stop waiting once it goes quiet
+                network_quiet(driver, quiet_ms=NETWORK_QUIET_MS, timeout=SCROLL_CHUNK_WAIT,
+                              site="search.scroll_chunk")
             
-            # Get job cards
-            job_cards = jobs_container.find_elements(By.CSS_SELECTOR, "li.scaffold-layout__list-item")
-            logging.info(f"Found {len(job_cards)} job cards on page {page}")
+            # Extract job cards
+            extract_start = time.perf_counter()
+            if card_extraction == "element":
+                page_jobs, card_count, first_card = extract_job_cards_element(jobs_container)
+            else:
+                page_jobs, card_count, first_card = extract_job_cards_js(driver, jobs_container)
+            current_telemetry().record(f"search.cards_{card_extraction}", time.perf_counter() - extract_start)
+            logging.info(f"Found {card_count} job cards on page {page} "
+                         f"({card_extraction} extraction: {time.perf_counter() - extract_start:.2f}s)")
             
-            if len(job_cards) == 0:
+            if card_count == 0:
                 logging.warning(f"No job cards detected on page {page}. Saving debug snapshot.")
                 capture_debug_artifacts(driver, prefix=f"jobs_list_page{page}_empty")
+            elif check_parity:
+                check_card_extraction_parity(driver, jobs_container, label=f"page {page}")
+            
+            for job_data in page_jobs:
+                jobs.append(job_data)
+                logging.info(f"Processed job: {job_data.get('job_title', 'Unknown Title')}")
+            stats["pages_scraped"] = page
             
-            for job in job_cards:
-                try:
-                    job_data = extract_job_details(job)
-                    if job_data:
-                        jobs.append(job_data)
-                        logging.info(f"Processed job: {job_data.get('job_title', 'Unknown Title')}")
-                except Exception as e:
-                    logging.error(f"Error processing job card: {e}")
-                    continue
+            # Stop early once a page is mostly jobs we already hold
+            if seen is not None and page_jobs:
+                page_urls = [job_data.get("job_url") for job_data in page_jobs]
+                seen_fraction = seen.seen_fraction(page_urls)
+                if seen_fraction is not None:
+                    n_seen = int(round(seen_fraction * len(page_urls)))
+                    stats["cards_seen"] += n_seen
+                    stats["cards_new"] += len(page_urls) - n_seen
+                    logging.info(f"Page {page}: {seen_fraction:.0%} of cards already seen")
+                    if seen_fraction >= seen_threshold and page < max_pages:
+                        stats["stopped_early"] = True
+                        stats["pages_saved"] = max_pages - page
+                        logging.info(f"Seen threshold {seen_threshold:.0%} reached - stopping pagination "
+                                     f"({stats['pages_saved']} page(s) saved)")
+                        break
             
             # Try to go to next page
             try:
@@ -204,7 +265,11 @@ def scrape_job_data(driver, url, max_pages=3):
                     logging.info("No more pages left")
                     break
                 next_button.click()
-                time.sleep(3)
+                if first_card is not None:
+                    # The old cards are replaced once the next page renders
+                    wait_for(driver, EC.staleness_of(first_card), NEXT_PAGE_WAIT, site="search.next_page")
+                network_quiet(driver, quiet_ms=NETWORK_QUIET_MS, timeout=NEXT_PAGE_WAIT,
+                              site="search.next_page_quiet")
                 page += 1
             except Exception:
                 logging.info("No more pages left")
@@ -320,7 +385,7 @@ def generate_unique_id():
     """Generate a unique ID using UUID4."""
     return str(uuid.uuid4())
 
-def save_results(df, job_title, search_params, search_folder=None):
+def save_results(df, job_title, search_params, search_folder=None, search_stats=None):
     """Save job results with the correct naming convention."""
     try:
         # Add unique IDs to each job record
@@ -356,9 +421,8 @@ def save_results(df, job_title, search_params, search_folder=None):
         # Construct filename
         filename = f"{job_title_clean}__{salary}__{job_type}_{search_type}_{work_geo_str}_{date_str}_{random_number}"
         
-        # Save both CSV and JSON versions
+        # Save the CSV and its JSON twin
         csv_path = os.path.join(job_folder, f"{filename}.csv")
-        json_path = os.path.join(job_folder, f"{filename}.json")
         
         # Reorder columns to have job_id first
         cols = ['job_id'] + [col for col in df.columns if col != 'job_id']
@@ -367,20 +431,16 @@ def save_results(df, job_title, search_params, search_folder=None):
         df.to_csv(csv_path, index=False)
         logging.info(f"Results saved to {csv_path}")
         
-        # Save as JSON with metadata
-        output_data = {
-            "metadata": {
-                "job_title": job_title_clean,
-                "search_params": search_params,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "file_id": random_number
-            },
-            "jobs": df.to_dict('records')
-        }
-        
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        logging.info(f"Results saved to {json_path}")
+        # JSON twin with metadata
+        json_path = write_json_twin(csv_path, df, {
+            "job_title": job_title_clean,
+            "search_params": search_params,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "file_id": random_number,
+            "search_stats": search_stats or {}
+        })
+        if json_path:
+            logging.info(f"Results saved to {json_path}")
         
         return csv_path
         
@@ -388,41 +448,51 @@ def save_results(df, job_title, search_params, search_folder=None):
         logging.error(f"Error saving results: {e}")
         raise
 
-def perform_linkedin_search(job_title, search_params):
-    """Perform LinkedIn job search and return results as DataFrame."""
-    driver = None
+def prepare_search_driver(driver):
+    """Open LinkedIn and load the session cookies into *driver*."""
+    logging.info("Navigating to LinkedIn main page...")
+    driver.get("https://www.linkedin.com")
+    wait_until_ready(driver, None, timeout=PAGE_READY_TIMEOUT, site="search.home")
+    logging.info(f"Current URL before cookies: {driver.current_url}")
+    capture_debug_artifacts(driver, prefix="feed_before_cookies")
+    
+    # Load cookies
+    logging.info("Loading cookies...")
+    cookies = load_cookie_data()
+    load_cookies(driver, cookies)
+    logging.info("Cookies loaded")
+    logging.info(f"Current URL after cookies: {driver.current_url}")
+    capture_debug_artifacts(driver, prefix="feed_after_cookies")
+
+def perform_linkedin_search(job_title, search_params, card_extraction=DEFAULT_CARD_EXTRACTION,
+                            check_parity=False, seen=None, seen_threshold=DEFAULT_SEEN_THRESHOLD, stats=None,
+                            driver=None):
+    """Perform LinkedIn job search and return results as DataFrame.
+
+    Pass an already prepared *driver* (see prepare_search_driver) to reuse
+    it; otherwise a driver is created here and closed afterwards.
+    """
+    owns_driver = driver is None
     try:
         logging.info(f"Starting LinkedIn search for {job_title}")
-        driver = setup_driver()
-        logging.info("Driver setup complete")
+        if owns_driver:
+            driver = setup_driver()
+            logging.info("Driver setup complete")
         
         url = generate_linkedin_job_url(job_title, search_params)
         logging.info(f"Attempting to navigate to URL: {url}")
         
-        # First navigate to LinkedIn
-        logging.info("Navigating to LinkedIn main page...")
-        driver.get("https://www.linkedin.com")
-        time.sleep(5)
-        logging.info(f"Current URL before cookies: {driver.current_url}")
-        capture_debug_artifacts(driver, prefix="feed_before_cookies")
-        
-        # Load cookies
-        logging.info("Loading cookies...")
-        cookies = load_cookie_data()
-        load_cookies(driver, cookies)
-        logging.info("Cookies loaded, waiting for page load...")
-        time.sleep(5)
-        logging.info(f"Current URL after cookies: {driver.current_url}")
-        capture_debug_artifacts(driver, prefix="feed_after_cookies")
+        if owns_driver:
+            prepare_search_driver(driver)
         
         # Now navigate to the search URL
         logging.info("Navigating to search URL...")
         driver.get(url)
-        time.sleep(5)
         
         # Scrape the data
         logging.info("Starting job scraping...")
-        jobs = scrape_job_data(driver, url)
+        jobs = scrape_job_data(driver, url, card_extraction=card_extraction, check_parity=check_parity,
+                               seen=seen, seen_threshold=seen_threshold, stats=stats)
         logging.info(f"Scraped {len(jobs)} jobs")
         
         if not jobs:
@@ -439,17 +509,17 @@ def perform_linkedin_search(job_title, search_params):
         logging.error("Stack trace:", exc_info=True)
         return pd.DataFrame()
     finally:
-        if driver:
+        if owns_driver and driver:
             try:
                 cleanup_driver(driver)
             except Exception as e:
                 logging.error(f"Error closing driver: {e}")
 
-def setup_driver():
+def setup_driver(profile_name="linkedin_job_search"):
     """Initialize and return Chrome driver with proper settings."""
     try:
         logging.info("Setting up Chrome driver via driver_utils...")
-        driver = create_driver(headless=True, profile_name="linkedin_job_search")
+        driver = create_driver(headless=True, profile_name=profile_name)
         driver.set_window_size(1440, 8000)
         logging.info("Chrome driver initialized successfully")
         return driver
@@ -486,6 +556,142 @@ def get_dynamic_selectors(driver):
         return None
 
 
+# Mirrors extract_job_details() selector-for-selector, including its fallbacks
+# and defaults. A card that the element path would drop (no company found by
+# any selector, anchor without href) comes back as null.
+EXTRACT_CARDS_JS = r"""
+var container = arguments[0], cardSelector = arguments[1], companyClass = arguments[2];
+function shown(el) { return el.getClientRects().length > 0; }
+function txt(el) {
+    if (!shown(el)) { return ''; }
+    return (el.innerText || '').replace(/\u00a0/g, ' ').trim();
+}
+function xp(root, path) {
+    return document.evaluate(path, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function extract(job) {
+    var title = 'Not Available';
+    var strong = job.querySelector("a[class*='job-card-container__link'] span[aria-hidden='true'] strong");
+    if (strong) {
+        title = txt(strong);
+        if (!title) {
+            var titleLink = job.querySelector("a[class*='job-card-container__link']");
+            if (titleLink) {
+                var aria = titleLink.getAttribute('aria-label');
+                title = aria ? aria.split(' with verification').join('') : 'Not Available';
+            } else {
+                title = 'Not Available';
+            }
+        }
+    }
+
+    var url = 'Not Available';
+    var anchor = job.querySelector('a.job-card-container__link');
+    if (anchor) {
+        if (!anchor.getAttribute('href')) { return null; }
+        url = anchor.href.split('?')[0];
+    }
+
+    var company = job.querySelector("span[class*='" + companyClass + "']")
+        || job.querySelector('div.artdeco-entity-lockup__subtitle span')
+        || xp(job, ".//div[contains(@class, 'artdeco-entity-lockup__title')]/../div[contains(@class, 'artdeco-entity-lockup__subtitle')]//span");
+    if (!company) { return null; }
+
+    var location = job.querySelector('ul.job-card-container__metadata-wrapper li span');
+    var salary = job.querySelector('div.artdeco-entity-lockup__metadata span');
+    var remote = xp(job, ".//*[contains(text(), 'Remote') or contains(text(), 'Onsite') or contains(text(), 'Hybrid')]");
+
+    return {
+        company_title: txt(company),
+        job_title: title,
+        job_url: url,
+        salary_range: salary ? txt(salary) : 'N/A',
+        location: location ? txt(location) : 'Not Available',
+        remote_status: remote ? txt(remote) : 'Not Specified'
+    };
+}
+var cards = container.querySelectorAll(cardSelector);
+var out = [];
+for (var i = 0; i < cards.length; i++) {
+    try { out.push(extract(cards[i])); } catch (e) { out.push(null); }
+}
+return {cards: out, first: cards.length ? cards[0] : null};
+"""
+
+
+def extract_job_cards_js(driver, jobs_container):
+    """Extract every card under *jobs_container* in one round trip.
+
+    Returns ``(jobs, card_count, first_card)``; ``jobs`` has the same dicts
+    extract_job_details() would produce, in page order.
+    """
+    result = driver.execute_script(EXTRACT_CARDS_JS, jobs_container, JOB_CARD_SELECTOR, DEFAULT_COMPANY_CLASS)
+    cards = (result or {}).get("cards") or []
+    jobs = [card for card in cards if card]
+    if len(jobs) < len(cards):
+        logging.error(f"Error extracting job details from {len(cards) - len(jobs)} card(s)")
+    return jobs, len(cards), (result or {}).get("first")
+
+
+def extract_job_cards_element(jobs_container):
+    """Per-card find_element extraction (one RPC per field)."""
+    job_cards = jobs_container.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)
+    jobs = []
+    for job in job_cards:
+        try:
+            job_data = extract_job_details(job)
+            if job_data:
+                jobs.append(job_data)
+        except Exception as e:
+            logging.error(f"Error processing job card: {e}")
+            continue
+    return jobs, len(job_cards), (job_cards[0] if job_cards else None)
+
+
+def compare_card_extractions(js_jobs, element_jobs):
+    """Field-level differences between the two card extraction paths."""
+    diffs = []
+    if len(js_jobs) != len(element_jobs):
+        diffs.append(f"card count: js={len(js_jobs)} element={len(element_jobs)}")
+    for i, (js_job, el_job) in enumerate(zip(js_jobs, element_jobs)):
+        for field in el_job:
+            if js_job.get(field) != el_job.get(field):
+                diffs.append(f"card {i} {field}: js={js_job.get(field)!r} element={el_job.get(field)!r}")
+    return diffs
+
+
+def check_card_extraction_parity(driver, jobs_container, label="page"):
+    """Run both extraction paths on the current page and log any mismatch."""
+    js_jobs, _, _ = extract_job_cards_js(driver, jobs_container)
+    element_jobs, _, _ = extract_job_cards_element(jobs_container)
+    diffs = compare_card_extractions(js_jobs, element_jobs)
+    if diffs:
+        logging.warning(f"Card extraction parity FAILED on {label} ({len(diffs)} differences):")
+        for diff in diffs:
+            logging.warning(f"  {diff}")
+    else:
+        logging.info(f"Card extraction parity OK on {label}: {len(js_jobs)} cards identical")
+    return diffs
+
+
+def check_parity_on_saved_html(html_paths):
+    """Load saved search-page HTML (e.g. data/debug/jobs_list_*.html) and compare both paths."""
+    driver = setup_driver()
+    failures = 0
+    try:
+        for html_path in html_paths:
+            driver.get(Path(os.path.abspath(html_path)).as_uri())
+            try:
+                jobs_container = locate_jobs_container(driver, timeout=5)
+            except TimeoutException:
+                logging.warning(f"No jobs container in {html_path}; skipped")
+                continue
+            failures += bool(check_card_extraction_parity(driver, jobs_container, label=html_path))
+    finally:
+        cleanup_driver(driver)
+    return failures
+
+
 def extract_job_details(job, selectors=None):
     """Extract details from a job card element."""
     try:
@@ -516,7 +722,7 @@ def extract_job_details(job, selectors=None):
 
         # Fallback selectors if dynamic ones aren't available
         default_selectors = {
-            'company_class': 'dWJplLBRBAptgNcPwCBFsflKmzwrdqqy',
+            'company_class': DEFAULT_COMPANY_CLASS,
         }
         
         current_selectors = selectors or default_selectors
@@ -602,22 +808,18 @@ def parse_arguments():
     parser.add_argument('--job_title', required=True, help='Job title to search for')
     return parser.parse_args()
 
-def main():
-    parser = argparse.ArgumentParser(description='LinkedIn Job Search')
-    parser.add_argument('--job_title', required=True, help='Job title to search for')
-    args = parser.parse_args()
-
-    job_title = args.job_title
-    logging.info(f"Starting job search for: {job_title}")
+def run_search(job_title, search_params, driver=None, card_extraction=DEFAULT_CARD_EXTRACTION,
+               check_parity=False, seen_threshold=DEFAULT_SEEN_THRESHOLD, full_crawl=False, seen=None):
+    """Search, save results and update metrics for one title.
 
+    Returns ``(df, saved_csv_path, search_stats)``; ``saved_csv_path`` is
+    None when nothing was found.  The seen set is only read here, so a
+    caller-supplied one can be shared between concurrent searches; new IDs
+    are added once their details are scraped (``record_detailed_jobs``).
+    """
     # Initialize metrics tracker
     metrics_tracker = JobMetricsTracker()
 
-    # Get search parameters from user
-    logging.info("Getting search parameters...")
-    search_params = get_search_parameters()
-    logging.info(f"Search parameters received: {search_params}")
-    
     # Create search directory
     logging.info("Creating search directory...")
     search_folder = create_search_directory(job_title)
@@ -625,34 +827,86 @@ def main():
     
     # Perform LinkedIn search
     logging.info("Starting LinkedIn search...")
-    df = perform_linkedin_search(job_title, search_params)
+    if full_crawl:
+        seen = None
+    elif seen is None:
+        seen = SeenJobSet()
+    search_stats = {}
+    # This search's waits only (concurrent searches each have their own scope)
+    with telemetry_scope() as telemetry:
+        df = perform_linkedin_search(job_title, search_params, card_extraction=card_extraction,
+                                     check_parity=check_parity, seen=seen,
+                                     seen_threshold=seen_threshold, stats=search_stats, driver=driver)
+    if search_stats:
+        logging.info(f"Search pagination: {search_stats.get('pages_scraped', 0)} page(s) scraped, "
+                     f"{search_stats.get('pages_saved', 0)} saved by seen-job early stop "
+                     f"({search_stats.get('cards_new', 0)} new / {search_stats.get('cards_seen', 0)} seen cards)")
     logging.info("LinkedIn search completed")
     
+    telemetry.dump(f"{job_title.lower().replace(' ', '_')}_search")
+
     if df is not None and not df.empty:
         logging.info(f"Found {len(df)} jobs. Saving results...")
-        # Save results using the same search_folder
-        saved_path = save_results(df, job_title, search_params, search_folder)
-        
-        # Save run metrics
-        metrics_tracker.save_run_metrics(
-            job_title=job_title,
-            total_jobs=len(df),
-            salary_range=search_params.get('salary_range', 'Not specified'),
-            job_type=search_params.get('job_type', 'Not specified'),
-            search_type=search_params.get('search_type', 'Not specified'),
-            geography=search_params.get('geography', 'Not specified')
-        )
-        
-        # Update jobs aggregation
-        metrics_tracker.update_jobs_aggregation(
-            job_title=job_title,
-            new_jobs=df.to_dict('records')
-        )
+        with _RESULTS_LOCK:
+            # Save results using the same search_folder
+            saved_path = save_results(df, job_title, search_params, search_folder, search_stats=search_stats)
+            
+            # Save run metrics
+            metrics_tracker.save_run_metrics(
+                job_title=job_title,
+                total_jobs=len(df),
+                salary_range=search_params.get('salary_range', 'Not specified'),
+                job_type=search_params.get('job_type', 'Not specified'),
+                search_type=search_params.get('search_type', 'Not specified'),
+                geography=search_params.get('geography', 'Not specified')
+            )
+            
+            # Update jobs aggregation
+            metrics_tracker.update_jobs_aggregation(
+                job_title=job_title,
+                new_jobs=frame_to_records(df)
+            )
         
-        return saved_path
+        return df, saved_path, search_stats
     else:
         logging.warning("No results found or DataFrame is empty")
+        return df, None, search_stats
+
+def main():
+    parser = argparse.ArgumentParser(description='LinkedIn Job Search')
+    parser.add_argument('--job_title', required=False, help='Job title to search for')
+    parser.add_argument('--card_extraction', choices=CARD_EXTRACTION_MODES, default=DEFAULT_CARD_EXTRACTION,
+                        help='Read job cards with one in-page script (js) or per element (element).')
+    parser.add_argument('--check_parity', action='store_true',
+                        help='Run both card extraction paths on every page and log differences.')
+    parser.add_argument('--parity_html', nargs='+', default=None,
+                        help='Only compare both extraction paths on saved search-page HTML files.')
+    parser.add_argument('--seen_threshold', type=float, default=DEFAULT_SEEN_THRESHOLD,
+                        help='Stop paginating once this fraction of a page is already-seen jobs (default: %(default)s).')
+    parser.add_argument('--full_crawl', action='store_true',
+                        help='Ignore the seen-job set and walk every page.')
+    args = parser.parse_args()
+
+    if args.parity_html:
+        failures = check_parity_on_saved_html(args.parity_html)
+        logging.info(f"Parity check finished: {failures} file(s) with differences")
         return None
+    if not args.job_title:
+        parser.error('--job_title is required')
+
+    logging.info(f"Starting job search for: {args.job_title}")
+
+    # Get search parameters from user
+    logging.info("Getting search parameters...")
+    search_params = get_search_parameters()
+    logging.info(f"Search parameters received: {search_params}")
+
+    df, saved_path, _ = run_search(
+        args.job_title, search_params,
+        card_extraction=args.card_extraction, check_parity=args.check_parity,
+        seen_threshold=args.seen_threshold, full_crawl=args.full_crawl,
+    )
+    return saved_path
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,373 @@
+"""
+Job Store
+═════════
+Columnar (Parquet) store for aggregated jobs, so the stages after the
+merge stop reading and rewriting the whole master CSV.
+
+Layout (hive-style partitions):
+
+    data/job_store/jobs/search_title=<title>/extract_date=<YYYY-MM-DD>/part-<ts>.parquet
+    data/job_store/side/<table>/search_title=<title>/<table>.parquet
+
+  • ``append`` writes only rows that are new or changed since the last
+    append (per-row content hash), into the partition of each row's
+    ``date_extracted`` – a run costs I/O for its new rows, not the master.
+    With ``complete=True`` the frame is the title's whole job set, and
+    stored jobs missing from it get a tombstone row (``_deleted``)
+  • ``read`` projects columns per file (the scorer reads only
+    ``job_url``, ``job_title`` and ``description``) and keeps the latest
+    version of each job
+  • derived columns live in small side tables keyed by ``job_url``
+    (``scores`` from alignment scoring, ``resumes`` from the resume
+    optimiser) and are joined on read
+  • CSV is an on-demand export (``export_csv`` / ``--export``)
+
+pyarrow is optional: without it ``JobStore.available()`` is False and
+callers keep their CSV behaviour.
+
+Usage:
+    store = JobStore()
+    store.append("marketing_analytics", master_df)
+    df = store.read("marketing_analytics", columns=["job_url", "job_title", "description"])
+    store.write_side("scores", "marketing_analytics", scores_df)
+
+CLI:
+    python src/job_extraction/job_store.py --job_title "marketing analytics" --export
+    python src/job_extraction/job_store.py --job_title "marketing analytics" --compact
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+from artifact_io import artifact_lock, atomic_write
+from paths import JOB_STORE_DIR, aggregated_for
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+KEY = "job_url"
+HASH_COLUMN = "_row_hash"
+STORED_AT_COLUMN = "_stored_at"
+DELETED_COLUMN = "_deleted"
+META_COLUMNS = (HASH_COLUMN, STORED_AT_COLUMN, DELETED_COLUMN)
+
+# Derived columns, by the side table that owns them
+SIDE_TABLES: Dict[str, List[str]] = {
+    "scores": ["alignment_score", "alignment_grade", "top_gaps"],
+    "resumes": ["optimized_resume_path"],
+}
+SIDE_COLUMNS = {col: table for table, cols in SIDE_TABLES.items() for col in cols}
+
+
+def _normalise(df: pd.DataFrame) -> pd.DataFrame:
+    """Key as str; mixed-type object columns as str (nulls kept) for Arrow."""
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object or col == KEY:
+            values = df[col]
+            df[col] = values.where(values.isna(), values.astype(str))
+    return df
+
+
+def _canonical(values: pd.Series) -> pd.Series:
+    """Dtype-independent text of a column (``0`` == ``0.0``, NaN == "nan" == "")."""
+    if pd.api.types.is_numeric_dtype(values):
+        numbers = pd.to_numeric(values, errors="coerce")
+        return numbers.map(lambda v: "" if pd.isna(v) else (str(int(v)) if float(v).is_integer() else repr(float(v))))
+    text = values.astype(str)
+    return text.mask(values.isna() | (text == "nan"), "")
+
+
+def _row_hashes(df: pd.DataFrame) -> pd.Series:
+    cols = sorted(c for c in df.columns if c not in META_COLUMNS)
+    canonical = pd.DataFrame({c: _canonical(df[c]) for c in cols}, index=df.index)
+    return pd.util.hash_pandas_object(canonical, index=False).astype("uint64")
+
+
+def _write_parquet(df: pd.DataFrame, path: Path, lock: bool = False) -> None:
+    """Atomic write; part files have unique names, so only side tables need *lock*."""
+    with atomic_write(path, "wb", lock=lock) as f:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), f)
+
+
+class JobStore:
+    """Partitioned Parquet store of aggregated jobs plus derived side tables."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root) if root else JOB_STORE_DIR
+
+    @staticmethod
+    def available() -> bool:
+        return pq is not None
+
+    # ── layout ────────────────────────────────────────────────────────────
+
+    def _title_dir(self, job_title_clean: str) -> Path:
+        return self.root / "jobs" / f"search_title={job_title_clean}"
+
+    def _side_path(self, table: str, job_title_clean: str) -> Path:
+        return self.root / "side" / table / f"search_title={job_title_clean}" / f"{table}.parquet"
+
+    def side_paths(self, job_title_clean: str) -> Dict[str, Path]:
+        """Existing side-table files for a title, by table name."""
+        paths = {table: self._side_path(table, job_title_clean) for table in SIDE_TABLES}
+        return {table: path for table, path in paths.items() if path.exists()}
+
+    def parts(self, job_title_clean: str) -> List[Path]:
+        return sorted(self._title_dir(job_title_clean).glob("extract_date=*/part-*.parquet"))
+
+    def has(self, job_title_clean: str) -> bool:
+        return self.available() and bool(self.parts(job_title_clean))
+
+    def location(self, job_title_clean: str) -> str:
+        """Directory holding the title's partitions (for logs and run records)."""
+        return str(self._title_dir(job_title_clean))
+
+    def titles(self) -> List[str]:
+        """Titles with stored jobs."""
+        if not self.available():
+            return []
+        title_dirs = (self.root / "jobs").glob("search_title=*")
+        titles = (path.name.split("=", 1)[1] for path in title_dirs)
+        return sorted(title for title in titles if self.parts(title))
+
+    # ── base table ────────────────────────────────────────────────────────
+
+    def _read_parts(self, job_title_clean: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        frames = []
+        for part in self.parts(job_title_clean):
+            names = pq.ParquetFile(part).schema_arrow.names
+            cols = names if columns is None else [c for c in columns if c in names]
+            if cols:
+                frames.append(pq.read_table(part, columns=cols).to_pandas())
+        if not frames:
+            return pd.DataFrame(columns=list(columns or []))
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _latest(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the most recently stored version of each job (tombstoned jobs dropped)."""
+        if STORED_AT_COLUMN in df.columns:
+            df = df.sort_values(STORED_AT_COLUMN, kind="stable")
+        df = df.drop_duplicates(KEY, keep="last")
+        if DELETED_COLUMN in df.columns:
+            df = df[df[DELETED_COLUMN].ne(True)]
+        return df
+
+    def append(self, job_title_clean: str, df: pd.DataFrame, complete: bool = False) -> int:
+        """Store the rows of *df* that are new or changed; returns rows written.
+
+        Derived (side-table) columns in *df* are ignored.  With *complete*,
+        *df* is the title's whole job set: stored jobs missing from it are
+        tombstoned, so ``read`` stops returning them.
+        """
+        if df is None or KEY not in df.columns:
+            return 0
+        drop = [c for c in df.columns if c in SIDE_COLUMNS or c in META_COLUMNS]
+        batch = _normalise(df.drop(columns=drop))
+        batch = batch.dropna(subset=[KEY]).drop_duplicates(KEY, keep="last")
+        hashes = _row_hashes(batch)
+
+        removed = []
+        stored = self._read_parts(job_title_clean, [KEY, HASH_COLUMN, STORED_AT_COLUMN, DELETED_COLUMN])
+        if not stored.empty:
+            latest = self._latest(stored)
+            known = dict(zip(latest[KEY], latest[HASH_COLUMN].tolist()))
+            changed = [known.get(k) != h for k, h in zip(batch[KEY], hashes.tolist())]
+            if complete:
+                removed = sorted(set(known) - set(batch[KEY]))
+            batch, hashes = batch[changed], hashes[changed]
+        if batch.empty and not removed:
+            logging.info(f"Job store: '{job_title_clean}' already up to date")
+            return 0
+
+        now = datetime.now()
+        part_name = f"part-{now.strftime('%Y%m%d_%H%M%S_%f')}.parquet"
+        if not batch.empty:
+            batch = batch.assign(**{HASH_COLUMN: hashes.to_numpy(), STORED_AT_COLUMN: now.isoformat()})
+            if "date_extracted" in batch.columns:
+                dates = pd.to_datetime(batch["date_extracted"], errors="coerce", format="mixed").dt.strftime("%Y-%m-%d")
+                dates = dates.fillna(now.strftime("%Y-%m-%d"))
+            else:
+                dates = pd.Series(now.strftime("%Y-%m-%d"), index=batch.index)
+            for date, group in batch.groupby(dates, sort=True):
+                _write_parquet(group, self._title_dir(job_title_clean) / f"extract_date={date}" / part_name)
+        if removed:
+            # Hash 0 keeps the hash column uint64 when parts are concatenated
+            tombstones = pd.DataFrame({
+                KEY: removed,
+                HASH_COLUMN: pd.Series(0, index=range(len(removed)), dtype="uint64"),
+                STORED_AT_COLUMN: now.isoformat(),
+                DELETED_COLUMN: True,
+            })
+            removed_name = part_name.replace(".parquet", "_removed.parquet")
+            _write_parquet(tombstones, self._title_dir(job_title_clean) / f"extract_date={now:%Y-%m-%d}" / removed_name)
+        logging.info(f"Job store: wrote {len(batch)} new/changed rows and {len(removed)} removals "
+                     f"for '{job_title_clean}'")
+        return len(batch) + len(removed)
+
+    def read(
+        self,
+        job_title_clean: str,
+        columns: Optional[Sequence[str]] = None,
+        side: bool = True,
+    ) -> pd.DataFrame:
+        """Latest row per job, projected to *columns* (all when ``None``).
+
+        Side-table columns are joined when requested (or all of them when
+        *columns* is ``None`` and *side* is true).
+        """
+        base_cols = None if columns is None else [c for c in columns if c not in SIDE_COLUMNS]
+        fetch = None if base_cols is None else list(dict.fromkeys([KEY, *base_cols, STORED_AT_COLUMN, DELETED_COLUMN]))
+        df = self._read_parts(job_title_clean, fetch)
+        if df.empty:
+            return df.drop(columns=list(META_COLUMNS), errors="ignore")
+        df = self._latest(df).drop(columns=list(META_COLUMNS), errors="ignore").reset_index(drop=True)
+
+        if side:
+            if columns is None:
+                tables = list(SIDE_TABLES)
+            else:
+                tables = list(dict.fromkeys(SIDE_COLUMNS[c] for c in columns if c in SIDE_COLUMNS))
+            df = self.join_side(job_title_clean, df, tables)
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def compact(self, job_title_clean: str) -> int:
+        """Rewrite each date partition as one file holding only the latest rows."""
+        parts = self.parts(job_title_clean)
+        if len(parts) <= 1:
+            return len(parts)
+        frames = []
+        for part in parts:
+            frame = pq.read_table(part).to_pandas()
+            frame["_partition"] = str(part.parent)
+            frames.append(frame)
+        # Tombstoned jobs go for good: every part they could live in is rewritten
+        latest = self._latest(pd.concat(frames, ignore_index=True)).drop(columns=[DELETED_COLUMN], errors="ignore")
+
+        part_name = f"part-{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.parquet"
+        for partition, group in latest.groupby("_partition"):
+            _write_parquet(group.drop(columns=["_partition"]), Path(partition) / part_name)
+        for part in parts:
+            part.unlink()
+        remaining = self.parts(job_title_clean)
+        logging.info(f"Job store: compacted '{job_title_clean}' from {len(parts)} to {len(remaining)} part files")
+        return len(remaining)
+
+    # ── side tables ───────────────────────────────────────────────────────
+
+    def side(self, table: str, job_title_clean: str) -> pd.DataFrame:
+        path = self._side_path(table, job_title_clean)
+        if not self.available() or not path.exists():
+            return pd.DataFrame(columns=[KEY] + SIDE_TABLES[table])
+        return pq.read_table(path).to_pandas()
+
+    def write_side(self, table: str, job_title_clean: str, df: pd.DataFrame) -> Path:
+        """Upsert derived columns for *table* (keyed by ``job_url``)."""
+        if table not in SIDE_TABLES:
+            raise ValueError(f"Unknown side table '{table}' (expected one of {sorted(SIDE_TABLES)})")
+        cols = [KEY] + [c for c in SIDE_TABLES[table] if c in df.columns]
+        new = _normalise(df[cols].dropna(subset=[KEY]).drop_duplicates(KEY, keep="last"))
+        path = self._side_path(table, job_title_clean)
+        # read → upsert → write under the table's lock (scoring and the resume
+        # optimiser of overlapping runs may update the same table)
+        with artifact_lock(path):
+            old = self.side(table, job_title_clean)
+            if not old.empty:
+                new = pd.concat([old[~old[KEY].isin(new[KEY])], new], ignore_index=True)
+            _write_parquet(new, path, lock=True)
+        logging.info(f"Job store: {table} side table for '{job_title_clean}' now has {len(new)} rows")
+        return path
+
+    def join_side(
+        self,
+        job_title_clean: str,
+        df: pd.DataFrame,
+        tables: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Left-join side-table columns onto *df*; side values win where present."""
+        if not self.available() or KEY not in df.columns:
+            return df
+        for table in (SIDE_TABLES if tables is None else tables):
+            side_df = self.side(table, job_title_clean)
+            if side_df.empty:
+                continue
+            side_cols = [c for c in side_df.columns if c != KEY]
+            keys = df[KEY].astype(str)
+            joined = side_df.set_index(KEY).reindex(keys.to_numpy())
+            joined.index = df.index
+            df = df.copy()
+            for col in side_cols:
+                df[col] = joined[col].combine_first(df[col]) if col in df.columns else joined[col]
+        return df
+
+    # ── export ────────────────────────────────────────────────────────────
+
+    def export_csv(self, job_title_clean: str, path: Optional[str] = None) -> Optional[str]:
+        """Write the title's jobs (with side columns) to CSV on demand."""
+        df = self.read(job_title_clean)
+        if df.empty:
+            logging.warning(f"Job store: nothing stored for '{job_title_clean}'")
+            return None
+        if "date_extracted" in df.columns:
+            df = df.sort_values("date_extracted", ascending=False)
+        path = path or str(aggregated_for(job_title_clean) / f"{job_title_clean}_store_export.csv")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_csv(path, index=False)
+        logging.info(f"Job store: exported {len(df)} jobs to {path}")
+        return path
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect, export or compact the columnar job store.")
+    parser.add_argument("--job_title", required=True, help="Job title to operate on.")
+    parser.add_argument("--export", nargs="?", const="", default=None, metavar="PATH",
+                        help="Export the title's jobs (with scores/resume paths) to CSV.")
+    parser.add_argument("--compact", action="store_true",
+                        help="Rewrite the title's partitions keeping only the latest row versions.")
+    args = parser.parse_args()
+
+    if not JobStore.available():
+        parser.error("pyarrow is not installed (pip install pyarrow)")
+
+    jt_clean = args.job_title.lower().replace(" ", "_")
+    store = JobStore()
+    if args.compact:
+        store.compact(jt_clean)
+    if args.export is not None:
+        store.export_csv(jt_clean, args.export or None)
+
+    parts = store.parts(jt_clean)
+    rows = len(store.read(jt_clean, columns=[KEY], side=False)) if parts else 0
+    print(f"{jt_clean}: {rows} jobs in {len(parts)} part files")
+    for table in SIDE_TABLES:
+        print(f"  side table {table}: {len(store.side(table, jt_clean))} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Job Upsert
+══════════
+Keyed, vectorised upsert of job batches into a master DataFrame.
+
+Replaces the per-URL loops in ``merge_job_details`` that built a
+full-column boolean mask over the master for every (url, column) pair –
+O(batch × master rows) per file – with one indexed join per batch:
+
+  • new keys are appended
+  • existing rows get *fill-missing-only* updates for ``UPSERT_COLUMNS``
+    (a value already present in the master is never overwritten)
+  • missing means NaN/None, an empty/whitespace string or the literal
+    string ``"nan"``; ``0`` is a valid value (e.g. posted today)
+  • within a batch, the last non-missing value per key wins
+
+Usage:
+    master_df, added, updated = upsert_jobs(master_df, batch_df)
+
+Benchmark against the previous loop on a synthetic master:
+    python src/job_extraction/job_upsert.py --rows 100000 --batch 5000
+"""
+
+import argparse
+import logging
+import time
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+UPSERT_COLUMNS = ["application_url", "days_since_posted", "description"]
+DEFAULT_KEY = "job_url"
+
+
+def missing_mask(values: pd.Series) -> pd.Series:
+    """True where a value counts as missing (NaN, blank or ``"nan"``)."""
+    mask = values.isna()
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        text = values.astype(str).str.strip()
+        mask |= (text == "") | (text.str.lower() == "nan")
+    return mask
+
+
+def fill_missing(
+    master_df: pd.DataFrame,
+    batch_df: pd.DataFrame,
+    key: str = DEFAULT_KEY,
+    columns: Sequence[str] = UPSERT_COLUMNS,
+) -> Tuple[pd.DataFrame, int]:
+    """Fill missing *columns* of existing master rows from *batch_df*.
+
+    Returns ``(master_df, rows_updated)``; *master_df* is updated in place
+    (columns absent from the master are added).
+    """
+    cols: List[str] = [c for c in columns if c in batch_df.columns]
+    if master_df.empty or batch_df.empty or not cols:
+        return master_df, 0
+
+    # Last non-missing value per key and column (groupby.last skips NaN)
+    batch = batch_df[[key] + cols].copy()
+    batch[key] = batch[key].astype(str)
+    for col in cols:
+        batch[col] = batch[col].mask(missing_mask(batch[col]))
+    latest = batch.groupby(key, sort=False)[cols].last()
+    if latest.empty:
+        return master_df, 0
+
+    # One indexed join: batch values aligned to every master row
+    aligned = latest.reindex(master_df[key].astype(str).to_numpy())
+    aligned.index = master_df.index
+
+    updated = np.zeros(len(master_df), dtype=bool)
+    for col in cols:
+        if col not in master_df.columns:
+            master_df[col] = None
+        fill = missing_mask(master_df[col]) & aligned[col].notna()
+        if fill.any():
+            if master_df[col].dtype != aligned[col].dtype:
+                master_df[col] = master_df[col].astype(object)
+            master_df.loc[fill, col] = aligned.loc[fill, col]
+            updated |= fill.to_numpy()
+    return master_df, int(updated.sum())
+
+
+def upsert_jobs(
+    master_df: pd.DataFrame,
+    batch_df: pd.DataFrame,
+    key: str = DEFAULT_KEY,
+    columns: Sequence[str] = UPSERT_COLUMNS,
+) -> Tuple[pd.DataFrame, int, int]:
+    """Fill-missing update existing keys, then append unseen ones.
+
+    Returns ``(master_df, rows_added, rows_updated)``.
+    """
+    if batch_df is None or batch_df.empty:
+        return master_df, 0, 0
+    if master_df.empty:
+        return batch_df.copy(), len(batch_df), 0
+
+    master_df[key] = master_df[key].astype(str)
+    batch_keys = batch_df[key].astype(str)
+    master_df, updated = fill_missing(master_df, batch_df, key, columns)
+
+    new_rows = batch_df[~batch_keys.isin(master_df[key])]
+    if not new_rows.empty:
+        new_rows = new_rows.assign(**{key: batch_keys[new_rows.index]})
+        master_df = pd.concat([master_df, new_rows], ignore_index=True)
+    return master_df, len(new_rows), updated
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Benchmark
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _legacy_fill_missing(master_df: pd.DataFrame, batch_df: pd.DataFrame) -> int:
+    """The per-URL mask loop this module replaces (kept for the benchmark)."""
+    jobs_updated = 0
+    for col in ["application_url", "days_since_posted"]:
+        url_to_value = dict(zip(batch_df["job_url"], batch_df[col]))
+        for url, new_value in url_to_value.items():
+            if new_value and str(new_value).strip() and str(new_value) != "nan":
+                mask = (master_df["job_url"] == url) & (
+                    master_df[col].isna()
+                    | (master_df[col].astype(str).str.strip() == "")
+                    | (master_df[col].astype(str) == "nan")
+                )
+                if mask.any():
+                    master_df.loc[mask, col] = new_value
+                    jobs_updated += 1
+    return jobs_updated
+
+
+def _synthetic_master(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ids = rng.choice(np.arange(3_900_000_000, 4_300_000_000), size=rows, replace=False)
+    blank = rng.random(rows) < 0.4
+    return pd.DataFrame({
+        "date_extracted": "2026-01-01 00:00:00",
+        "job_url": [f"https://www.linkedin.com/jobs/view/{i}/" for i in ids],
+        "job_title": "Marketing Analytics Manager",
+        "description": np.where(blank, None, "About the job ..."),
+        "days_since_posted": np.where(blank, np.nan, rng.integers(0, 30, rows)),
+        "application_url": np.where(blank, "", "https://example.com/apply"),
+    })
+
+
+def _synthetic_batch(master_df: pd.DataFrame, batch: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    existing = master_df["job_url"].sample(batch // 2, random_state=seed).tolist()
+    fresh = [f"https://www.linkedin.com/jobs/view/{5_000_000_000 + i}/" for i in range(batch - len(existing))]
+    urls = existing + fresh
+    return pd.DataFrame({
+        "job_url": urls,
+        "job_title": "Marketing Analytics Manager",
+        "description": "About the job (scraped)",
+        "days_since_posted": rng.integers(0, 30, len(urls)),
+        "application_url": "https://example.com/apply/new",
+    })
+
+
+def benchmark(rows: int, batch: int, legacy_sample: int) -> None:
+    master = _synthetic_master(rows)
+    updates = _synthetic_batch(master, batch)
+    existing = updates[updates["job_url"].isin(master["job_url"])]
+
+    start = time.perf_counter()
+    _, added, updated = upsert_jobs(master.copy(), updates)
+    vectorised = time.perf_counter() - start
+
+    sample = existing.head(legacy_sample)
+    start = time.perf_counter()
+    _legacy_fill_missing(master.copy(), sample)
+    legacy_sample_s = time.perf_counter() - start
+    legacy_est = legacy_sample_s * len(existing) / max(1, len(sample))
+
+    print(f"master rows: {rows:,}   batch: {batch:,} ({len(existing):,} existing, {added:,} new)")
+    print(f"upsert_jobs:        {vectorised:8.3f} s   ({updated:,} rows filled)")
+    print(f"legacy mask loop:   {legacy_est:8.3f} s   (estimated from {len(sample):,} URLs in {legacy_sample_s:.2f} s)")
+    print(f"speedup:            {legacy_est / vectorised:8.1f}x per batch "
+          f"(the legacy loop ran once per job_details CSV)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorised job upsert.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic master rows.")
+    parser.add_argument("--batch", type=int, default=5_000, help="Rows per upsert batch.")
+    parser.add_argument("--legacy_sample", type=int, default=200,
+                        help="Existing URLs timed through the legacy loop (extrapolated to the batch).")
+    args = parser.parse_args()
+    benchmark(args.rows, args.batch, args.legacy_sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,23 @@ from job_metrics_tracker import JobMetricsTracker
 import uuid
 import shutil
 from job_extraction.driver_utils import create_driver, cleanup_driver
+from job_extraction.detail_worker_pool import (
+    run_worker_pool, RateLimiter, DEFAULT_LOAD_JITTER_S, DEFAULT_MAX_LOADS_PER_MINUTE,
+)
+from job_extraction.job_page_parser import (
+    JobPageRecord, parse_job_page, find_date_text, normalise_description, remote_status_from_buttons,
+    TOP_CARD_SELECTOR, DESCRIPTION_SELECTOR, COMPANY_SELECTOR, TERTIARY_SELECTOR,
+    TERTIARY_SPAN_SELECTOR, LOCATION_SELECTOR, SALARY_SELECTOR, PREFERENCES_SELECTOR,
+)
+from job_extraction.page_waits import WaitBudget, current_telemetry, poll_until, telemetry_scope, wait_until_ready
+from job_extraction.result_journal import ResultJournal, journal_path_for, links_run_key
+from job_extraction.detail_cache import DetailCache, DEFAULT_TTL_DAYS, HIT, STALE
+from job_extraction.seen_jobs import record_detailed_jobs
+from job_extraction.frontier_priority import (
+    CardPreScorer, PriorityFrontier, save_pending_cards, with_pending_cards,
+)
 from paths import DEBUG_DIR, job_details_for
+from record_io import frame_to_records, write_json_twin
 
 # Set up logging
 logging.basicConfig(
@@ -31,31 +47,28 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
-def df_to_dict_safe(df):
-    """Convert DataFrame to dict, replacing NaT, NaN, and Timestamp values for JSON serialization."""
-    # Make a copy to avoid modifying the original
-    df_clean = df.copy()
-    
-    # Replace NaT (Not a Time) values with None
-    df_clean = df_clean.replace({pd.NaT: None})
-    # Replace NaN values with None
-    df_clean = df_clean.where(pd.notnull(df_clean), None)
-    
-    # Convert to dict first
-    records = df_clean.to_dict('records')
-    
-    # Post-process to convert Timestamp objects to strings and handle any remaining NaT/NaN
-    for record in records:
-        for key, value in record.items():
-            if isinstance(value, pd.Timestamp):
-                record[key] = value.strftime('%Y-%m-%d %H:%M:%S')
-            elif pd.isna(value) or value is pd.NaT:
-                record[key] = None
-    
-    return records
+# Column order of the tuple returned by get_job_details
+DETAIL_COLUMNS = [
+    'job_title', 'company', 'description', 'date_posted',
+    'location', 'remote', 'salary', 'job_url', 'days_since_posted', 'application_url'
+]
+
+# Field extraction modes for get_job_details: "snapshot" parses one page_source
+# with lxml; "webdriver" is the legacy per-field wait path (kept for comparison)
+EXTRACTION_MODES = ("snapshot", "webdriver")
+DEFAULT_EXTRACTION_MODE = "snapshot"
+# Seconds to wait for the description container after the top card is ready
+SNAPSHOT_DESCRIPTION_GRACE = 3
 
-def random_delay(base=1, variance=1):
-    time.sleep(base + random.uniform(0, variance))
+# Page-readiness / wait budgets (seconds) – see job_extraction.page_waits
+TOP_CARD_TIMEOUT = 15        # required: the job top card must render
+OPTIONAL_FIELD_BUDGET = 15   # shared by every optional wait on one job page
+APPLY_BUTTON_WAIT = 6
+INTERCEPT_WAIT = 1
+CLICK_OUTCOME_WAIT = 10
+LATE_REDIRECT_WAIT = 2
+NEW_WINDOW_LOAD_WAIT = 2
+NETWORK_QUIET_MS = 500
 
 def get_chrome_version():
     """Get the version of Chrome installed on the system."""
@@ -78,7 +91,7 @@ def load_cookies(driver, cookies):
         return
 
     driver.get("https://www.linkedin.com/feed/")
-    time.sleep(2)
+    wait_until_ready(driver, None, timeout=10, site="cookies.feed")
     
     # Delete existing cookies before adding new ones
     driver.delete_all_cookies()
@@ -100,7 +113,7 @@ def load_cookies(driver, cookies):
     
     logging.info(f"Loaded {cookies_loaded} cookies")
     driver.refresh()
-    time.sleep(3)
+    wait_until_ready(driver, None, timeout=10, quiet_ms=NETWORK_QUIET_MS, site="cookies.refresh")
 
 
 def capture_url_debug_snapshot(driver, prefix="apply_debug"):
@@ -121,8 +134,38 @@ def capture_url_debug_snapshot(driver, prefix="apply_debug"):
         logging.warning(f"Failed to capture debug snapshot: {e}")
 
 
-def extract_application_url(driver, wait):
-    """Extract the application URL by clicking the Apply button on LinkedIn job posting."""
+def _loaded_window_url(driver):
+    """Current URL of a freshly opened window once it has left about:blank and LinkedIn redirects."""
+    url = driver.current_url
+    if url and url != "about:blank" and "linkedin.com" not in url:
+        return url
+    return None
+
+def _sign_in_required(driver):
+    """True if LinkedIn put up a sign-in prompt instead of redirecting."""
+    sign_in_selectors = [
+        'div[data-test-modal="sign-in-modal"]',
+        'div.sign-in-modal',
+        'button[data-test-id="sign-in-button"]',
+        'a[href*="/login"]'
+    ]
+    for selector in sign_in_selectors:
+        try:
+            for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                if element.is_displayed():
+                    return True
+        except:
+            continue
+    return False
+
+def extract_application_url(driver, wait, budget=None):
+    """Extract the application URL by clicking the Apply button on LinkedIn job posting.
+
+    ``budget`` is the page's shared ``WaitBudget`` for optional fields; every
+    wait in here draws from it instead of sleeping for a fixed time.
+    """
+    if budget is None:
+        budget = WaitBudget(OPTIONAL_FIELD_BUDGET)
     original_window = None
     original_url = None
     application_url = None
@@ -144,18 +187,19 @@ def extract_application_url(driver, wait):
             'button.artdeco-button--primary[aria-label*="Apply"]'
         ]
         
+        def _find_apply_button():
+            # One poll covers every selector, in priority order
+            for selector in apply_button_selectors:
+                for btn in driver.find_elements(By.CSS_SELECTOR, selector):
+                    if btn.is_displayed() and btn.is_enabled():
+                        return selector, btn
+            return None
+        
         apply_button = None
-        for selector in apply_button_selectors:
-            try:
-                # Use shorter timeout for each attempt
-                short_wait = WebDriverWait(driver, 3)
-                apply_button = short_wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                if apply_button:
-                    logging.info(f"Found Apply button using selector: {selector}")
-                    break
-            except Exception as e:
-                logging.debug(f"Selector {selector} did not find button: {e}")
-                continue
+        found = budget.poll_until(_find_apply_button, "apply.button", cap=APPLY_BUTTON_WAIT)
+        if found:
+            selector, apply_button = found
+            logging.info(f"Found Apply button using selector: {selector}")
         
         if not apply_button:
             logging.warning("Apply button not found with any selector")
@@ -239,7 +283,6 @@ def extract_application_url(driver, wait):
         try:
             # Scroll button into view
             driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", apply_button)
-            time.sleep(0.5)
             
             # Get current window handles and URL before clicking
             windows_before = set(driver.window_handles)
@@ -287,16 +330,17 @@ def extract_application_url(driver, wait):
                         logging.warning(f"All click methods failed: {e3}")
             
             # Check if we intercepted a window.open call
-            time.sleep(0.5)  # Brief wait for JavaScript to execute
             try:
-                intercepted_url = driver.execute_script("return window._linkedinApplicationUrl;")
+                intercepted_url = budget.poll_until(
+                    lambda: driver.execute_script("return window._linkedinApplicationUrl;"),
+                    "apply.intercept", cap=INTERCEPT_WAIT)
                 if intercepted_url:
                     logging.info(f"Intercepted application URL from window.open: {intercepted_url}")
                     application_url = intercepted_url
                     # Still need to check if window opened to close it
-                    time.sleep(1)
-                    windows_after = set(driver.window_handles)
-                    new_windows = windows_after - windows_before
+                    new_windows = budget.poll_until(
+                        lambda: set(driver.window_handles) - windows_before,
+                        "apply.intercept_window", cap=INTERCEPT_WAIT)
                     if new_windows:
                         new_window = new_windows.pop()
                         driver.switch_to.window(new_window)
@@ -310,190 +354,121 @@ def extract_application_url(driver, wait):
                 logging.warning("Could not click Apply button")
                 return "Not Available"
             
-            # Check if LinkedIn is asking for authentication
-            time.sleep(1)  # Brief wait to see if auth modal appears
-            try:
-                # Check for sign-in prompts or modals
-                sign_in_selectors = [
-                    'div[data-test-modal="sign-in-modal"]',
-                    'div.sign-in-modal',
-                    'button[data-test-id="sign-in-button"]',
-                    'a[href*="/login"]'
-                ]
-                for selector in sign_in_selectors:
-                    try:
-                        sign_in_element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if sign_in_element.is_displayed():
-                            logging.warning("LinkedIn sign-in required - cannot extract application URL without authentication")
-                            return "Not Available"
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Wait and check for new window/tab (check multiple times)
-            max_wait_time = 10  # Increased wait time for new windows
-            check_interval = 0.3
-            waited = 0
-            
-            logging.info(f"Waiting up to {max_wait_time} seconds for new window or navigation...")
-            logging.info(f"Windows before click: {len(windows_before)} - {list(windows_before)}")
-            
-            while waited < max_wait_time:
-                time.sleep(check_interval)
-                waited += check_interval
+            def _detect_click_outcome():
+                # New window/tab opened by the click
+                new_windows = set(driver.window_handles) - windows_before
+                if new_windows:
+                    new_window = new_windows.pop()
+                    logging.info(f"New window detected, switching to: {new_window}")
+                    driver.switch_to.window(new_window)
+                    window_url = poll_until(lambda: _loaded_window_url(driver), NEW_WINDOW_LOAD_WAIT,
+                                            "apply.new_window_load") or driver.current_url
+                    driver.close()
+                    driver.switch_to.window(original_window)
+                    if "linkedin.com" in window_url:
+                        # Closed it; keep waiting for the real redirect
+                        logging.warning(f"New window opened but still on LinkedIn: {window_url}")
+                        return None
+                    logging.info(f"Found application URL in new window: {window_url}")
+                    return "window", window_url
                 
-                # Check for new windows
-                try:
-                    windows_after = set(driver.window_handles)
-                    new_windows = windows_after - windows_before
-                    
-                    if new_windows:
-                        logging.info(f"New window detected! Total windows: {len(windows_after)}, New: {len(new_windows)}")
-                        # New window opened - switch to it and get URL
-                        new_window = new_windows.pop()
-                        logging.info(f"Switching to new window: {new_window}")
-                        driver.switch_to.window(new_window)
-                        time.sleep(2)  # Wait for page to load
-                        application_url = driver.current_url
-                        logging.info(f"Found application URL in new window: {application_url}")
-                        
-                        # Validate it's not a LinkedIn page
-                        if "linkedin.com" in application_url:
-                            logging.warning(f"New window opened but still on LinkedIn: {application_url}")
-                            # Close this window and continue waiting
-                            driver.close()
-                            driver.switch_to.window(original_window)
-                            continue
-                        
-                        # Close the new window and switch back
-                        driver.close()
-                        driver.switch_to.window(original_window)
-                        logging.info("Closed new window and switched back to original")
-                        break
-                except Exception as window_error:
-                    logging.debug(f"Error checking windows: {window_error}")
+                # Navigation in the same window
+                current_url = driver.current_url
+                if current_url != original_url_before_click and "linkedin.com" not in current_url:
+                    logging.info(f"Found application URL via navigation: {current_url}")
+                    return "navigation", current_url
                 
-                # Check if current URL changed (navigation in same window)
-                try:
-                    current_url = driver.current_url
-                    if current_url != original_url_before_click:
-                        logging.info(f"URL changed from {original_url_before_click} to {current_url}")
-                        if "linkedin.com" not in current_url:
-                            # Navigated to external URL
-                            application_url = current_url
-                            logging.info(f"Found application URL via navigation: {application_url}")
-                            # Navigate back to original page
-                            driver.get(original_url)
-                            time.sleep(2)
-                            break
-                        elif current_url != original_url:
-                            # URL changed but still on LinkedIn - might be redirecting
-                            logging.debug(f"URL changed to LinkedIn page: {current_url}")
-                except Exception as url_error:
-                    logging.debug(f"Error checking URL: {url_error}")
+                # LinkedIn asking for authentication instead of redirecting
+                if _sign_in_required(driver):
+                    return "sign_in", None
+                return None
             
-            if waited >= max_wait_time and not application_url:
-                logging.warning(f"Timeout after {max_wait_time} seconds - no new window or navigation detected")
-                # Check one more time for windows (sometimes they open slowly)
-                try:
-                    final_windows = set(driver.window_handles)
-                    final_new_windows = final_windows - windows_before
-                    if final_new_windows:
-                        logging.info(f"Found new window on final check: {len(final_new_windows)}")
-                        new_window = final_new_windows.pop()
-                        driver.switch_to.window(new_window)
-                        time.sleep(1)
-                        application_url = driver.current_url
-                        if "linkedin.com" not in application_url:
-                            logging.info(f"Found application URL in delayed new window: {application_url}")
-                            driver.close()
-                            driver.switch_to.window(original_window)
-                        else:
-                            driver.close()
-                            driver.switch_to.window(original_window)
-                            application_url = None
-                except Exception as e:
-                    logging.debug(f"Error in final window check: {e}")
+            logging.info(f"Waiting up to {min(CLICK_OUTCOME_WAIT, budget.remaining()):.1f} seconds for new window or navigation...")
+            logging.info(f"Windows before click: {len(windows_before)} - {list(windows_before)}")
+            outcome = budget.poll_until(_detect_click_outcome, "apply.click_outcome", cap=CLICK_OUTCOME_WAIT)
+            if not outcome:
+                # Slow windows / async redirects: one short follow-up poll
+                outcome = budget.poll_until(_detect_click_outcome, "apply.late_redirect", cap=LATE_REDIRECT_WAIT)
             
-            # If still no URL found, check for redirects or links that appeared
-            if not application_url:
-                # Wait a bit more for async redirects
-                time.sleep(2)
-                final_url = driver.current_url
-                
-                if final_url != original_url_before_click and "linkedin.com" not in final_url:
-                    application_url = final_url
-                    logging.info(f"Found application URL after additional wait: {application_url}")
+            if outcome:
+                kind, found_url = outcome
+                if kind == "sign_in":
+                    logging.warning("LinkedIn sign-in required - cannot extract application URL without authentication")
+                    return "Not Available"
+                application_url = found_url
+                if kind == "navigation":
+                    # Navigate back to original page
                     driver.get(original_url)
-                    time.sleep(2)
-                else:
-                    # Try to find external links that might have appeared
+            else:
+                logging.warning("Timed out waiting for a new window or navigation after clicking Apply")
+            
+            # If still no URL found, look for links that appeared
+            if not application_url:
+                # Try to find external links that might have appeared
+                try:
+                    # Look for links in modals or overlays that might have appeared
+                    # First check if a modal/overlay appeared
                     try:
-                        # Look for links in modals or overlays that might have appeared
-                        # First check if a modal/overlay appeared
-                        try:
-                            # Check for common modal/overlay patterns
-                            modal_selectors = [
-                                'div[role="dialog"]',
-                                'div.modal',
-                                'div.overlay',
-                                'div[class*="modal"]',
-                                'div[class*="overlay"]',
-                                'aside[role="dialog"]'
-                            ]
-                            for modal_selector in modal_selectors:
-                                try:
-                                    modal = driver.find_element(By.CSS_SELECTOR, modal_selector)
-                                    if modal.is_displayed():
-                                        logging.info(f"Found modal/overlay: {modal_selector}")
-                                        # Look for external links in the modal
-                                        modal_links = modal.find_elements(By.CSS_SELECTOR, "a[href*='http']:not([href*='linkedin.com'])")
-                                        for link in modal_links:
-                                            href = link.get_attribute("href")
-                                            if href and href.startswith("http"):
-                                                if any(keyword in href.lower() for keyword in ["taleo", "greenhouse", "apply", "job", "careers", "ats", "workday", "tbe"]):
-                                                    application_url = href
-                                                    logging.info(f"Found application URL in modal link: {application_url}")
-                                                    # Close modal if possible
-                                                    try:
-                                                        close_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label*='close'], button[aria-label*='Close'], .artdeco-modal__dismiss")
-                                                        close_btn.click()
-                                                        time.sleep(0.5)
-                                                    except:
-                                                        pass
-                                                    break
-                                        if application_url:
-                                            break
-                                except:
-                                    continue
-                        except:
-                            pass
-                        
-                        # Also check all external links on the page
-                        if not application_url:
-                            external_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='http']:not([href*='linkedin.com'])")
-                            for link in external_links[:20]:  # Check first 20 external links
-                                href = link.get_attribute("href")
-                                if href and href.startswith("http"):
-                                    href_lower = href.lower()
-                                    # Exclude common non-application URLs
-                                    exclude_keywords = ["benefits", "facebook-life", "work-life", "careers/life", "about", "culture", "privacy", "terms", "cookie"]
-                                    if any(exclude in href_lower for exclude in exclude_keywords):
-                                        continue
-                                    
-                                    # Check if it looks like an application URL
-                                    application_keywords = [
-                                        "taleo", "greenhouse", "apply", "job", "careers", "ats", "workday", 
-                                        "tbe", "viewrequisition", "requisition", "application", "candidate", 
-                                        "recruiting", "hire", "position", "opening", "vacancy", "phf.tbe"
-                                    ]
-                                    if any(keyword in href_lower for keyword in application_keywords):
-                                        application_url = href
-                                        logging.info(f"Found application URL in link element: {application_url}")
+                        # Check for common modal/overlay patterns
+                        modal_selectors = [
+                            'div[role="dialog"]',
+                            'div.modal',
+                            'div.overlay',
+                            'div[class*="modal"]',
+                            'div[class*="overlay"]',
+                            'aside[role="dialog"]'
+                        ]
+                        for modal_selector in modal_selectors:
+                            try:
+                                modal = driver.find_element(By.CSS_SELECTOR, modal_selector)
+                                if modal.is_displayed():
+                                    logging.info(f"Found modal/overlay: {modal_selector}")
+                                    # Look for external links in the modal
+                                    modal_links = modal.find_elements(By.CSS_SELECTOR, "a[href*='http']:not([href*='linkedin.com'])")
+                                    for link in modal_links:
+                                        href = link.get_attribute("href")
+                                        if href and href.startswith("http"):
+                                            if any(keyword in href.lower() for keyword in ["taleo", "greenhouse", "apply", "job", "careers", "ats", "workday", "tbe"]):
+                                                application_url = href
+                                                logging.info(f"Found application URL in modal link: {application_url}")
+                                                # Close modal if possible
+                                                try:
+                                                    close_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label*='close'], button[aria-label*='Close'], .artdeco-modal__dismiss")
+                                                    close_btn.click()
+                                                except:
+                                                    pass
+                                                break
+                                    if application_url:
                                         break
-                    except Exception as e:
-                        logging.debug(f"Error searching for external links: {e}")
+                            except:
+                                continue
+                    except:
+                        pass
+                    
+                    # Also check all external links on the page
+                    if not application_url:
+                        external_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='http']:not([href*='linkedin.com'])")
+                        for link in external_links[:20]:  # Check first 20 external links
+                            href = link.get_attribute("href")
+                            if href and href.startswith("http"):
+                                href_lower = href.lower()
+                                # Exclude common non-application URLs
+                                exclude_keywords = ["benefits", "facebook-life", "work-life", "careers/life", "about", "culture", "privacy", "terms", "cookie"]
+                                if any(exclude in href_lower for exclude in exclude_keywords):
+                                    continue
+                                
+                                # Check if it looks like an application URL
+                                application_keywords = [
+                                    "taleo", "greenhouse", "apply", "job", "careers", "ats", "workday", 
+                                    "tbe", "viewrequisition", "requisition", "application", "candidate", 
+                                    "recruiting", "hire", "position", "opening", "vacancy", "phf.tbe"
+                                ]
+                                if any(keyword in href_lower for keyword in application_keywords):
+                                    application_url = href
+                                    logging.info(f"Found application URL in link element: {application_url}")
+                                    break
+                except Exception as e:
+                    logging.debug(f"Error searching for external links: {e}")
             
             if application_url and application_url.startswith("http"):
                 # Final validation - exclude common non-application URLs
@@ -554,8 +529,130 @@ def extract_application_url(driver, wait):
             pass
         return "Not Available"
 
-def get_job_details(driver, url):
-    """Get details for a single job posting."""
+def _extract_fields_webdriver(driver, wait):
+    """Legacy extraction: one WebDriver wait/lookup per field."""
+    record = JobPageRecord()
+
+    try:
+        show_more_button = wait.until(EC.element_to_be_clickable(
+            (By.CSS_SELECTOR, '.feed-shared-inline-show-more-text__see-more-less-toggle')))
+        driver.execute_script("arguments[0].click();", show_more_button)
+    except Exception as e:
+        logging.warning(f"Show more button not found: {e}")
+
+    # Extract all fields with appropriate waits
+    record.job_title = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, TOP_CARD_SELECTOR))).text.strip()
+
+    try:
+        job_description_element = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, DESCRIPTION_SELECTOR)))
+        record.description = normalise_description(job_description_element.text)
+    except:
+        record.description = "-"
+
+    try:
+        record.company = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, COMPANY_SELECTOR))).text.strip()
+    except:
+        record.company = "-"
+
+    try:
+        # Target the tertiary description container where date info is located
+        tertiary_container = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, TERTIARY_SELECTOR)))
+        spans = tertiary_container.find_elements(By.CSS_SELECTOR, TERTIARY_SPAN_SELECTOR)
+        record.date_text = find_date_text([span.text for span in spans], tertiary_container.text)
+    except Exception as e:
+        logging.warning(f"Could not extract date posted: {e}", exc_info=True)
+
+    try:
+        record.location = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, LOCATION_SELECTOR))).text.strip()
+    except:
+        record.location = "-"
+
+    try:
+        record.salary = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, SALARY_SELECTOR))).text.strip()
+    except:
+        record.salary = "-"
+
+    try:
+        # Look for the job-details-fit-level-preferences container first
+        preferences_container = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, PREFERENCES_SELECTOR)))
+        buttons = preferences_container.find_elements(By.TAG_NAME, "button")
+        record.remote_status = remote_status_from_buttons([b.text.strip() for b in buttons])
+    except Exception as e:
+        logging.warning(f"Could not extract remote status: {e}")
+        record.remote_status = "Onsite"
+
+    return record
+
+def _extract_fields_snapshot(driver, budget):
+    """Parse every field from one page_source snapshot (the top card is already ready)."""
+    # The description renders with the top card; give it a short grace period only
+    if not budget.present(driver, DESCRIPTION_SELECTOR, "detail.description", cap=SNAPSHOT_DESCRIPTION_GRACE):
+        logging.warning("Description container not present at snapshot time")
+
+    record = parse_job_page(driver.page_source)
+    if not record.job_title:
+        raise ValueError("Job title missing from page snapshot")
+    return record
+
+def cached_job_details(entry, url, application_url=None):
+    """Build the get_job_details tuple from a cache entry (days_since_posted recomputed)."""
+    date_posted = pd.to_datetime(entry.get('date_posted'), errors='coerce')
+    date_posted = None if pd.isna(date_posted) else date_posted
+    if application_url in (None, '', '-'):
+        application_url = entry.get('application_url') or "Not Available"
+    return (entry.get('job_title'), entry.get('company') or "-", entry.get('description'), date_posted,
+            entry.get('location') or "-", entry.get('remote') or "Onsite", entry.get('salary') or "-",
+            url, calculate_days_since_posted(date_posted), application_url)
+
+def refresh_cached_job_details(driver, url, entry, cache):
+    """STALE cache entry: reload the page only to re-fetch the application URL."""
+    application_url = None
+    try:
+        logging.info(f"Refreshing application URL for cached job: {url}")
+        driver.get(url)
+        wait_until_ready(driver, TOP_CARD_SELECTOR, timeout=TOP_CARD_TIMEOUT, site="detail.top_card")
+        application_url = extract_application_url(driver, WebDriverWait(driver, 15), WaitBudget(OPTIONAL_FIELD_BUDGET))
+    except Exception as e:
+        logging.warning(f"Could not refresh application URL for {url}, keeping cached value: {e}")
+    cache.refresh(url, application_url)
+    return cached_job_details(entry, url, application_url)
+
+def resolve_from_cache(cache, links, journal):
+    """Journal every cache HIT and return the links that still need a page load."""
+    remaining = []
+    for url in links:
+        status, entry = cache.lookup(url)
+        if status == HIT:
+            journal.append(dict(zip(DETAIL_COLUMNS, cached_job_details(entry, url))))
+        else:
+            remaining.append(url)
+    logging.info(f"Detail cache: {len(links) - len(remaining)} of {len(links)} URLs served from cache")
+    return remaining
+
+def get_job_details(driver, url, extraction=DEFAULT_EXTRACTION_MODE, cache=None):
+    """Get details for a single job posting.
+
+    ``extraction`` selects how fields are read once the page has loaded:
+    ``"snapshot"`` (one page_source parse) or ``"webdriver"`` (legacy
+    per-field waits, kept for comparison).
+
+    With a ``DetailCache``, fresh entries are returned without loading the
+    page, stale entries only re-fetch the application URL, and full scrapes
+    are written back to the cache.
+    """
+    if cache is not None:
+        status, entry = cache.lookup(url, count=False)
+        if status == HIT:
+            return cached_job_details(entry, url)
+        if status == STALE:
+            return refresh_cached_job_details(driver, url, entry, cache)
+
     max_retries = 2  # Reduced retries since we're using batch processing
     retry_count = 0
     
@@ -563,148 +660,46 @@ def get_job_details(driver, url):
         try:
             logging.info(f"Processing URL: {url}")
             
-            # Initial page load with delay
+            # Initial page load: wait for the top card instead of a fixed sleep
             driver.get(url)
-            time.sleep(random.uniform(3, 5))
+            wait_until_ready(driver, TOP_CARD_SELECTOR, timeout=TOP_CARD_TIMEOUT, site="detail.top_card")
             
             wait = WebDriverWait(driver, 15)
+            budget = WaitBudget(OPTIONAL_FIELD_BUDGET)
             
-            # Initialize variables
-            job_title = company_name = job_description = date_posted = location = salary = remote_status = days_since_posted = application_url = None
-            
-            # Extract job details with minimal delays
-            try:
-                show_more_button = wait.until(EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, '.feed-shared-inline-show-more-text__see-more-less-toggle')))
-                driver.execute_script("arguments[0].click();", show_more_button)
-            except Exception as e:
-                logging.warning(f"Show more button not found: {e}")
-            
-            # Extract all fields with appropriate waits
-            job_title = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'h1'))).text.strip()
+            extract_start = time.perf_counter()
+            if extraction == "webdriver":
+                record = _extract_fields_webdriver(driver, wait)
+            else:
+                record = _extract_fields_snapshot(driver, budget)
+            extract_elapsed = time.perf_counter() - extract_start
+            current_telemetry().record(f"detail.extract_{extraction}", extract_elapsed)
+            logging.info(f"Field extraction ({extraction}) took {extract_elapsed:.2f}s")
             
-            try:
-                job_description_element = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, 'div.job-details-about-the-job-module__description div.feed-shared-inline-show-more-text')))
-                job_description = job_description_element.text.replace("-", " ").strip()
-                job_description = re.sub(r'\s+', ' ', job_description)
-            except:
-                job_description = "-"
-                
-            try:
-                company_name = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, 'div.job-details-jobs-unified-top-card__company-name a'))).text.strip()
-            except:
-                company_name = "-"
-                
-            try:
-                # Target the tertiary description container where date info is located
-                tertiary_container = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, 'div.job-details-jobs-unified-top-card__tertiary-description-container')))
-                
-                # Find spans that contain date/time information
-                date_text = None
-                spans = tertiary_container.find_elements(By.CSS_SELECTOR, 'span.tvm__text.tvm__text--low-emphasis')
-                
-                # Time pattern that matches "X hours/days/weeks/months ago" with or without "Posted/Reposted"
-                time_ago_pattern = re.compile(r'(\d+)\s*(hour|day|week|month)s?\s*ago', re.IGNORECASE)
-                
-                for span in spans:
-                    span_text = span.text.strip()
-                    logging.debug(f"Checking span text for date: '{span_text}'")
-                    
-                    # Check if this span contains a time-ago pattern
-                    if time_ago_pattern.search(span_text):
-                        date_text = span_text
-                        logging.info(f"Found time-ago pattern in span: '{date_text}'")
-                        break
-                    # Also check for "Posted" or "Reposted" prefix
-                    elif 'reposted' in span_text.lower() or 'posted' in span_text.lower():
-                        date_text = span_text
-                        logging.info(f"Found posted/reposted in span: '{date_text}'")
-                        break
-                
-                # If not found in spans, try searching the entire container text
-                if not date_text:
-                    container_text = tertiary_container.text
-                    logging.debug(f"Container text: '{container_text}'")
-                    
-                    # Look for time-ago pattern anywhere in container
-                    time_match = time_ago_pattern.search(container_text)
-                    if time_match:
-                        # Get the full match with surrounding context
-                        match_start = max(0, time_match.start() - 10)
-                        match_end = min(len(container_text), time_match.end())
-                        date_text = container_text[match_start:match_end].strip()
-                        # Clean up - remove leading punctuation
-                        date_text = re.sub(r'^[·\s]+', '', date_text)
-                        logging.info(f"Found time-ago pattern in container: '{date_text}'")
-                
-                if date_text:
-                    logging.info(f"Found date text: {date_text}")
-                    date_posted = parse_date_posted(date_text)
-                    # Calculate days since posted
-                    days_since_posted = calculate_days_since_posted(date_posted)
-                    logging.info(f"Parsed date_posted: {date_posted}, days_since_posted: {days_since_posted}")
-                else:
-                    logging.warning("Could not find date text in tertiary container")
-                    date_posted = None
-                    days_since_posted = None
-            except Exception as e:
-                logging.warning(f"Could not extract date posted: {e}", exc_info=True)
-                date_posted = None
-                days_since_posted = None
-                
-            try:
-                location = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, 'div.job-details-jobs-unified-top-card__primary-description-container span.tvm__text'))).text.strip()
-            except:
-                location = "-"
-                
-            try:
-                salary = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "div.job-details-preferences-and-skills__pill span.ui-label.text-body-small"))).text.strip()
-            except:
-                salary = "-"
-                
-            try:
-                # Look for the job-details-fit-level-preferences container first
-                preferences_container = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "div.job-details-fit-level-preferences")))
-                
-                # Find buttons within the container that contain location type text
-                buttons = preferences_container.find_elements(By.TAG_NAME, "button")
-                remote_status = "Onsite"  # Default fallback
-                
-                for button in buttons:
-                    button_text = button.text.strip()
-                    # Check if button contains location type keywords
-                    if any(keyword in button_text for keyword in ["Remote", "Hybrid", "Onsite"]):
-                        # Extract just the location type (may have other text like "Full-time")
-                        if "Remote" in button_text:
-                            remote_status = "Remote"
-                            break
-                        elif "Hybrid" in button_text:
-                            remote_status = "Hybrid"
-                            break
-                        elif "Onsite" in button_text:
-                            remote_status = "Onsite"
-                            break
-                
-            except Exception as e:
-                logging.warning(f"Could not extract remote status: {e}")
-                remote_status = "Onsite"
+            date_posted = days_since_posted = None
+            if record.date_text:
+                logging.info(f"Found date text: {record.date_text}")
+                date_posted = parse_date_posted(record.date_text)
+                # Calculate days since posted
+                days_since_posted = calculate_days_since_posted(date_posted)
+                logging.info(f"Parsed date_posted: {date_posted}, days_since_posted: {days_since_posted}")
+            else:
+                logging.warning("Could not find date text in tertiary container")
             
             # Extract application URL from Apply button
             try:
                 logging.info("Attempting to extract application URL...")
-                application_url = extract_application_url(driver, wait)
+                application_url = extract_application_url(driver, wait, budget)
                 logging.info(f"Application URL extraction result: {application_url}")
             except Exception as e:
                 logging.warning(f"Could not extract application URL: {e}", exc_info=True)
                 application_url = "Not Available"
             
-            return job_title, company_name, job_description, date_posted, location, remote_status, salary, url, days_since_posted, application_url
+            job_details = (record.job_title, record.company, record.description, date_posted, record.location,
+                           record.remote_status, record.salary, url, days_since_posted, application_url)
+            if cache is not None:
+                cache.store(url, dict(zip(DETAIL_COLUMNS, job_details)))
+            return job_details
             
         except Exception as e:
             retry_count += 1
@@ -816,37 +811,24 @@ def save_job_details(df, job_title):
         cols = ['job_id'] + [col for col in df.columns if col != 'job_id']
         df = df[cols]
         
-        # Save both CSV and JSON versions
+        # Save the CSV and its JSON twin
         csv_path = os.path.join(folder_store, f"{base_filename}.csv")
-        json_path = os.path.join(folder_store, f"{base_filename}.json")
         
         df.to_csv(csv_path, index=False)
         logging.info(f"Results saved to {csv_path}")
         
-        # Convert NaT to None or a string
-        df = df.where(pd.notnull(df), None)
-        
-        # Convert datetime columns to strings
-        for col in df.select_dtypes(include=['datetime64[ns]']).columns:
-            df[col] = df[col].astype(str)
-        
-        # Save as JSON with metadata (keeping company in metadata only)
-        company_name = df['company'].iloc[0] if not df.empty else 'unknown'
+        # JSON twin with metadata (keeping company in metadata only)
+        company_name = df['company'].iloc[0] if not df.empty and pd.notna(df['company'].iloc[0]) else 'unknown'
         company_name_clean = company_name.lower().replace(' ', '_').replace(',', '').replace('.', '')
         
-        output_data = {
-            "metadata": {
-                "job_title": job_title_clean,
-                "company": company_name_clean,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "file_id": random_number
-            },
-            "jobs": df_to_dict_safe(df)
-        }
-        
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        logging.info(f"Results saved to {json_path}")
+        json_path = write_json_twin(csv_path, df, {
+            "job_title": job_title_clean,
+            "company": company_name_clean,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "file_id": random_number
+        })
+        if json_path:
+            logging.info(f"Results saved to {json_path}")
         
         return csv_path
         
@@ -854,100 +836,314 @@ def save_job_details(df, job_title):
         logging.error(f"Error saving job details: {e}")
         raise
 
-def process_job_links(links, output_dir, job_title, test_limit=None):
-    """Process job links in batches with appropriate delays."""
+def create_worker_driver(worker_id, cookies):
+    """Create a driver with its own profile directory and load cookies into it."""
+    driver = create_driver(profile_name=f"job_details_worker_{worker_id}")
     try:
-        if test_limit and len(links) > test_limit:
-            links = links[:test_limit]
-            logging.info(f"TESTING MODE: Limiting to {test_limit} jobs for testing")
-        
-        # Initialize driver once
-        driver = create_driver()
-        load_cookies(driver, load_cookie_data())
-        
-        # Process in small batches
-        batch_size = 3
-        results = []
-        
-        for i in range(0, len(links), batch_size):
-            batch = links[i:i + batch_size]
-            logging.info(f"Processing batch {i//batch_size + 1} of {(len(links) + batch_size - 1)//batch_size}")
+        load_cookies(driver, cookies)
+    except Exception:
+        cleanup_driver(driver)
+        raise
+    return driver
+
+def collect_job_details_parallel(links, workers, max_per_minute=DEFAULT_MAX_LOADS_PER_MINUTE,
+                                  extraction=DEFAULT_EXTRACTION_MODE, sink=None, cache=None, deadline=None):
+    """Collect job details with a pool of drivers; results keep the order of links."""
+    cookies = load_cookie_data()
+    if not cookies:
+        logging.warning("No cookies loaded")
+    telemetry = current_telemetry()     # worker threads record into the caller's run
+
+    def create(worker_id):
+        with telemetry_scope(telemetry):
+            return create_worker_driver(worker_id, cookies)
+
+    def process(driver, url):
+        with telemetry_scope(telemetry):
+            return get_job_details(driver, url, extraction=extraction, cache=cache)
+
+    return run_worker_pool(
+        links,
+        n_workers=workers,
+        driver_factory=create,
+        process_fn=process,
+        cleanup_fn=cleanup_driver,
+        max_per_minute=max_per_minute,
+        sink=sink,
+        deadline=deadline,
+    )
+
+def _is_scraped(record):
+    """A journaled record counts as done unless it is the failure placeholder."""
+    return record.get('job_title') not in (None, '-')
+
+def open_detail_journal(job_title_clean, run_key, links):
+    """Open the run journal and return it with the links that still need scraping."""
+    journal = ResultJournal(journal_path_for(job_title_clean, run_key))
+    done = journal.completed_urls(is_complete=_is_scraped)
+    pending = [url for url in links if url not in done]
+    if len(pending) < len(links):
+        logging.info(f"Resuming from journal {journal.path}: "
+                     f"{len(links) - len(pending)} of {len(links)} URLs already scraped")
+    return journal, pending
+
+def open_detail_cache(job_title_clean, use_cache=True, ttl_days=DEFAULT_TTL_DAYS):
+    """Load the shared detail cache and seed it from this title's existing outputs."""
+    if not use_cache:
+        return None
+    cache = DetailCache(ttl_days=ttl_days)
+    cache.seed_from_outputs(job_title_clean)
+    return cache
+
+def close_detail_cache(cache):
+    if cache is not None:
+        cache.save()
+        cache.log_stats()
+
+def journal_to_frame(journal, links):
+    """Compact the journal into the final DataFrame, in input-link order."""
+    df_results = pd.DataFrame(journal.compact('job_url', order=links), columns=DETAIL_COLUMNS)
+    df_results['date_posted'] = pd.to_datetime(df_results['date_posted'], errors='coerce')
+    return df_results
+
+def write_detail_outputs(df_results, job_title_clean):
+    """Save the CSV + JSON detail files for a run; returns the CSV path."""
+    folder_store = str(job_details_for(job_title_clean))
+    os.makedirs(folder_store, exist_ok=True)
+    
+    # Generate filename with timestamp
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_filename = f"{job_title_clean}_job_details_{timestamp}.csv"
+    output_path = os.path.join(folder_store, output_filename)
+    
+    # Save CSV
+    df_results.to_csv(output_path, index=False)
+    logging.info(f"Results saved to {output_path}")
+    
+    # Save the JSON twin
+    json_path = write_json_twin(output_path, df_results, {
+        "job_title": job_title_clean,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "total_jobs": len(df_results)
+    })
+    if json_path:
+        logging.info(f"Results saved to {json_path}")
+    return output_path
+
+def process_job_links(links, output_dir, job_title, test_limit=None, workers=1,
+                      max_per_minute=DEFAULT_MAX_LOADS_PER_MINUTE, extraction=DEFAULT_EXTRACTION_MODE,
+                      use_cache=True, cache_ttl_days=DEFAULT_TTL_DAYS):
+    """Process job links in batches with appropriate delays (or with a worker pool if workers > 1).
+
+    Every result is journaled as it arrives, so an interrupted run restarted
+    with the same links skips the URLs it already scraped.
+    """
+    with telemetry_scope() as telemetry:
+        driver = None
+        journal = None
+        cache = None
+        job_title_clean = job_title.lower().replace(' ', '_')
+        try:
+            if test_limit and len(links) > test_limit:
+                links = links[:test_limit]
+                logging.info(f"TESTING MODE: Limiting to {test_limit} jobs for testing")
+
+            journal, pending = open_detail_journal(job_title_clean, links_run_key(links), links)
+            cache = open_detail_cache(job_title_clean, use_cache, cache_ttl_days)
+            if cache is not None:
+                pending = resolve_from_cache(cache, pending, journal)
+
+            # Process in small batches
+            batch_size = 3
+
+            if workers > 1:
+                collect_job_details_parallel(
+                    pending, workers, max_per_minute, extraction,
+                    sink=lambda position, job_details: journal.append(dict(zip(DETAIL_COLUMNS, job_details))),
+                    cache=cache,
+                )
+            elif pending:
+                # Initialize driver once
+                driver = create_driver()
+                load_cookies(driver, load_cookie_data())
+
+                for i in range(0, len(pending), batch_size):
+                    batch = pending[i:i + batch_size]
+                    logging.info(f"Processing batch {i//batch_size + 1} of {(len(pending) + batch_size - 1)//batch_size}")
             
-            # Process each URL in the batch
-            for url in batch:
-                try:
-                    job_details = get_job_details(driver, url)
-                    if job_details:
-                        results.append(job_details)
-                except Exception as e:
-                    logging.error(f"Error processing URL {url}: {e}")
-                    continue
+                    # Process each URL in the batch
+                    for url in batch:
+                        try:
+                            job_details = get_job_details(driver, url, extraction=extraction, cache=cache)
+                            if job_details:
+                                journal.append(dict(zip(DETAIL_COLUMNS, job_details)))
+                        except Exception as e:
+                            logging.error(f"Error processing URL {url}: {e}")
+                            continue
                 
-                # Add delay between jobs within batch (5-10 seconds)
-                time.sleep(random.uniform(5, 10))
+                        # Add delay between jobs within batch (5-10 seconds)
+                        time.sleep(random.uniform(5, 10))
             
-            # Add longer delay between batches (20-30 seconds)
-            if i + batch_size < len(links):
-                delay = random.uniform(20, 30)
-                logging.info(f"Taking a break between batches ({delay:.1f} seconds)...")
-                time.sleep(delay)
+                    # Add longer delay between batches (20-30 seconds)
+                    if i + batch_size < len(pending):
+                        delay = random.uniform(20, 30)
+                        logging.info(f"Taking a break between batches ({delay:.1f} seconds)...")
+                        time.sleep(delay)
         
-        # Create results DataFrame
-        df_results = pd.DataFrame(results, columns=[
-            'job_title', 'company', 'description', 'date_posted',
-            'location', 'remote', 'salary', 'job_url', 'days_since_posted', 'application_url'
-        ])
-        
-        # Save results in job_details directory
-        job_title_clean = job_title.lower().replace(' ', '_')
-        folder_store = str(job_details_for(job_title_clean))
-        os.makedirs(folder_store, exist_ok=True)
-        
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_filename = f"{job_title_clean}_job_details_{timestamp}.csv"
-        output_path = os.path.join(folder_store, output_filename)
-        
-        # Save both CSV and JSON
-        df_results.to_csv(output_path, index=False)
-        logging.info(f"Results saved to {output_path}")
-        
-        # Save JSON version
-        json_path = output_path.replace('.csv', '.json')
-        output_data = {
-            "metadata": {
-                "job_title": job_title_clean,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "total_jobs": len(df_results)
-            },
-            "jobs": df_to_dict_safe(df_results)
-        }
-        
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        logging.info(f"Results saved to {json_path}")
+            # Compact the journal into the final CSV/JSON
+            journal.close()
+            df_results = journal_to_frame(journal, links)
+            write_detail_outputs(df_results, job_title_clean)
+            record_detailed_jobs(df_results)
+            journal.archive()
         
-        return df_results
+            return df_results
         
-    except Exception as e:
-        logging.error(f"Error in process_job_links: {e}")
-        return pd.DataFrame()
-    finally:
+        except Exception as e:
+            logging.error(f"Error in process_job_links: {e}")
+            return pd.DataFrame()
+        finally:
+            if journal:
+                journal.close()
+            close_detail_cache(cache)
+            telemetry.dump(f"{job_title_clean}_job_details")
+            if driver:
+                try:
+                    cleanup_driver(driver)
+                except:
+                    pass
+
+def scrape_job_details(job_title_clean, links, run_key, driver=None, workers=1,
+                       max_per_minute=DEFAULT_MAX_LOADS_PER_MINUTE, extraction=DEFAULT_EXTRACTION_MODE,
+                       use_cache=True, cache_ttl_days=DEFAULT_TTL_DAYS, seed_titles=(),
+                       cards=None, time_budget=None, target_salary=None):
+    """Scrape details for *links* through the journal and cache; returns the DataFrame.
+
+    Results are journaled under *run_key*; re-running with the same key
+    after a crash or Ctrl-C resumes where the previous run stopped.  Writes
+    no CSV/JSON outputs (see collect_job_details).
+
+    Pass a *driver* that already carries the LinkedIn session (e.g. the one
+    used for the search) to reuse it; it is left open for the caller.
+    Otherwise a driver is created, given the session cookies and closed here.
+    Ignored when ``workers > 1`` (the pool creates its own drivers).
+    *seed_titles* lists further titles whose outputs seed the detail cache.
+    Page loads stay under *max_per_minute* either way.
+
+    Pending URLs are scraped highest pre-score first (see frontier_priority;
+    *cards* supplies the search-card rows to score).  With *time_budget*
+    (minutes) no new URL is started once the budget is spent; the unstarted
+    cards are saved per title and ``with_pending_cards`` adds them to the
+    next run's cards.
+    """
+    with telemetry_scope() as telemetry:
+        owns_driver = driver is None
+        deadline = time.monotonic() + time_budget * 60 if time_budget else None
+
+        journal, pending = open_detail_journal(job_title_clean, run_key, links)
+        cache = open_detail_cache(job_title_clean, use_cache, cache_ttl_days)
+        if cache is not None:
+            for title_clean in seed_titles:
+                if title_clean != job_title_clean:
+                    cache.seed_from_outputs(title_clean)
+            pending = resolve_from_cache(cache, pending, journal)
+        frontier = PriorityFrontier.from_cards(pending, cards, CardPreScorer(target_salary=target_salary))
+
         try:
-            cleanup_driver(driver)
-        except:
-            pass
+            logging.info(f"Starting to process {len(pending)} job links...")
+            if workers > 1:
+                collect_job_details_parallel(
+                    frontier.drain(), workers, max_per_minute, extraction,
+                    sink=lambda position, job_details: journal.append(dict(zip(DETAIL_COLUMNS, job_details))),
+                    cache=cache, deadline=deadline,
+                )
+            elif frontier:
+                if owns_driver:
+                    logging.info("Initializing Chrome driver...")
+                    driver = create_driver()
+                    # Load cookies
+                    logging.info("Loading cookies...")
+                    cookies = load_cookie_data()
+                    if cookies:
+                        load_cookies(driver, cookies)
+                    else:
+                        logging.warning("No cookies loaded")
+                # Same page-load cap as the worker pool, with jitter between loads
+                limiter = RateLimiter(max_per_minute, jitter_s=DEFAULT_LOAD_JITTER_S)
+                while frontier:
+                    limiter.acquire()
+                    if deadline is not None and time.monotonic() >= deadline:
+                        logging.info(f"Time budget reached – {len(frontier)} lower-priority URLs carried to the next run")
+                        break
+                    link, score = frontier.pop()
+                    logging.debug(f"Scraping {link} (pre-score {score:.2f})")
+                    job_details = get_job_details(driver, link, extraction=extraction, cache=cache)
+                    if job_details:
+                        journal.append(dict(zip(DETAIL_COLUMNS, job_details)))
 
-def main(job_title, input_filename, test_limit=None):
-    """Main function with cleaned job title."""
-    driver = None
-    try:
-        # Clean job title
-        job_title_clean = job_title.lower().replace(' ', '_')
-        
-        # Initialize metrics tracker
-        metrics_tracker = JobMetricsTracker()
+            # Compact the journal into the final result set; only described jobs
+            # join the seen set, and URLs never started (time budget) are
+            # carried to this title's next run
+            journal.close()
+            df_results = journal_to_frame(journal, links)
+            record_detailed_jobs(df_results)
+            started = journal.completed_urls()
+            save_pending_cards(job_title_clean, cards, [url for url in links if url not in started])
+            journal.archive()
+            return df_results
         
+        finally:
+            journal.close()
+            close_detail_cache(cache)
+            telemetry.dump(f"{job_title_clean}_job_details")
+            if owns_driver and driver:
+                logging.info("Closing Chrome driver...")
+                try:
+                    cleanup_driver(driver)
+                except Exception as e:
+                    logging.error(f"Error closing driver: {e}")
+
+def save_detail_results(df_results, job_title):
+    """Write the detail CSV/JSON for *job_title* and add the jobs to the metrics aggregation."""
+    if df_results.empty:
+        return None
+    job_title_clean = job_title.lower().replace(' ', '_')
+    output_path = write_detail_outputs(df_results, job_title_clean)
+    
+    # Update metrics
+    JobMetricsTracker().update_jobs_aggregation(
+        job_title=job_title,
+        new_jobs=frame_to_records(df_results)
+    )
+    return output_path
+
+def collect_job_details(job_title, links, run_key, driver=None, workers=1,
+                        max_per_minute=DEFAULT_MAX_LOADS_PER_MINUTE, extraction=DEFAULT_EXTRACTION_MODE,
+                        use_cache=True, cache_ttl_days=DEFAULT_TTL_DAYS,
+                        cards=None, time_budget=None, target_salary=None):
+    """Scrape details for *links*, save the CSV/JSON outputs and return the DataFrame.
+
+    See scrape_job_details for journaling, driver reuse, prioritisation
+    and the time budget.
+    """
+    df_results = scrape_job_details(
+        job_title.lower().replace(' ', '_'), links, run_key, driver=driver, workers=workers,
+        max_per_minute=max_per_minute, extraction=extraction,
+        use_cache=use_cache, cache_ttl_days=cache_ttl_days,
+        cards=cards, time_budget=time_budget, target_salary=target_salary,
+    )
+    save_detail_results(df_results, job_title)
+    return df_results
+
+def main(job_title, input_filename, test_limit=None, workers=1,
+         max_per_minute=DEFAULT_MAX_LOADS_PER_MINUTE, extraction=DEFAULT_EXTRACTION_MODE,
+         use_cache=True, cache_ttl_days=DEFAULT_TTL_DAYS, time_budget=None):
+    """Main function with cleaned job title.
+
+    Results are journaled per input file; re-running after a crash or
+    Ctrl-C resumes where the previous run stopped.
+    """
+    try:
         # Load job links from input file
         logging.info(f"Loading job links from {input_filename}")
         df, links = load_job_links(input_filename)
@@ -955,94 +1151,22 @@ def main(job_title, input_filename, test_limit=None):
             logging.warning("No job links found to process.")
             return
 
-        # Initialize driver
-        logging.info("Initializing Chrome driver...")
-        driver = create_driver()
-        
-        try:
-            # Load cookies
-            logging.info("Loading cookies...")
-            cookies = load_cookie_data()
-            if cookies:
-                load_cookies(driver, cookies)
-            else:
-                logging.warning("No cookies loaded")
-            
-            # Process job links and collect detailed information
-            if test_limit and len(links) > test_limit:
-                links = links[:test_limit]
-                logging.info(f"TESTING MODE: Limiting to {test_limit} jobs for testing")
-            
-            logging.info(f"Starting to process {len(links)} job links...")
-            detailed_jobs = []
-            for link in links:
-                job_details = get_job_details(driver, link)
-                if job_details:
-                    # Convert tuple to dictionary
-                    job_dict = {
-                        'job_title': job_details[0],
-                        'company': job_details[1],
-                        'description': job_details[2],
-                        'date_posted': job_details[3],
-                        'location': job_details[4],
-                        'remote': job_details[5],
-                        'salary': job_details[6],
-                        'job_url': job_details[7],
-                        'days_since_posted': job_details[8],
-                        'application_url': job_details[9]
-                    }
-                    detailed_jobs.append(job_dict)
-            
-            # Create DataFrame from detailed jobs
-            if detailed_jobs:
-                df_results = pd.DataFrame(detailed_jobs)
-                
-                # Save to job details directory
-                folder_store = str(job_details_for(job_title_clean))
-                os.makedirs(folder_store, exist_ok=True)
-                
-                # Generate filename with timestamp
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                output_filename = f"{job_title_clean}_job_details_{timestamp}.csv"
-                output_path = os.path.join(folder_store, output_filename)
-                
-                # Save CSV
-                df_results.to_csv(output_path, index=False)
-                logging.info(f"Results saved to {output_path}")
-                
-                # Save JSON version
-                json_path = output_path.replace('.csv', '.json')
-                output_data = {
-                    "metadata": {
-                        "job_title": job_title_clean,
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "total_jobs": len(df_results)
-                    },
-                    "jobs": df_to_dict_safe(df_results)
-                }
-                
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
-                logging.info(f"Results saved to {json_path}")
-                
-                # Update metrics
-                metrics_tracker.update_jobs_aggregation(
-                    job_title=job_title,
-                    new_jobs=detailed_jobs
-                )
-            
-        finally:
-            if driver:
-                logging.info("Closing Chrome driver...")
-                cleanup_driver(driver)
+        # Process job links and collect detailed information
+        if test_limit and len(links) > test_limit:
+            links = links[:test_limit]
+            logging.info(f"TESTING MODE: Limiting to {test_limit} jobs for testing")
+
+        run_key = os.path.splitext(os.path.basename(input_filename))[0]
+        cards = with_pending_cards(job_title.lower().replace(' ', '_'), df)
+        links = list(dict.fromkeys(links + cards['job_url'].dropna().astype(str).tolist()))
+        return collect_job_details(
+            job_title, links, run_key, workers=workers, max_per_minute=max_per_minute,
+            extraction=extraction, use_cache=use_cache, cache_ttl_days=cache_ttl_days,
+            cards=cards, time_budget=time_budget,
+        )
                 
     except Exception as e:
         logging.error(f"Error in main processing: {str(e)}")
-        if driver:
-            try:
-                cleanup_driver(driver)
-            except:
-                pass
         raise
 
 if __name__ == "__main__":
@@ -1051,6 +1175,21 @@ if __name__ == "__main__":
     parser.add_argument("--filename", required=True)
     parser.add_argument("--test_limit", type=int, default=None,
                         help="Limit number of job links processed (optional).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of parallel Chrome drivers (default: 1, serial).")
+    parser.add_argument("--max_per_minute", type=float, default=DEFAULT_MAX_LOADS_PER_MINUTE,
+                        help="Page-load cap per minute, serial or across all workers (default: %(default)s).")
+    parser.add_argument("--extraction", choices=EXTRACTION_MODES, default=DEFAULT_EXTRACTION_MODE,
+                        help="Field extraction: one page_source parse (snapshot) or legacy per-field waits (webdriver).")
+    parser.add_argument("--no_cache", action="store_true",
+                        help="Ignore the persistent detail cache and scrape every URL.")
+    parser.add_argument("--cache_ttl_days", type=float, default=DEFAULT_TTL_DAYS,
+                        help="Days before a cached application URL is re-fetched (default: %(default)s).")
+    parser.add_argument("--time_budget", type=float, default=None,
+                        help="Minutes to spend scraping; the highest pre-scored jobs go first and unstarted ones carry to the next run.")
     args = parser.parse_args()
     
-    main(args.job_title, args.filename, test_limit=args.test_limit)
+    main(args.job_title, args.filename, test_limit=args.test_limit,
+         workers=args.workers, max_per_minute=args.max_per_minute, extraction=args.extraction,
+         use_cache=not args.no_cache, cache_ttl_days=args.cache_ttl_days,
+         time_budget=args.time_budget)
@@ -22,6 +22,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from paths import MASTER_JOB_TITLE_JSON
+from artifact_io import write_json
 
 logging.basicConfig(
     level=logging.INFO,
@@ -52,10 +53,7 @@ def _save(title: str, data: dict | None = None) -> dict:
             "created_at": now,
             "updated_at": now,
         }
-    MASTER_JOB_TITLE_JSON.parent.mkdir(parents=True, exist_ok=True)
-    MASTER_JOB_TITLE_JSON.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    write_json(MASTER_JOB_TITLE_JSON, data)
     logging.info("Saved master job title → %s", MASTER_JOB_TITLE_JSON)
     return data
 
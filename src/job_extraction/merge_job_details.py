@@ -7,11 +7,24 @@ from datetime import datetime
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from job_extraction.ingest_manifest import IngestManifest
+from job_extraction.job_store import JobStore
+from job_extraction.job_upsert import UPSERT_COLUMNS, fill_missing, upsert_jobs
+from job_extraction.near_duplicates import NearDuplicateIndex
+from job_extraction.salary_parser import add_salary_columns
+from job_extraction.unified_manifest import UnifiedManifest
+from artifact_io import artifact_lock, write_csv
+from record_io import write_json_twin
+from job_db import get_job_db
 from paths import (
     aggregated_for, job_details_for, search_results_for, master_aggregated_csv,
-    AGGREGATED_DIR, UNIFIED_MASTER_CSV,
+    AGGREGATED_DIR, NEAR_DUPLICATE_INDEX, UNIFIED_MASTER_CSV,
 )
 
+# Ingest-manifest sections (see job_extraction.ingest_manifest)
+DETAILS_SECTION = "job_details"
+SALARY_SECTION = "salary"
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -119,7 +132,7 @@ def deduplicate_by_company_and_title(df, keep_strategy='latest'):
         return df
 
 
-def create_salary_filtered_aggregate(job_title, min_salary=175000):
+def create_salary_filtered_aggregate(job_title, min_salary=175000, master_df=None):
     """
     Create a salary-filtered version of the aggregated file.
     Now also excludes engineering jobs.
@@ -127,6 +140,8 @@ def create_salary_filtered_aggregate(job_title, min_salary=175000):
     Args:
         job_title (str): The job title to process
         min_salary (int): Minimum salary threshold in thousands (default 175 for $175K)
+        master_df (pd.DataFrame, optional): The master aggregate already in memory
+            (skips re-reading the master CSV)
     
     Returns:
         str: Path to the salary-filtered file
@@ -137,12 +152,14 @@ def create_salary_filtered_aggregate(job_title, min_salary=175000):
         # Path to the master aggregated file
         master_file = str(master_aggregated_csv(job_title_clean))
         
-        if not os.path.exists(master_file):
+        if master_df is not None:
+            df = master_df
+        elif not os.path.exists(master_file):
             logging.error(f"Master file not found: {master_file}")
             return None
-        
-        # Load the master aggregated file
-        df = pd.read_csv(master_file)
+        else:
+            # Load the master aggregated file
+            df = pd.read_csv(master_file)
         
         if df.empty:
             logging.warning("Master aggregated file is empty")
@@ -166,35 +183,20 @@ def create_salary_filtered_aggregate(job_title, min_salary=175000):
         salary_file = master_file.replace('_master_aggregated.csv', f'_aggregated_salary_{min_salary}k.csv')
         
         # Save the salary-filtered file
-        salary_filtered_df.to_csv(salary_file, index=False)
-        
-        # Create JSON version
-        json_file = salary_file.replace('.csv', '.json')
-        df_json = salary_filtered_df.copy()
-        df_json = df_json.where(pd.notnull(df_json), None)
-        
-        # Convert datetime columns to strings
-        for col in df_json.select_dtypes(include=['datetime64[ns]']).columns:
-            df_json[col] = df_json[col].astype(str)
-        
-        output_data = {
-            "metadata": {
-                "job_title": job_title_clean,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "total_jobs": len(salary_filtered_df),
-                "min_salary_threshold": f"${min_salary}K",
-                "filter_type": "salary_range + exclude_engineering",
-                "filters_applied": [
-                    f"salary >= ${min_salary}K",
-                    "exclude jobs with 'engineer' or 'engineering' in job title"
-                ]
-            },
-            "jobs": df_json.to_dict('records')
-        }
-        
-        with open(json_file, 'w', encoding='utf-8') as f:
-            import json
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        write_csv(salary_filtered_df, salary_file, index=False)
+        
+        # Create the JSON twin
+        write_json_twin(salary_file, salary_filtered_df, {
+            "job_title": job_title_clean,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "total_jobs": len(salary_filtered_df),
+            "min_salary_threshold": f"${min_salary}K",
+            "filter_type": "salary_range + exclude_engineering",
+            "filters_applied": [
+                f"salary >= ${min_salary}K",
+                "exclude jobs with 'engineer' or 'engineering' in job title"
+            ]
+        })
         
         logging.info(f"Created salary-filtered aggregated file with {len(salary_filtered_df)} jobs (excluding engineering): {salary_file}")
         
@@ -205,8 +207,13 @@ def create_salary_filtered_aggregate(job_title, min_salary=175000):
         raise
 
 
-def build_master_salary_aggregate(job_title, min_salary=175):
-    """Aggregate all salary-filtered CSVs into a single master file."""
+def build_master_salary_aggregate(job_title, min_salary=175, manifest=None, full_rebuild=False):
+    """Aggregate all salary-filtered CSVs into a single master file.
+
+    Skipped (existing output returned) when no salary CSV changed since the
+    last build, per the title's ingest manifest.  A caller that passes its
+    own *manifest* is responsible for saving it.
+    """
     try:
         job_title_clean = job_title.lower().replace(' ', '_')
         aggregated_path = str(aggregated_for(job_title_clean))
@@ -217,6 +224,14 @@ def build_master_salary_aggregate(job_title, min_salary=175):
             logging.warning(f"No salary-filtered files found for {job_title_clean}")
             return None
 
+        output_file = os.path.join(aggregated_path, f"{job_title_clean}_master_aggregated_{min_salary}k.csv")
+        owns_manifest = manifest is None
+        if owns_manifest:
+            manifest = IngestManifest(job_title_clean)
+        if not full_rebuild and os.path.exists(output_file) and not manifest.changed(SALARY_SECTION, csv_files):
+            logging.info(f"Salary-filtered inputs unchanged, keeping {output_file}")
+            return output_file
+
         frames = []
         for file in csv_files:
             try:
@@ -231,10 +246,14 @@ def build_master_salary_aggregate(job_title, min_salary=175):
         if 'job_url' in master_df.columns:
             master_df = master_df.drop_duplicates(subset=['job_url'], keep='last')
 
-        output_file = os.path.join(aggregated_path, f"{job_title_clean}_master_aggregated_{min_salary}k.csv")
-        master_df.to_csv(output_file, index=False)
+        write_csv(master_df, output_file, index=False)
         logging.info(f"Saved master salary aggregate to: {output_file}")
 
+        for file in csv_files:
+            manifest.mark(SALARY_SECTION, file)
+        if owns_manifest:
+            manifest.save()
+
         return output_file
     except Exception as e:
         logging.error(f"Error building master salary aggregate: {e}")
@@ -245,6 +264,10 @@ def filter_by_salary(df, min_salary=175):
     """
     Filter DataFrame by salary range.
     
+    Keeps rows whose annualised upper bound (``salary_max_annual``, parsed
+    once at merge time) reaches the threshold.  Frames without the parsed
+    columns are parsed here first.
+    
     Args:
         df (pd.DataFrame): DataFrame to filter
         min_salary (int): Minimum salary threshold in thousands
@@ -257,26 +280,15 @@ def filter_by_salary(df, min_salary=175):
             return df
         
         # Check if salary_range column exists
-        if 'salary_range' not in df.columns:
+        if 'salary_range' not in df.columns and 'salary_max_annual' not in df.columns:
             logging.warning("salary_range column not found, returning original DataFrame")
             return df
         
-        # Create a copy to avoid modifying original
-        filtered_df = df.copy()
+        if 'salary_max_annual' not in df.columns:
+            df = add_salary_columns(df)
         
-        # Extract salary numbers from salary_range column
-        filtered_df['salary_extracted'] = filtered_df['salary_range'].astype(str).apply(extract_salary_numbers)
-        
-        # Filter based on minimum salary
-        # Include rows where any extracted salary is >= min_salary
-        mask = filtered_df['salary_extracted'].apply(
-            lambda salaries: any(salary >= min_salary for salary in salaries) if salaries else False
-        )
-        
-        filtered_df = filtered_df[mask]
-        
-        # Remove the temporary salary_extracted column
-        filtered_df = filtered_df.drop('salary_extracted', axis=1)
+        mask = pd.to_numeric(df['salary_max_annual'], errors='coerce') >= min_salary * 1000
+        filtered_df = df[mask.fillna(False)]
         
         logging.info(f"Filtered {len(df)} jobs to {len(filtered_df)} jobs with salary >= ${min_salary}K")
         
@@ -286,62 +298,49 @@ def filter_by_salary(df, min_salary=175):
         logging.error(f"Error filtering by salary: {e}")
         return df
 
-def extract_salary_numbers(salary_text):
-    """
-    Extract salary numbers from salary text.
-    
-    Args:
-        salary_text (str): Salary text like "$70/hr - $75/hr", "$100K/yr - $140K/yr", etc.
-    
-    Returns:
-        list: List of salary numbers in thousands
-    """
-    try:
-        if pd.isna(salary_text) or salary_text == '-':
-            return []
-        
-        import re
-        
-        # Convert to string and clean
-        salary_str = str(salary_text).replace(',', '').replace('$', '').replace(' ', '')
-        
-        # Extract numbers followed by K (thousands)
-        k_matches = re.findall(r'(\d+(?:\.\d+)?)k', salary_str.lower())
-        k_numbers = [float(match) for match in k_matches]
-        
-        # Extract numbers followed by /yr or /hr
-        yr_hr_matches = re.findall(r'(\d+(?:\.\d+)?)(?:/yr|/hr)', salary_str.lower())
-        yr_hr_numbers = [float(match) for match in yr_hr_matches]
-        
-        # For hourly rates, convert to annual (assuming 2000 hours/year)
-        annual_from_hourly = [num * 2 for num in yr_hr_numbers if 'hr' in salary_str.lower()]
-        
-        # Combine all numbers
-        all_numbers = k_numbers + yr_hr_numbers + annual_from_hourly
-        
-        # Remove duplicates and sort
-        unique_numbers = list(set(all_numbers))
-        
-        return unique_numbers
-        
-    except Exception as e:
-        logging.error(f"Error extracting salary numbers from '{salary_text}': {e}")
-        return []
-
-def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
+def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None, full_rebuild=False, details=None,
+                                      export_csv=False):
     """
     Aggregate jobs by job title, dedupe them, and only add new jobs.
-    Creates a master aggregated file with date_extracted column.
+    Maintains the title's master aggregate with date_extracted column.
     Now includes deduplication by company + job title combination.
     Also creates salary-filtered versions (excluding engineering jobs).
     
+    With the job store (pyarrow installed) the store is the master: the
+    previous jobs are read from it and only new/changed rows are written
+    back.  A master CSV left from before the store seeds it on the first
+    merge.  The master CSV is written only without the store, or with
+    *export_csv*.
+    
+    Only job_details CSVs that are new or changed since the last run (per
+    the title's ingest manifest) are read; everything older is already in
+    the master.  A caller that already holds this run's details (the
+    pipeline's details stage) passes them as *details*; those are used
+    as-is instead of being re-read from disk.
+    
     Args:
         job_title (str): The job title to aggregate
         new_jobs_df (pd.DataFrame, optional): New jobs to add from current run
+        full_rebuild (bool): Ignore the manifest and re-read every job_details CSV
+        details (dict, optional): This run's job_details frames keyed by the CSV
+            they were saved to; ingested alongside any other new/changed files
+            and recorded in the ingest manifest
+        export_csv (bool): Also write the master CSV when the job store is used
+    
+    The title's master stays locked for the whole read-merge-write, so
+    overlapping runs for the same title cannot drop each other's jobs.
     
     Returns:
-        str: Path to the aggregated file
+        str: Path to the master CSV when one was written, else the title's
+        job store location
     """
+    job_title_clean = job_title.lower().replace(' ', '_')
+    with artifact_lock(master_aggregated_csv(job_title_clean)):
+        return _aggregate_jobs_with_deduplication(job_title, new_jobs_df, full_rebuild, details, export_csv)
+
+
+def _aggregate_jobs_with_deduplication(job_title, new_jobs_df, full_rebuild, details=None, export_csv=False):
+    """Body of aggregate_jobs_with_deduplication (called with the master locked)."""
     try:
         # Clean job title
         job_title_clean = job_title.lower().replace(' ', '_')
@@ -353,43 +352,66 @@ def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
         
         # Path to master aggregated file
         master_file = os.path.join(aggregated_path, f"{job_title_clean}_master_aggregated.csv")
+        store = JobStore()
         
         # Initialize master dataframe
         master_df = pd.DataFrame()
         
-        # Load existing master file if it exists
-        if os.path.exists(master_file):
+        # Load the existing master: job store → master CSV (seeds the store)
+        if store.has(job_title_clean):
+            master_df = store.read(job_title_clean, side=False)
+            logging.info(f"Loaded existing master from the job store with {len(master_df)} records")
+        elif os.path.exists(master_file):
             master_df = pd.read_csv(master_file)
             logging.info(f"Loaded existing master file with {len(master_df)} records")
         else:
             logging.info("No existing master file found, creating new one")
         
+        manifest = IngestManifest(job_title_clean)
+        if full_rebuild or master_df.empty:
+            manifest.reset(DETAILS_SECTION)
+        # This run's details, handed over in memory by the caller (read last,
+        # so they win over older files for the same job)
+        in_memory = {path: df for path, df in (details or {}).items()
+                     if path and df is not None and not df.empty}
+
+        # Plus every job_details file that is new/changed since the last
+        # aggregation – e.g. from a standalone job_url_details.py run, or a
+        # run whose merge failed
+        job_details_path = str(job_details_for(job_title_clean))
+        patterns = [
+            os.path.join(job_details_path, f"{job_title_clean}_details_*.csv"),
+            os.path.join(job_details_path, f"{job_title_clean}_job_details_*.csv"),
+        ]
+        detail_files = []
+        for pattern in patterns:
+            detail_files.extend(glob.glob(pattern))
+        in_memory_keys = {os.path.abspath(path) for path in in_memory}
+        detail_files = [file for file in detail_files if os.path.abspath(file) not in in_memory_keys]
+        changed_files = manifest.changed(DETAILS_SECTION, detail_files)
+        detail_data = {}
+        for file in changed_files:
+            try:
+                detail_data[file] = pd.read_csv(file)
+            except Exception as e:
+                logging.warning(f"Error reading job details file {file}: {e}")
+        detail_data.update(in_memory)
+        logging.info(f"Ingesting {len(detail_data)} job_details file(s) "
+                     f"({len(in_memory)} from this run, {len(detail_data) - len(in_memory)} new/changed on disk); "
+                     f"{len(detail_files) - len(changed_files)} already ingested")
+        
         def enrich_from_job_details(df_in):
             """Merge description, days_since_posted, and application_url from job_details by job_url."""
             try:
-                job_details_path = str(job_details_for(job_title_clean))
-                patterns = [
-                    os.path.join(job_details_path, f"{job_title_clean}_details_*.csv"),
-                    os.path.join(job_details_path, f"{job_title_clean}_job_details_*.csv"),
-                ]
-                detail_files = []
-                for pattern in patterns:
-                    detail_files.extend(glob.glob(pattern))
-
-                if not detail_files or df_in.empty:
+                if not detail_data or df_in.empty:
                     return df_in
 
-                detail_frames = []
-                for file in detail_files:
-                    try:
-                        detail_df = pd.read_csv(file)
-                        if 'job_url' in detail_df.columns:
-                            detail_frames.append(
-                                detail_df[['job_url', 'description', 'days_since_posted', 'application_url']]
-                                .dropna(subset=['job_url'])
-                            )
-                    except Exception as e:
-                        logging.warning(f"Error reading job details file {file}: {e}")
+                detail_frames = [
+                    detail_df[['job_url', 'description', 'days_since_posted', 'application_url']]
+                    .dropna(subset=['job_url'])
+                    for detail_df in detail_data.values()
+                    if 'job_url' in detail_df.columns
+                ]
 
                 if not detail_frames:
                     return df_in
@@ -437,44 +459,23 @@ def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
             # Enrich new jobs from job_details files if available
             new_jobs_df = enrich_from_job_details(new_jobs_df)
             
+            # Details already in the job database (e.g. scraped under another title)
+            try:
+                stored_details = get_job_db().details_for(new_jobs_df['job_url'])
+                new_jobs_df, filled = fill_missing(new_jobs_df, stored_details)
+                if filled:
+                    logging.info(f"Filled details for {filled} new jobs from the job database")
+            except Exception as e:
+                logging.warning(f"Could not read details from the job database: {e}")
+            
             if not master_df.empty:
-                master_df['job_url'] = master_df['job_url'].astype(str)
-                
-                # Find new jobs (not in master file)
-                existing_urls = set(master_df['job_url'].tolist())
-                new_jobs_filtered = new_jobs_df[~new_jobs_df['job_url'].isin(existing_urls)]
-                
-                # Update existing jobs with new application_url and days_since_posted values
-                update_columns = ['application_url', 'days_since_posted']
-                jobs_updated = 0
-                for col in update_columns:
-                    if col in new_jobs_df.columns:
-                        # Create a mapping from job_url to the new column value
-                        url_to_value = dict(zip(new_jobs_df['job_url'], new_jobs_df[col]))
-                        
-                        # Ensure the column exists in master_df
-                        if col not in master_df.columns:
-                            master_df[col] = None
-                        
-                        # Update rows where we have new data and old data is missing/empty
-                        for url, new_value in url_to_value.items():
-                            if new_value and str(new_value).strip() and str(new_value) != 'nan':
-                                mask = (master_df['job_url'] == url) & (
-                                    master_df[col].isna() | 
-                                    (master_df[col].astype(str).str.strip() == '') |
-                                    (master_df[col].astype(str) == 'nan')
-                                )
-                                if mask.any():
-                                    master_df.loc[mask, col] = new_value
-                                    jobs_updated += 1
+                # Fill missing application_url/days_since_posted/description, append unseen jobs
+                master_df, new_jobs_added, jobs_updated = upsert_jobs(master_df, new_jobs_df)
                 
                 if jobs_updated > 0:
-                    logging.info(f"Updated {jobs_updated} existing jobs with new application_url/days_since_posted data")
+                    logging.info(f"Updated {jobs_updated} existing jobs with new {'/'.join(UPSERT_COLUMNS)} data")
                 
-                if not new_jobs_filtered.empty:
-                    # Append new jobs to master
-                    master_df = pd.concat([master_df, new_jobs_filtered], ignore_index=True)
-                    new_jobs_added = len(new_jobs_filtered)
+                if new_jobs_added:
                     logging.info(f"Added {new_jobs_added} new unique jobs to master file")
                 else:
                     logging.info("No new unique jobs to add")
@@ -484,20 +485,11 @@ def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
                 new_jobs_added = len(new_jobs_df)
                 logging.info(f"Created new master file with {new_jobs_added} jobs")
         
-        # Also process all existing CSV files in job_details directory to ensure completeness
-        job_details_path = str(job_details_for(job_title_clean))
-        if os.path.exists(job_details_path):
-            patterns = [
-                os.path.join(job_details_path, f"{job_title_clean}_details_*.csv"),
-                os.path.join(job_details_path, f"{job_title_clean}_job_details_*.csv"),
-            ]
-            csv_files = []
-            for pattern in patterns:
-                csv_files.extend(glob.glob(pattern))
-            
-            for file in csv_files:
+        # Also fold in the new/changed job_details files to ensure completeness
+        if detail_data:
+            for file, file_df in detail_data.items():
                 try:
-                    df = pd.read_csv(file)
+                    df = file_df.copy()
                     df['job_url'] = df['job_url'].astype(str)
                     
                     # Add date_extracted if not present
@@ -512,31 +504,11 @@ def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
                         else:
                             df.insert(0, 'date_extracted', current_date)
                     
-                    # Find jobs not in master
+                    # Fill missing values on known jobs, append jobs not in master
                     if not master_df.empty:
-                        existing_urls = set(master_df['job_url'].tolist())
-                        new_from_file = df[~df['job_url'].isin(existing_urls)]
-                        
-                        # Update existing jobs with new application_url and days_since_posted values
-                        update_columns = ['application_url', 'days_since_posted']
-                        for col in update_columns:
-                            if col in df.columns:
-                                url_to_value = dict(zip(df['job_url'], df[col]))
-                                if col not in master_df.columns:
-                                    master_df[col] = None
-                                for url, new_value in url_to_value.items():
-                                    if new_value and str(new_value).strip() and str(new_value) != 'nan':
-                                        mask = (master_df['job_url'] == url) & (
-                                            master_df[col].isna() | 
-                                            (master_df[col].astype(str).str.strip() == '') |
-                                            (master_df[col].astype(str) == 'nan')
-                                        )
-                                        if mask.any():
-                                            master_df.loc[mask, col] = new_value
-                        
-                        if not new_from_file.empty:
-                            master_df = pd.concat([master_df, new_from_file], ignore_index=True)
-                            logging.info(f"Added {len(new_from_file)} jobs from {os.path.basename(file)}")
+                        master_df, added_from_file, _ = upsert_jobs(master_df, df)
+                        if added_from_file:
+                            logging.info(f"Added {added_from_file} jobs from {os.path.basename(file)}")
                     else:
                         master_df = df
                         logging.info(f"Initialized master file from {os.path.basename(file)}")
@@ -567,59 +539,77 @@ def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
             # Enrich master with job_details data before saving
             master_df = enrich_from_job_details(master_df)
 
+            # Parse salary_range into typed columns once (new/unparsed rows only)
+            master_df = add_salary_columns(master_df)
+
+            # Cluster reposted jobs (near-duplicate descriptions, across titles)
+            try:
+                with artifact_lock(NEAR_DUPLICATE_INDEX):
+                    dup_index = NearDuplicateIndex()
+                    if dup_index.update(master_df):
+                        dup_index.save()
+                master_df = dup_index.assign(master_df)
+            except Exception as e:
+                logging.warning(f"Near-duplicate clustering skipped: {e}")
+
             # Sort by date_extracted (most recent first)
             master_df = master_df.sort_values('date_extracted', ascending=False)
             
-            # Save master aggregated file
-            master_df.to_csv(master_file, index=False)
-            logging.info(f"Saved master aggregated file with {len(master_df)} unique jobs to: {master_file}")
-            
-            # Also save a copy with current date for this run
-            run_file = os.path.join(aggregated_path, f"{job_title_clean}_aggregated_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-            master_df.to_csv(run_file, index=False)
+            # Save the master: the columnar job store takes only new/changed
+            # rows (and tombstones jobs the dedupe dropped); the CSV is
+            # rewritten only without the store, or when an export is asked for
+            if store.available():
+                store.append(job_title_clean, master_df, complete=True)
+                result = store.location(job_title_clean)
+                logging.info(f"Job store holds {len(master_df)} unique jobs for '{job_title_clean}'")
+            else:
+                logging.warning("pyarrow not installed – master kept as CSV only")
+            if export_csv or not store.available():
+                write_csv(master_df, master_file, index=False)
+                result = master_file
+                logging.info(f"Saved master aggregated file with {len(master_df)} unique jobs to: {master_file}")
             
             # NEW: Create salary-filtered version (excluding engineering jobs)
             try:
-                salary_file = create_salary_filtered_aggregate(job_title, min_salary=175)
+                salary_file = create_salary_filtered_aggregate(job_title, min_salary=175, master_df=master_df)
                 if salary_file:
                     logging.info(f"Created salary-filtered aggregated file: {salary_file}")
-                master_salary_file = build_master_salary_aggregate(job_title, min_salary=175)
+                master_salary_file = build_master_salary_aggregate(job_title, min_salary=175, manifest=manifest,
+                                                                   full_rebuild=full_rebuild)
                 if master_salary_file:
                     logging.info(f"Created master salary aggregate file: {master_salary_file}")
             except Exception as e:
                 logging.error(f"Error creating salary-filtered aggregate: {e}")
             
-            # Create JSON version with metadata
-            json_file = master_file.replace('.csv', '.json')
-            df_json = master_df.copy()
-            df_json = df_json.where(pd.notnull(df_json), None)
-            
-            # Convert datetime columns to strings
-            for col in df_json.select_dtypes(include=['datetime64[ns]']).columns:
-                df_json[col] = df_json[col].astype(str)
-            
-            output_data = {
-                "metadata": {
-                    "job_title": job_title_clean,
-                    "timestamp": current_date,
-                    "total_unique_jobs": len(master_df),
-                    "new_jobs_added_this_run": new_jobs_added,
-                    "last_updated": current_date,
-                    "deduplication_strategy": "job_url + company_title_combination"
-                },
-                "jobs": df_json.to_dict('records')
-            }
-            
-            with open(json_file, 'w', encoding='utf-8') as f:
-                import json
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            # Job database: write through the jobs touched by this run
+            # (everything on the first sync of a title)
+            try:
+                db = get_job_db()
+                sync_df = master_df
+                if db.job_count(job_title_clean):
+                    touched = set(new_jobs_df['job_url']) if new_jobs_df is not None and not new_jobs_df.empty else set()
+                    for file_df in detail_data.values():
+                        if 'job_url' in file_df.columns:
+                            touched.update(file_df['job_url'].astype(str))
+                    sync_df = master_df[master_df['job_url'].astype(str).isin(touched)]
+                db.upsert_jobs(job_title_clean, sync_df)
+                db.upsert_details(sync_df)
+            except Exception as e:
+                logging.error(f"Error updating job database: {e}")
             
-            logging.info(f"Saved JSON version to: {json_file}")
+            # Record ingested job_details files only once the master is safely written
+            for file, file_df in detail_data.items():
+                if os.path.exists(file):
+                    manifest.mark(DETAILS_SECTION, file, rows=len(file_df))
+            manifest.save()
             
-            # Rebuild the cross-title unified master CSV
-            rebuild_unified_master()
+            # Without the job store, merge this title's changes into the
+            # cross-title unified master CSV; with it, the unified view is read
+            # from the store and the CSV is only exported on request
+            if not store.available():
+                rebuild_unified_master(full_rebuild=full_rebuild)
             
-            return master_file
+            return result
         
         return None
         
@@ -628,61 +618,207 @@ def aggregate_jobs_with_deduplication(job_title, new_jobs_df=None):
         raise
 
 
-def rebuild_unified_master():
+def _unified_sources():
+    """Per-title master CSVs under data/aggregated, by title."""
+    agg_root = str(AGGREGATED_DIR)
+    sources = {}
+    for title_dir in sorted(os.listdir(agg_root)):
+        master_file = os.path.join(agg_root, title_dir, f"{title_dir}_master_aggregated.csv")
+        if os.path.isfile(master_file):
+            sources[title_dir] = master_file
+    return sources
+
+
+def _read_title_master(title_dir, master_file, store):
+    """One title's master with ``search_title`` and the store's side columns."""
+    df = pd.read_csv(master_file)
+    df["search_title"] = title_dir
+    # Scores / optimised-resume paths live in the job store's side tables
+    return store.join_side(title_dir, df)
+
+
+def _resolve_unified(unified):
+    """One row per job_url: the latest ``date_extracted`` wins (ties → later title)."""
+    if "job_url" in unified.columns:
+        if "date_extracted" in unified.columns:
+            order = pd.to_datetime(unified["date_extracted"], errors="coerce", format="mixed")
+            unified = (unified.assign(_order=order)
+                       .sort_values(["_order", "search_title"], na_position="first", kind="stable")
+                       .drop(columns="_order"))
+        unified = unified.drop_duplicates(subset=["job_url"], keep="last")
+
+    # Sort newest first
+    if "date_extracted" in unified.columns:
+        unified = unified.sort_values("date_extracted", ascending=False)
+    return unified
+
+
+def load_unified_master(store=None):
+    """
+    Every title's jobs in one frame, read from the job store.
+
+    Each title's rows live in its own store partitions (a merge replaces
+    them in place), so this is the unified master without a unified file.
+    Titles the store does not hold yet fall back to their master CSV.
+    Adds ``search_title``, joins the side-table columns and deduplicates on
+    ``job_url`` like the unified CSV.  Returns an empty frame without data.
+    """
+    store = store or JobStore()
+    frames = []
+    stored = store.titles()
+    for title_dir in stored:
+        df = store.read(title_dir)
+        if not df.empty:
+            frames.append(df.assign(search_title=title_dir))
+    if os.path.isdir(str(AGGREGATED_DIR)):
+        for title_dir, master_file in _unified_sources().items():
+            if title_dir in stored:
+                continue
+            try:
+                frames.append(_read_title_master(title_dir, master_file, store))
+            except Exception as e:
+                logging.warning("load_unified_master: error reading %s: %s", master_file, e)
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    return _resolve_unified(pd.concat(frames, ignore_index=True))
+
+
+def rebuild_unified_master(full_rebuild=False):
     """
-    Rebuild the unified master CSV by concatenating every per-title
+    Bring the unified master CSV up to date and return its path.
+
+    With the job store (pyarrow installed) this is an on-demand export of
+    load_unified_master(); merges do not touch the CSV.
+
+    Without it, the CSV is the unified master, built from every per-title
     master_aggregated CSV.  Adds a ``search_title`` column so rows
-    remain traceable back to the search that produced them.
+    remain traceable back to the search that produced them, and joins the
+    derived columns (alignment scores, optimised resume paths) from the
+    job store's side tables.
 
     Deduplicates on ``job_url`` (keeps latest) so the same posting
     found under multiple searches appears only once.
 
+    Incremental by default: only titles whose master CSV or side tables
+    changed since the last build (see job_extraction.unified_manifest) are
+    re-read, and their rows replace that title's rows in the unified file.
+    A full rebuild happens with *full_rebuild*, on the first build, when a
+    title disappears or drops a job it owned, or when a changed title
+    brings new columns.  The unified CSV is locked for the whole rebuild.
+
     Returns the path to the unified CSV, or *None* if no data exists.
     """
-    try:
-        agg_root = str(AGGREGATED_DIR)
-        if not os.path.isdir(agg_root):
-            logging.info("rebuild_unified_master: aggregated dir does not exist yet.")
-            return None
+    with artifact_lock(UNIFIED_MASTER_CSV):
+        store = JobStore()
+        if store.available():
+            return _export_unified_master(store)
+        return _rebuild_unified_master(full_rebuild)
 
-        frames = []
-        for title_dir in sorted(os.listdir(agg_root)):
-            title_path = os.path.join(agg_root, title_dir)
-            if not os.path.isdir(title_path):
-                continue
-            master_file = os.path.join(title_path, f"{title_dir}_master_aggregated.csv")
-            if not os.path.isfile(master_file):
-                continue
-            try:
-                df = pd.read_csv(master_file)
-                if df.empty:
-                    continue
-                df["search_title"] = title_dir
-                frames.append(df)
-                logging.info("rebuild_unified_master: added %d rows from '%s'", len(df), title_dir)
-            except Exception as e:
-                logging.warning("rebuild_unified_master: error reading %s: %s", master_file, e)
 
-        if not frames:
-            logging.info("rebuild_unified_master: no per-title masters found.")
+def _export_unified_master(store):
+    """Write load_unified_master() to the unified CSV (called with it locked)."""
+    try:
+        unified = load_unified_master(store)
+        if unified.empty:
+            logging.info("rebuild_unified_master: no stored or per-title jobs found.")
             return None
+        out_path = str(UNIFIED_MASTER_CSV)
+        write_csv(unified, out_path, index=False)
+        logging.info("rebuild_unified_master: exported %d unique jobs from the job store → %s",
+                     len(unified), out_path)
+        return out_path
+    except Exception as e:
+        logging.error("rebuild_unified_master failed: %s", e)
+        return None
 
-        unified = pd.concat(frames, ignore_index=True)
-
-        # Deduplicate – same job_url across titles keeps the most-recent row
-        if "job_url" in unified.columns:
-            unified = unified.drop_duplicates(subset=["job_url"], keep="last")
 
-        # Sort newest first
-        if "date_extracted" in unified.columns:
-            unified = unified.sort_values("date_extracted", ascending=False)
+def _rebuild_unified_master(full_rebuild):
+    """Body of rebuild_unified_master (called with the unified CSV locked)."""
+    try:
+        if not os.path.isdir(str(AGGREGATED_DIR)):
+            logging.info("rebuild_unified_master: aggregated dir does not exist yet.")
+            return None
 
-        os.makedirs(str(AGGREGATED_DIR), exist_ok=True)
         out_path = str(UNIFIED_MASTER_CSV)
-        unified.to_csv(out_path, index=False)
+        store = JobStore()
+        manifest = UnifiedManifest(store=store)
+        sources = _unified_sources()
+        changed = manifest.changed(sources)
+        removed = [t for t in manifest.titles if t not in sources]
+
+        if not sources:
+            logging.info("rebuild_unified_master: no per-title masters found.")
+            return None
+        if not changed and not removed and not full_rebuild and os.path.exists(out_path):
+            logging.info("rebuild_unified_master: no title changed since build %d; unified master is current.",
+                         manifest.builds)
+            return out_path
+
+        # Incremental path: keyed replace of the changed titles' rows
+        unified = None
+        frames = {}
+        reason = None
+        if full_rebuild:
+            reason = "requested"
+        elif not os.path.exists(out_path) or not manifest.columns:
+            reason = "no previous build"
+        elif removed:
+            reason = f"titles removed: {', '.join(removed)}"
+
+        if reason is None:
+            for title_dir in changed:
+                try:
+                    frames[title_dir] = _read_title_master(title_dir, sources[title_dir], store)
+                except Exception as e:
+                    logging.warning("rebuild_unified_master: error reading %s: %s", sources[title_dir], e)
+            new_columns = set().union(*(df.columns for df in frames.values())) - set(manifest.columns)
+            if new_columns:
+                reason = f"schema change (new columns: {', '.join(sorted(new_columns))})"
+            else:
+                unified = pd.read_csv(out_path)
+                if list(unified.columns) != manifest.columns:
+                    reason = "unified CSV columns differ from the manifest"
+                else:
+                    replaced = unified["search_title"].isin(changed)
+                    kept_urls = set().union(*(set(df["job_url"].astype(str)) for df in frames.values()))
+                    lost = set(unified.loc[replaced, "job_url"].astype(str)) - kept_urls
+                    if lost:
+                        reason = f"{len(lost)} jobs dropped from changed titles"
+                    else:
+                        unified = _resolve_unified(pd.concat([unified[~replaced]] + list(frames.values()),
+                                                             ignore_index=True))
+                        for title_dir, df in frames.items():
+                            logging.info("rebuild_unified_master: merged %d rows from '%s'", len(df), title_dir)
+
+        if reason is not None:
+            logging.info("rebuild_unified_master: full rebuild (%s)", reason)
+            frames = {}
+            for title_dir, master_file in sources.items():
+                try:
+                    df = _read_title_master(title_dir, master_file, store)
+                    if df.empty:
+                        continue
+                    frames[title_dir] = df
+                    logging.info("rebuild_unified_master: added %d rows from '%s'", len(df), title_dir)
+                except Exception as e:
+                    logging.warning("rebuild_unified_master: error reading %s: %s", master_file, e)
+            if not frames:
+                logging.info("rebuild_unified_master: no per-title masters found.")
+                return None
+            unified = _resolve_unified(pd.concat(list(frames.values()), ignore_index=True))
+            for title_dir in removed:
+                manifest.forget(title_dir)
+
+        write_csv(unified, out_path, index=False)
+
+        for title_dir in changed:
+            if title_dir in frames:
+                manifest.mark(title_dir, sources[title_dir], rows=len(frames[title_dir]))
+        manifest.save(list(unified.columns), mode="incremental" if reason is None else "full")
         logging.info(
-            "rebuild_unified_master: saved %d unique jobs → %s",
-            len(unified), out_path,
+            "rebuild_unified_master: saved %d unique jobs → %s (build %d, %d titles changed)",
+            len(unified), out_path, manifest.builds, len(changed),
         )
         return out_path
 
@@ -691,10 +827,12 @@ def rebuild_unified_master():
         return None
 
 
-def process_job_search_results(job_title):
+def process_job_search_results(job_title, full_rebuild=False, export_csv=False):
     """
     Process all job search results for a given job title and create aggregated file.
     This function processes both the initial search results and detailed job information.
+    With full_rebuild, every job_details CSV is re-read regardless of the ingest manifest;
+    with export_csv, the master CSV is written even when the job store holds the master.
     """
     try:
         job_title_clean = job_title.lower().replace(' ', '_')
@@ -717,7 +855,8 @@ def process_job_search_results(job_title):
                     search_df.insert(0, 'date_extracted', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
                 
                 # Aggregate these results
-                result_file = aggregate_jobs_with_deduplication(job_title, search_df)
+                result_file = aggregate_jobs_with_deduplication(job_title, search_df, full_rebuild=full_rebuild,
+                                                                export_csv=export_csv)
                 
                 if result_file:
                     logging.info(f"Successfully processed search results for {job_title}")
@@ -746,14 +885,15 @@ def process_job_search_results(job_title):
                     detailed_df.insert(0, 'date_extracted', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
                 
                 # Aggregate these results
-                result_file = aggregate_jobs_with_deduplication(job_title, detailed_df)
+                result_file = aggregate_jobs_with_deduplication(job_title, detailed_df, full_rebuild=full_rebuild,
+                                                                export_csv=export_csv)
                 
                 if result_file:
                     logging.info(f"Successfully processed detailed results for {job_title}")
                     return result_file
         
         # If no specific new data, just update the master file
-        result_file = aggregate_jobs_with_deduplication(job_title)
+        result_file = aggregate_jobs_with_deduplication(job_title, full_rebuild=full_rebuild, export_csv=export_csv)
         
         return result_file
         
@@ -767,12 +907,18 @@ def main():
     parser.add_argument('--job_title', help='Job title to process')
     parser.add_argument('--input_file', help='Specific CSV file to process (optional)')
     parser.add_argument('--rebuild_unified', action='store_true',
-                        help='Only rebuild the unified master CSV (no per-title merge)')
+                        help='Only rebuild the unified master CSV (no per-title merge); '
+                             'with the job store this exports it on demand')
+    parser.add_argument('--full_rebuild', '--full-rebuild', action='store_true',
+                        help='Re-read every job_details CSV and rebuild the unified master from scratch, '
+                             'ignoring the ingest and unified manifests')
+    parser.add_argument('--export_csv', action='store_true',
+                        help='Also write the per-title master CSV when the job store holds the master')
     args = parser.parse_args()
     
     try:
         if args.rebuild_unified:
-            unified = rebuild_unified_master()
+            unified = rebuild_unified_master(full_rebuild=args.full_rebuild)
             if unified:
                 logging.info(f"Unified master rebuilt: {unified}")
             else:
@@ -786,13 +932,15 @@ def main():
             # Process specific input file
             if os.path.exists(args.input_file):
                 df = pd.read_csv(args.input_file)
-                result_file = aggregate_jobs_with_deduplication(args.job_title, df)
+                result_file = aggregate_jobs_with_deduplication(args.job_title, df, full_rebuild=args.full_rebuild,
+                                                                export_csv=args.export_csv)
             else:
                 logging.error(f"Input file not found: {args.input_file}")
                 return
         else:
             # Process all results for the job title
-            result_file = process_job_search_results(args.job_title)
+            result_file = process_job_search_results(args.job_title, full_rebuild=args.full_rebuild,
+                                                     export_csv=args.export_csv)
         
         if result_file:
             logging.info(f"Job aggregation completed successfully. Output: {result_file}")
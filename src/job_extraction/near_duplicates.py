@@ -0,0 +1,342 @@
+"""
+Near-Duplicate Detection
+════════════════════════
+Finds reposted jobs – the same description under a new URL, reworded
+title or agency company name – with MinHash signatures over description
+shingles and an LSH band index, and groups them into clusters so later
+stages (insights, term extraction, scoring, resume optimisation) handle
+one representative per cluster.
+
+  • shingles    5-word windows of the normalised description
+  • signature   128 MinHash values (multiply-shift hashing of shingles)
+  • LSH         16 bands × 8 rows – pairs with Jaccard ≈ 0.7+ collide;
+                candidates are confirmed by signature similarity ≥ 0.8
+  • clusters    connected components of confirmed pairs; the member
+                signed first is the representative and its job_url is
+                the cluster ID (``dup_cluster_id``)
+
+Signatures are persisted for every job across all titles, so a run signs
+only new or changed descriptions; banding and clustering are vectorised
+over the signature matrix (sub-quadratic: O(n · bands) bucket work).
+
+    data/aggregated/_near_duplicates.npz
+
+Usage:
+    index = NearDuplicateIndex()
+    index.update(master_df)        # sign new descriptions, re-cluster
+    index.save()
+    master_df = index.assign(master_df)              # adds dup_cluster_id
+    todo = index.representatives(todo_df, done=processed_urls)
+
+CLI:
+    python src/job_extraction/near_duplicates.py --job_title "marketing analytics"
+    python src/job_extraction/near_duplicates.py --benchmark 100000
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from artifact_io import atomic_write
+from job_extraction.job_store import JobStore
+from paths import NEAR_DUPLICATE_INDEX, master_aggregated_csv
+
+CLUSTER_COLUMN = "dup_cluster_id"
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 5
+MIN_WORDS = 30          # shorter descriptions are never clustered
+THRESHOLD = 0.8         # estimated Jaccard needed to confirm a candidate pair
+
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_SHIFT = np.uint64(32)
+_SEED = 1
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_rng = np.random.RandomState(_SEED)
+# h(x) = (a·x + b) mod 2^64 >> 32, with odd a: one hash function per permutation
+_PERM_A = _rng.randint(0, 1 << 63, size=NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_PERM_B = _rng.randint(0, 1 << 63, size=NUM_PERM, dtype=np.uint64)
+# Odd multipliers that fold a shingle's word hashes into one 32-bit value
+_FOLD = np.array([0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F, 0x165667B1], dtype=np.uint64)[:SHINGLE_WORDS]
+
+
+def _text_hash(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def minhash_signature(description: str, vocab: Optional[Dict[str, int]] = None) -> Optional[np.ndarray]:
+    """MinHash signature (uint32[NUM_PERM]) of a description, ``None`` if too short."""
+    words = _WORD_RE.findall(str(description).lower())
+    if len(words) < MIN_WORDS:
+        return None
+    vocab = {} if vocab is None else vocab
+    ids = np.fromiter(
+        (vocab[w] if w in vocab else vocab.setdefault(w, _text_hash(w)) for w in words),
+        dtype=np.uint64, count=len(words),
+    )
+    # Shingle hash = Σ word_hash · fold_j over the window (mod 2^32)
+    windows = np.lib.stride_tricks.sliding_window_view(ids, SHINGLE_WORDS)
+    shingles = np.unique((windows * _FOLD).sum(axis=1) & _MAX_HASH)
+    hashed = shingles[:, None] * _PERM_A
+    hashed += _PERM_B
+    hashed >>= _SHIFT
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def _band_keys(signatures: np.ndarray) -> np.ndarray:
+    """One 64-bit key per (row, band): the band's ROWS values folded together."""
+    bands = signatures.reshape(len(signatures), BANDS, ROWS).astype(np.uint64)
+    keys = np.zeros((len(signatures), BANDS), dtype=np.uint64)
+    for r in range(ROWS):
+        keys = keys * np.uint64(0x100000001B3) ^ bands[:, :, r]
+    return keys
+
+
+def cluster_signatures(signatures: np.ndarray, threshold: float = THRESHOLD) -> np.ndarray:
+    """Representative row for every row of *signatures* (its own index if unique).
+
+    Rows sharing any LSH band bucket become candidates; each bucket member is
+    checked against the bucket's first row, so the work is linear in
+    rows × bands rather than quadratic in bucket size.
+    """
+    n = len(signatures)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    keys = _band_keys(signatures)
+    band_ids = np.broadcast_to(np.arange(BANDS), keys.shape)
+    rows = np.broadcast_to(np.arange(n)[:, None], keys.shape)
+    buckets = pd.DataFrame({"band": band_ids.ravel(), "key": keys.ravel(), "row": rows.ravel()})
+    anchor = buckets.groupby(["band", "key"], sort=False)["row"].transform("min").to_numpy()
+    pairs = np.unique(np.stack([anchor, buckets["row"].to_numpy()], axis=1), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+
+    if len(pairs):
+        agreement = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        pairs = pairs[agreement >= threshold]
+    graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n, n)) if len(pairs) \
+        else coo_matrix((n, n))
+    _, labels = connected_components(graph, directed=False)
+    # Earliest-signed member (lowest row) represents its component
+    first = pd.Series(np.arange(n)).groupby(labels).transform("min").to_numpy()
+    return first.astype(np.int64)
+
+
+class NearDuplicateIndex:
+    """Persisted MinHash signatures of all job descriptions plus their clusters."""
+
+    def __init__(self, path: Optional[str] = None, threshold: float = THRESHOLD, load: bool = True):
+        self.path = path or str(NEAR_DUPLICATE_INDEX)
+        self.threshold = threshold
+        self.urls: List[str] = []
+        self.desc_hashes = np.zeros(0, dtype=np.uint32)
+        self.signatures = np.zeros((0, NUM_PERM), dtype=np.uint32)
+        self.reps = np.zeros(0, dtype=np.int64)
+        self._row: Dict[str, int] = {}
+        if load:
+            self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if int(data["num_perm"]) != NUM_PERM or int(data["seed"]) != _SEED:
+                    logging.warning("Near-duplicate index %s has other hash settings; re-signing", self.path)
+                    return
+                self.urls = data["urls"].tolist()
+                self.desc_hashes = data["desc_hashes"]
+                self.signatures = data["signatures"]
+                self.reps = data["reps"]
+        except Exception as e:
+            logging.warning("Could not read near-duplicate index %s (re-signing): %s", self.path, e)
+            self.urls = []
+            self.desc_hashes = np.zeros(0, dtype=np.uint32)
+            self.signatures = np.zeros((0, NUM_PERM), dtype=np.uint32)
+            self.reps = np.zeros(0, dtype=np.int64)
+        self._row = {url: i for i, url in enumerate(self.urls)}
+
+    def save(self) -> None:
+        with atomic_write(self.path, "wb") as f:
+            np.savez(
+                f,
+                urls=np.array(self.urls, dtype=str),
+                desc_hashes=self.desc_hashes,
+                signatures=self.signatures,
+                reps=self.reps,
+                num_perm=NUM_PERM,
+                seed=_SEED,
+            )
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    # ── indexing ──────────────────────────────────────────────────────────
+
+    def update(self, df: pd.DataFrame) -> int:
+        """Sign new or changed descriptions in *df* and re-cluster; returns rows signed."""
+        if df.empty or "job_url" not in df.columns or "description" not in df.columns:
+            return 0
+        vocab: Dict[str, int] = {}
+        new_urls, new_hashes, new_sigs = [], [], []
+        changed_rows, changed_hashes, changed_sigs = [], [], []
+        for url, desc in zip(df["job_url"].astype(str), df["description"]):
+            if pd.isna(desc):
+                continue
+            desc_hash = _text_hash(str(desc))
+            row = self._row.get(url)
+            if row is not None and self.desc_hashes[row] == desc_hash:
+                continue
+            sig = minhash_signature(desc, vocab)
+            if sig is None:
+                continue
+            if row is None:
+                self._row[url] = len(self.urls) + len(new_urls)
+                new_urls.append(url)
+                new_hashes.append(desc_hash)
+                new_sigs.append(sig)
+            else:
+                changed_rows.append(row)
+                changed_hashes.append(desc_hash)
+                changed_sigs.append(sig)
+
+        if changed_rows:
+            self.desc_hashes[changed_rows] = changed_hashes
+            self.signatures[changed_rows] = changed_sigs
+        if new_urls:
+            self.urls.extend(new_urls)
+            self.desc_hashes = np.concatenate([self.desc_hashes, np.array(new_hashes, dtype=np.uint32)])
+            self.signatures = np.vstack([self.signatures, np.array(new_sigs, dtype=np.uint32)])
+        signed = len(new_urls) + len(changed_rows)
+        if signed or len(self.reps) != len(self.urls):
+            self.reps = cluster_signatures(self.signatures, self.threshold)
+            logging.info(
+                "Near-duplicates: signed %d descriptions; %d jobs in %d clusters",
+                signed, len(self.urls), len(np.unique(self.reps)),
+            )
+        return signed
+
+    # ── lookups ───────────────────────────────────────────────────────────
+
+    def cluster_ids(self, urls: Iterable[str]) -> pd.Series:
+        """Cluster ID (representative job_url) per URL; unknown URLs are their own cluster."""
+        urls = pd.Series(list(urls), dtype=object).astype(str)
+        rows = urls.map(self._row)
+        known = rows.notna()
+        ids = urls.copy()
+        if known.any():
+            rep_urls = np.array(self.urls, dtype=object)[self.reps[rows[known].astype(np.int64).to_numpy()]]
+            ids[known] = rep_urls
+        return ids
+
+    def assign(self, df: pd.DataFrame) -> pd.DataFrame:
+        """*df* with a ``dup_cluster_id`` column."""
+        if df.empty or "job_url" not in df.columns:
+            return df
+        df = df.copy()
+        df[CLUSTER_COLUMN] = self.cluster_ids(df["job_url"]).to_numpy()
+        return df
+
+    def representatives(self, df: pd.DataFrame, done: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """One row per cluster in *df*, dropping clusters already covered by *done* URLs.
+
+        The cluster's own representative is kept when it is in *df*;
+        otherwise its first row.
+        """
+        if df.empty or "job_url" not in df.columns or not len(self):
+            return df
+        urls = df["job_url"].astype(str)
+        clusters = self.cluster_ids(urls).set_axis(df.index)
+        # Representatives first, so they win their cluster
+        order = (clusters != urls.to_numpy()).astype(int).sort_values(kind="stable").index
+        keep = (~clusters.loc[order].duplicated()).reindex(df.index)
+        if done is not None:
+            covered = set(self.cluster_ids(done))
+            keep &= ~clusters.isin(covered)
+        skipped = len(df) - int(keep.sum())
+        if skipped:
+            logging.info("Near-duplicates: skipping %d reposted copies of jobs in the same cluster", skipped)
+        return df[keep]
+
+    def duplicate_count(self) -> int:
+        return int((self.reps != np.arange(len(self.reps))).sum())
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _synthetic_descriptions(n: int, dup_rate: float = 0.2, seed: int = 7) -> List[str]:
+    rng = np.random.RandomState(seed)
+    vocab = np.array([f"w{i}" for i in range(5000)])
+    docs: List[str] = []
+    for _ in range(n):
+        if docs and rng.rand() < dup_rate:
+            words = docs[rng.randint(len(docs))].split()
+            # Repost: a few words edited
+            for pos in rng.randint(0, len(words), size=3):
+                words[pos] = vocab[rng.randint(len(vocab))]
+            docs.append(" ".join(words))
+        else:
+            docs.append(" ".join(vocab[rng.randint(len(vocab), size=rng.randint(150, 400))]))
+    return docs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find reposted jobs with MinHash/LSH.")
+    parser.add_argument("--job_title", help="Index this title's jobs (job store or master CSV) and report its clusters.")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="Sign and cluster N synthetic descriptions (in memory).")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        docs = _synthetic_descriptions(args.benchmark)
+        index = NearDuplicateIndex(load=False)
+        start = time.perf_counter()
+        index.update(pd.DataFrame({"job_url": [f"u{i}" for i in range(len(docs))], "description": docs}))
+        elapsed = time.perf_counter() - start
+        print(f"{len(docs):,} descriptions signed and clustered in {elapsed:.1f}s; "
+              f"{index.duplicate_count():,} near-duplicates found")
+        return
+
+    if not args.job_title:
+        parser.error("--job_title or --benchmark is required")
+    jt_clean = args.job_title.lower().replace(" ", "_")
+    store = JobStore()
+    master_csv = master_aggregated_csv(jt_clean)
+    if store.has(jt_clean):
+        df = store.read(jt_clean, columns=["job_url", "job_title", "company_title", "description"], side=False)
+    elif master_csv.exists():
+        df = pd.read_csv(master_csv)
+    else:
+        parser.error(f"No stored jobs or master CSV for '{jt_clean}': {master_csv}")
+    index = NearDuplicateIndex()
+    index.update(df)
+    index.save()
+    df = index.assign(df)
+    sizes = df[CLUSTER_COLUMN].value_counts()
+    print(f"{jt_clean}: {len(df)} jobs in {len(sizes)} clusters "
+          f"({int((sizes > 1).sum())} with reposts, {len(df) - len(sizes)} duplicate rows)")
+    cols = [c for c in ("job_title", "company_title", "job_url") if c in df.columns]
+    for cluster_id in sizes[sizes > 1].index[:10]:
+        print(f"\n{cluster_id}")
+        print(df.loc[df[CLUSTER_COLUMN] == cluster_id, cols].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""
+Page Waits
+══════════
+Shared wait layer for the LinkedIn scrapers.  Replaces fixed
+``time.sleep`` calls and stacked 15-second optional-element waits with:
+
+  • ``wait_until_ready``  – block on a concrete readiness condition
+                            (anchor selector present, document parsed,
+                            optional network-quiet window)
+  • ``network_quiet``     – poll Resource Timing (observer + buffer)
+                            until no request has finished for ``quiet_ms``
+  • ``WaitBudget``        – one total time budget shared by every
+                            optional field on a page
+  • ``poll_until``        – generic predicate poll (replaces sleep loops)
+
+Every call is recorded per call site in a ``WaitTelemetry`` instance –
+the thread's ``telemetry_scope`` if one is open, else the module-level
+``TELEMETRY`` – and can be dumped as a per-run latency histogram.  Each
+search and detail run opens its own scope, so concurrent searches and
+the stages of one process never mix their samples:
+
+    with telemetry_scope() as telemetry:
+        ...                                 # waits on this thread
+        telemetry.dump("job_details")       # → data/metrics/wait_telemetry/…json
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from paths import TELEMETRY_DIR
+
+# Histogram bucket upper bounds (seconds); the last bucket is open-ended
+HISTOGRAM_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 15.0, 30.0]
+DEFAULT_POLL_INTERVAL = 0.2
+
+# Returns {state, present, idle_ms} in one round trip.  idle_ms is the time
+# since the most recent resource finished loading (network-quiet proxy).
+#
+# The Resource Timing buffer stops taking entries once full (250 by default,
+# and it persists across SPA pagination), which would make the page look
+# quiet forever.  So the first probe on each document installs a
+# PerformanceObserver that tracks the latest responseEnd, and empties the
+# buffer now and whenever it fills (noting its latest responseEnd first).  The
+# buffer is still scanned each probe – it is small, and catches entries the
+# observer has not been handed yet.
+_READY_PROBE_JS = """
+var sel = arguments[0];
+var net = window.__pageWaitsNet;
+if (!net) {
+    net = window.__pageWaitsNet = {last: 0};
+    var note = function (entries) {
+        for (var i = 0; i < entries.length; i++) {
+            if (entries[i].responseEnd > net.last) { net.last = entries[i].responseEnd; }
+        }
+    };
+    var drain = function () {
+        note(performance.getEntriesByType('resource'));
+        performance.clearResourceTimings();
+    };
+    try {
+        new PerformanceObserver(function (list) { note(list.getEntries()); }).observe({type: 'resource'});
+    } catch (e) {}
+    performance.addEventListener('resourcetimingbufferfull', drain);
+    drain();   // the buffer may already be full when the first probe runs
+}
+var entries = performance.getEntriesByType('resource');
+var last = net.last;
+for (var i = 0; i < entries.length; i++) {
+    if (entries[i].responseEnd > last) { last = entries[i].responseEnd; }
+}
+return {
+    state: document.readyState,
+    present: sel ? document.querySelector(sel) !== null : true,
+    idle_ms: performance.now() - last
+};
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Telemetry
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class WaitTelemetry:
+    """Thread-safe record of time actually spent at each wait call site."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def record(self, site: str, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self._samples.setdefault(site, []).append(seconds)
+            if timed_out:
+                self._timeouts[site] = self._timeouts.get(site, 0) + 1
+
+    @contextmanager
+    def timed(self, site: str):
+        """Time a block; an exception inside the block counts as a timeout."""
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            yield
+        except Exception:
+            timed_out = True
+            raise
+        finally:
+            self.record(site, time.perf_counter() - start, timed_out)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._timeouts.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-site count / total / percentiles / histogram."""
+        with self._lock:
+            samples = {site: sorted(v) for site, v in self._samples.items()}
+            timeouts = dict(self._timeouts)
+
+        out: Dict[str, Dict[str, Any]] = {}
+        for site, values in samples.items():
+            n = len(values)
+            counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+            for v in values:
+                idx = next((i for i, b in enumerate(HISTOGRAM_BUCKETS) if v <= b), len(HISTOGRAM_BUCKETS))
+                counts[idx] += 1
+            labels = [f"<={b}s" for b in HISTOGRAM_BUCKETS] + [f">{HISTOGRAM_BUCKETS[-1]}s"]
+            out[site] = {
+                "count": n,
+                "timeouts": timeouts.get(site, 0),
+                "total_s": round(sum(values), 3),
+                "mean_s": round(sum(values) / n, 3),
+                "p50_s": round(values[n // 2], 3),
+                "p95_s": round(values[min(n - 1, int(n * 0.95))], 3),
+                "max_s": round(values[-1], 3),
+                "histogram": dict(zip(labels, counts)),
+            }
+        return out
+
+    def log_summary(self) -> None:
+        summary = self.summary()
+        if not summary:
+            return
+        logging.info("Wait telemetry (seconds spent per call site):")
+        for site, s in sorted(summary.items(), key=lambda kv: -kv[1]["total_s"]):
+            logging.info(
+                "  %-28s n=%-4d total=%7.1f  p50=%5.2f  p95=%5.2f  max=%5.2f  timeouts=%d",
+                site, s["count"], s["total_s"], s["p50_s"], s["p95_s"], s["max_s"], s["timeouts"],
+            )
+
+    def dump(self, run_label: str = "run") -> Optional[str]:
+        """Write the histogram JSON for this run; returns the file path."""
+        summary = self.summary()
+        if not summary:
+            return None
+        os.makedirs(TELEMETRY_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(str(TELEMETRY_DIR), f"{run_label}_waits_{timestamp}.json")
+        payload = {
+            "metadata": {
+                "run_label": run_label,
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "total_wait_s": round(sum(s["total_s"] for s in summary.values()), 3),
+            },
+            "sites": summary,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        self.log_summary()
+        logging.info("Wait telemetry saved to %s", path)
+        return path
+
+
+# Process-wide default, for waits outside any telemetry_scope
+TELEMETRY = WaitTelemetry()
+
+_scope = threading.local()
+
+
+def current_telemetry() -> WaitTelemetry:
+    """This thread's scoped telemetry, else ``TELEMETRY``."""
+    return getattr(_scope, "telemetry", None) or TELEMETRY
+
+
+@contextmanager
+def telemetry_scope(telemetry: Optional[WaitTelemetry] = None):
+    """Record this thread's waits into *telemetry* (a fresh instance by default).
+
+    Worker threads of the same run re-enter the scope with the run's
+    instance, which is shared safely between threads.
+    """
+    previous = getattr(_scope, "telemetry", None)
+    _scope.telemetry = telemetry or WaitTelemetry()
+    try:
+        yield _scope.telemetry
+    finally:
+        _scope.telemetry = previous
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Wait primitives
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def poll_until(
+    predicate: Callable[[], Any],
+    timeout: float,
+    site: str,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    telemetry: Optional[WaitTelemetry] = None,
+) -> Any:
+    """Poll *predicate* until it returns a truthy value or *timeout* elapses.
+
+    Returns the truthy value, or ``None`` on timeout.  Exceptions raised by
+    the predicate are treated as "not yet".
+    """
+    telemetry = telemetry or current_telemetry()
+    start = time.perf_counter()
+    deadline = start + max(0.0, timeout)
+    result = None
+    while True:
+        try:
+            result = predicate()
+        except Exception as e:
+            logging.debug("poll_until(%s) predicate error: %s", site, e)
+            result = None
+        if result or time.perf_counter() >= deadline:
+            break
+        time.sleep(min(interval, max(0.0, deadline - time.perf_counter())))
+    telemetry.record(site, time.perf_counter() - start, timed_out=not result)
+    return result or None
+
+
+def wait_for(
+    driver,
+    condition,
+    timeout: float,
+    site: str,
+    required: bool = False,
+    telemetry: Optional[WaitTelemetry] = None,
+):
+    """``WebDriverWait(driver, timeout).until(condition)`` with telemetry.
+
+    Returns ``None`` on timeout unless *required*, in which case the
+    ``TimeoutException`` propagates.
+    """
+    telemetry = telemetry or current_telemetry()
+    start = time.perf_counter()
+    try:
+        result = WebDriverWait(driver, max(0.0, timeout), poll_frequency=DEFAULT_POLL_INTERVAL).until(condition)
+        telemetry.record(site, time.perf_counter() - start)
+        return result
+    except TimeoutException:
+        telemetry.record(site, time.perf_counter() - start, timed_out=True)
+        if required:
+            raise
+        return None
+
+
+def network_quiet(
+    driver,
+    quiet_ms: int = 500,
+    timeout: float = 5.0,
+    site: str = "network_quiet",
+    telemetry: Optional[WaitTelemetry] = None,
+) -> bool:
+    """Wait until no resource has finished loading for *quiet_ms*."""
+    def _probe():
+        status = driver.execute_script(_READY_PROBE_JS, None)
+        return status and status.get("idle_ms", 0) >= quiet_ms
+
+    return bool(poll_until(_probe, timeout, site, telemetry=telemetry))
+
+
+def wait_until_ready(
+    driver,
+    selector: Optional[str],
+    timeout: float = 15.0,
+    quiet_ms: int = 0,
+    site: str = "page_ready",
+    telemetry: Optional[WaitTelemetry] = None,
+) -> bool:
+    """Block until the page is usable.
+
+    Ready means: ``document.readyState`` is past ``loading``, *selector*
+    (the anchor element, e.g. the job top card) is present and – when
+    *quiet_ms* > 0 – the network has been quiet for that long.  If the
+    anchor is present but the network never settles, the page is treated
+    as ready once *timeout* elapses.
+
+    Raises ``TimeoutException`` if the anchor never appears.
+    """
+    seen_anchor = {"value": False}
+
+    def _probe():
+        status = driver.execute_script(_READY_PROBE_JS, selector)
+        if not status or status.get("state") == "loading" or not status.get("present"):
+            return False
+        seen_anchor["value"] = True
+        return status.get("idle_ms", 0) >= quiet_ms
+
+    if poll_until(_probe, timeout, site, telemetry=telemetry):
+        return True
+    if seen_anchor["value"]:
+        logging.debug("wait_until_ready(%s): anchor present, network never settled", site)
+        return True
+    raise TimeoutException(f"Page not ready after {timeout}s (anchor: {selector})")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Shared budget for optional fields
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class WaitBudget:
+    """One time budget shared by all optional waits on a page.
+
+    Once the budget is spent, further optional waits return immediately
+    instead of each burning its own full timeout.
+    """
+
+    def __init__(self, total: float, telemetry: Optional[WaitTelemetry] = None):
+        self.total = total
+        self.telemetry = telemetry or current_telemetry()
+        self._deadline = time.perf_counter() + total
+
+    def remaining(self) -> float:
+        return max(0.0, self._deadline - time.perf_counter())
+
+    def wait_for(self, driver, condition, site: str, cap: Optional[float] = None):
+        """Optional wait drawing from the budget; ``None`` when absent."""
+        timeout = self.remaining() if cap is None else min(cap, self.remaining())
+        return wait_for(driver, condition, timeout, site, telemetry=self.telemetry)
+
+    def present(self, driver, selector: str, site: str, cap: Optional[float] = None):
+        """Shortcut for an optional ``presence_of_element_located`` wait."""
+        return self.wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, selector)), site, cap)
+
+    def poll_until(self, predicate: Callable[[], Any], site: str, cap: Optional[float] = None) -> Any:
+        timeout = self.remaining() if cap is None else min(cap, self.remaining())
+        return poll_until(predicate, timeout, site, telemetry=self.telemetry)
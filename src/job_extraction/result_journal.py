@@ -0,0 +1,203 @@
+"""
+Result Journal
+══════════════
+Crash-safe, append-only JSONL journal for long scraping runs.
+
+  • One JSON record per line, appended as soon as it is scraped
+  • ``fsync`` is batched (every N records or T seconds) and forced on close
+  • A torn last line (crash mid-write) is dropped and truncated on load
+  • ``completed_urls`` lets a restarted run skip work already journaled
+  • ``compact`` collapses the journal (last record per key wins) into the
+    final ordered result set; ``archive`` retires the journal afterwards
+
+Journals live under ``data/job_details/<title>/_journal/<run_key>.jsonl``
+so re-running the same input file resumes the same journal.  Cards a
+time-budgeted run never started are carried to the title's next run via
+``pending_<title>.jsonl`` in the same folder (see frontier_priority).
+
+Usage:
+    journal = ResultJournal(journal_path_for(title_clean, run_key))
+    pending = [u for u in links if u not in journal.completed_urls()]
+    journal.append(record)      # thread-safe
+    journal.close()
+    records = journal.compact("job_url", order=links)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from paths import job_details_for
+
+DEFAULT_FSYNC_EVERY = 10        # records
+DEFAULT_FSYNC_INTERVAL = 5.0    # seconds
+
+
+def journal_path_for(job_title_clean: str, run_key: str) -> str:
+    """data/job_details/<title>/_journal/<run_key>.jsonl"""
+    return str(job_details_for(job_title_clean) / "_journal" / f"{run_key}.jsonl")
+
+
+def pending_path_for(job_title_clean: str) -> str:
+    """data/job_details/<title>/_journal/pending_<title>.jsonl – cards a time-budgeted run left unstarted."""
+    return str(job_details_for(job_title_clean) / "_journal" / f"pending_{job_title_clean}.jsonl")
+
+
+def links_run_key(links: Iterable[str]) -> str:
+    """Stable key for a URL list (same links → same journal)."""
+    digest = hashlib.sha1("\n".join(links).encode("utf-8")).hexdigest()
+    return f"links_{digest[:12]}"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if value is pd.NaT:
+        return None
+    return str(value)
+
+
+class ResultJournal:
+    """Append-only JSONL journal with batched fsync and torn-write recovery."""
+
+    def __init__(
+        self,
+        path: str,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+    ):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._fh = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # ── Reading ───────────────────────────────────────────────────────────
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Read every intact record, repairing a torn final line in place."""
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        records: List[Dict[str, Any]] = []
+        lines = data.split(b"\n")
+        offset = 0
+        for i, raw in enumerate(lines):
+            if i == len(lines) - 1:
+                # Text after the final newline: a write cut short by a crash
+                if raw.strip():
+                    self._repair_tail(offset, raw, records)
+                break
+            if raw.strip():
+                try:
+                    records.append(json.loads(raw.decode("utf-8")))
+                except ValueError:
+                    if any(rest.strip() for rest in lines[i + 1:]):
+                        logging.warning("Skipping corrupt journal line %d in %s", i + 1, self.path)
+                    else:
+                        logging.warning("Dropping torn final line from journal %s", self.path)
+                        self._truncate(offset)
+                        break
+            offset += len(raw) + 1
+        return records
+
+    def _repair_tail(self, offset: int, raw: bytes, records: List[Dict[str, Any]]) -> None:
+        """Keep an unterminated last record if it parses, otherwise cut it off."""
+        try:
+            records.append(json.loads(raw.decode("utf-8")))
+        except ValueError:
+            logging.warning("Dropping torn final line from journal %s", self.path)
+            self._truncate(offset)
+            return
+        with self._lock:
+            self._close_handle()
+            with open(self.path, "ab") as f:
+                f.write(b"\n")
+
+    def _truncate(self, offset: int) -> None:
+        with self._lock:
+            self._close_handle()
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+    def completed_urls(
+        self,
+        key: str = "job_url",
+        is_complete: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Set[str]:
+        """Keys whose latest journaled record counts as done."""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for record in self.load():
+            if record.get(key) is not None:
+                latest[record[key]] = record
+        return {k for k, r in latest.items() if is_complete is None or is_complete(r)}
+
+    def compact(self, key: str = "job_url", order: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Last record per *key*; in *order* if given, else first-seen order."""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for record in self.load():
+            k = record.get(key)
+            if k is None:
+                continue
+            latest[k] = record  # a retry replaces the record but keeps its first-seen slot
+        if order is None:
+            return list(latest.values())
+        return [latest[k] for k in dict.fromkeys(order) if k in latest]
+
+    # ── Writing ───────────────────────────────────────────────────────────
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record; durable after the next batched fsync."""
+        line = json.dumps(record, ensure_ascii=False, default=_json_default) + "\n"
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(self.path, "a", encoding="utf-8")
+            self._fh.write(line)
+            self._fh.flush()
+            self._unsynced += 1
+            if (self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def archive(self) -> Optional[str]:
+        """Rename the journal once its results are compacted into final outputs."""
+        self.close()
+        if not os.path.exists(self.path):
+            return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        archived = self.path[: -len(".jsonl")] + f".compacted_{timestamp}.jsonl"
+        os.replace(self.path, archived)
+        logging.info("Journal archived to %s", archived)
+        return archived
+
+    def _sync(self) -> None:
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_handle(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+            self._sync()
+            self._fh.close()
+            self._fh = None
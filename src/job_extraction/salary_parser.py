@@ -0,0 +1,253 @@
+"""
+Salary Parser
+═════════════
+Vectorised parsing of LinkedIn salary text into typed columns, computed
+once when jobs are merged:
+
+    salary_min_annual   float  lower bound, annualised
+    salary_max_annual   float  upper bound, annualised (= min for a single amount)
+    salary_period       str    period as shown: hour / day / week / month / year
+    currency            str    ISO code (USD, CAD, GBP, EUR, ...)
+
+Handles the formats LinkedIn shows on cards and job pages:
+
+    "$100K/yr - $140K/yr"      "$70/hr - $75/hr"       "$150K/yr"
+    "$120,000/yr - $150,000/yr" "$55.50/hr"            "CA$90K/yr - CA$110K/yr"
+    "£40K/yr - £50K/yr"        "€60K/yr"               "$8K/mo"
+    "$100K/yr - $140K/yr · 401(k) benefit"   "$1.2M/yr"
+    "2 benefits · $120K/yr"    "Medical, 401(k) · $100K/yr - $120K/yr"
+
+Anything else ("N/A", "-", benefit-only text such as "Medical, 401(k)")
+yields NaN / None.  Amounts must carry a currency, a K/M suffix or a
+period, so "401(k)" is never read as a salary; the first amount that does
+is the salary, wherever it sits in the text.
+
+Salary filtering is then a numeric predicate:
+
+    df = add_salary_columns(df)
+    df[df["salary_max_annual"] >= 175_000]
+
+Self-check over generated salary strings (every format × random amounts):
+    python src/job_extraction/salary_parser.py --check
+"""
+
+import argparse
+import logging
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+SALARY_COLUMNS = ["salary_min_annual", "salary_max_annual", "salary_period", "currency"]
+
+PERIOD_MULTIPLIER = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+_PERIOD_ALIASES = {
+    "hr": "hour", "hour": "hour", "hourly": "hour",
+    "day": "day", "daily": "day",
+    "wk": "week", "week": "week", "weekly": "week",
+    "mo": "month", "month": "month", "monthly": "month",
+    "yr": "year", "year": "year", "annum": "year", "annually": "year", "annual": "year",
+}
+_CURRENCIES = {
+    "$": "USD", "us$": "USD", "usd": "USD",
+    "ca$": "CAD", "c$": "CAD", "cad": "CAD",
+    "a$": "AUD", "au$": "AUD", "aud": "AUD",
+    "£": "GBP", "gbp": "GBP",
+    "€": "EUR", "eur": "EUR",
+    "₹": "INR", "inr": "INR",
+}
+DEFAULT_CURRENCY = "USD"
+_SUFFIX_MULTIPLIER = {"k": 1_000, "m": 1_000_000}
+# A bare amount below this is taken as hourly, otherwise yearly
+_HOURLY_CEILING = 1000
+
+_CURRENCY = r"(?:US\$|CA\$|AU\$|C\$|A\$|\$|£|€|₹|USD|CAD|AUD|GBP|EUR|INR)"
+_PERIOD = r"(?:hr|hour|yr|year|annum|mo|month|wk|week|day)"
+
+
+def _amount(n: int) -> str:
+    return (
+        rf"(?P<cur{n}>{_CURRENCY})?\s*"
+        rf"(?P<num{n}>\d{{1,3}}(?:,\d{{3}})+(?:\.\d+)?|\d+(?:\.\d+)?)\s*"
+        rf"(?P<k{n}>[kKmM]\b)?"
+        rf"(?:\s*(?:/|per|an?)\s*(?P<per{n}>{_PERIOD})\b)?"
+    )
+
+
+SALARY_RE = re.compile(
+    rf"{_amount(1)}(?:\s*(?:-|–|—|to)\s*{_amount(2)})?",
+    re.IGNORECASE,
+)
+
+
+def parse_salary(text: pd.Series) -> pd.DataFrame:
+    """Parse a Series of salary strings into the four ``SALARY_COLUMNS``."""
+    text = pd.Series(text, dtype=object)
+    matches = (
+        text.where(text.notna(), "").astype(str).reset_index(drop=True)
+        .str.extractall(SALARY_RE).astype("string")
+    )
+
+    # An amount needs a currency, K/M suffix or period to count as a salary;
+    # the first such match per row is the salary
+    counts = matches["cur1"].notna() | matches["k1"].notna() | matches["per1"].notna()
+    first = matches[counts].groupby(level=0).head(1).droplevel("match")
+    parts = first.reindex(pd.RangeIndex(len(text))).set_axis(text.index)
+    valid = parts["num1"].notna()
+    has_second = parts["num2"].notna() & (
+        parts["cur2"].notna() | parts["k2"].notna() | parts["per2"].notna() | parts["cur1"].notna()
+    )
+
+    def _value(n: int) -> pd.Series:
+        numbers = pd.to_numeric(parts[f"num{n}"].str.replace(",", "", regex=False), errors="coerce").astype("float64")
+        scale = parts[f"k{n}"].str.lower().map(_SUFFIX_MULTIPLIER).astype("float64").fillna(1.0)
+        return numbers * scale
+
+    low = _value(1).where(valid)
+    high = _value(2).where(valid & has_second).fillna(low)
+
+    # Period as shown (second amount wins); bare amounts: small → hourly
+    period = parts["per2"].where(has_second).fillna(parts["per1"]).str.lower().map(_PERIOD_ALIASES).astype(object)
+    inferred = np.where(high < _HOURLY_CEILING, "hour", "year")
+    period = pd.Series(np.where(period.notna(), period, inferred), index=text.index, dtype=object).where(valid)
+
+    multiplier = period.map(PERIOD_MULTIPLIER)
+    low_annual, high_annual = low * multiplier, high * multiplier
+    salary_min = np.fmin(low_annual, high_annual)
+    salary_max = np.fmax(low_annual, high_annual)
+
+    currency = parts["cur1"].fillna(parts["cur2"]).str.lower().map(_CURRENCIES).astype(object)
+    currency = currency.where(~valid | currency.notna(), DEFAULT_CURRENCY).where(valid)
+
+    return pd.DataFrame({
+        "salary_min_annual": pd.Series(salary_min, index=text.index, dtype="float64"),
+        "salary_max_annual": pd.Series(salary_max, index=text.index, dtype="float64"),
+        "salary_period": period.where(valid & period.notna(), None),
+        "currency": currency.where(valid & currency.notna(), None),
+    })
+
+
+def add_salary_columns(df: pd.DataFrame, source: str = "salary_range", force: bool = False) -> pd.DataFrame:
+    """Return *df* with ``SALARY_COLUMNS`` filled from *source*.
+
+    Only rows not parsed before (all four columns empty) are parsed unless
+    *force* is set.
+    """
+    if df.empty or source not in df.columns:
+        return df
+    df = df.copy()
+    for col in SALARY_COLUMNS:
+        if col not in df.columns:
+            df[col] = np.nan if col.endswith("_annual") else None
+    todo = df.index if force else df.index[df[SALARY_COLUMNS].isna().all(axis=1)]
+    if len(todo):
+        parsed = parse_salary(df.loc[todo, source])
+        for col in SALARY_COLUMNS:
+            if not col.endswith("_annual"):
+                df[col] = df[col].astype(object)
+            df.loc[todo, col] = parsed[col]
+    for col in ("salary_min_annual", "salary_max_annual"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Self-check
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _money(value: float, thousands: bool, commas: bool, decimals: bool) -> str:
+    if thousands:
+        return f"{value / 1000:g}K"
+    if decimals:
+        return f"{value:,.2f}" if commas else f"{value:.2f}"
+    return f"{value:,.0f}" if commas else f"{value:.0f}"
+
+
+def _generate_case(rng: random.Random):
+    """One salary string in a LinkedIn format plus its expected parse."""
+    symbol, code = rng.choice([("$", "USD"), ("CA$", "CAD"), ("£", "GBP"), ("€", "EUR")])
+    period, suffix = rng.choice([("year", "/yr"), ("hour", "/hr"), ("month", "/mo")])
+    if period == "year":
+        low = rng.randrange(30, 400) * 1000
+        thousands, decimals = rng.random() < 0.8, False
+    elif period == "hour":
+        low = rng.randrange(15, 250) + (rng.choice([0, 0.5]) if rng.random() < 0.3 else 0)
+        thousands, decimals = False, low != int(low)
+    else:
+        low = rng.randrange(3, 30) * 1000
+        thousands, decimals = True, False
+    high = low + (rng.randrange(0, 60) * (1000 if period != "hour" else 1))
+    commas = rng.random() < 0.5
+    single = rng.random() < 0.25
+
+    text = f"{symbol}{_money(low, thousands, commas, decimals)}{suffix}"
+    if not single:
+        text += f" - {symbol}{_money(high, thousands, commas, decimals)}{suffix}"
+    if rng.random() < 0.2:
+        text += " · 401(k) benefit"
+    high = low if single else high
+    mult = PERIOD_MULTIPLIER[period]
+    return text, (low * mult, high * mult, period, code)
+
+
+# Real card texts that once tripped the parser: (text, expected parse)
+FIXED_CASES = [
+    ("2 benefits · $120K/yr", (120_000, 120_000, "year", "USD")),
+    ("Medical, 401(k) · $100K/yr - $120K/yr", (100_000, 120_000, "year", "USD")),
+    ("$1.2M/yr", (1_200_000, 1_200_000, "year", "USD")),
+    ("$1M/yr - $1.5M/yr", (1_000_000, 1_500_000, "year", "USD")),
+    ("401(k) · Medical · $55/hr", (55 * 2080, 55 * 2080, "hour", "USD")),
+]
+
+
+def self_check(cases: int = 5000, seed: int = 3) -> int:
+    """Parse generated strings and compare with their expected values; returns failures."""
+    rng = random.Random(seed)
+    generated = [_generate_case(rng) for _ in range(cases)] + FIXED_CASES
+    negatives = ["N/A", "-", "", None, "Medical, 401(k), +1 benefit", "Vision, Dental", "401(k)", "Actively recruiting"]
+    texts = [t for t, _ in generated] + negatives
+
+    start = time.perf_counter()
+    parsed = parse_salary(pd.Series(texts, dtype=object))
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    for i, (text, (low, high, period, code)) in enumerate(generated):
+        row = parsed.iloc[i]
+        ok = (
+            abs(row["salary_min_annual"] - low) < 1e-6
+            and abs(row["salary_max_annual"] - high) < 1e-6
+            and row["salary_period"] == period
+            and row["currency"] == code
+        )
+        if not ok:
+            failures += 1
+            if failures <= 10:
+                logging.error(f"Mismatch for {text!r}: got {row.to_dict()}, expected {(low, high, period, code)}")
+    for j, text in enumerate(negatives, start=len(generated)):
+        if parsed.iloc[j][SALARY_COLUMNS].notna().any():
+            failures += 1
+            logging.error(f"Non-salary text {text!r} parsed as {parsed.iloc[j].to_dict()}")
+
+    print(f"{len(texts):,} salary strings parsed in {elapsed * 1000:.1f} ms; {failures} mismatches")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse LinkedIn salary text.")
+    parser.add_argument("text", nargs="*", help="Salary strings to parse and print.")
+    parser.add_argument("--check", action="store_true", help="Run the generated-format self-check.")
+    parser.add_argument("--cases", type=int, default=5000, help="Generated strings for --check.")
+    args = parser.parse_args()
+
+    if args.text:
+        print(pd.concat([pd.Series(args.text, name="text"), parse_salary(pd.Series(args.text))], axis=1).to_string())
+    if args.check or not args.text:
+        raise SystemExit(1 if self_check(args.cases) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Score Cache
+═══════════
+Incremental alignment scoring for one search title.  Two levels:
+
+  1. incidence   which index inputs each job description contains (the
+                 automaton pass – the expensive part), keyed by
+                 (job URL, description hash, index term hash).  Reused
+                 across resume, supplementary-term and weight changes;
+                 only new or edited descriptions, or a change to the
+                 index terms / aliases, are matched again.
+  2. details     a score key per job – description hash + index hash +
+                 resume/supplementary hash + job title – and an
+                 append-only JSONL detail store.  Only jobs whose key
+                 changed get a new line; the last line per job wins and
+                 the file is compacted once stale lines outnumber live
+                 ones.
+
+Re-weighting every job from the cached incidence is vectorised (see
+``batch_scorer``), so a run costs matching + detail output for the new
+jobs only.
+
+    data/alignment/scores/<title>/
+        <title>_score_cache.npz          urls, hashes, score keys, CSR rows
+        <title>_alignment_detail.jsonl   {"job_url": ..., "score_key": ..., <result>}
+
+Usage:
+    cache = ScoreCache(jt_clean)
+    matrix, empty = cache.incidence(urls, descriptions, scorer, index_sha1)
+    changed = cache.changed(job_titles, index_sha1, resume_sha1)
+    cache.append_details(records for the changed rows)
+    cache.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from artifact_io import atomic_write
+from paths import alignment_scores_for
+from record_io import dumps
+
+COMPACT_RATIO = 2       # rewrite the JSONL once it holds 2× the live jobs' lines
+COMPACT_MIN_LINES = 1000
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def description_hashes(descriptions: Sequence[str]) -> np.ndarray:
+    """64-bit hash of each description."""
+    return np.fromiter((_digest(text) for text in descriptions), dtype=np.uint64, count=len(descriptions))
+
+
+def score_keys(desc_hashes: np.ndarray, job_titles: Sequence[str], *version_hashes: str) -> List[str]:
+    """Per-job key of everything a score depends on."""
+    versions = ":".join(version_hashes)
+    return [
+        hashlib.blake2b(f"{h}:{title}:{versions}".encode("utf-8"), digest_size=8).hexdigest()
+        for h, title in zip(desc_hashes.tolist(), job_titles)
+    ]
+
+
+class ScoreCache:
+    """Cached incidence rows and detail keys for one title's scored jobs."""
+
+    def __init__(self, job_title_clean: str, directory: Optional[str] = None):
+        directory = str(directory or alignment_scores_for(job_title_clean))
+        self.path = os.path.join(directory, f"{job_title_clean}_score_cache.npz")
+        self.detail_path = os.path.join(directory, f"{job_title_clean}_alignment_detail.jsonl")
+        self.index_sha1 = ""
+        self.urls: List[str] = []
+        self.desc_hashes = np.zeros(0, dtype=np.uint64)
+        self.keys: List[str] = []
+        self.matrix = sparse.csr_matrix((0, 0))
+        self.detail_lines = 0
+        self.reused = 0
+        self.matched = 0
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self.index_sha1 = str(data["index_sha1"])
+                self.urls = data["urls"].tolist()
+                self.desc_hashes = data["desc_hashes"]
+                self.keys = data["score_keys"].tolist()
+                self.matrix = sparse.csr_matrix(
+                    (np.ones(len(data["indices"])), data["indices"], data["indptr"]),
+                    shape=tuple(data["shape"]),
+                )
+                self.detail_lines = int(data["detail_lines"])
+        except Exception as e:
+            logging.warning("Could not read score cache %s (rescoring all jobs): %s", self.path, e)
+            self.index_sha1, self.urls, self.keys = "", [], []
+            self.desc_hashes = np.zeros(0, dtype=np.uint64)
+            self.matrix = sparse.csr_matrix((0, 0))
+
+    def save(self) -> None:
+        with atomic_write(self.path, "wb") as f:
+            np.savez(
+                f,
+                index_sha1=self.index_sha1,
+                urls=np.array(self.urls, dtype=str),
+                desc_hashes=self.desc_hashes,
+                score_keys=np.array(self.keys, dtype=str),
+                indptr=self.matrix.indptr,
+                indices=self.matrix.indices,
+                shape=np.array(self.matrix.shape),
+                detail_lines=self.detail_lines,
+            )
+
+    # ── level 1: incidence ────────────────────────────────────────────────
+
+    def incidence(self, urls: Sequence[str], descriptions: Sequence[str], scorer: Any,
+                  index_sha1: str) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """
+        Incidence matrix and empty-JD mask for the jobs, matching only
+        descriptions that are new, edited, or were matched against other
+        index terms.  *scorer* is a ``BatchScorer``.
+        """
+        hashes = description_hashes(descriptions)
+        n_inputs = len(scorer.inputs)
+        cached_row: Dict[str, int] = {}
+        if index_sha1 == self.index_sha1 and self.matrix.shape[1] == n_inputs:
+            cached_row = {url: row for row, url in enumerate(self.urls)}
+
+        reuse_at, reuse_from, fresh = [], [], []
+        for i, (url, h) in enumerate(zip(urls, hashes.tolist())):
+            row = cached_row.get(url) if url else None
+            if row is not None and int(self.desc_hashes[row]) == h:
+                reuse_at.append(i)
+                reuse_from.append(row)
+            else:
+                fresh.append(i)
+
+        new_rows, _ = scorer.incidence([descriptions[i] for i in fresh])
+        stacked = sparse.vstack([self.matrix[reuse_from] if reuse_from else sparse.csr_matrix((0, n_inputs)),
+                                 new_rows], format="csr")
+        order = np.empty(len(urls), dtype=np.int64)
+        order[np.array(reuse_at + fresh, dtype=np.int64)] = np.arange(len(urls))
+        matrix = stacked[order]
+        matrix.sort_indices()
+
+        self.reused, self.matched = len(reuse_at), len(fresh)
+        self.index_sha1 = index_sha1
+        self._pending = (list(urls), hashes, matrix)
+        return matrix, scorer.empty_mask(descriptions)
+
+    # ── level 2: score keys + JSONL details ───────────────────────────────
+
+    def changed(self, job_titles: Sequence[str], *version_hashes: str) -> List[Tuple[int, str]]:
+        """
+        (row, score key) of the jobs from the last ``incidence`` call whose
+        key differs from the stored one – the jobs needing a detail line.
+        *version_hashes* are the index and resume/supplementary hashes.
+        """
+        urls, hashes, matrix = self._pending
+        keys = score_keys(hashes, job_titles, *version_hashes)
+        stored = dict(zip(self.urls, self.keys)) if os.path.exists(self.detail_path) else {}
+        changed = [(i, key) for i, (url, key) in enumerate(zip(urls, keys)) if not url or stored.get(url) != key]
+        self.urls, self.desc_hashes, self.matrix, self.keys = urls, hashes, matrix, keys
+        return changed
+
+    def append_details(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Append detail records (each with job_url + score_key); compacts when mostly stale."""
+        written = 0
+        os.makedirs(os.path.dirname(self.detail_path), exist_ok=True)
+        with open(self.detail_path, "ab") as f:
+            for record in records:
+                f.write(dumps(record) + b"\n")
+                written += 1
+            f.flush()
+            os.fsync(f.fileno())
+        self.detail_lines += written
+        if self.detail_lines > max(COMPACT_MIN_LINES, COMPACT_RATIO * len(self.urls)):
+            self.compact()
+        return written
+
+    def details(self) -> Iterator[Dict[str, Any]]:
+        """Current detail record per job (the last line whose key is live)."""
+        if not os.path.exists(self.detail_path):
+            return
+        live = dict(zip(self.urls, self.keys))
+        latest: Dict[str, Dict[str, Any]] = {}
+        with open(self.detail_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue            # a torn last line from an interrupted append
+                if live.get(record.get("job_url")) == record.get("score_key"):
+                    latest[record["job_url"]] = record
+        for url in self.urls:
+            if url in latest:
+                yield latest[url]
+
+    def compact(self) -> None:
+        """Rewrite the JSONL with one line per live job."""
+        records = list(self.details())
+        with atomic_write(self.detail_path, "wb", lock=False) as f:
+            for record in records:
+                f.write(dumps(record) + b"\n")
+        logging.info("Compacted %s: %d → %d lines", os.path.basename(self.detail_path),
+                     self.detail_lines, len(records))
+        self.detail_lines = len(records)
@@ -0,0 +1,154 @@
+"""
+Seen Jobs
+═════════
+Persistent set of LinkedIn job IDs already collected, across all titles.
+
+Stored as one sorted ``int64`` numpy array (8 bytes per job, exact – no
+false positives), so membership for a whole page of cards is a single
+``np.searchsorted`` call.
+
+Used by ``job_search.scrape_job_data`` to stop paginating once a page is
+mostly jobs we already hold, turning daily runs into a delta fetch.  A job
+only counts as held once its details (with a real description) are scraped –
+``record_detailed_jobs`` is called after the detail journal is compacted –
+so a job cut off by the time budget or a crash is still found next run.
+
+Storage: ``data/search_results/seen_job_ids.npy``
+Seeded on first use from the job store, plus the master aggregated CSVs of
+titles it does not hold and the unified master.
+"""
+
+import glob
+import logging
+import os
+import sys
+from typing import Iterable, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from artifact_io import artifact_lock, atomic_write
+from job_extraction.detail_cache import has_description
+from job_extraction.job_store import JobStore
+from job_extraction.utils import extract_linkedin_job_id
+from paths import AGGREGATED_DIR, SEEN_JOB_IDS_NPY, UNIFIED_MASTER_CSV
+
+# Stop paginating when at least this fraction of a page's cards is already seen
+DEFAULT_SEEN_THRESHOLD = 0.8
+
+
+def job_ids_from_urls(urls: Iterable[str]) -> np.ndarray:
+    """Numeric job IDs for *urls* (URLs without an ID are skipped)."""
+    ids = [extract_linkedin_job_id(url) for url in urls]
+    return np.array([int(i) for i in ids if i], dtype=np.int64)
+
+
+class SeenJobSet:
+    """Sorted int64 array of job IDs with vectorised membership tests."""
+
+    def __init__(self, path: str = str(SEEN_JOB_IDS_NPY)):
+        self.path = path
+        self.ids = np.empty(0, dtype=np.int64)
+        self.load()
+
+    def __len__(self) -> int:
+        return int(self.ids.size)
+
+    # ── Persistence ───────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        if os.path.exists(self.path):
+            try:
+                self.ids = np.unique(np.load(self.path).astype(np.int64))
+                logging.info("Loaded %d seen job IDs from %s", len(self), self.path)
+                return
+            except Exception as e:
+                logging.warning("Could not read seen-job set %s: %s", self.path, e)
+        self.seed_from_aggregates()
+
+    def save(self) -> None:
+        """Union with the IDs on disk and write atomically (another run may have saved meanwhile)."""
+        with artifact_lock(self.path):
+            if os.path.exists(self.path):
+                try:
+                    self.add(np.load(self.path))
+                except Exception as e:
+                    logging.warning("Could not re-read seen-job set %s: %s", self.path, e)
+            with atomic_write(self.path, "wb") as f:
+                np.save(f, self.ids)
+        logging.info("Saved %d seen job IDs to %s", len(self), self.path)
+
+    def seed_from_aggregates(self) -> int:
+        """Add every job ID held in the job store and the master aggregated / unified CSVs."""
+        store = JobStore()
+        stored = store.titles()
+        before = len(self)
+        for title in stored:
+            try:
+                urls = store.read(title, columns=["job_url"], side=False)["job_url"].dropna().astype(str)
+            except Exception as e:
+                logging.debug("Skipping stored title %s while seeding seen jobs: %s", title, e)
+                continue
+            self.add(job_ids_from_urls(urls))
+        # Titles the store holds are current there; their master CSV may be stale
+        paths: List[str] = sorted(
+            path for path in glob.glob(str(AGGREGATED_DIR / "*" / "*_master_aggregated.csv"))
+            if os.path.basename(os.path.dirname(path)) not in stored
+        )
+        if UNIFIED_MASTER_CSV.exists():
+            paths.append(str(UNIFIED_MASTER_CSV))
+        for path in paths:
+            try:
+                urls = pd.read_csv(path, usecols=["job_url"])["job_url"].dropna().astype(str)
+            except Exception as e:
+                logging.debug("Skipping %s while seeding seen jobs: %s", path, e)
+                continue
+            self.add(job_ids_from_urls(urls))
+        added = len(self) - before
+        if added:
+            logging.info("Seeded seen-job set with %d IDs from %d stored title(s) and %d aggregate file(s)",
+                         added, len(stored), len(paths))
+        return added
+
+    # ── Membership ────────────────────────────────────────────────────────
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        """Boolean mask: which of *ids* are already seen."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not self.ids.size or not ids.size:
+            return np.zeros(ids.shape, dtype=bool)
+        pos = np.searchsorted(self.ids, ids)
+        pos[pos >= self.ids.size] = 0
+        return self.ids[pos] == ids
+
+    def seen_fraction(self, urls: Iterable[str]) -> Optional[float]:
+        """Fraction of *urls* already seen (``None`` if none carry a job ID)."""
+        ids = job_ids_from_urls(urls)
+        if not ids.size:
+            return None
+        return float(self.contains(ids).mean())
+
+    def add(self, ids: Iterable[int]) -> None:
+        ids = np.asarray(list(ids) if not isinstance(ids, np.ndarray) else ids, dtype=np.int64)
+        if ids.size:
+            self.ids = np.union1d(self.ids, ids)
+
+    def add_urls(self, urls: Iterable[str]) -> None:
+        self.add(job_ids_from_urls(urls))
+
+
+def record_detailed_jobs(details_df: pd.DataFrame, path: str = str(SEEN_JOB_IDS_NPY)) -> int:
+    """Add the jobs in *details_df* that carry a description to the seen set; returns how many."""
+    if details_df is None or details_df.empty or not {"job_url", "description"} <= set(details_df.columns):
+        return 0
+    # Failed scrapes keep the "-" placeholder; they must stay unseen so the next run retries them
+    described = has_description(details_df["description"])
+    ids = job_ids_from_urls(details_df.loc[described, "job_url"].dropna().astype(str))
+    if not ids.size:
+        return 0
+    seen = SeenJobSet(path)
+    seen.add(ids)
+    seen.save()
+    return int(ids.size)
@@ -0,0 +1,138 @@
+"""
+Unified Manifest
+════════════════
+Per-title version vector for the cross-title ``unified_master.csv``, so a
+rebuild re-reads only the titles whose inputs changed since the last build.
+
+A title's inputs are its ``<title>_master_aggregated.csv`` plus its job
+store side tables (scores, optimised resume paths).  A title counts as
+changed when a file's size or mtime differ AND the master's content hash
+or a side table's stat differ.  Each change bumps the title's version.
+
+The manifest also records the unified column set; a changed title that
+brings new columns forces a full rebuild.
+
+    data/aggregated/_unified_manifest.json
+    {"builds": 12, "columns": [...],
+     "titles": {"<title>": {"version": 3, "size": ..., "mtime": ...,
+                            "sha1": "...", "side": {...}, "rows": 812}}}
+
+Usage:
+    manifest = UnifiedManifest()
+    changed = manifest.changed(sources)      # {title: master_csv}
+    ...merge the changed titles...
+    manifest.mark(title, master_csv, rows=len(df))
+    manifest.save(list(unified.columns), mode="incremental")
+"""
+
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from artifact_io import write_json
+from job_extraction.ingest_manifest import file_sha1
+from job_extraction.job_store import JobStore
+from paths import UNIFIED_MANIFEST_JSON
+
+
+class UnifiedManifest:
+    """Version vector of the per-title inputs merged into the unified master."""
+
+    def __init__(self, path: Optional[str] = None, store: Optional[JobStore] = None):
+        self.path = path or str(UNIFIED_MANIFEST_JSON)
+        self.store = store or JobStore()
+        self.builds = 0
+        self.columns: List[str] = []
+        self._titles: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, str] = {}   # hashes computed this run
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            self.builds = int(payload.get("builds", 0))
+            self.columns = list(payload.get("columns", []))
+            self._titles = payload.get("titles", {})
+        except Exception as e:
+            logging.warning("Could not read unified manifest %s (full rebuild): %s", self.path, e)
+            self.builds, self.columns, self._titles = 0, [], {}
+
+    def save(self, columns: List[str], mode: str) -> None:
+        self.builds += 1
+        self.columns = list(columns)
+        payload = {
+            "updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "builds": self.builds,
+            "last_mode": mode,
+            "columns": self.columns,
+            "titles": self._titles,
+        }
+        write_json(self.path, payload)
+
+    @property
+    def titles(self) -> List[str]:
+        return sorted(self._titles)
+
+    def versions(self) -> Dict[str, int]:
+        """The version vector: title → number of changes merged so far."""
+        return {title: entry.get("version", 0) for title, entry in sorted(self._titles.items())}
+
+    def forget(self, title: str) -> None:
+        self._titles.pop(title, None)
+
+    # ── change detection ──────────────────────────────────────────────────
+
+    def _hash(self, path: str) -> str:
+        if path not in self._hashes:
+            self._hashes[path] = file_sha1(path)
+        return self._hashes[path]
+
+    def _side_state(self, title: str) -> Dict[str, List[float]]:
+        state = {}
+        for table, path in self.store.side_paths(title).items():
+            stat = path.stat()
+            state[table] = [stat.st_size, stat.st_mtime]
+        return state
+
+    def changed(self, sources: Dict[str, str]) -> List[str]:
+        """Titles in *sources* (title → master CSV) that are new or changed."""
+        out = []
+        for title, path in sorted(sources.items()):
+            entry = self._titles.get(title)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if entry is None or entry.get("side", {}) != self._side_state(title):
+                out.append(title)
+                continue
+            if entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime:
+                continue
+            if entry.get("sha1") == self._hash(path):
+                # Touched but identical: refresh the stat so it is not hashed again
+                entry.update({"size": stat.st_size, "mtime": stat.st_mtime})
+                continue
+            out.append(title)
+        return out
+
+    def mark(self, title: str, path: str, rows: Optional[int] = None) -> None:
+        """Record *title* as merged in its current state, bumping its version."""
+        stat = os.stat(path)
+        entry = self._titles.get(title, {})
+        self._titles[title] = {
+            "version": entry.get("version", 0) + 1,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "sha1": self._hash(path),
+            "side": self._side_state(title),
+            "rows": rows,
+            "merged_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
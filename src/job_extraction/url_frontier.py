@@ -0,0 +1,173 @@
+"""
+URL Frontier
+════════════
+Multi-title search support: run several title searches concurrently and
+funnel every discovered posting into ONE frontier deduplicated by
+LinkedIn job ID.
+
+  • Each posting is detail-scraped once, however many titles found it
+  • ``search_titles`` records every title whose search returned the
+    posting, so the merge step can attribute it to each of them
+  • Total detail work scales with unique postings, not titles × postings
+
+Titles come from ``config/search_titles.json``:
+
+    {
+      "titles": ["marketing analytics", "marketing analytics manager"],
+      "search_params": {"salary_range": 160000, "job_type": "full_time",
+                        "search_type": "exact", "work_geo_codes": ["2"]},
+      "max_concurrent_searches": 3
+    }
+
+``search_params`` is optional (prompted once when absent).
+
+Usage:
+    config = load_search_titles()
+    frontier = run_multi_title_search(config["titles"], config["search_params"])
+    links = frontier.links()
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from job_extraction.utils import extract_linkedin_job_id
+from paths import SEARCH_TITLES_JSON
+
+DEFAULT_MAX_CONCURRENT_SEARCHES = 3
+TITLE_SEPARATOR = "|"
+
+
+def load_search_titles(path: str = str(SEARCH_TITLES_JSON)) -> Dict[str, Any]:
+    """Read the multi-title search config (titles deduplicated, order kept)."""
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    titles = [t.strip() for t in config.get("titles", []) if t and t.strip()]
+    titles = list(dict.fromkeys(titles))
+    if not titles:
+        raise ValueError(f"No titles listed in {path}")
+    return {
+        "titles": titles,
+        "search_params": config.get("search_params") or None,
+        "max_concurrent_searches": int(config.get("max_concurrent_searches", DEFAULT_MAX_CONCURRENT_SEARCHES)),
+    }
+
+
+def frontier_key(url: str) -> str:
+    """Job ID when the URL carries one, else the URL itself."""
+    return extract_linkedin_job_id(url) or str(url)
+
+
+class UrlFrontier:
+    """Thread-safe, job-ID-deduplicated set of search cards with title attribution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cards: Dict[str, Dict[str, Any]] = {}     # key → first card seen
+        self._titles: Dict[str, List[str]] = {}         # key → titles that found it
+        self.cards_added = 0
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def add(self, job_title: str, df: pd.DataFrame) -> int:
+        """Add one title's search results; returns how many postings were new."""
+        if df is None or df.empty or "job_url" not in df.columns:
+            return 0
+        new = 0
+        with self._lock:
+            for card in df.dropna(subset=["job_url"]).to_dict("records"):
+                key = frontier_key(card["job_url"])
+                self.cards_added += 1
+                if key not in self._cards:
+                    self._cards[key] = card
+                    self._titles[key] = []
+                    new += 1
+                if job_title not in self._titles[key]:
+                    self._titles[key].append(job_title)
+        return new
+
+    def links(self) -> List[str]:
+        """Unique job URLs in discovery order."""
+        with self._lock:
+            return [card["job_url"] for card in self._cards.values()]
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per unique posting, with a ``search_titles`` column."""
+        with self._lock:
+            rows = [
+                {**card, "search_titles": TITLE_SEPARATOR.join(self._titles[key])}
+                for key, card in self._cards.items()
+            ]
+        return pd.DataFrame(rows)
+
+    def log_stats(self) -> None:
+        if not self.cards_added:
+            return
+        logging.info(
+            f"URL frontier: {self.cards_added} cards from all titles → {len(self)} unique postings "
+            f"({self.cards_added - len(self)} cross-title duplicates skipped)"
+        )
+
+
+def cards_for_title(frontier_df: pd.DataFrame, job_title: str) -> pd.DataFrame:
+    """Rows of a frontier frame attributed to *job_title*."""
+    if frontier_df.empty or "search_titles" not in frontier_df.columns:
+        return frontier_df.iloc[0:0]
+    mask = frontier_df["search_titles"].astype(str).str.split(TITLE_SEPARATOR).apply(lambda ts: job_title in ts)
+    return frontier_df[mask]
+
+
+def run_multi_title_search(
+    titles: List[str],
+    search_params: Dict[str, Any],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_SEARCHES,
+    frontier: Optional[UrlFrontier] = None,
+) -> UrlFrontier:
+    """Search every title concurrently (one Chrome each) into a shared frontier.
+
+    Each title still gets its own search-results CSV/JSON, as with a
+    single-title run.  A title whose search fails is logged and skipped.
+    """
+    # Imported here so the frontier helpers stay usable without Selenium
+    from job_extraction.job_search import prepare_search_driver, run_search, setup_driver
+    from job_extraction.driver_utils import cleanup_driver
+    from job_extraction.seen_jobs import SeenJobSet
+
+    frontier = frontier or UrlFrontier()
+    seen = SeenJobSet()   # shared read-only; IDs are added once details are scraped
+
+    def _search(index: int, job_title: str) -> int:
+        driver = setup_driver(profile_name=f"linkedin_job_search_{index}")
+        try:
+            prepare_search_driver(driver)
+            df, _, _ = run_search(job_title, search_params, driver=driver, seen=seen)
+        finally:
+            try:
+                cleanup_driver(driver)
+            except Exception as e:
+                logging.error(f"Error closing driver for '{job_title}': {e}")
+        return frontier.add(job_title, df)
+
+    workers = max(1, min(max_concurrent, len(titles)))
+    logging.info(f"Searching {len(titles)} titles with {workers} concurrent browser(s)")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search") as pool:
+        futures = {pool.submit(_search, i, title): title for i, title in enumerate(titles)}
+        for future in as_completed(futures):
+            title = futures[future]
+            try:
+                new = future.result()
+                logging.info(f"Search '{title}' finished: {new} new unique postings")
+            except Exception as e:
+                logging.error(f"Search '{title}' failed: {e}")
+
+    frontier.log_stats()
+    return frontier
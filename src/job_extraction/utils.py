@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import re
 from pathlib import Path
 
 # Default cookie path is config/linkedin_cookies.txt
@@ -39,4 +40,19 @@ def load_cookie_data(cookie_file=None):
         raise
     except Exception as e:
         logging.error(f"Unexpected error loading cookies: {e}")
-        raise
\ No newline at end of file
+        raise
+
+_JOB_ID_PATTERNS = [
+    re.compile(r"/jobs/view/(?:[^/?#]*?-)?(\d{6,})"),
+    re.compile(r"[?&](?:currentJobId|jobId)=(\d{6,})"),
+]
+
+def extract_linkedin_job_id(url):
+    """Return the numeric LinkedIn job ID from a job URL, or None."""
+    if not url or not isinstance(url, str):
+        return None
+    for pattern in _JOB_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
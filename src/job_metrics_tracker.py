@@ -1,3 +1,22 @@
+"""
+Job Metrics Tracker
+═══════════════════
+Records search runs and the jobs they collected in the job database.
+
+Each run is one INSERT into the append-only ``runs`` table – constant work
+per run, and concurrent pipelines (threads or processes) each add their
+own row under SQLite's WAL locking instead of rewriting a shared file.
+Runs older than ``RUN_RETENTION_DAYS`` are periodically folded into
+per-day ``run_rollups``; per-title rollups are computed on demand from
+both.
+
+CLI:
+    python src/job_metrics_tracker.py                     # per-title search rollup
+    python src/job_metrics_tracker.py --job_title "marketing analytics"
+    python src/job_metrics_tracker.py --compact 90        # fold runs older than 90 days
+"""
+
+import argparse
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -9,6 +28,7 @@ import logging
 import uuid
 
 from paths import METRICS_DIR
+from job_db import RUN_RETENTION_DAYS, JobDB, get_job_db
 
 # Configure logging
 logging.basicConfig(
@@ -22,9 +42,15 @@ def generate_unique_id() -> str:
     return str(uuid.uuid4())
 
 class JobMetricsTracker:
-    def __init__(self, base_dir: str = None):
+    """Run metrics and per-title collected jobs, recorded in the job database
+    (``runs`` and ``jobs`` tables) instead of ever-growing CSVs."""
+
+    KIND = "search"
+
+    def __init__(self, base_dir: str = None, db: Optional[JobDB] = None):
         self.base_dir = Path(base_dir) if base_dir else METRICS_DIR
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.db = db or get_job_db()
     
     def save_run_metrics(self, 
                         job_title: str,
@@ -33,35 +59,19 @@ class JobMetricsTracker:
                         job_type: str,
                         search_type: str,
                         geography: str) -> str:
-        """Save metrics for a single job collection run."""
+        """Save metrics for a single job collection run; returns the run ID."""
         try:
-            # Create metrics data with unique ID
-            metrics_data = {
-                'run_id': generate_unique_id(),
-                'date_of_run': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'job_title_input': job_title,
-                'total_jobs_collected': total_jobs,
-                'job_title': job_title,
-                'salary_range': salary_range,
-                'job_type_setting': job_type,
-                'search_type': search_type,
-                'geography': geography
-            }
-            
-            # Create or update metrics file
-            metrics_file = self.base_dir / f"{job_title.lower().replace(' ', '_')}_job_run_metrics.csv"
-            
-            if metrics_file.exists():
-                existing_df = pd.read_csv(metrics_file)
-                updated_df = pd.concat([existing_df, pd.DataFrame([metrics_data])], ignore_index=True)
-            else:
-                updated_df = pd.DataFrame([metrics_data])
-            
-            # Save metrics
-            updated_df.to_csv(metrics_file, index=False)
-            logging.info(f"Saved run metrics to {metrics_file}")
-            
-            return str(metrics_file)
+            run_id = self.db.record_run(
+                self.KIND, job_title, "completed",
+                run_id=generate_unique_id(),
+                total_jobs=total_jobs,
+                salary_range=salary_range,
+                job_type=job_type,
+                search_type=search_type,
+                geography=geography,
+            )
+            logging.info(f"Saved run metrics for '{job_title}' (run {run_id}) to {self.db.path}")
+            return run_id
             
         except Exception as e:
             logging.error(f"Error saving run metrics: {e}")
@@ -70,49 +80,55 @@ class JobMetricsTracker:
     def update_jobs_aggregation(self,
                               job_title: str,
                               new_jobs: List[Dict]) -> str:
-        """Update the aggregated jobs file with new job records."""
+        """Record collected jobs for *job_title* (jobs already known are refreshed, not duplicated)."""
         try:
-            # Prepare new jobs data with unique IDs
-            new_jobs_data = []
             collection_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            jobs_df = pd.DataFrame(new_jobs)
+            if jobs_df.empty:
+                return str(self.db.path)
+            if 'date_extracted' not in jobs_df.columns:
+                jobs_df['date_extracted'] = collection_date
             
-            for job in new_jobs:
-                job_data = {
-                    'job_id': generate_unique_id(),
-                    'job_title_input': job_title,
-                    'job_title_collected': job.get('job_title', ''),
-                    'company_name': job.get('company_name', ''),
-                    'date_of_collection': collection_date,
-                    'job_url': job.get('job_url', ''),
-                    'location': job.get('location', ''),
-                    'salary_range': job.get('salary_range', ''),
-                    'job_type': job.get('job_type', '')
-                }
-                new_jobs_data.append(job_data)
-            
-            # Create or update aggregation file
-            agg_file = self.base_dir / f"{job_title.lower().replace(' ', '_')}_individual_jobs_agg.csv"
-            
-            if agg_file.exists():
-                existing_df = pd.read_csv(agg_file)
-                # Remove duplicates based on job_url if it exists
-                if 'job_url' in existing_df.columns:
-                    new_jobs_df = pd.DataFrame(new_jobs_data)
-                    # Only add jobs that don't exist (based on URL)
-                    existing_urls = set(existing_df['job_url'].dropna())
-                    new_jobs_df = new_jobs_df[~new_jobs_df['job_url'].isin(existing_urls)]
-                    updated_df = pd.concat([existing_df, new_jobs_df], ignore_index=True)
-                else:
-                    updated_df = pd.concat([existing_df, pd.DataFrame(new_jobs_data)], ignore_index=True)
-            else:
-                updated_df = pd.DataFrame(new_jobs_data)
+            job_title_clean = job_title.lower().replace(' ', '_')
+            added = self.db.upsert_jobs(job_title_clean, jobs_df)
+            self.db.upsert_details(jobs_df)
+            logging.info(f"Updated jobs aggregation for '{job_title}': {added} new of {len(jobs_df)} in {self.db.path}")
             
-            # Save aggregated data
-            updated_df.to_csv(agg_file, index=False)
-            logging.info(f"Updated jobs aggregation in {agg_file}")
-            
-            return str(agg_file)
+            return str(self.db.path)
             
         except Exception as e:
             logging.error(f"Error updating jobs aggregation: {e}")
-            raise 
\ No newline at end of file
+            raise
+
+    def rollup(self, job_title: Optional[str] = None) -> pd.DataFrame:
+        """Per-title search totals: runs, jobs found, average per run, first / last run."""
+        return self.db.run_rollup(self.KIND, job_title)
+
+    def history(self, job_title: str) -> pd.DataFrame:
+        """Uncompacted runs for *job_title*, oldest first."""
+        return self.db.runs(job_title=job_title, kind=self.KIND)
+
+    def compact(self, older_than_days: int = RUN_RETENTION_DAYS) -> int:
+        """Fold runs older than *older_than_days* into the per-day rollups."""
+        return self.db.compact_runs(older_than_days)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show per-title search run metrics.")
+    parser.add_argument("--job_title", help="Only this title.")
+    parser.add_argument("--compact", type=int, metavar="DAYS", default=None,
+                        help="First fold runs older than DAYS into per-day rollups.")
+    args = parser.parse_args()
+
+    tracker = JobMetricsTracker()
+    if args.compact is not None:
+        tracker.compact(args.compact)
+    rollup = tracker.rollup(args.job_title)
+    if rollup.empty:
+        print("No search runs recorded.")
+    else:
+        print(rollup.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,15 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import logging
-import subprocess
-import glob
-from datetime import datetime
+import argparse
 
-from paths import (
-    SEARCH_RESULTS_DIR, JOBS_RAN_CSV,
-    search_results_for,
+from job_db import get_job_db
+from job_extraction.job_search import get_search_parameters
+from job_extraction.url_frontier import load_search_titles
+from pipeline_runner import (
+    MULTI_TITLE_LABEL, PipelineContext, PipelineRunner, STAGE_NAMES,
+    build_default_stages, build_multi_title_stages, latest_run_id,
 )
-from job_extraction.jd_insights import run_jd_insights
-from job_extraction.master_job_title import ensure_master_job_title
-from job_extraction.input_index_generator import generate_or_load_index
-from job_extraction.jd_term_extractor import enrich_index_from_jds
-from job_extraction.alignment_scorer import score_all_jobs
-from auto_application.resume_optimizer import run_resume_optimisation
 
 # Configure logging
 logging.basicConfig(
@@ -24,191 +19,110 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
-def ensure_jobs_ran_file_exists():
-    """Create jobs_ran.csv if it doesn't exist."""
-    log_dir = str(SEARCH_RESULTS_DIR)
-    log_file = str(JOBS_RAN_CSV)
-    
-    # Create directory if it doesn't exist
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Create file with headers if it doesn't exist
-    if not os.path.exists(log_file):
-        with open(log_file, 'w') as f:
-            f.write("timestamp,job_keyword,search_status\n")
-        logging.info(f"Created new jobs_ran.csv file at {log_file}")
-
-def find_latest_csv(job_title, search_folder=None):
-    """Find the latest CSV file for a given job title."""
-    try:
-        # Clean job title for filename matching
-        job_title_clean = job_title.lower().replace(' ', '_')
-        
-        # Look in the job-specific subdirectory
-        if search_folder is None:
-            search_folder = str(SEARCH_RESULTS_DIR)
-        job_folder = os.path.join(search_folder, job_title_clean)
-        
-        # Get all matching CSV files from the subdirectory
-        pattern = os.path.join(job_folder, f"{job_title_clean}__*.csv")
-        matching_files = glob.glob(pattern)
-        
-        if not matching_files:
-            raise FileNotFoundError(f"No CSV files found for job title: {job_title} in {job_folder}")
-            
-        # Get the most recent file
-        latest_file = max(matching_files, key=os.path.getctime)
-        logging.info(f"Found latest CSV file: {latest_file}")
-        return latest_file
-        
-    except Exception as e:
-        logging.error(f"Error finding latest CSV: {e}")
-        raise
-
 def record_job_search(job_title, status="completed"):
-    """Record a job search in the jobs_ran.csv file."""
-    log_file = str(JOBS_RAN_CSV)
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(log_file, 'a') as f:
-        f.write(f"{timestamp},{job_title},{status}\n")
+    """Record a job search as a pipeline run in the job database."""
+    get_job_db().record_run("pipeline", job_title, status)
     logging.info(f"Recorded job search for '{job_title}' with status '{status}'")
 
 
-def run_job_search_pipeline():
-    """Run the complete job search pipeline."""
+def run_job_search_pipeline(job_title=None, from_stage=None, run_id=None, workers=1, time_budget=None):
+    """Run the complete job search pipeline in-process.
+
+    Stages (search → details → merge → insights → alignment → resume) share
+    one Chrome driver and hand DataFrames to each other directly.  Pass
+    *from_stage* to re-run from a later stage using the outputs persisted
+    by *run_id* (default: the latest run for *job_title*).  *time_budget*
+    caps the details stage in minutes (most relevant jobs first).
+    """
     try:
         logging.info("Starting job search pipeline...")
         
-        # Ensure jobs_ran.csv exists
-        ensure_jobs_ran_file_exists()
-        
         # Prompt for job title if not provided
-        job_title = input("Enter the job title to search for: ").strip()
+        if not job_title:
+            job_title = input("Enter the job title to search for: ").strip()
+        
+        search_params = None
+        if from_stage and from_stage != STAGE_NAMES[0]:
+            run_id = run_id or latest_run_id(job_title)
+            if not run_id:
+                raise FileNotFoundError(f"No previous pipeline run found for '{job_title}' to resume from")
+            logging.info(f"Re-running from stage '{from_stage}' using run {run_id}")
+        else:
+            # Search parameters are only needed when the search stage runs
+            search_params = get_search_parameters()
         
-        # PIPELINE 1: Run job search
-        logging.info("PIPELINE 1: Running the JOB SEARCH pipeline:")
-        cmd = ['python3', './src/job_extraction/job_search.py', '--job_title', job_title]
+        ctx = PipelineContext(job_title, search_params, run_id=run_id, workers=workers,
+                              time_budget=time_budget)
+        runner = PipelineRunner(build_default_stages(), ctx)
+        try:
+            runner.run(from_stage=from_stage)
+        finally:
+            search_status = runner.manifest["stages"].get("search", {}).get("status")
+            if search_status and (not from_stage or from_stage == STAGE_NAMES[0]):
+                record_job_search(job_title, search_status)
         
-        result = subprocess.run(
-            cmd,
-            stdin=None,
-            stdout=None,
-            stderr=None,
-        )
+        logging.info("Job search pipeline completed")
         
-        if result.returncode != 0:
-            record_job_search(job_title, "failed")
-            raise subprocess.CalledProcessError(result.returncode, cmd)
+    except Exception as e:
+        logging.error(f"Pipeline error: {e}")
+        raise
+
+def run_multi_title_pipeline(config_path=None, from_stage=None, run_id=None, workers=1, time_budget=None):
+    """Search every title in config/search_titles.json concurrently, then
+    detail-scrape each unique posting once and merge it into every title
+    that found it."""
+    try:
+        logging.info("Starting multi-title job search pipeline...")
         
-        # Record successful search
-        record_job_search(job_title, "completed")
+        config = load_search_titles(config_path) if config_path else load_search_titles()
+        titles = config["titles"]
+        logging.info(f"Titles: {', '.join(titles)}")
         
-        # Get the job title that was used (from the latest run in jobs_ran.csv)
-        log_file = str(JOBS_RAN_CSV)
-        logging.info(f"Looking for log file at: {log_file}")
+        search_params = config["search_params"]
+        if from_stage and from_stage != STAGE_NAMES[0]:
+            run_id = run_id or latest_run_id(MULTI_TITLE_LABEL)
+            if not run_id:
+                raise FileNotFoundError("No previous multi-title pipeline run found to resume from")
+            logging.info(f"Re-running from stage '{from_stage}' using run {run_id}")
+        elif not search_params:
+            search_params = get_search_parameters()
         
-        if os.path.exists(log_file):
-            logging.info("Found jobs_ran.csv file")
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                logging.info(f"Found {len(lines)} lines in jobs_ran.csv")
-                if len(lines) > 1:  # Header + at least one entry
-                    last_line = lines[-1]
-                    logging.info(f"Last line from jobs_ran.csv: {last_line.strip()}")
-                    job_title = last_line.split(',')[1]  # Assuming job_keyword is second column
-                    logging.info(f"Extracted job title: {job_title}")
-                    
-                    # Find the latest CSV file for this job title
-                    try:
-                        latest_csv = find_latest_csv(job_title)
-                        logging.info(f"Found latest CSV file: {latest_csv}")
-                        
-                        # PIPELINE 2: Run URL details collection
-                        logging.info("PIPELINE 2: Running the JOB URL DETAILS pipeline:")
-                        cmd = ['python3', './src/job_extraction/job_url_details.py', '--job_title', job_title, '--filename', latest_csv]
-                        logging.info(f"Running command: {' '.join(cmd)}")
-                        
-                        result = subprocess.run(
-                            cmd,
-                            stdin=None,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True
-                        )
-                        
-                        if result.returncode != 0:
-                            logging.error(f"Pipeline 2 failed with output: {result.stdout}\nError: {result.stderr}")
-                            raise subprocess.CalledProcessError(result.returncode, cmd)
-                        else:
-                            logging.info("Pipeline 2 completed successfully")
-                            
-                            # PIPELINE 3: Merge job details
-                            logging.info("PIPELINE 3: Running the JOB DETAILS MERGE pipeline:")
-                            cmd = ['python3', './src/job_extraction/merge_job_details.py', '--job_title', job_title]
-                            logging.info(f"Running command: {' '.join(cmd)}")
-                            
-                            result = subprocess.run(
-                                cmd,
-                                stdin=None,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True
-                            )
-                            
-                            if result.returncode != 0:
-                                logging.error(f"Pipeline 3 failed with output: {result.stdout}\nError: {result.stderr}")
-                                raise subprocess.CalledProcessError(result.returncode, cmd)
-                            else:
-                                logging.info("Pipeline 3 completed successfully")
-                                
-                                # PIPELINE 5: Aggregated JD Insights
-                                logging.info("PIPELINE 5: Running the JD INSIGHTS pipeline:")
-                                try:
-                                    insights_path = run_jd_insights(job_title)
-                                    if insights_path:
-                                        logging.info(f"Pipeline 5 completed – insights: {insights_path}")
-                                    else:
-                                        logging.warning("Pipeline 5 produced no new insights (may already be up to date)")
-                                except Exception as e:
-                                    logging.error(f"Pipeline 5 (JD Insights) failed: {e}")
-                                    logging.info("Continuing to next pipeline...")
-                                
-                                # PIPELINE 5.5: Job Alignment Scoring
-                                logging.info("PIPELINE 5.5: Running the JOB ALIGNMENT SCORING pipeline:")
-                                try:
-                                    master_title = ensure_master_job_title()
-                                    alignment_index = generate_or_load_index(master_title)
-                                    alignment_index = enrich_index_from_jds(alignment_index, job_title)
-                                    n_scored = score_all_jobs(alignment_index, job_title)
-                                    logging.info(f"Pipeline 5.5 completed – {n_scored} jobs scored")
-                                except Exception as e:
-                                    logging.error(f"Pipeline 5.5 (Alignment Scoring) failed: {e}")
-                                    logging.info("Continuing to next pipeline...")
-                                
-                                # PIPELINE 6: JD-Based Resume Optimisation
-                                logging.info("PIPELINE 6: Running the RESUME OPTIMISATION pipeline:")
-                                try:
-                                    n_optimised = run_resume_optimisation(job_title)
-                                    logging.info(f"Pipeline 6 completed – {n_optimised} resumes optimised")
-                                except Exception as e:
-                                    logging.error(f"Pipeline 6 (Resume Optimisation) failed: {e}")
-                                    logging.info("Continuing...")
-                                
-                                logging.info("Job search pipeline completed successfully")
-                    except FileNotFoundError as e:
-                        logging.error(f"Could not find CSV file: {e}")
-                    except Exception as e:
-                        logging.error(f"Error in Pipeline 2 or 3: {e}")
-                else:
-                    logging.error("No job entries found in jobs_ran.csv")
-        else:
-            logging.error(f"Log file not found at {log_file}")
+        ctx = PipelineContext(MULTI_TITLE_LABEL, search_params, run_id=run_id, workers=workers, titles=titles,
+                              max_concurrent_searches=config["max_concurrent_searches"],
+                              time_budget=time_budget)
+        runner = PipelineRunner(build_multi_title_stages(), ctx)
+        try:
+            runner.run(from_stage=from_stage)
+        finally:
+            search_status = runner.manifest["stages"].get("search", {}).get("status")
+            if search_status and (not from_stage or from_stage == STAGE_NAMES[0]):
+                for title in titles:
+                    record_job_search(title, search_status)
         
-        logging.info("Job search pipeline completed")
+        logging.info("Multi-title job search pipeline completed")
         
     except Exception as e:
         logging.error(f"Pipeline error: {e}")
         raise
 
 if __name__ == "__main__":
-    run_job_search_pipeline()
+    parser = argparse.ArgumentParser(description="Run the get-jobs pipeline.")
+    parser.add_argument("--job_title", default=None, help="Job title to search for (prompted if omitted).")
+    parser.add_argument("--from_stage", choices=STAGE_NAMES, default=None,
+                        help="Re-run from this stage, reusing earlier outputs from --run_id.")
+    parser.add_argument("--run_id", default=None,
+                        help="Pipeline run to resume (default: latest run for the job title).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parallel Chrome drivers for the details stage (default: 1, shares the search driver).")
+    parser.add_argument("--time_budget", type=float, default=None,
+                        help="Minutes for the details stage; most relevant jobs are detailed first.")
+    parser.add_argument("--multi_title", nargs="?", const="", default=None, metavar="CONFIG",
+                        help="Search every title in config/search_titles.json (or CONFIG) concurrently.")
+    args = parser.parse_args()
+    
+    if args.multi_title is not None:
+        run_multi_title_pipeline(args.multi_title or None, from_stage=args.from_stage,
+                                 run_id=args.run_id, workers=args.workers, time_budget=args.time_budget)
+    else:
+        run_job_search_pipeline(args.job_title, from_stage=args.from_stage,
+                                run_id=args.run_id, workers=args.workers, time_budget=args.time_budget)
@@ -27,6 +27,7 @@ SEARCH_RESULTS_DIR  = DATA_DIR / "search_results"
 JOB_DETAILS_DIR     = DATA_DIR / "job_details"
 AGGREGATED_DIR      = DATA_DIR / "aggregated"
 METRICS_DIR         = DATA_DIR / "metrics"
+TELEMETRY_DIR       = METRICS_DIR / "wait_telemetry"
 APPLICATION_LOGS_DIR = DATA_DIR / "application_logs"
 DEBUG_DIR           = DATA_DIR / "debug"
 ANALYSIS_DIR        = DATA_DIR / "analysis"
@@ -36,15 +37,25 @@ OPTIMIZED_RESUMES_DIR   = DATA_DIR / "optimized_resumes"
 ALIGNMENT_DIR           = DATA_DIR / "alignment"
 ALIGNMENT_SCORES_DIR    = ALIGNMENT_DIR / "scores"
 MASTER_INPUT_INDEX      = ALIGNMENT_DIR / "master_input_index.json"
+RESUME_COVERAGE_JSON    = ALIGNMENT_DIR / "resume_coverage.json"
+PIPELINE_RUNS_DIR       = DATA_DIR / "pipeline_runs"
+JOB_STORE_DIR           = DATA_DIR / "job_store"
+JOB_DB                  = DATA_DIR / "jobs.db"
 
 # ── Config (alignment inputs) ─────────────────────────────────────────────
 MASTER_JOB_TITLE_JSON   = CONFIG_DIR / "master_job_title.json"
 SUPPLEMENTARY_TERMS     = CONFIG_DIR / "supplementary_terms.json"
+SEARCH_TITLES_JSON      = CONFIG_DIR / "search_titles.json"
 
 # ── Tracking files ─────────────────────────────────────────────────────────
 JOBS_RAN_CSV        = SEARCH_RESULTS_DIR / "jobs_ran.csv"
+SEEN_JOB_IDS_NPY    = SEARCH_RESULTS_DIR / "seen_job_ids.npy"
 APPLICATIONS_CSV    = APPLICATION_LOGS_DIR / "applications.csv"
 UNIFIED_MASTER_CSV  = AGGREGATED_DIR / "unified_master.csv"
+UNIFIED_MANIFEST_JSON = AGGREGATED_DIR / "_unified_manifest.json"
+NEAR_DUPLICATE_INDEX = AGGREGATED_DIR / "_near_duplicates.npz"
+DETAIL_CACHE_JSONL  = JOB_DETAILS_DIR / "_detail_cache.jsonl"
+DETAIL_CACHE_JSON   = JOB_DETAILS_DIR / "_detail_cache.json"   # legacy, migrated on load
 
 
 # ── Helper to get per-title subdirectories ─────────────────────────────────
@@ -64,6 +75,14 @@ def insights_for(job_title_clean: str) -> Path:
     """data/insights/<title>/"""
     return INSIGHTS_DIR / job_title_clean
 
+def ingest_manifest_for(job_title_clean: str) -> Path:
+    """data/aggregated/<title>/_ingest_manifest.json"""
+    return aggregated_for(job_title_clean) / "_ingest_manifest.json"
+
+def detail_cache_manifest_for(job_title_clean: str) -> Path:
+    """data/job_details/<title>/_detail_cache_manifest.json"""
+    return job_details_for(job_title_clean) / "_detail_cache_manifest.json"
+
 def master_aggregated_csv(job_title_clean: str) -> Path:
     """data/aggregated/<title>/<title>_master_aggregated.csv"""
     return aggregated_for(job_title_clean) / f"{job_title_clean}_master_aggregated.csv"
@@ -71,3 +90,7 @@ def master_aggregated_csv(job_title_clean: str) -> Path:
 def alignment_scores_for(job_title_clean: str) -> Path:
     """data/alignment/scores/<title>/"""
     return ALIGNMENT_SCORES_DIR / job_title_clean
+
+def pipeline_runs_for(job_title_clean: str) -> Path:
+    """data/pipeline_runs/<title>/"""
+    return PIPELINE_RUNS_DIR / job_title_clean
@@ -0,0 +1,465 @@
+"""
+Pipeline Runner
+═══════════════
+In-process stage graph for the get-jobs pipeline.  Replaces the chain of
+``python3 job_search.py`` / ``job_url_details.py`` / ``merge_job_details.py``
+subprocesses, each of which re-imported pandas / Selenium / NLTK, started
+its own Chrome and reloaded cookies, and found its input by globbing for
+the newest CSV.
+
+  • Stages are declared with explicit ``inputs`` / ``outputs``; outputs are
+    handed to later stages in memory (DataFrames stay DataFrames)
+  • One Chrome driver is created lazily and shared by the scraping stages,
+    then closed as soon as no remaining stage needs it
+  • Every output is persisted under ``data/pipeline_runs/<title>/<run_id>/``
+    with a ``manifest.json`` (stage status, seconds, artifact locations,
+    artifact-lock contention for the run)
+  • ``from_stage`` re-runs from any stage, reloading earlier outputs from
+    a previous run's manifest
+  • ``build_multi_title_stages`` searches every title in
+    ``config/search_titles.json`` concurrently and detail-scrapes each
+    unique posting once (see ``job_extraction.url_frontier``)
+
+Usage:
+    runner = PipelineRunner(build_default_stages(), PipelineContext(job_title, search_params))
+    manifest = runner.run()
+    manifest = runner.run(from_stage="merge")        # reuse search/details outputs
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from artifact_io import lock_stats
+from paths import pipeline_runs_for
+from job_extraction.job_search import prepare_search_driver, run_search, setup_driver
+from job_extraction.job_url_details import save_detail_results, scrape_job_details
+from job_extraction.frontier_priority import with_pending_cards
+from job_extraction.result_journal import links_run_key
+from job_extraction.url_frontier import (
+    DEFAULT_MAX_CONCURRENT_SEARCHES, cards_for_title, run_multi_title_search,
+)
+from job_extraction.driver_utils import cleanup_driver
+from job_extraction.merge_job_details import aggregate_jobs_with_deduplication
+from job_extraction.jd_insights import run_jd_insights
+from job_extraction.master_job_title import ensure_master_job_title
+from job_extraction.input_index_generator import generate_or_load_index
+from job_extraction.jd_term_extractor import enrich_index_from_jds
+from job_extraction.alignment_scorer import score_all_jobs
+from auto_application.resume_optimizer import run_resume_optimisation
+
+MANIFEST_NAME = "manifest.json"
+RUN_ID_FORMAT = "%Y%m%d_%H%M%S"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Stage declaration / run context
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class Stage:
+    """One node of the pipeline graph.
+
+    ``fn(ctx, **inputs)`` must return a dict holding every name in
+    ``outputs``.  A failing optional (``required=False``) stage is logged
+    and the pipeline continues; a failing required stage stops the run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[..., Dict[str, Any]],
+        inputs: Sequence[str] = (),
+        outputs: Sequence[str] = (),
+        required: bool = True,
+        uses_driver: bool = False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.required = required
+        self.uses_driver = uses_driver
+
+
+class PipelineContext:
+    """Run-wide state: job title, search parameters, options and the shared driver."""
+
+    def __init__(
+        self,
+        job_title: str,
+        search_params: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None,
+        **options: Any,
+    ):
+        self.job_title = job_title
+        self.job_title_clean = job_title.lower().replace(' ', '_')
+        self.search_params = search_params or {}
+        self.run_id = run_id or datetime.now().strftime(RUN_ID_FORMAT)
+        self.run_dir = str(pipeline_runs_for(self.job_title_clean) / self.run_id)
+        self.options = options
+        self._driver = None
+
+    @property
+    def driver(self):
+        """Shared Chrome driver with the LinkedIn session loaded (created on first use)."""
+        if self._driver is None:
+            self._driver = setup_driver()
+            prepare_search_driver(self._driver)
+        return self._driver
+
+    def close_driver(self) -> None:
+        if self._driver is not None:
+            try:
+                cleanup_driver(self._driver)
+            except Exception as e:
+                logging.error(f"Error closing shared driver: {e}")
+            self._driver = None
+
+
+def latest_run_id(job_title: str) -> Optional[str]:
+    """Most recent run with a manifest for *job_title*, if any."""
+    base = pipeline_runs_for(job_title.lower().replace(' ', '_'))
+    if not base.exists():
+        return None
+    runs = sorted(p.name for p in base.iterdir() if (p / MANIFEST_NAME).exists())
+    return runs[-1] if runs else None
+
+
+def load_manifest(job_title: str, run_id: str) -> Dict[str, Any]:
+    path = pipeline_runs_for(job_title.lower().replace(' ', '_')) / run_id / MANIFEST_NAME
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Runner
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class PipelineRunner:
+    """Executes declared stages in order, persisting every output."""
+
+    def __init__(self, stages: List[Stage], ctx: PipelineContext):
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate stage names: {names}")
+        produced = set()
+        for stage in stages:
+            missing = [name for name in stage.inputs if name not in produced]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' needs {missing}, which no earlier stage produces")
+            produced.update(stage.outputs)
+
+        self.stages = stages
+        self.ctx = ctx
+        self.artifacts: Dict[str, Any] = {}
+        self.manifest: Dict[str, Any] = {
+            "run_id": ctx.run_id,
+            "job_title": ctx.job_title,
+            "search_params": ctx.search_params,
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "stages": {},
+            "artifacts": {},
+        }
+
+    # ── Persistence ───────────────────────────────────────────────────────
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.ctx.run_dir, MANIFEST_NAME)
+
+    def _save_manifest(self) -> None:
+        os.makedirs(self.ctx.run_dir, exist_ok=True)
+        self.manifest["updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _persist(self, stage: Stage, outputs: Dict[str, Any]) -> None:
+        os.makedirs(self.ctx.run_dir, exist_ok=True)
+        for name in stage.outputs:
+            value = outputs.get(name)
+            if isinstance(value, pd.DataFrame):
+                path = os.path.join(self.ctx.run_dir, f"{name}.pkl")
+                value.to_pickle(path)
+                entry = {"type": "dataframe", "path": path, "rows": len(value)}
+            else:
+                entry = {"type": "value", "value": value}
+            entry["stage"] = stage.name
+            self.manifest["artifacts"][name] = entry
+
+    def _restore(self, previous: Dict[str, Any], names: Sequence[str]) -> None:
+        """Load *names* from a previous run's manifest into memory."""
+        for name in names:
+            entry = previous.get("artifacts", {}).get(name)
+            if entry is None:
+                raise ValueError(f"Run {previous.get('run_id')} has no persisted '{name}' to resume from")
+            if entry["type"] == "dataframe":
+                self.artifacts[name] = pd.read_pickle(entry["path"])
+            else:
+                self.artifacts[name] = entry.get("value")
+            self.manifest["artifacts"][name] = entry
+            logging.info(f"Reloaded '{name}' from run {previous.get('run_id')}")
+
+    # ── Execution ─────────────────────────────────────────────────────────
+
+    def run(self, from_stage: Optional[str] = None) -> Dict[str, Any]:
+        """Run every stage (or those from *from_stage* on); returns the manifest."""
+        names = [stage.name for stage in self.stages]
+        start_index = 0
+        if from_stage:
+            if from_stage not in names:
+                raise ValueError(f"Unknown stage '{from_stage}'. Choose from: {', '.join(names)}")
+            start_index = names.index(from_stage)
+            if start_index:
+                previous = load_manifest(self.ctx.job_title, self.ctx.run_id)
+                self.manifest.update({k: previous[k] for k in ("created", "search_params") if k in previous})
+                self.manifest["stages"] = dict(previous.get("stages", {}))
+                self.ctx.search_params = self.ctx.search_params or previous.get("search_params", {})
+                needed = {n for stage in self.stages[start_index:] for n in stage.inputs}
+                earlier = {n for stage in self.stages[:start_index] for n in stage.outputs}
+                self._restore(previous, sorted(needed & earlier))
+
+        pending = self.stages[start_index:]
+        logging.info(f"Pipeline run {self.ctx.run_id}: stages {', '.join(s.name for s in pending)}")
+        lock_stats(reset=True)   # count this run's lock waits only
+        try:
+            for i, stage in enumerate(pending):
+                self._run_stage(stage)
+                if not any(later.uses_driver for later in pending[i + 1:]):
+                    self.ctx.close_driver()
+        finally:
+            self.ctx.close_driver()
+            self.manifest["lock_stats"] = lock_stats()
+            self._save_manifest()
+            self.log_timings()
+        return self.manifest
+
+    def _run_stage(self, stage: Stage) -> None:
+        logging.info(f"STAGE {stage.name}: starting")
+        inputs = {name: self.artifacts[name] for name in stage.inputs}
+        start = time.perf_counter()
+        status, error = "completed", None
+        try:
+            outputs = stage.fn(self.ctx, **inputs) or {}
+            missing = [name for name in stage.outputs if name not in outputs]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' did not return {missing}")
+            self.artifacts.update({name: outputs[name] for name in stage.outputs})
+            self._persist(stage, outputs)
+        except Exception as e:
+            status, error = "failed", str(e)
+            if stage.required:
+                raise
+            logging.error(f"STAGE {stage.name} failed: {e}")
+            logging.info("Continuing to next stage...")
+        finally:
+            seconds = round(time.perf_counter() - start, 3)
+            self.manifest["stages"][stage.name] = {
+                "status": status,
+                "seconds": seconds,
+                "error": error,
+                "finished": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._save_manifest()
+            logging.info(f"STAGE {stage.name}: {self.manifest['stages'][stage.name]['status']} in {seconds:.1f}s")
+
+    def log_timings(self) -> None:
+        stages = self.manifest.get("stages", {})
+        if not stages:
+            return
+        logging.info(f"Pipeline timings (run {self.ctx.run_id}, manifest {self.manifest_path}):")
+        for name in [s.name for s in self.stages if s.name in stages]:
+            info = stages[name]
+            logging.info(f"  {name:<10} {info['status']:<10} {info['seconds']:8.1f}s")
+        total = sum(info["seconds"] for info in stages.values())
+        logging.info(f"  {'total':<10} {'':<10} {total:8.1f}s")
+        for path, info in self.manifest.get("lock_stats", {}).items():
+            if info["contended"]:
+                logging.info(f"  lock wait  {info['contended']:>3}/{info['acquired']:<3} waits "
+                             f"{info['wait_s']:6.1f}s (max {info['max_wait_s']:.1f}s) {path}")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Get-jobs stages
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def search_stage(ctx: PipelineContext) -> Dict[str, Any]:
+    df, saved_path, stats = run_search(ctx.job_title, ctx.search_params, driver=ctx.driver)
+    if saved_path is None:
+        raise RuntimeError(f"Job search for '{ctx.job_title}' returned no results")
+    return {"search_df": df, "search_csv": saved_path, "search_stats": stats}
+
+
+def details_stage(ctx: PipelineContext, search_df: pd.DataFrame, search_csv: str) -> Dict[str, Any]:
+    # This run's cards plus those the previous run's time budget left unstarted
+    cards = with_pending_cards(ctx.job_title_clean, search_df)
+    links = cards['job_url'].dropna().astype(str).tolist() if 'job_url' in cards.columns else []
+    workers = ctx.options.get("workers", 1)
+    # Journal key matches job_url_details.py --filename <search_csv>, so either entry point resumes the other
+    run_key = os.path.splitext(os.path.basename(search_csv))[0]
+    details_df = scrape_job_details(
+        ctx.job_title_clean, links, run_key,
+        driver=ctx.driver if workers <= 1 and links else None,
+        workers=workers,
+        cards=cards,
+        time_budget=ctx.options.get("time_budget"),
+        target_salary=ctx.search_params.get("salary_range"),
+    )
+    details_csv = save_detail_results(details_df, ctx.job_title)
+    return {"details_df": details_df, "details_csv": details_csv}
+
+
+def merge_stage(ctx: PipelineContext, search_df: pd.DataFrame, details_df: pd.DataFrame,
+                details_csv: Optional[str]) -> Dict[str, Any]:
+    search_df = search_df.copy()
+    if 'date_extracted' not in search_df.columns:
+        search_df.insert(0, 'date_extracted', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    master_csv = aggregate_jobs_with_deduplication(ctx.job_title, search_df, details={details_csv: details_df})
+    if not master_csv:
+        raise RuntimeError("Merge produced no master aggregate")
+    return {"master_csv": master_csv}
+
+
+def insights_stage(ctx: PipelineContext, master_csv: str) -> Dict[str, Any]:
+    insights_path = run_jd_insights(ctx.job_title)
+    if not insights_path:
+        logging.warning("JD insights produced no new insights (may already be up to date)")
+    return {"insights_path": insights_path}
+
+
+def alignment_stage(ctx: PipelineContext, master_csv: str) -> Dict[str, Any]:
+    master_title = ensure_master_job_title()
+    alignment_index = generate_or_load_index(master_title)
+    alignment_index = enrich_index_from_jds(alignment_index, ctx.job_title)
+    return {"jobs_scored": score_all_jobs(alignment_index, ctx.job_title)}
+
+
+def resume_stage(ctx: PipelineContext, master_csv: str) -> Dict[str, Any]:
+    return {"resumes_optimised": run_resume_optimisation(ctx.job_title)}
+
+
+def build_default_stages() -> List[Stage]:
+    """search → details → merge → insights / alignment / resume."""
+    return [
+        Stage("search", search_stage, outputs=("search_df", "search_csv", "search_stats"), uses_driver=True),
+        Stage("details", details_stage, inputs=("search_df", "search_csv"), outputs=("details_df", "details_csv"),
+              uses_driver=True),
+        Stage("merge", merge_stage, inputs=("search_df", "details_df", "details_csv"), outputs=("master_csv",)),
+        Stage("insights", insights_stage, inputs=("master_csv",), outputs=("insights_path",), required=False),
+        Stage("alignment", alignment_stage, inputs=("master_csv",), outputs=("jobs_scored",), required=False),
+        Stage("resume", resume_stage, inputs=("master_csv",), outputs=("resumes_optimised",), required=False),
+    ]
+
+
+STAGE_NAMES = [stage.name for stage in build_default_stages()]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Multi-title stages (titles from config/search_titles.json)
+# ═══════════════════════════════════════════════════════════════════════════
+
+MULTI_TITLE_LABEL = "multi_title"
+
+
+def multi_search_stage(ctx: PipelineContext) -> Dict[str, Any]:
+    frontier = run_multi_title_search(
+        ctx.options["titles"], ctx.search_params,
+        max_concurrent=ctx.options.get("max_concurrent_searches", DEFAULT_MAX_CONCURRENT_SEARCHES),
+    )
+    if not len(frontier):
+        raise RuntimeError("No title search returned any results")
+    return {"frontier_df": frontier.to_frame()}
+
+
+def multi_details_stage(ctx: PipelineContext, frontier_df: pd.DataFrame) -> Dict[str, Any]:
+    """Scrape each unique posting once, then write per-title detail outputs.
+
+    ``details_df`` carries each posting's ``search_titles`` so the merge
+    splits it per title in memory; ``details_csvs`` maps title → saved CSV.
+    """
+    frontier_df = with_pending_cards(ctx.job_title_clean, frontier_df)
+    links = frontier_df['job_url'].astype(str).tolist()
+    workers = ctx.options.get("workers", 1)
+    titles = ctx.options["titles"]
+    details_df = scrape_job_details(
+        ctx.job_title_clean, links, links_run_key(links),
+        driver=ctx.driver if workers <= 1 and links else None,
+        workers=workers,
+        seed_titles=[t.lower().replace(' ', '_') for t in titles],
+        cards=frontier_df,
+        time_budget=ctx.options.get("time_budget"),
+        target_salary=ctx.search_params.get("salary_range"),
+    )
+    attribution = frontier_df[['job_url', 'search_titles']].assign(job_url=frontier_df['job_url'].astype(str))
+    details_df = details_df.assign(job_url=details_df['job_url'].astype(str)).merge(
+        attribution.drop_duplicates('job_url'), on='job_url', how='left')
+    details_csvs = {}
+    for title in titles:
+        title_details = cards_for_title(details_df, title).drop(columns=['search_titles'])
+        details_csvs[title] = save_detail_results(title_details, title)
+    return {"details_df": details_df, "details_csvs": details_csvs}
+
+
+def multi_merge_stage(ctx: PipelineContext, frontier_df: pd.DataFrame, details_df: pd.DataFrame,
+                      details_csvs: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Merge every posting into the aggregate of each title that found it."""
+    master_csvs = {}
+    current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    for title in ctx.options["titles"]:
+        cards = cards_for_title(frontier_df, title).copy()
+        if cards.empty:
+            logging.info(f"No postings attributed to '{title}', skipping merge")
+            continue
+        if 'date_extracted' not in cards.columns:
+            cards.insert(0, 'date_extracted', current_date)
+        title_details = cards_for_title(details_df, title).drop(columns=['search_titles'])
+        master_csvs[title] = aggregate_jobs_with_deduplication(
+            title, cards, details={details_csvs.get(title): title_details})
+    if not master_csvs:
+        raise RuntimeError("Merge produced no master aggregates")
+    return {"master_csvs": master_csvs}
+
+
+def _per_title(stage_fn: Callable[[PipelineContext, str], Any], output: str) -> Callable[..., Dict[str, Any]]:
+    """Run a single-title post-merge stage for every merged title; *output* maps title → result."""
+    def run(ctx: PipelineContext, master_csvs: Dict[str, str]) -> Dict[str, Any]:
+        results = {}
+        for title in master_csvs:
+            title_ctx = PipelineContext(title, ctx.search_params, run_id=ctx.run_id, **ctx.options)
+            try:
+                results[title] = next(iter(stage_fn(title_ctx, master_csvs[title]).values()))
+            except Exception as e:
+                logging.error(f"{stage_fn.__name__} failed for '{title}': {e}")
+                results[title] = None
+        return {output: results}
+    run.__name__ = stage_fn.__name__
+    return run
+
+
+def build_multi_title_stages() -> List[Stage]:
+    """search (concurrent) → details (unique postings) → merge (per title) → post-merge stages."""
+    return [
+        Stage("search", multi_search_stage, outputs=("frontier_df",)),
+        Stage("details", multi_details_stage, inputs=("frontier_df",), outputs=("details_df", "details_csvs"),
+              uses_driver=True),
+        Stage("merge", multi_merge_stage, inputs=("frontier_df", "details_df", "details_csvs"),
+              outputs=("master_csvs",)),
+        Stage("insights", _per_title(insights_stage, "insights_paths"), inputs=("master_csvs",),
+              outputs=("insights_paths",), required=False),
+        Stage("alignment", _per_title(alignment_stage, "jobs_scored"), inputs=("master_csvs",),
+              outputs=("jobs_scored",), required=False),
+        Stage("resume", _per_title(resume_stage, "resumes_optimised"), inputs=("master_csvs",),
+              outputs=("resumes_optimised",), required=False),
+    ]
@@ -0,0 +1,233 @@
+"""
+Record I/O
+══════════
+Fast DataFrame → JSON records for the JSON twins written next to the
+search, detail and salary CSVs (and for the record lists handed to the
+metrics tracker).
+
+  • column-level conversion  datetimes → "YYYY-MM-DD HH:MM:SS" strings,
+                             missing values → None, per column rather than
+                             per cell; no whole-frame copies
+  • orjson when installed    falls back to the standard json module with
+                             the same output
+  • output mode              ``JOB_JSON_OUTPUT`` environment variable:
+        compact   {"metadata": ..., "jobs": [...]} on one line (default)
+        pretty    the same document indented by 2 (the old format)
+        jsonl     <name>.jsonl – a {"metadata": ...} line, then one job per
+                  line, streamed without building the whole document
+        off       no JSON twin; the CSV is the only output
+
+Twins are written atomically (see ``artifact_io``).
+
+Usage:
+    records = frame_to_records(df)
+    write_json_twin(csv_path, df, {"job_title": ..., "timestamp": ...})
+
+    python src/record_io.py --benchmark          # 10k and 100k rows
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from artifact_io import atomic_write
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_OUTPUT_ENV = "JOB_JSON_OUTPUT"
+JSON_OUTPUT_MODES = ("compact", "pretty", "jsonl", "off")
+DEFAULT_JSON_OUTPUT = "compact"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# DataFrame → records
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _column_values(col: pd.Series) -> List[Any]:
+    """One column as JSON-ready Python values."""
+    if pd.api.types.is_object_dtype(col.dtype) and pd.api.types.infer_dtype(col, skipna=True) in ("datetime", "datetime64", "date"):
+        col = pd.to_datetime(col, errors="coerce")
+    if pd.api.types.is_datetime64_any_dtype(col.dtype):
+        values = col.dt.strftime(TIMESTAMP_FORMAT).to_numpy(dtype=object)
+    elif pd.api.types.is_integer_dtype(col.dtype) and not pd.api.types.is_extension_array_dtype(col.dtype):
+        return col.tolist()                 # numpy ints / bools cannot be missing
+    elif pd.api.types.is_bool_dtype(col.dtype) and not pd.api.types.is_extension_array_dtype(col.dtype):
+        return col.tolist()
+    else:
+        values = col.to_numpy(dtype=object)
+    mask = col.isna().to_numpy()
+    if mask.any():
+        values[mask] = None
+    return values.tolist()
+
+
+def iter_records(df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    """Rows of *df* as dicts of JSON-ready values (NaN/NaT → None, timestamps → strings)."""
+    names = [str(c) for c in df.columns]
+    columns = [_column_values(df.iloc[:, i]) for i in range(df.shape[1])]
+    for row in zip(*columns):
+        yield dict(zip(names, row))
+
+
+def frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """List form of ``iter_records``."""
+    return list(iter_records(df))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Serialisation
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _default(obj: Any) -> Any:
+    """Values the column conversion left behind (e.g. inside mixed object columns)."""
+    if isinstance(obj, (datetime, date)):
+        return None if pd.isna(obj) else obj.strftime(TIMESTAMP_FORMAT)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def json_output_mode(mode: Optional[str] = None) -> str:
+    """*mode*, else ``$JOB_JSON_OUTPUT``, else compact."""
+    mode = (mode or os.environ.get(JSON_OUTPUT_ENV) or DEFAULT_JSON_OUTPUT).strip().lower()
+    if mode not in JSON_OUTPUT_MODES:
+        logging.warning(f"Unknown {JSON_OUTPUT_ENV}={mode!r}, using {DEFAULT_JSON_OUTPUT}")
+        return DEFAULT_JSON_OUTPUT
+    return mode
+
+
+def write_json_twin(csv_path: str, df: pd.DataFrame, metadata: Dict[str, Any],
+                    mode: Optional[str] = None, key: str = "jobs") -> Optional[str]:
+    """Write *df* with *metadata* next to *csv_path*; returns the path, or None when off."""
+    mode = json_output_mode(mode)
+    if mode == "off":
+        return None
+    stem = os.path.splitext(csv_path)[0]
+    if mode == "jsonl":
+        path = stem + ".jsonl"
+        with atomic_write(path, "wb") as f:
+            f.write(dumps({"metadata": metadata}) + b"\n")
+            for record in iter_records(df):
+                f.write(dumps(record) + b"\n")
+        return path
+    path = stem + ".json"
+    payload = dumps({"metadata": metadata, key: frame_to_records(df)}, indent=(mode == "pretty"))
+    with atomic_write(path, "wb") as f:
+        f.write(payload)
+    return path
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Benchmark
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _legacy_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """The previous per-cell conversion (two frame copies + a Python loop), for comparison."""
+    df_clean = df.copy().replace({pd.NaT: None})
+    df_clean = df_clean.where(pd.notnull(df_clean), None)
+    records = df_clean.to_dict("records")
+    for record in records:
+        for k, value in record.items():
+            if isinstance(value, pd.Timestamp):
+                record[k] = value.strftime(TIMESTAMP_FORMAT)
+            elif pd.isna(value) or value is pd.NaT:
+                record[k] = None
+    return records
+
+
+def _synthetic_jobs(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    words = np.array("data analytics python sql stakeholder marketing growth experiment model pipeline "
+                     "dashboard team product insight strategy cloud warehouse metric forecast".split())
+    description = [" ".join(rng.choice(words, 350)) for _ in range(min(n, 2000))]
+    posted = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, n), unit="D"))
+    posted[rng.random(n) < 0.1] = pd.NaT
+    salary = rng.uniform(80_000, 250_000, n)
+    salary[rng.random(n) < 0.3] = np.nan
+    return pd.DataFrame({
+        "job_id": np.arange(n),
+        "job_url": [f"https://www.linkedin.com/jobs/view/{i}" for i in range(n)],
+        "job_title": rng.choice(["Data Analyst", "Marketing Analyst", "Analytics Engineer"], n),
+        "company": rng.choice(["Acme", "Globex", None], n),
+        "date_posted": posted,
+        "salary_max_annual": salary,
+        "description": [description[i % len(description)] for i in range(n)],
+    })
+
+
+def benchmark(sizes=(10_000, 100_000), out_dir: Optional[str] = None) -> pd.DataFrame:
+    """Time the old path (df_to_dict_safe + json indent=2) against each output mode."""
+    import tempfile
+
+    rows = []
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp:
+        for n in sizes:
+            df = _synthetic_jobs(n)
+            meta = {"job_title": "benchmark", "total_jobs": n}
+            csv_path = os.path.join(tmp, f"bench_{n}.csv")
+
+            start = time.perf_counter()
+            legacy = {"metadata": meta, "jobs": _legacy_records(df)}
+            with open(csv_path.replace(".csv", "_legacy.json"), "w", encoding="utf-8") as f:
+                json.dump(legacy, f, indent=2, ensure_ascii=False)
+            base = time.perf_counter() - start
+            rows.append({"rows": n, "path": "legacy pretty", "seconds": round(base, 3),
+                         "mb": round(os.path.getsize(csv_path.replace(".csv", "_legacy.json")) / 1e6, 1),
+                         "speedup": 1.0})
+
+            for mode in ("pretty", "compact", "jsonl"):
+                start = time.perf_counter()
+                path = write_json_twin(csv_path, df, meta, mode=mode)
+                elapsed = time.perf_counter() - start
+                rows.append({"rows": n, "path": mode, "seconds": round(elapsed, 3),
+                             "mb": round(os.path.getsize(path) / 1e6, 1),
+                             "speedup": round(base / elapsed, 1)})
+            assert frame_to_records(df.head(500)) == _legacy_records(df.head(500))
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON record serialisation")
+    parser.add_argument("--benchmark", action="store_true", help="Time 10k and 100k row twins against the old path")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    if args.benchmark:
+        print(f"serializer: {'orjson ' + orjson.__version__ if orjson else 'json (orjson not installed)'}")
+        print(benchmark(args.sizes).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()